@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+PCR protokollerini toplu dışa aktarma scripti.
+Reaksiyon kayıtlarını CSV veya NDJSON dosyasından satır satır okur, protokolleri
+parçalar hâlinde hesaplar ve NDJSON, CSV veya metin olarak akışa yazar. Bellek
+kullanımı kayıt sayısından bağımsızdır.
+
+Örnek:
+    python export_protocols.py reaksiyonlar.csv --format ndjson -o protokoller.ndjson
+"""
+
+import argparse
+import csv
+import json
+import sys
+import os
+
+try:
+    from src.core.calculator import PCRCalculator
+    from src.core.optimizer import PCROptimizer
+    from src.core.protocol_batch import BATCH_FIELDS, DEFAULT_CHUNK_SIZE
+    from src.core.protocol_generator import STREAM_FORMATS, ProtocolGenerator
+    from src.core.rules import PRESETS
+except ImportError:
+    # Çalışma dizininden göreceli olarak içe aktar
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from src.core.calculator import PCRCalculator
+    from src.core.optimizer import PCROptimizer
+    from src.core.protocol_batch import BATCH_FIELDS, DEFAULT_CHUNK_SIZE
+    from src.core.protocol_generator import STREAM_FORMATS, ProtocolGenerator
+    from src.core.rules import PRESETS
+
+# Girdi dosyası biçimleri
+INPUT_FORMATS = ("csv", "ndjson")
+
+# CSV girdisinde sayıya çevrilen alanlar
+NUMERIC_FIELDS = ("template_length", "template_concentration", "target_yield", "gc_content")
+
+
+def _parse_value(name, text):
+    """CSV hücresini protokol argümanına çevirir; boş hücre None döndürür."""
+    text = text.strip()
+    if not text:
+        return None
+    if name == "is_diagnostic":
+        return text.lower() in ("1", "true", "evet", "yes")
+    if name in NUMERIC_FIELDS:
+        text = text.replace(",", ".")
+        try:
+            return int(text)
+        except ValueError:
+            return float(text)
+    return text
+
+
+def iter_records(stream, input_format):
+    """
+    Girdi akışındaki reaksiyon kayıtlarını sırayla üretir.
+
+    Args:
+        stream (file): Metin akışı
+        input_format (str): "csv" (başlık satırı alan adlarıdır) veya "ndjson"
+
+    Yields:
+        dict: create_protocols_batch alanlarını içeren kayıt
+
+    Raises:
+        ValueError: Sayısal bir hücre veya NDJSON satırı okunamazsa (satır
+            numarası ve alan adıyla)
+    """
+    if input_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            record = {}
+            for name, text in row.items():
+                try:
+                    value = _parse_value(name, text or "")
+                except ValueError:
+                    raise ValueError(
+                        f"{reader.line_num}. satır, {name} alanı sayı değil: {text!r}"
+                    ) from None
+                if value is not None:
+                    record[name] = value
+            yield record
+    else:
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as error:
+                    raise ValueError(f"{line_number}. satır geçerli bir JSON nesnesi değil: {error}") from None
+
+
+def build_parser():
+    """Komut satırı argüman ayrıştırıcısını oluşturur."""
+    parser = argparse.ArgumentParser(
+        description="Reaksiyon kayıtları için PCR protokollerini toplu olarak dışa aktarır.",
+        epilog=f"Girdi alanları: {', '.join(BATCH_FIELDS)}"
+    )
+    parser.add_argument("input", nargs="?", help="Girdi dosyası (verilmezse standart girdi)")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS,
+                        help="Girdi biçimi (verilmezse dosya uzantısından belirlenir)")
+    parser.add_argument("--format", default="ndjson", choices=STREAM_FORMATS, help="Çıktı biçimi")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (verilmezse standart çıktı)")
+    parser.add_argument("--tm-model", default="basic", choices=("basic", "nearest_neighbor"),
+                        help="Tm hesaplama modeli")
+    parser.add_argument("--rules", default="taq", choices=sorted(PRESETS),
+                        help="Polimeraz/kit ön ayarı")
+    parser.add_argument("--cycle-model", default="log2", choices=("log2", "kinetic"),
+                        help="Döngü sayısı modeli")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Bir parçada hesaplanan kayıt sayısı")
+    return parser
+
+
+def main(argv=None):
+    """Protokolleri dışa aktarır ve yazılan protokol sayısını standart hataya bildirir."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format
+    if input_format is None:
+        input_format = "ndjson" if args.input and args.input.endswith((".ndjson", ".jsonl")) else "csv"
+    if args.chunk_size < 1:
+        parser.error("Parça boyutu en az 1 olmalıdır.")
+
+    optimizer = PCROptimizer(
+        calculator=PCRCalculator(tm_model=args.tm_model), rules=args.rules,
+        cycle_model=args.cycle_model
+    )
+    generator = ProtocolGenerator(optimizer)
+
+    source = open(args.input, encoding="utf-8", newline="") if args.input else sys.stdin
+    target = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        protocols = generator.generate_protocols(iter_records(source, input_format), args.chunk_size)
+        count = generator.write_protocols(protocols, target, args.format)
+    except ValueError as error:
+        # Okunamayan hücreler ve geçersiz alanlar/modlar traceback yerine kullanım hatası olarak bildirilir
+        parser.error(str(error))
+    finally:
+        if args.input:
+            source.close()
+        if args.output:
+            target.close()
+    print(f"{count} protokol yazıldı.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,15 +4,24 @@ PCR Optimizer ana uygulama dosyası.
 
 import os
 from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, flash
+from flask import Response, stream_with_context
 import json
 import tempfile
 from datetime import datetime
 
 from core.calculator import PCRCalculator
 from core.optimizer import PCROptimizer
-from core.protocol_generator import ProtocolGenerator
+from core.incremental import IncrementalOptimizer
+from core.multiplex import MultiplexAnalyzer
+from core.plate_planner import PlatePlanner
+from core.scheduler import SCHEDULE_METHODS, RunScheduler, jobs_from_plan
+from core.primer_design import PrimerDesigner
+from core.protocol_cache import ProtocolCache
+from core.protocol_generator import STREAM_FORMATS, ProtocolGenerator
 from utils.validators import PCRValidationError, validate_dna_sequence, validate_primer
+from utils.validators import validate_design_parameters, validate_numeric_value
 from utils.validators import validate_template_length, validate_cycle_number, validate_concentration
+from utils.validators import validate_protocol_mode
 from utils.helpers import format_dna_sequence, estimate_pcr_product_size, generate_filename
 
 
@@ -21,9 +30,20 @@ app = Flask(__name__)
 app.secret_key = os.urandom(24)  # Flask flash mesajları için gerekli
 
 # PCR bileşenleri oluşturma
-calculator = PCRCalculator()
-optimizer = PCROptimizer()
-protocol_generator = ProtocolGenerator(optimizer)
+# Aynı primerler tekrar tekrar gönderildiği için Tm/GC değerleri önbelleğe alınır
+calculator = PCRCalculator(cache_size=4096)
+optimizer = PCROptimizer(calculator=calculator)
+# Aynı istekler için protokol ve raporlar yeniden oluşturulmaz; disk katmanı
+# için PCR_PROTOCOL_CACHE_DIR ortam değişkeni kullanılır
+protocol_cache = ProtocolCache(
+    maxsize=1024,
+    ttl=24 * 3600,
+    directory=os.environ.get('PCR_PROTOCOL_CACHE_DIR')
+)
+protocol_generator = ProtocolGenerator(optimizer, cache=protocol_cache)
+# Yeniden optimizasyon isteklerinde önceki protokollerin aşama sonuçları
+# tanıtıcılarla bellekte tutulur
+incremental_optimizer = IncrementalOptimizer(optimizer, max_handles=1024)
 
 # Geçici dosyalar için klasör
 TEMP_DIR = os.path.join(tempfile.gettempdir(), 'pcr_optimizer')
@@ -121,6 +141,13 @@ def optimize():
                     
             # PCR tipi
             data['is_diagnostic'] = request.form.get('pcr_type') == 'diagnostic'
+            
+            # Protokol modu (standart, touchdown veya gradyan)
+            try:
+                data['mode'] = validate_protocol_mode(request.form.get('protocol_mode'))
+            except PCRValidationError as e:
+                flash(str(e), 'error')
+                return render_template('optimize.html')
                 
             # Protokolü oluştur
             protocol = protocol_generator.generate_protocol(**data)
@@ -155,7 +182,7 @@ def report(session_id):
             protocol = json.load(f)
             
         # Metinsel raporu oluştur
-        report_text = protocol_generator.protocol_to_text(protocol)
+        report_text = protocol_generator.render(protocol, 'text')
         
         return render_template('report.html', 
                                protocol=protocol, 
@@ -177,15 +204,15 @@ def download(session_id, format):
             
         # İstenen formatta rapor oluştur
         if format == 'json':
-            content = protocol_generator.protocol_to_json(protocol)
+            content = protocol_generator.render(protocol, 'json')
             mimetype = 'application/json'
             filename = 'pcr_protocol.json'
         elif format == 'csv':
-            content = protocol_generator.protocol_to_csv(protocol)
+            content = protocol_generator.render(protocol, 'csv')
             mimetype = 'text/csv'
             filename = 'pcr_protocol.csv'
         else:  # text
-            content = protocol_generator.protocol_to_text(protocol)
+            content = protocol_generator.render(protocol, 'text')
             mimetype = 'text/plain'
             filename = 'pcr_protocol.txt'
             
@@ -204,46 +231,58 @@ def download(session_id, format):
         return redirect(url_for('index'))
 
 
+def _protocol_parameters(data, require_template=True):
+    """
+    API verisini doğrulanmış create_complete_protocol argümanlarına dönüştürür.
+    
+    require_template False ise (ör. yeniden optimizasyon değişiklikleri) dizi
+    veya şablon uzunluğu zorunlu değildir; yalnızca gönderilen alanlar döner.
+    """
+    validated_data = {}
+    
+    # DNA dizisi veya uzunluğu
+    if 'sequence' in data:
+        validated_data['sequence'] = validate_dna_sequence(data['sequence'])
+        validated_data['template_length'] = len(validated_data['sequence'])
+    elif 'template_length' in data:
+        validated_data['template_length'] = validate_template_length(data['template_length'])
+    elif require_template:
+        raise PCRValidationError('DNA dizisi veya şablon uzunluğu gereklidir.')
+        
+    # Opsiyonel parametreler
+    if 'forward_primer' in data:
+        validated_data['forward_primer'] = validate_primer(data['forward_primer'], 'İleri primer')
+        
+    if 'reverse_primer' in data:
+        validated_data['reverse_primer'] = validate_primer(data['reverse_primer'], 'Geri primer')
+        
+    if 'template_concentration' in data:
+        validated_data['template_concentration'] = validate_concentration(
+            data['template_concentration'], 
+            'Şablon konsantrasyonu'
+        )
+        
+    if 'target_yield' in data:
+        validated_data['target_yield'] = validate_concentration(
+            data['target_yield'], 
+            'Hedef verim'
+        )
+        
+    if 'is_diagnostic' in data:
+        validated_data['is_diagnostic'] = bool(data['is_diagnostic'])
+        
+    if 'mode' in data:
+        validated_data['mode'] = validate_protocol_mode(data['mode'])
+    
+    return validated_data
+
+
 @app.route('/api/optimize', methods=['POST'])
 def api_optimize():
     """PCR optimizasyon API."""
     try:
-        # JSON verilerini al
-        data = request.json
-        
-        # Veri doğrulama
-        validated_data = {}
-        
-        # DNA dizisi veya uzunluğu
-        if 'sequence' in data:
-            validated_data['sequence'] = validate_dna_sequence(data['sequence'])
-            validated_data['template_length'] = len(validated_data['sequence'])
-        elif 'template_length' in data:
-            validated_data['template_length'] = validate_template_length(data['template_length'])
-        else:
-            return jsonify({'error': 'DNA dizisi veya şablon uzunluğu gereklidir.'}), 400
-            
-        # Opsiyonel parametreler
-        if 'forward_primer' in data:
-            validated_data['forward_primer'] = validate_primer(data['forward_primer'], 'İleri primer')
-            
-        if 'reverse_primer' in data:
-            validated_data['reverse_primer'] = validate_primer(data['reverse_primer'], 'Geri primer')
-            
-        if 'template_concentration' in data:
-            validated_data['template_concentration'] = validate_concentration(
-                data['template_concentration'], 
-                'Şablon konsantrasyonu'
-            )
-            
-        if 'target_yield' in data:
-            validated_data['target_yield'] = validate_concentration(
-                data['target_yield'], 
-                'Hedef verim'
-            )
-            
-        if 'is_diagnostic' in data:
-            validated_data['is_diagnostic'] = bool(data['is_diagnostic'])
+        # JSON verilerini al ve doğrula
+        validated_data = _protocol_parameters(request.json)
             
         # Protokolü oluştur
         protocol = protocol_generator.generate_protocol(**validated_data)
@@ -257,6 +296,258 @@ def api_optimize():
         return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
 
 
+@app.route('/api/reoptimize', methods=['POST'])
+def api_reoptimize():
+    """
+    Artımlı yeniden optimizasyon API.
+    
+    {"parameters": {...}} yeni bir protokol tanıtıcısı oluşturur;
+    {"handle": "...", "delta": {...}} önceki protokolden yalnızca değişen
+    girdilerin etkilediği aşamaları yeniden hesaplar.
+    """
+    try:
+        data = request.json or {}
+        
+        if data.get('handle'):
+            delta = _protocol_parameters(data.get('delta') or {}, require_template=False)
+            try:
+                handle = incremental_optimizer.update(data['handle'], **delta)
+            except KeyError:
+                return jsonify({'error': 'Protokol tanıtıcısı bulunamadı veya süresi doldu.'}), 404
+        else:
+            handle = incremental_optimizer.create(**_protocol_parameters(data.get('parameters') or {}))
+        
+        return jsonify({
+            'handle': handle.id,
+            'protocol': handle.protocol,
+            'recomputed': handle.recomputed
+        })
+        
+    except PCRValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
+
+
+@app.route('/api/design_primers', methods=['POST'])
+def api_design_primers():
+    """Şablon dizisi için primer çifti tasarlama API."""
+    try:
+        data = request.json or {}
+        
+        if 'sequence' not in data:
+            return jsonify({'error': 'DNA dizisi gereklidir.'}), 400
+        sequence = validate_dna_sequence(data['sequence'])
+        top_k = int(validate_numeric_value(data.get('top_k', 5), 'Çift sayısı', min_value=1, max_value=50))
+        
+        designer = PrimerDesigner(calculator=calculator, **validate_design_parameters(data))
+        pairs = designer.design(sequence, top_k=top_k)
+        
+        return jsonify({'pairs': pairs})
+        
+    except PCRValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
+
+
+@app.route('/api/multiplex', methods=['POST'])
+def api_multiplex():
+    """Multipleks primer paneli uyumluluk analizi API."""
+    try:
+        data = request.json or {}
+        
+        primers = data.get('primers')
+        if not primers:
+            return jsonify({'error': 'Primer listesi gereklidir.'}), 400
+        
+        # Primerler {"ad": "dizi"} sözlüğü veya dizi listesi olarak verilebilir
+        if isinstance(primers, dict):
+            names = list(primers.keys())
+            sequences = list(primers.values())
+        else:
+            names = None
+            sequences = primers
+        sequences = [
+            validate_primer(sequence, f"{names[i] if names else f'P{i + 1}'} primeri")
+            for i, sequence in enumerate(sequences)
+        ]
+        
+        analyzer = MultiplexAnalyzer(calculator=calculator)
+        if 'max_tm_difference' in data:
+            analyzer.max_tm_difference = validate_numeric_value(
+                data['max_tm_difference'], 'En fazla Tm farkı', min_value=0, max_value=50
+            )
+        result = analyzer.analyze(sequences, names)
+        
+        # Matrisleri JSON'a uygun listelere dönüştür
+        for key in ('tm_difference', 'dimer_score', 'max_run', 'three_prime_run'):
+            result[key] = result[key].tolist()
+        
+        return jsonify(result)
+        
+    except PCRValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
+
+
+def _plate_records(reactions):
+    """API'ye gönderilen reaksiyon listesini doğrulanmış protokol argümanlarına dönüştürür."""
+    if not reactions or not isinstance(reactions, list):
+        raise PCRValidationError('Reaksiyon listesi gereklidir.')
+    
+    records = []
+    for i, reaction in enumerate(reactions):
+        record = {'template_length': validate_template_length(reaction.get('template_length'))}
+        for field, label in (('forward_primer', 'İleri primer'), ('reverse_primer', 'Geri primer')):
+            if reaction.get(field):
+                record[field] = validate_primer(reaction[field], f"{i + 1}. reaksiyon {label.lower()}")
+        for field, label in (('template_concentration', 'Şablon konsantrasyonu'), ('target_yield', 'Hedef verim')):
+            if reaction.get(field) is not None:
+                record[field] = validate_concentration(reaction[field], label)
+        if reaction.get('gc_content') is not None:
+            record['gc_content'] = validate_numeric_value(
+                reaction['gc_content'], 'GC içeriği', min_value=0, max_value=100
+            )
+        record['is_diagnostic'] = bool(reaction.get('is_diagnostic', False))
+        if reaction.get('mode'):
+            record['mode'] = validate_protocol_mode(reaction['mode'])
+        records.append(record)
+    return records
+
+
+def _plate_plan(data):
+    """API verisindeki reaksiyonları ortak programlara gruplar (PlatePlanner.plan sonucu)."""
+    records = _plate_records(data.get('reactions'))
+    planner = PlatePlanner(
+        annealing_tolerance=validate_numeric_value(
+            data.get('annealing_tolerance', 2.0), 'Bağlanma sıcaklığı toleransı',
+            min_value=0, max_value=20
+        ),
+        extension_tolerance=validate_numeric_value(
+            data.get('extension_tolerance', 30), 'Uzama süresi toleransı',
+            min_value=0, max_value=600
+        ),
+        plate_size=int(validate_numeric_value(
+            data.get('plate_size', 96), 'Plaka boyutu', min_value=1, max_value=1536
+        ))
+    )
+    return planner.plan(optimizer.create_protocols_batch(records).to_dicts())
+
+
+@app.route('/api/plate_plan', methods=['POST'])
+def api_plate_plan():
+    """Plakadaki reaksiyonları ortak termal programlara gruplama API."""
+    try:
+        return jsonify(_plate_plan(request.json or {}))
+        
+    except PCRValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
+
+
+@app.route('/api/schedule', methods=['POST'])
+def api_schedule():
+    """Program gruplarını termal döngüleyicilere atayan çalıştırma planı API."""
+    try:
+        data = request.json or {}
+        
+        instruments = data.get('instruments')
+        if not instruments or not isinstance(instruments, list):
+            return jsonify({'error': 'Cihaz listesi gereklidir.'}), 400
+        instruments = [
+            {
+                'name': instrument.get('name'),
+                'capacity': int(validate_numeric_value(
+                    instrument.get('capacity'), 'Cihaz kapasitesi', min_value=1, max_value=1536
+                ))
+            }
+            for instrument in instruments
+        ]
+        
+        method = data.get('method', 'auto')
+        if method not in SCHEDULE_METHODS:
+            return jsonify({'error': f"Planlama yöntemi geçersiz. Geçerli yöntemler: {', '.join(SCHEDULE_METHODS)}."}), 400
+        
+        # İşler doğrudan ("jobs": protokol ve reaksiyon sayısı) veya plaka planından oluşturulur
+        if data.get('jobs'):
+            jobs = [
+                {
+                    'name': job.get('name', f'Program {i + 1}'),
+                    'protocol': job['protocol'],
+                    'reactions': int(validate_numeric_value(
+                        job.get('reactions', 1), 'Reaksiyon sayısı', min_value=1
+                    ))
+                }
+                for i, job in enumerate(data['jobs'])
+            ]
+            result = RunScheduler(instruments, method).schedule(jobs)
+        else:
+            plan = _plate_plan(data)
+            result = RunScheduler(instruments, method).schedule(jobs_from_plan(plan))
+            result['plan'] = plan
+        
+        return jsonify(result)
+        
+    except PCRValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except (KeyError, TypeError, ValueError) as e:
+        return jsonify({'error': f'Geçersiz iş tanımı: {str(e)}'}), 400
+    except Exception as e:
+        return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
+
+
+# Akış biçimlerinin MIME türleri ve dosya uzantıları
+STREAM_MIMETYPES = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv', 'csv'),
+    'text': ('text/plain', 'txt')
+}
+
+
+@app.route('/api/export', methods=['POST'])
+def api_export():
+    """
+    Çok sayıda reaksiyonun protokollerini NDJSON, CSV veya metin olarak akışla indirme API.
+    
+    Protokoller parça parça hesaplanıp yanıta yazılır; yanıt bellekte
+    bütünüyle oluşturulmaz.
+    """
+    try:
+        data = request.json or {}
+        
+        format = data.get('format', 'ndjson')
+        if format not in STREAM_FORMATS:
+            return jsonify({'error': f"Çıktı biçimi geçersiz. Geçerli biçimler: {', '.join(STREAM_FORMATS)}."}), 400
+        records = _plate_records(data.get('reactions'))
+        
+        mimetype, extension = STREAM_MIMETYPES[format]
+        protocols = protocol_generator.generate_protocols(records)
+        return Response(
+            stream_with_context(protocol_generator.iter_protocols(protocols, format)),
+            mimetype=mimetype,
+            headers={
+                'Content-Disposition': f"attachment; filename={generate_filename('pcr_protocols', extension)}"
+            }
+        )
+        
+    except PCRValidationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Beklenmeyen bir hata oluştu: {str(e)}'}), 500
+
+
+@app.route('/api/cache_stats')
+def api_cache_stats():
+    """Protokol ve primer önbelleklerinin isabet istatistikleri API."""
+    return jsonify({
+        'protocol_cache': protocol_generator.cache_stats(),
+        'calculator_cache': calculator.cache_stats()
+    })
+
+
 def create_app():
     """Flask uygulaması oluştur."""
     return app
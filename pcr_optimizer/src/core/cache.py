@@ -0,0 +1,150 @@
+"""
+Boyutu sınırlı, iş parçacığı güvenli LRU önbellek modülü.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+# Önbellekte bulunmayan anahtarlar için işaretçi
+_MISSING = object()
+
+
+class LRUCache:
+    """En az kullanılanı çıkaran (LRU), boyutu sınırlı önbellek."""
+
+    def __init__(self, maxsize=1024):
+        """
+        LRUCache sınıfı için başlatıcı.
+
+        Args:
+            maxsize (int): Önbellekte tutulacak en fazla kayıt sayısı
+        """
+        if maxsize < 1:
+            raise ValueError("Önbellek boyutu en az 1 olmalıdır.")
+
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+        # İstatistik sayaçları
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __getstate__(self):
+        """
+        Pickle durumunu döndürür.
+
+        Kilit pickle edilemediği için kayıtlarla birlikte dışarıda bırakılır;
+        başka bir sürece gönderilen önbellek boş olarak başlar.
+        """
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        """Pickle durumundan boş bir önbellek kurar."""
+        self.__init__(state["maxsize"])
+
+    def __len__(self):
+        """Önbellekteki kayıt sayısını döndürür."""
+        return len(self._data)
+
+    def __contains__(self, key):
+        """Anahtarın önbellekte olup olmadığını döndürür (istatistikleri etkilemez)."""
+        with self._lock:
+            return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Anahtara karşılık gelen değeri döndürür.
+
+        Args:
+            key: Önbellek anahtarı
+            default: Anahtar bulunamazsa döndürülecek değer
+
+        Returns:
+            Önbellekteki değer veya default
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Değeri önbelleğe ekler; gerekirse en eski kaydı çıkarır.
+
+        Args:
+            key: Önbellek anahtarı
+            value: Saklanacak değer
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        """
+        Anahtarı önbellekten çıkarır (istatistikleri etkilemez).
+
+        Args:
+            key: Önbellek anahtarı
+            default: Anahtar bulunamazsa döndürülecek değer
+
+        Returns:
+            Çıkarılan değer veya default
+        """
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def get_or_compute(self, key, compute):
+        """
+        Değeri önbellekten döndürür; yoksa hesaplayıp ekler.
+
+        Hesaplama kilit dışında yapılır; aynı anahtar eşzamanlı olarak iki kez
+        hesaplanabilir ancak sonuç aynı olduğu için bu zararsızdır.
+
+        Args:
+            key: Önbellek anahtarı
+            compute (callable): Değeri hesaplayan parametresiz fonksiyon
+
+        Returns:
+            Önbellekteki veya yeni hesaplanan değer
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Önbelleği ve istatistik sayaçlarını sıfırlar."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: Boyut, isabet, ıska, çıkarma sayıları ve isabet oranı
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
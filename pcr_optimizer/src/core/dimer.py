@@ -0,0 +1,193 @@
+"""
+Primer dimer (self-dimer, cross-dimer) ve 3' uç tamamlayıcılığını puanlayan modül.
+
+Bir primer, diğerinin ters yönüyle tüm kaydırmalarda (offset) hizalanır.
+Hizalamalar NumPy dizisi olarak "kaydırılmış köşegen" düzeninde tutulur;
+böylece iç içe Python döngüleri olmadan N primer çifti tek seferde puanlanır.
+"""
+
+import numpy as np
+
+from .sequence_encoding import BASE_C, BASE_G, BASE_OTHER, encode_padded
+
+
+# Tamamlayıcı baz çifti ağırlıkları (Wallace kuralıyla uyumlu: A-T=2, G-C=4)
+AT_PAIR_WEIGHT = 2
+GC_PAIR_WEIGHT = 4
+
+# Uyarı eşikleri (ardışık tamamlayıcı baz sayısı)
+DIMER_RUN_WARNING = 8
+THREE_PRIME_RUN_WARNING = 4
+
+# Bellek kullanımını sınırlamak için tek seferde puanlanan en fazla çift sayısı
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def _runs(paired, weights, width):
+    """
+    Son eksen boyunca ardışık eşleşme uzunluklarını ve ağırlıklı toplamlarını hesaplar.
+
+    Her konumda, o konumda biten kesintisiz eşleşme dizisinin uzunluğu ve
+    ağırlık toplamı döndürülür (kümülatif toplam - son kırılma noktası).
+    Uzunluk ve ağırlık tek bir tamsayıda (ağırlık * (width + 1) + uzunluk)
+    birlikte biriktirilir; böylece kümülatif işlemler bir kez yapılır.
+
+    Args:
+        paired (numpy.ndarray): Eşleşme maskesi
+        weights (numpy.ndarray): Eşleşme ağırlıkları (eşleşmeyenlerde 0)
+        width (int): Son eksenin uzunluğu (uzunluk alanının üst sınırı)
+
+    Returns:
+        tuple: (uzunluklar, ağırlıklı toplamlar)
+    """
+    base = width + 1
+    largest = GC_PAIR_WEIGHT * width * base + width
+    dtype = np.int16 if largest <= np.iinfo(np.int16).max else np.int32
+
+    combined = weights.astype(dtype) * base + paired
+    cumsum = np.cumsum(combined, axis=-1, dtype=dtype)
+    breaks = np.maximum.accumulate(np.where(paired, 0, cumsum), axis=-1)
+    runs = cumsum - breaks
+
+    return runs % base, runs // base
+
+
+def _score_chunk(first_primers, second_primers):
+    """Bir grup primer çiftini puanlar (score_dimers_batch için)."""
+    n_pairs = len(first_primers)
+    width = max(
+        max((len(primer) for primer in first_primers), default=1),
+        max((len(primer) for primer in second_primers), default=1),
+        1
+    )
+    first, first_lengths = encode_padded(first_primers, width)
+    second, second_lengths = encode_padded(second_primers, width)
+    first = first.astype(np.int8)
+    second = second.astype(np.int8)
+
+    # İkinci primeri 3'→5' yönüne çevir: reversed[m] = second[uzunluk - 1 - m]
+    positions = np.arange(width)
+    reversed_index = second_lengths[:, None] - 1 - positions[None, :]
+    reversed_second = np.where(
+        reversed_index >= 0,
+        np.take_along_axis(second, np.clip(reversed_index, 0, None), axis=1),
+        BASE_OTHER
+    )
+
+    # Köşegen düzeni: offset d için first[i] ile reversed[i - d] eşleşir
+    offsets = np.arange(-(width - 1), width)
+    partner_index = positions[None, :] - offsets[:, None]
+    in_range = (partner_index >= 0) & (partner_index < width)
+    partner = reversed_second[:, np.clip(partner_index, 0, width - 1)]
+
+    base = first[:, None, :]
+    paired = (
+        in_range[None, :, :]
+        & (base != BASE_OTHER)
+        & (partner != BASE_OTHER)
+        & (base + partner == 3)
+    )
+    is_gc = (base == BASE_G) | (base == BASE_C)
+    weights = np.where(is_gc, GC_PAIR_WEIGHT, AT_PAIR_WEIGHT).astype(np.int8) * paired
+
+    run_lengths, run_scores = _runs(paired, weights, width)
+
+    # İlk primerin 3' ucunda (i = uzunluk - 1) biten eşleşmeler
+    rows = np.arange(n_pairs)
+    last_index = np.clip(first_lengths - 1, 0, None)
+    end_first_runs = run_lengths[rows, :, last_index]
+    end_first_scores = run_scores[rows, :, last_index]
+
+    # İkinci primerin 3' ucundan (m = 0, yani i = d) başlayan eşleşmeler: d >= 0
+    # köşegenlerinde başlangıcı tam olarak i = d olan ardışık eşleşmeler
+    start_offsets = offsets[offsets >= 0]
+    diagonal_lengths = run_lengths[:, width - 1:, :]
+    run_starts = positions[None, None, :] - diagonal_lengths + 1
+    from_second_end = paired[:, width - 1:, :] & (run_starts == start_offsets[None, :, None])
+    end_second_runs = np.where(from_second_end, diagonal_lengths, 0).max(axis=2)
+    end_second_scores = np.where(from_second_end, run_scores[:, width - 1:, :], 0).max(axis=2)
+
+    return {
+        "score": run_scores.max(axis=(1, 2)),
+        "max_run": run_lengths.max(axis=(1, 2)),
+        "three_prime_score": np.maximum(
+            end_first_scores.max(axis=1), end_second_scores.max(axis=1)
+        ),
+        "three_prime_run": np.maximum(
+            end_first_runs.max(axis=1), end_second_runs.max(axis=1)
+        )
+    }
+
+
+def score_dimers_batch(first_primers, second_primers, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    N primer çiftinin dimer puanlarını tek çağrıda hesaplar.
+
+    Her çift için ikinci primerin ters yönü ilk primere karşı tüm
+    kaydırmalarda hizalanır ve ardışık tamamlayıcı bölgeler bulunur.
+
+    Args:
+        first_primers (list): İlk primer dizileri (5'→3')
+        second_primers (list): İkinci primer dizileri (5'→3'); self-dimer için
+            ilk primerlerle aynı liste verilir
+        chunk_size (int): Bellek kullanımını sınırlamak için grup boyutu
+
+    Returns:
+        dict: Her biri N uzunluğunda dizi olan "score" (ağırlıklı en uzun
+            tamamlayıcı bölge), "max_run" (baz), "three_prime_score" ve
+            "three_prime_run" (herhangi bir primerin 3' ucunu içeren bölge)
+    """
+    first_primers = list(first_primers)
+    second_primers = list(second_primers)
+    if len(first_primers) != len(second_primers):
+        raise ValueError("Primer listeleri aynı uzunlukta olmalıdır.")
+
+    keys = ("score", "max_run", "three_prime_score", "three_prime_run")
+    if not first_primers:
+        return {key: np.zeros(0, dtype=np.int64) for key in keys}
+
+    chunks = [
+        _score_chunk(first_primers[start:start + chunk_size],
+                     second_primers[start:start + chunk_size])
+        for start in range(0, len(first_primers), chunk_size)
+    ]
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in keys}
+
+
+def score_dimer(first_primer, second_primer):
+    """
+    Tek bir primer çiftinin dimer puanlarını hesaplar.
+
+    Args:
+        first_primer (str): İlk primer dizisi (5'→3')
+        second_primer (str): İkinci primer dizisi (5'→3')
+
+    Returns:
+        dict: "score", "max_run", "three_prime_score", "three_prime_run"
+    """
+    scores = score_dimers_batch([first_primer], [second_primer])
+    return {key: int(values[0]) for key, values in scores.items()}
+
+
+def dimer_warnings(scores, label):
+    """
+    Dimer puanları eşikleri aşıyorsa uyarı mesajları üretir.
+
+    Args:
+        scores (dict): score_dimer sonucu
+        label (str): Mesajda kullanılacak çift adı (ör. "İleri primer self-dimer")
+
+    Returns:
+        list: Uyarı mesajları
+    """
+    warnings = []
+    if scores["three_prime_run"] >= THREE_PRIME_RUN_WARNING:
+        warnings.append(
+            f"{label}: 3' uçta {scores['three_prime_run']} bazlık tamamlayıcı bölge "
+            f"(primer dimer riski)."
+        )
+    elif scores["max_run"] >= DIMER_RUN_WARNING:
+        warnings.append(
+            f"{label}: {scores['max_run']} bazlık ardışık tamamlayıcı bölge."
+        )
+    return warnings
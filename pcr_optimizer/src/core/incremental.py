@@ -0,0 +1,245 @@
+"""
+Protokol aşamalarının bağımlılık grafiğiyle artımlı yeniden optimizasyon modülü.
+
+create_complete_protocol'ün adımları (dizi profilleri, GC → sıcaklıklar,
+uzunluk → süreler, konsantrasyon → döngüler vb.) aşamalar olarak modellenir;
+her aşama create_complete_protocol'ün çağırdığı PCROptimizer aşama metodunu
+kullanır.
+Her aşama hangi girdilere ve hangi önceki aşamalara bağlı olduğunu bildirir.
+Bir girdi değiştiğinde yalnızca ona (doğrudan veya dolaylı) bağlı aşamalar
+kirli (dirty) işaretlenip yeniden hesaplanır; diğer aşamaların sonuçları
+önceki protokolden aynen kullanılır. Örneğin yalnızca hedef verim
+değiştiğinde şablon GC taraması ve primer Tm hesapları tekrarlanmaz.
+
+Sonuç, aynı girdilerle create_complete_protocol'ün vereceği protokolle
+birebir aynıdır.
+"""
+
+import copy
+import uuid
+
+from .cache import LRUCache
+from .cycling import PROTOCOL_MODES
+
+
+# create_complete_protocol girdileri ve varsayılan değerleri
+PROTOCOL_INPUTS = {
+    "template_length": None,
+    "forward_primer": None,
+    "reverse_primer": None,
+    "template_concentration": None,
+    "target_yield": None,
+    "sequence": None,
+    "is_diagnostic": False,
+    "gc_content": None,
+    "mode": "standard"
+}
+
+# Aşamalar: (ad, bağlı olduğu girdiler, bağlı olduğu aşamalar), hesaplama sırasıyla
+STAGES = (
+    ("sequence", ("sequence",), ()),
+    ("forward", ("forward_primer",), ()),
+    ("reverse", ("reverse_primer",), ()),
+    ("gc", ("gc_content",), ("sequence",)),
+    ("temperatures", (), ("forward", "reverse", "gc")),
+    ("primer_checks", (), ("forward", "reverse")),
+    ("annealing", (), ("temperatures", "primer_checks")),
+    ("amplicon", (), ("sequence", "forward", "reverse")),
+    ("times", ("template_length",), ("amplicon", "gc")),
+    ("cycles", ("template_concentration", "target_yield", "is_diagnostic"), ()),
+    ("protocol", ("mode",), ("gc", "annealing", "primer_checks", "amplicon", "times", "cycles"))
+)
+
+# Bellekte tutulan en fazla protokol tanıtıcısı
+DEFAULT_MAX_HANDLES = 256
+
+
+def dirty_stages(changed_inputs):
+    """
+    Değişen girdilerden etkilenen aşamaları bulur.
+
+    Args:
+        changed_inputs (iterable): Değeri değişen girdi adları
+
+    Returns:
+        list: Yeniden hesaplanması gereken aşamalar (hesaplama sırasıyla)
+    """
+    changed_inputs = set(changed_inputs)
+    dirty = []
+    for name, inputs, dependencies in STAGES:
+        if changed_inputs.intersection(inputs) or any(stage in dirty for stage in dependencies):
+            dirty.append(name)
+    return dirty
+
+
+class ProtocolHandle:
+    """Artımlı optimizasyonda bir protokolün girdilerini ve aşama sonuçlarını tutan tanıtıcı."""
+
+    def __init__(self, handle_id, inputs, stages, recomputed):
+        """
+        ProtocolHandle sınıfı için başlatıcı.
+
+        Args:
+            handle_id (str): Tanıtıcı kimliği
+            inputs (dict): Protokolün tüm girdileri
+            stages (dict): Aşama adı -> aşama sonucu
+            recomputed (list): Bu protokol için yeniden hesaplanan aşamalar
+        """
+        self.id = handle_id
+        self.inputs = inputs
+        self.stages = stages
+        self.recomputed = recomputed
+
+    @property
+    def protocol(self):
+        """Protokolün bir kopyasını döndürür."""
+        return copy.deepcopy(self.stages["protocol"])
+
+
+class IncrementalOptimizer:
+    """Protokolleri aşama bağımlılıklarına göre artımlı olarak yeniden optimize eden sınıf."""
+
+    def __init__(self, optimizer, max_handles=DEFAULT_MAX_HANDLES):
+        """
+        IncrementalOptimizer sınıfı için başlatıcı.
+
+        Args:
+            optimizer (PCROptimizer): Aşamaları hesaplayan optimizasyon nesnesi
+            max_handles (int): Bellekte tutulacak en fazla tanıtıcı sayısı (LRU)
+        """
+        self.optimizer = optimizer
+        self.handles = LRUCache(max_handles)
+
+    def create(self, **parameters):
+        """
+        Tüm aşamaları hesaplayarak yeni bir protokol tanıtıcısı oluşturur.
+
+        Args:
+            **parameters: create_complete_protocol argümanları
+
+        Returns:
+            ProtocolHandle: Yeni tanıtıcı
+        """
+        inputs = self._inputs(dict(PROTOCOL_INPUTS), parameters)
+        return self._evaluate(inputs, {}, [name for name, _, _ in STAGES])
+
+    def update(self, handle, **delta):
+        """
+        Önceki protokolden yalnızca değişen girdilerin etkilediği aşamaları yeniden hesaplar.
+
+        Args:
+            handle (ProtocolHandle or str): Önceki tanıtıcı veya kimliği
+            **delta: Değişen create_complete_protocol argümanları
+
+        Returns:
+            ProtocolHandle: Yeni tanıtıcı (önceki tanıtıcı değişmez)
+
+        Raises:
+            KeyError: Tanıtıcı bulunamazsa (ör. LRU'dan çıkarılmışsa)
+        """
+        previous = self.get(handle)
+        inputs = self._inputs(dict(previous.inputs), delta)
+        changed = [name for name in inputs if inputs[name] != previous.inputs[name]]
+        return self._evaluate(inputs, previous.stages, dirty_stages(changed))
+
+    def get(self, handle):
+        """
+        Kimliği verilen tanıtıcıyı döndürür.
+
+        Args:
+            handle (ProtocolHandle or str): Tanıtıcı veya kimliği
+
+        Returns:
+            ProtocolHandle: Tanıtıcı
+
+        Raises:
+            KeyError: Tanıtıcı bulunamazsa
+        """
+        if isinstance(handle, ProtocolHandle):
+            return handle
+        found = self.handles.get(handle)
+        if found is None:
+            raise KeyError(f"Protokol tanıtıcısı bulunamadı: {handle}")
+        return found
+
+    def _inputs(self, inputs, parameters):
+        """Girdileri doğrular ve önceki girdilerle birleştirir."""
+        unknown = set(parameters) - set(PROTOCOL_INPUTS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen protokol alanları: {', '.join(sorted(unknown))}")
+        if parameters.get("mode", "standard") not in PROTOCOL_MODES:
+            raise ValueError(
+                f"Bilinmeyen protokol modu: {parameters['mode']}. "
+                f"Geçerli modlar: {', '.join(PROTOCOL_MODES)}"
+            )
+        inputs.update(parameters)
+        return inputs
+
+    def _evaluate(self, inputs, previous_stages, dirty):
+        """Kirli aşamaları sırayla hesaplar, diğerlerini önceki sonuçlardan alır."""
+        stages = dict(previous_stages)
+        for name in dirty:
+            stages[name] = getattr(self, f"_stage_{name}")(inputs, stages)
+
+        handle = ProtocolHandle(uuid.uuid4().hex, inputs, stages, list(dirty))
+        self.handles.put(handle.id, handle)
+        return handle
+
+    # Aşama fonksiyonları: create_complete_protocol'ün kullandığı PCROptimizer aşama metotları
+
+    def _stage_sequence(self, inputs, stages):
+        """Şablon dizisinin profilini oluşturur."""
+        return self.optimizer.profile_sequence(inputs["sequence"])
+
+    def _stage_forward(self, inputs, stages):
+        """İleri primerin profilini oluşturur."""
+        return self.optimizer.profile_sequence(inputs["forward_primer"])
+
+    def _stage_reverse(self, inputs, stages):
+        """Geri primerin profilini oluşturur."""
+        return self.optimizer.profile_sequence(inputs["reverse_primer"])
+
+    def _stage_gc(self, inputs, stages):
+        """GC içeriğini, karar GC değerini ve yerel GC değerini hesaplar."""
+        return self.optimizer.resolve_gc_content(stages["sequence"], inputs["gc_content"])
+
+    def _stage_temperatures(self, inputs, stages):
+        """Sıcaklıkları optimize eder."""
+        return self.optimizer.optimize_temperatures(stages["forward"], stages["reverse"], stages["gc"][1])
+
+    def _stage_primer_checks(self, inputs, stages):
+        """Firkete ve dimer uyarılarını ve 3' uç dimer riskini hesaplar."""
+        return self.optimizer.check_primers(stages["forward"], stages["reverse"])
+
+    def _stage_annealing(self, inputs, stages):
+        """3' uç dimer riskinde bağlanma sıcaklığını ayarlar."""
+        return self.optimizer.adjust_annealing_for_dimers(stages["temperatures"], stages["primer_checks"][1])
+
+    def _stage_amplicon(self, inputs, stages):
+        """Primerlerin şablondaki ürününü bulur."""
+        return self.optimizer.locate_amplicon(stages["sequence"], stages["forward"], stages["reverse"])
+
+    def _stage_times(self, inputs, stages):
+        """Süreleri şablon uzunluğuna veya ürün boyutuna göre optimize eder."""
+        return self.optimizer.optimize_protocol_times(
+            inputs["template_length"], stages["amplicon"], stages["gc"][1]
+        )
+
+    def _stage_cycles(self, inputs, stages):
+        """Döngü sayısını (ve kinetik model kullanılıyorsa çoğaltma eğrisini) hesaplar."""
+        return self.optimizer.optimize_cycles(
+            inputs["template_concentration"], inputs["target_yield"], inputs["is_diagnostic"]
+        )
+
+    def _stage_protocol(self, inputs, stages):
+        """Aşama sonuçlarından tam protokolü oluşturur."""
+        gc_content, _, local_gc_content = stages["gc"]
+        cycle_number, amplification = stages["cycles"]
+        protocol = self.optimizer.build_protocol(
+            stages["annealing"], stages["times"], cycle_number, mode=inputs["mode"],
+            forward_primer=stages["forward"], reverse_primer=stages["reverse"],
+            gc_content=gc_content, local_gc_content=local_gc_content, amplicon=stages["amplicon"],
+            amplification=amplification, warnings=stages["primer_checks"][0]
+        )
+        # Aşama sonuçları tanıtıcılar arasında paylaşıldığı için protokol kopyalanır
+        return copy.deepcopy(protocol)
@@ -2,23 +2,76 @@
 PCR koşullarını optimize eden modül.
 """
 
+import math
+import numpy as np
+
 from .calculator import PCRCalculator
+from .cycling import (
+    DEFAULT_GRADIENT_COLUMNS, DEFAULT_TOUCHDOWN_RANGE, DEFAULT_TOUCHDOWN_STEP, PROTOCOL_MODES,
+    gradient_layout, touchdown_stages
+)
+from .dimer import DIMER_RUN_WARNING, THREE_PRIME_RUN_WARNING, dimer_warnings
+from .iupac import is_degenerate
+from .kinetics import AmplificationModel
+from .rules import DEFAULT_PRESET, RuleSet
+from .protocol_batch import (
+    BATCH_FIELDS, ProtocolBatch, assemble_protocol, is_set, normalize_records, numeric_column
+)
+from .secondary_structure import HAIRPIN_DELTA_G_WARNING, hairpin_record, hairpin_warnings
+from .sequence_encoding import round_array
+from .sequence_profile import SequenceProfile
 
 
 class PCROptimizer:
     """PCR koşullarını optimize etmek için ana sınıf."""
     
-    def __init__(self):
-        """PCROptimizer sınıfı için başlatıcı."""
-        self.calculator = PCRCalculator()
+    def __init__(self, calculator=None, gc_statistic="mean", gc_window=100, rules=DEFAULT_PRESET,
+                 cycle_model="log2"):
+        """
+        PCROptimizer sınıfı için başlatıcı.
         
-        # Standart PCR sıcaklık değerleri
-        self.default_denaturation_temp = 95  # °C
-        self.default_denaturation_time = 30  # saniye
-        self.default_annealing_time = 30  # saniye
-        self.default_extension_temp = 72  # °C
-        self.default_final_extension_time = 300  # saniye (5 dakika)
-        self.default_initial_denaturation_time = 180  # saniye (3 dakika)
+        Args:
+            calculator (PCRCalculator, optional): Kullanılacak hesaplayıcı. Verilmezse
+                varsayılan (basit Tm modelli) bir PCRCalculator oluşturulur.
+            gc_statistic (str or float): Dizi verildiğinde eşik kararlarında
+                kullanılacak GC istatistiği: "mean" (küresel GC), "max" veya
+                0-100 arasında bir yüzdelik (yerel GC profilinden)
+            gc_window (int): Yerel GC profili için pencere uzunluğu (baz)
+            rules (str, dict or RuleSet): Varsayılan değerler ve eşik kuralları
+                için ön ayar adı (ör. "taq", "high_fidelity"), kural tablosu
+                veya derlenmiş RuleSet
+            cycle_model (str or AmplificationModel): Konsantrasyon ve hedef verim
+                verildiğinde döngü sayısının seçimi: "log2" (tam ikiye katlanma,
+                calculate_cycle_number), "kinetic" (varsayılan parametreli
+                AmplificationModel) veya yapılandırılmış bir AmplificationModel
+        """
+        self.calculator = calculator if calculator is not None else PCRCalculator()
+        
+        # Eşik kararları için GC istatistiği
+        self.gc_statistic = gc_statistic
+        self.gc_window = gc_window
+        
+        # Varsayılan sıcaklık/süre değerleri ve eşik kuralları
+        self.rules = RuleSet.of(rules)
+        
+        # Döngü sayısı için çoğaltma kinetiği modeli (None ise log2 kuralı)
+        if cycle_model == "log2":
+            self.amplification_model = None
+        elif cycle_model == "kinetic":
+            self.amplification_model = AmplificationModel()
+        elif isinstance(cycle_model, AmplificationModel):
+            self.amplification_model = cycle_model
+        else:
+            raise ValueError(
+                f"Bilinmeyen döngü modeli: {cycle_model}. Geçerli modeller: log2, kinetic"
+            )
+        
+        # 3' uç dimer riski olduğunda bağlanma sıcaklığına eklenecek değer (°C)
+        self.dimer_annealing_adjustment = 0
+        
+        # Touchdown modunda döngü başına sıcaklık düşüşü (°C) ve gradyan sütun sayısı
+        self.touchdown_step = DEFAULT_TOUCHDOWN_STEP
+        self.gradient_columns = DEFAULT_GRADIENT_COLUMNS
         
     def optimize_temperatures(self, forward_primer=None, reverse_primer=None, gc_content=None):
         """
@@ -32,27 +85,20 @@ class PCROptimizer:
         Returns:
             dict: Optimize edilmiş sıcaklık değerleri
         """
-        # Varsayılan değerlerle başla
+        # Varsayılan değerler ve GC eşik kuralları kural tablosundan gelir
+        values = self.rules.evaluate({"gc_content": gc_content})
         optimized_temps = {
-            "denaturation_temp": self.default_denaturation_temp,
-            "annealing_temp": 55,  # Varsayılan bağlanma sıcaklığı
-            "extension_temp": self.default_extension_temp
+            "denaturation_temp": values["denaturation_temp"],
+            "annealing_temp": values["annealing_temp"],
+            "extension_temp": values["extension_temp"]
         }
         
-        # Primer dizileri verilmişse, bağlanma sıcaklığını hesapla
+        # Primer dizileri verilmişse, hesaplayıcının Tm modeliyle bağlanma sıcaklığını hesapla
         if forward_primer and reverse_primer:
             optimized_temps["annealing_temp"] = self.calculator.calculate_annealing_temp(
                 forward_primer, reverse_primer
             )
         
-        # GC içeriği verilmişse, denatürasyon sıcaklığını ayarla
-        if gc_content:
-            # GC içeriği yüksekse, denatürasyon sıcaklığını artır
-            if gc_content > 65:
-                optimized_temps["denaturation_temp"] = 98
-            elif gc_content > 55:
-                optimized_temps["denaturation_temp"] = 97
-        
         return optimized_temps
     
     def optimize_times(self, template_length=None, gc_content=None):
@@ -66,29 +112,19 @@ class PCROptimizer:
         Returns:
             dict: Optimize edilmiş süre değerleri
         """
-        # Varsayılan değerlerle başla
+        # Varsayılan değerler, uzun şablon ve GC eşik kuralları kural tablosundan gelir
+        values = self.rules.evaluate({"template_length": template_length, "gc_content": gc_content})
         optimized_times = {
-            "initial_denaturation_time": self.default_initial_denaturation_time,
-            "denaturation_time": self.default_denaturation_time,
-            "annealing_time": self.default_annealing_time,
-            "extension_time": 60,  # Varsayılan uzama süresi (1 dakika)
-            "final_extension_time": self.default_final_extension_time
+            "initial_denaturation_time": values["initial_denaturation_time"],
+            "denaturation_time": values["denaturation_time"],
+            "annealing_time": values["annealing_time"],
+            "extension_time": values["extension_time"],
+            "final_extension_time": values["final_extension_time"]
         }
         
         # Şablon uzunluğu verilmişse, uzama süresini hesapla
         if template_length:
             optimized_times["extension_time"] = self.calculator.calculate_extension_time(template_length)
-            
-            # Uzun şablonlar için son uzama süresini uzat
-            if template_length > 3000:
-                optimized_times["final_extension_time"] = 600  # 10 dakika
-        
-        # GC içeriği verilmişse, denatürasyon süresini ayarla
-        if gc_content:
-            # GC içeriği yüksekse, denatürasyon süresini uzat
-            if gc_content > 65:
-                optimized_times["initial_denaturation_time"] = 300  # 5 dakika
-                optimized_times["denaturation_time"] = 45  # 45 saniye
         
         return optimized_times
     
@@ -104,76 +140,632 @@ class PCROptimizer:
         Returns:
             int: Optimize edilmiş döngü sayısı
         """
-        # Varsayılan döngü sayısı
-        default_cycles = 25 if not is_diagnostic else 40
-        
         # Şablon konsantrasyonu ve hedef verim verilmişse, döngü sayısını hesapla
         if template_concentration and target_yield:
+            if self.amplification_model is not None:
+                return self.simulate_amplification(template_concentration, target_yield)[0]
             return self.calculator.calculate_cycle_number(template_concentration, target_yield)
         
-        return default_cycles
+        # Varsayılan döngü sayısı (tanısal PCR kuralı kural tablosundadır)
+        return self.rules.evaluate({"is_diagnostic": is_diagnostic})["cycle_count"]
+    
+    def simulate_amplification(self, template_concentration, target_yield):
+        """
+        Çoğaltma kinetiği modeliyle döngü sayısını seçer ve eğriyi döndürür.
+        
+        Args:
+            template_concentration (float): Şablon DNA konsantrasyonu (ng/μL)
+            target_yield (float): Hedeflenen ürün miktarı (ng/μL)
+            
+        Returns:
+            tuple: (döngü sayısı, AmplificationModel.curve_record sonucu)
+        """
+        model = self.amplification_model or AmplificationModel()
+        cycles, reached, curves = model.cycle_numbers([template_concentration], [target_yield])
+        return int(cycles[0]), model.curve_record(curves[:, 0], target_yield, reached[0])
+    
+    def explain_rules(self, template_length=None, gc_content=None, is_diagnostic=False):
+        """
+        Verilen kayıt için kural tablosunda tetiklenen kuralları listeler.
+        
+        Args:
+            template_length (int, optional): Hedef DNA'nın (veya PCR ürününün)
+                baz çifti uzunluğu
+            gc_content (float, optional): Eşik kararlarında kullanılan GC içeriği
+            is_diagnostic (bool): Tanısal PCR ise True
+            
+        Returns:
+            list: RuleSet.explain sonucu (tetiklenen kurallar, uygulanma sırasıyla)
+        """
+        return self.rules.explain({
+            "template_length": template_length,
+            "gc_content": gc_content,
+            "is_diagnostic": is_diagnostic
+        })
+    
+    def check_primer_dimers(self, forward_primer, reverse_primer):
+        """
+        İleri ve geri primerler için self-dimer ve cross-dimer kontrolü yapar.
+        
+        Args:
+            forward_primer (str or SequenceProfile): İleri primer dizisi
+            reverse_primer (str or SequenceProfile): Geri primer dizisi
+            
+        Returns:
+            tuple: (uyarı mesajları listesi, 3' uç dimer riski var mı)
+        """
+        pairs = [
+            ("İleri primer self-dimer", forward_primer, forward_primer),
+            ("Geri primer self-dimer", reverse_primer, reverse_primer),
+            ("İleri/geri primer cross-dimer", forward_primer, reverse_primer)
+        ]
+        
+        warnings = []
+        three_prime_risk = False
+        for label, first, second in pairs:
+            scores = self.calculator.calculate_dimer(first, second)
+            warnings.extend(dimer_warnings(scores, label))
+            if scores["three_prime_run"] >= THREE_PRIME_RUN_WARNING:
+                three_prime_risk = True
+        
+        return warnings, three_prime_risk
+    
+    def check_primer_hairpins(self, forward_primer=None, reverse_primer=None):
+        """
+        Verilen primerlerin firkete (hairpin) yapılarını kontrol eder.
+        
+        Args:
+            forward_primer (str or SequenceProfile, optional): İleri primer dizisi
+            reverse_primer (str or SequenceProfile, optional): Geri primer dizisi
+            
+        Returns:
+            list: Uyarı mesajları
+        """
+        warnings = []
+        for label, primer in (("İleri primer", forward_primer), ("Geri primer", reverse_primer)):
+            if primer:
+                warnings.extend(hairpin_warnings(self.calculator.calculate_hairpin(primer), label))
+        return warnings
     
     def create_complete_protocol(self, template_length=None, forward_primer=None, 
                                 reverse_primer=None, template_concentration=None, 
-                                target_yield=None, sequence=None, is_diagnostic=False):
+                                target_yield=None, sequence=None, is_diagnostic=False,
+                                gc_content=None, mode="standard"):
         """
         Tam bir PCR protokolü oluşturur.
         
+        Diziler en başta birer SequenceProfile'a dönüştürülür; böylece her dizi
+        istek boyunca yalnızca bir kez taranır.
+        
         Args:
             template_length (int, optional): Hedef DNA'nın baz çifti uzunluğu
-            forward_primer (str, optional): İleri primer dizisi
-            reverse_primer (str, optional): Geri primer dizisi
+            forward_primer (str or SequenceProfile, optional): İleri primer dizisi
+            reverse_primer (str or SequenceProfile, optional): Geri primer dizisi
             template_concentration (float, optional): Şablon DNA konsantrasyonu (ng/μL)
             target_yield (float, optional): Hedeflenen ürün miktarı (ng/μL)
-            sequence (str, optional): Hedef DNA dizisi
+            sequence (str or SequenceProfile, optional): Hedef DNA dizisi. İki primer
+                de verilirse uzama süresi primerlerin bağlandığı ürünün boyutuna
+                göre hesaplanır.
             is_diagnostic (bool): Tanısal PCR ise True, klonlama için ise False
+            gc_content (float, optional): Önceden hesaplanmış GC içeriği yüzdesi.
+                Verilirse diziden yeniden hesaplanmaz.
+            mode (str): Protokol modu: "standard" (tek döngü bloğu), "touchdown"
+                (bağlanma sıcaklığı Tm üst sınırından adım adım düşürülen ek
+                aşama, "cycle_stages") veya "gradient" (12 sütunlu blok için
+                sütun başına bağlanma sıcaklıkları, "gradient")
             
         Returns:
             dict: Tam PCR protokolü
         """
-        # GC içeriğini hesapla (eğer dizi verilmişse)
-        gc_content = None
-        if sequence:
+        if mode not in PROTOCOL_MODES:
+            raise ValueError(
+                f"Bilinmeyen protokol modu: {mode}. Geçerli modlar: {', '.join(PROTOCOL_MODES)}"
+            )
+        
+        # Dizi profillerini bir kez oluştur
+        sequence = self.profile_sequence(sequence)
+        forward_primer = self.profile_sequence(forward_primer)
+        reverse_primer = self.profile_sequence(reverse_primer)
+        
+        gc_content, decision_gc, local_gc_content = self.resolve_gc_content(sequence, gc_content)
+        
+        # Sıcaklık optimizasyonu, firkete/dimer kontrolü ve 3' uç dimer ayarı
+        optimized_temps = self.optimize_temperatures(forward_primer, reverse_primer, decision_gc)
+        warnings, three_prime_risk = self.check_primers(forward_primer, reverse_primer)
+        optimized_temps = self.adjust_annealing_for_dimers(optimized_temps, three_prime_risk)
+        
+        amplicon = self.locate_amplicon(sequence, forward_primer, reverse_primer)
+        optimized_times = self.optimize_protocol_times(template_length, amplicon, decision_gc)
+        cycle_number, amplification = self.optimize_cycles(
+            template_concentration, target_yield, is_diagnostic
+        )
+        
+        return self.build_protocol(
+            optimized_temps, optimized_times, cycle_number, mode=mode,
+            forward_primer=forward_primer, reverse_primer=reverse_primer,
+            gc_content=gc_content, local_gc_content=local_gc_content, amplicon=amplicon,
+            amplification=amplification, warnings=warnings
+        )
+    
+    # create_complete_protocol aşamaları (IncrementalOptimizer da aynı metotları kullanır)
+    
+    def profile_sequence(self, sequence):
+        """
+        Diziyi bir kez taranan SequenceProfile'a dönüştürür.
+        
+        Args:
+            sequence (str or SequenceProfile, optional): Dizi
+            
+        Returns:
+            SequenceProfile or None: Profil; dizi boşsa olduğu gibi döndürülür
+        """
+        return SequenceProfile.of(sequence) if sequence else sequence
+    
+    def resolve_gc_content(self, sequence=None, gc_content=None):
+        """
+        Protokolün GC içeriğini ve eşik kararlarında kullanılan GC değerini belirler.
+        
+        Args:
+            sequence (SequenceProfile, optional): Hedef DNA dizisinin profili
+            gc_content (float, optional): Önceden hesaplanmış GC içeriği yüzdesi
+            
+        Returns:
+            tuple: (GC içeriği, karar GC değeri, protokole yazılacak yerel GC
+                değeri veya None)
+        """
+        # GC içeriğini hesapla (eğer verilmemişse ve dizi verilmişse)
+        if gc_content is None and sequence:
             gc_content = self.calculator.calculate_gc_content(sequence)
+        
+        # Eşik kararları için yerel GC istatistiğini kullan (yapılandırılmışsa)
+        if sequence and self.gc_statistic != "mean":
+            local_gc_content = self.calculator.calculate_local_gc(
+                sequence, self.gc_statistic, self.gc_window
+            )
+            return gc_content, local_gc_content, local_gc_content
+        return gc_content, gc_content, None
+    
+    def check_primers(self, forward_primer=None, reverse_primer=None):
+        """
+        Firkete ve primer dimer uyarılarını ve 3' uç dimer riskini hesaplar.
+        
+        Args:
+            forward_primer (SequenceProfile, optional): İleri primer profili
+            reverse_primer (SequenceProfile, optional): Geri primer profili
             
-        # Sıcaklık ve süre optimizasyonlarını yap
-        optimized_temps = self.optimize_temperatures(forward_primer, reverse_primer, gc_content)
-        optimized_times = self.optimize_times(template_length, gc_content)
-        cycle_number = self.optimize_cycle_number(template_concentration, target_yield, is_diagnostic)
-        
-        # Tam protokolü oluştur
-        protocol = {
-            "initial_denaturation": {
-                "temperature": optimized_temps["denaturation_temp"],
-                "time": optimized_times["initial_denaturation_time"]
-            },
-            "cycles": {
-                "count": cycle_number,
-                "denaturation": {
-                    "temperature": optimized_temps["denaturation_temp"],
-                    "time": optimized_times["denaturation_time"]
-                },
-                "annealing": {
-                    "temperature": optimized_temps["annealing_temp"],
-                    "time": optimized_times["annealing_time"]
-                },
-                "extension": {
-                    "temperature": optimized_temps["extension_temp"],
-                    "time": optimized_times["extension_time"]
-                }
-            },
-            "final_extension": {
-                "temperature": optimized_temps["extension_temp"],
-                "time": optimized_times["final_extension_time"]
-            },
-            "hold": {
-                "temperature": 4,
-                "time": "indefinite"
-            }
-        }
+        Returns:
+            tuple: (uyarı listesi, 3' uç dimer riski var mı)
+        """
+        warnings = self.check_primer_hairpins(forward_primer, reverse_primer)
+        three_prime_risk = False
+        if forward_primer and reverse_primer:
+            dimer_warning_list, three_prime_risk = self.check_primer_dimers(forward_primer, reverse_primer)
+            warnings.extend(dimer_warning_list)
+        return warnings, three_prime_risk
+    
+    def adjust_annealing_for_dimers(self, temperatures, three_prime_risk):
+        """
+        3' uç dimer riski varsa bağlanma sıcaklığını yükseltir (yapılandırılmışsa).
+        
+        Args:
+            temperatures (dict): optimize_temperatures sonucu (değiştirilmez)
+            three_prime_risk (bool): check_primers'ın bildirdiği 3' uç dimer riski
+            
+        Returns:
+            dict: Ayarlanmış sıcaklıklar
+        """
+        temperatures = dict(temperatures)
+        if three_prime_risk and self.dimer_annealing_adjustment:
+            temperatures["annealing_temp"] = round(
+                temperatures["annealing_temp"] + self.dimer_annealing_adjustment, 1
+            )
+        return temperatures
+    
+    def locate_amplicon(self, sequence=None, forward_primer=None, reverse_primer=None):
+        """
+        Primerlerin şablonda bağlandığı ürünü bulur.
+        
+        Args:
+            sequence (SequenceProfile, optional): Hedef DNA dizisinin profili
+            forward_primer (SequenceProfile, optional): İleri primer profili
+            reverse_primer (SequenceProfile, optional): Geri primer profili
+            
+        Returns:
+            dict or None: find_amplicon sonucu; dizi veya primerlerden biri yoksa None
+        """
+        if sequence and forward_primer and reverse_primer:
+            return self.calculator.find_amplicon(sequence, forward_primer, reverse_primer)
+        return None
+    
+    def optimize_protocol_times(self, template_length=None, amplicon=None, gc_content=None):
+        """
+        Protokol sürelerini optimize eder.
+        
+        Primerlerin şablondaki bağlanma yerleri biliniyorsa uzama süresi
+        şablonun tamamı yerine gerçek ürün boyutuna göre hesaplanır.
+        
+        Args:
+            template_length (int, optional): Hedef DNA'nın baz çifti uzunluğu
+            amplicon (dict, optional): locate_amplicon sonucu
+            gc_content (float, optional): Karar GC değeri
+            
+        Returns:
+            dict: optimize_times sonucu
+        """
+        if amplicon:
+            template_length = amplicon["size"]
+        return self.optimize_times(template_length, gc_content)
+    
+    def optimize_cycles(self, template_concentration=None, target_yield=None, is_diagnostic=False):
+        """
+        Döngü sayısını ve (kinetik model kullanılıyorsa) çoğaltma eğrisini hesaplar.
+        
+        Args:
+            template_concentration (float, optional): Şablon DNA konsantrasyonu (ng/μL)
+            target_yield (float, optional): Hedeflenen ürün miktarı (ng/μL)
+            is_diagnostic (bool): Tanısal PCR ise True
+            
+        Returns:
+            tuple: (döngü sayısı, çoğaltma bilgisi veya None)
+        """
+        if self.amplification_model is not None and template_concentration and target_yield:
+            return self.simulate_amplification(template_concentration, target_yield)
+        return self.optimize_cycle_number(template_concentration, target_yield, is_diagnostic), None
+    
+    def build_protocol(self, temperatures, times, cycle_number, mode="standard", forward_primer=None,
+                       reverse_primer=None, gc_content=None, local_gc_content=None, amplicon=None,
+                       amplification=None, warnings=None):
+        """
+        Aşama sonuçlarından tam protokolü oluşturur.
+        
+        Args:
+            temperatures (dict): Ayarlanmış sıcaklıklar
+            times (dict): Süreler
+            cycle_number (int): Döngü sayısı
+            mode (str): Protokol modu
+            forward_primer (SequenceProfile, optional): İleri primer profili (mod için)
+            reverse_primer (SequenceProfile, optional): Geri primer profili (mod için)
+            gc_content (float, optional): GC içeriği
+            local_gc_content (float, optional): Yerel GC değeri
+            amplicon (dict, optional): PCR ürünü
+            amplification (dict, optional): Çoğaltma bilgisi
+            warnings (list, optional): Uyarılar
+            
+        Returns:
+            dict: Tam PCR protokolü
+        """
+        protocol = assemble_protocol(temperatures, times, cycle_number)
+        if mode != "standard":
+            self.apply_mode(protocol, mode, forward_primer, reverse_primer)
         
         # Ekstra bilgileri ekle
         if gc_content:
             protocol["gc_content"] = gc_content
+        
+        if local_gc_content is not None:
+            protocol["local_gc_content"] = local_gc_content
+        
+        if amplicon:
+            protocol["amplicon"] = amplicon
+        
+        if amplification:
+            protocol["amplification"] = amplification
+        
+        if warnings:
+            protocol["warnings"] = list(warnings)
+            
+        return protocol
+    
+    def primer_tm_high(self, forward_primer=None, reverse_primer=None):
+        """
+        Verilen primerlerin en yüksek Tm üst sınırını döndürür.
+        
+        Args:
+            forward_primer (str or SequenceProfile, optional): İleri primer dizisi
+            reverse_primer (str or SequenceProfile, optional): Geri primer dizisi
+            
+        Returns:
+            float or None: Tm üst sınırı (°C); primer verilmemişse None
+        """
+        highs = [
+            self.calculator.calculate_tm_range(primer)[1]
+            for primer in (forward_primer, reverse_primer) if primer
+        ]
+        return max(highs) if highs else None
+    
+    def apply_mode(self, protocol, mode, forward_primer, reverse_primer):
+        """
+        Touchdown aşamalarını veya gradyan düzenini protokole ekler.
+        
+        Args:
+            protocol (dict): Standart protokol (yerinde güncellenir)
+            mode (str): "touchdown" veya "gradient"
+            forward_primer (SequenceProfile, optional): İleri primer profili
+            reverse_primer (SequenceProfile, optional): Geri primer profili
+        """
+        annealing_temp = protocol["cycles"]["annealing"]["temperature"]
+        tm_high = self.primer_tm_high(forward_primer, reverse_primer)
+        protocol["mode"] = mode
+        
+        if mode == "touchdown":
+            start_temp = tm_high if tm_high is not None else annealing_temp + DEFAULT_TOUCHDOWN_RANGE
+            protocol["cycle_stages"] = touchdown_stages(
+                protocol["cycles"], start_temp, self.touchdown_step
+            )
+        else:
+            protocol["gradient"] = gradient_layout(annealing_temp, tm_high, self.gradient_columns)
+    
+    def create_protocols_batch(self, records):
+        """
+        Çok sayıda reaksiyon için protokolleri sütun işlemleriyle oluşturur.
+        
+        Sıcaklık, süre ve döngü kuralları tüm satırlara NumPy dizileri
+        üzerinde uygulanır; Tm, firkete ve dimer hesapları hesaplayıcının
+        toplu metotlarıyla tek çağrıda yapılır. Sonuçlar create_complete_protocol
+        ile değer, tür ve anahtar bakımından birebir aynıdır. Şablon dizisi
+        (sequence) verilen satırlar yerel GC ve ürün boyutu, touchdown veya
+        gradyan modundaki satırlar ek aşamalar gerektirdiği için
+        create_complete_protocol ile tek tek hesaplanır.
+        
+        Args:
+            records (list or dict): create_complete_protocol argümanlarını içeren
+                sözlüklerin listesi veya alan adı -> değer dizisi eşlemesi
+                (template_length, forward_primer, reverse_primer,
+                template_concentration, target_yield, sequence, is_diagnostic,
+                gc_content, mode)
+            
+        Returns:
+            ProtocolBatch: Sütunlu sonuçlar; protokol sözlüklerine indeksleme
+                veya to_dicts() ile dönüştürülür
+            
+        Raises:
+            ValueError: Bilinmeyen alan veya protokol modu varsa
+        """
+        fields, n_rows = normalize_records(records)
+        modes = [mode or "standard" for mode in fields["mode"]]
+        invalid = sorted({str(mode) for mode in modes if mode not in PROTOCOL_MODES})
+        if invalid:
+            raise ValueError(
+                f"Bilinmeyen protokol modu: {', '.join(invalid)}. "
+                f"Geçerli modlar: {', '.join(PROTOCOL_MODES)}"
+            )
+        scalar_rows = [
+            i for i, (sequence, mode) in enumerate(zip(fields["sequence"], modes))
+            if is_set(sequence) or mode != "standard"
+        ]
+        batch_rows = np.ones(n_rows, dtype=bool)
+        batch_rows[scalar_rows] = False
+        
+        forward = [
+            str(primer) if is_set(primer) and batch_rows[i] else ""
+            for i, primer in enumerate(fields["forward_primer"])
+        ]
+        reverse = [
+            str(primer) if is_set(primer) and batch_rows[i] else ""
+            for i, primer in enumerate(fields["reverse_primer"])
+        ]
+        
+        gc_values = fields["gc_content"]
+        gc_content = np.array(
+            [float(value) if is_set(value) else np.nan for value in gc_values], dtype=np.float64
+        )
+        gc_integer = np.array(
+            [isinstance(value, int) and is_set(value) for value in gc_values], dtype=bool
+        )
+        
+        template_length = numeric_column(fields["template_length"])
+        is_diagnostic = np.array([is_set(value) for value in fields["is_diagnostic"]], dtype=bool)
+        
+        # Varsayılan değerler ve eşik kuralları: her kural tüm satırlara tek işlemle uygulanır
+        columns, integer_masks = self.rules.evaluate_batch({
+            "gc_content": gc_content,
+            "template_length": template_length,
+            "is_diagnostic": is_diagnostic
+        })
+        columns["gc_content"] = gc_content
+        integer_masks["gc_content"] = gc_integer
+        
+        # Hesaplanan bağlanma sıcaklıkları float olabileceği için sütun float64 tutulur
+        annealing_default = self.rules.defaults["annealing_temp"]
+        integer_masks.setdefault(
+            "annealing_temp", np.full(n_rows, isinstance(annealing_default, int))
+        )
+        columns["annealing_temp"] = columns["annealing_temp"].astype(np.float64)
+        self._batch_annealing(columns["annealing_temp"], integer_masks["annealing_temp"], forward, reverse)
+        warnings = self._batch_warnings(
+            columns["annealing_temp"], integer_masks["annealing_temp"], forward, reverse
+        )
+        
+        # Uzama süresi ve döngü sayısı hesaplanan satırlarda int'tir
+        computed = self._batch_extension_time(columns["extension_time"], template_length)
+        if "extension_time" in integer_masks:
+            integer_masks["extension_time"][computed] = True
+        template_concentration = numeric_column(fields["template_concentration"])
+        target_yield = numeric_column(fields["target_yield"])
+        computed = self._batch_cycles(columns["cycle_count"], template_concentration, target_yield)
+        if "cycle_count" in integer_masks:
+            integer_masks["cycle_count"][computed] = True
+        
+        amplification = None
+        if self.amplification_model is not None:
+            amplification = self._batch_amplification(
+                columns["cycle_count"], computed & batch_rows,
+                template_concentration, fields["target_yield"]
+            )
+        
+        batch = ProtocolBatch(columns, integer_masks, warnings, amplification=amplification)
+        for index in scalar_rows:
+            parameters = {field: fields[field][index] for field in BATCH_FIELDS}
+            parameters["mode"] = modes[index]
+            batch.set_row(index, self.create_complete_protocol(**parameters))
+        return batch
+    
+    def _batch_annealing(self, annealing_temp, integer, forward, reverse):
+        """
+        İki primeri de verilen satırların bağlanma sıcaklığını yerinde hesaplar.
+        
+        Args:
+            annealing_temp (numpy.ndarray): Bağlanma sıcaklığı sütunu (float64)
+            integer (numpy.ndarray): Değeri int olan satırların maskesi (yerinde
+                güncellenir; skaler yolda kısa primerler için Wallace kuralı int
+                döndürür)
+            forward (list): İleri primerler (verilmeyenler için "")
+            reverse (list): Geri primerler (verilmeyenler için "")
+        """
+        pairs = [i for i in range(len(forward)) if forward[i] and reverse[i]]
+        
+        # Dejenere primerler Tm alt sınırını kullanır (varyant araması)
+        plain = []
+        for i in pairs:
+            if is_degenerate(forward[i]) or is_degenerate(reverse[i]):
+                value = self.calculator.calculate_annealing_temp(forward[i], reverse[i])
+                annealing_temp[i] = value
+                integer[i] = isinstance(value, int)
+            else:
+                plain.append(i)
+        if not plain:
+            return
+        
+        forward_primers = [forward[i] for i in plain]
+        reverse_primers = [reverse[i] for i in plain]
+        forward_tm = self.calculator.calculate_tm_batch(forward_primers)
+        reverse_tm = self.calculator.calculate_tm_batch(reverse_primers)
+        
+        basic = self.calculator.tm_model == "basic"
+        forward_integer = np.array([basic and len(p) < 14 for p in forward_primers], dtype=bool)
+        reverse_integer = np.array([basic and len(p) < 14 for p in reverse_primers], dtype=bool)
+        
+        # min() eşitlikte ilk değeri (ileri primer) seçer
+        forward_lowest = forward_tm <= reverse_tm
+        annealing_temp[plain] = round_array(np.where(forward_lowest, forward_tm, reverse_tm) - 5, 1)
+        integer[plain] = np.where(forward_lowest, forward_integer, reverse_integer)
+    
+    def _batch_warnings(self, annealing_temp, annealing_integer, forward, reverse):
+        """
+        Firkete ve dimer uyarılarını toplu hesaplar; 3' uç riskinde bağlanma sıcaklığını ayarlar.
+        
+        Args:
+            annealing_temp (numpy.ndarray): Bağlanma sıcaklığı sütunu (yerinde güncellenir)
+            annealing_integer (numpy.ndarray): Değeri int olan satırların maskesi
+            forward (list): İleri primerler (verilmeyenler için "")
+            reverse (list): Geri primerler (verilmeyenler için "")
             
-        return protocol 
\ No newline at end of file
+        Returns:
+            list: Her satır için uyarı mesajları
+        """
+        warnings = [[] for _ in forward]
+        
+        # Firketeler: önce tüm ileri, sonra tüm geri primerler
+        rows = [i for i, primer in enumerate(forward) if primer]
+        rows += [i for i, primer in enumerate(reverse) if primer]
+        n_forward = sum(1 for primer in forward if primer)
+        primers = [forward[i] for i in rows[:n_forward]] + [reverse[i] for i in rows[n_forward:]]
+        if primers:
+            hairpins = self.calculator.calculate_hairpin_batch(primers)
+            stable = round_array(hairpins["delta_g"], 2) <= HAIRPIN_DELTA_G_WARNING
+            for k in np.flatnonzero(stable).tolist():
+                label = "İleri primer" if k < n_forward else "Geri primer"
+                warnings[rows[k]].extend(hairpin_warnings(hairpin_record(hairpins, k), label))
+        
+        # Dimerler: ileri self, geri self ve cross-dimer
+        pairs = [i for i in range(len(forward)) if forward[i] and reverse[i]]
+        if not pairs:
+            return warnings
+        
+        forward_primers = [forward[i] for i in pairs]
+        reverse_primers = [reverse[i] for i in pairs]
+        scores = self.calculator.calculate_dimer_batch(
+            forward_primers + reverse_primers + forward_primers,
+            forward_primers + reverse_primers + reverse_primers
+        )
+        three_prime_run = scores["three_prime_run"].reshape(3, len(pairs))
+        max_run = scores["max_run"].reshape(3, len(pairs))
+        labels = ("İleri primer self-dimer", "Geri primer self-dimer", "İleri/geri primer cross-dimer")
+        
+        flagged = (three_prime_run >= THREE_PRIME_RUN_WARNING) | (max_run >= DIMER_RUN_WARNING)
+        for group, k in zip(*np.nonzero(flagged.T)):
+            warnings[pairs[group]].extend(dimer_warnings(
+                {"max_run": int(max_run[k, group]), "three_prime_run": int(three_prime_run[k, group])},
+                labels[k]
+            ))
+        
+        # 3' uç dimer riski varsa bağlanma sıcaklığını yükselt (yapılandırılmışsa)
+        if self.dimer_annealing_adjustment:
+            risk = np.array(pairs)[(three_prime_run >= THREE_PRIME_RUN_WARNING).any(axis=0)]
+            annealing_temp[risk] = round_array(
+                annealing_temp[risk] + self.dimer_annealing_adjustment, 1
+            )
+            if not isinstance(self.dimer_annealing_adjustment, int):
+                annealing_integer[risk] = False
+        return warnings
+    
+    def _batch_extension_time(self, extension_time, template_length):
+        """
+        Şablon uzunluğu verilen satırların uzama süresini yerinde hesaplar.
+        
+        Args:
+            extension_time (numpy.ndarray): Uzama süresi sütunu
+            template_length (numpy.ndarray): Şablon uzunlukları (verilmeyenler 0)
+            
+        Returns:
+            numpy.ndarray: Uzama süresi hesaplanan satırların maskesi
+        """
+        given = template_length != 0
+        
+        # calculate_extension_time ile aynı: ceil(max(30, uzunluk / hız) * 1.2)
+        extension_time[given] = np.ceil(
+            np.maximum(30, template_length[given] / self.calculator.polymerase_speed) * 1.2
+        )
+        return given
+    
+    def _batch_cycles(self, cycles, template_concentration, target_yield):
+        """
+        Konsantrasyon ve hedef verim verilen satırların döngü sayısını yerinde hesaplar.
+        
+        Args:
+            cycles (numpy.ndarray): Döngü sayısı sütunu (kural tablosu varsayılanları)
+            template_concentration (numpy.ndarray): Şablon konsantrasyonları
+            target_yield (numpy.ndarray): Hedef verimler
+            
+        Returns:
+            numpy.ndarray: calculate_cycle_number kuralının uygulandığı satırların maskesi
+        """
+        given = (template_concentration != 0) & (target_yield != 0)
+        positive = given & (template_concentration > 0) & (target_yield > 0)
+        cycles[given & ~positive] = 30
+        
+        if positive.any():
+            ratio = target_yield[positive] / template_concentration[positive]
+            doublings = np.log2(ratio)
+            # Tam sayıya çok yakın değerler math.log2 ile yeniden hesaplanır
+            # (numpy.log2 son basamakta farklı yuvarlanabilir)
+            boundary = np.abs(doublings - np.round(doublings)) < 1e-9
+            if boundary.any():
+                doublings[boundary] = [math.log2(value) for value in ratio[boundary].tolist()]
+            cycles[positive] = np.clip(np.ceil(doublings), 15, 40)
+        return given
+    
+    def _batch_amplification(self, cycles, rows, template_concentration, target_yield):
+        """
+        Seçilen satırları tek kinetik simülasyonla çözüp döngü sayısını yerinde günceller.
+        
+        Args:
+            cycles (numpy.ndarray): Döngü sayısı sütunu
+            rows (numpy.ndarray): Konsantrasyon ve hedef verim verilen satırların maskesi
+            template_concentration (numpy.ndarray): Şablon konsantrasyonları
+            target_yield (list): Hedef verimler (girdideki değerler)
+            
+        Returns:
+            dict: Satır indeksi -> çoğaltma eğrisi
+        """
+        indices = np.flatnonzero(rows).tolist()
+        if not indices:
+            return {}
+        
+        targets = [target_yield[i] for i in indices]
+        chosen, reached, curves = self.amplification_model.cycle_numbers(
+            template_concentration[indices], np.array(targets, dtype=np.float64)
+        )
+        cycles[indices] = chosen
+        records = self.amplification_model.curve_records(curves, targets, reached)
+        return dict(zip(indices, records))
@@ -0,0 +1,327 @@
+"""
+DNA dizilerini baz başına 2 bit ile saklayan sıkıştırılmış dizi modülü.
+
+A, C, G ve T bazları 2 bitlik kodlarla her bayta dört baz olacak şekilde
+paketlenir. N ve diğer belirsiz bazlar ayrı bir seyrek maskede (konum ve
+karakter) tutulur. Uzun şablonlar için bellek kullanımı str'ye göre yaklaşık
+dört kat azalır.
+"""
+
+import hashlib
+import numpy as np
+
+from .sequence_encoding import BASE_OTHER, encode_sequence
+
+
+# Belirsiz bazların (IUPAC) tümleyenleri
+_AMBIGUOUS_COMPLEMENT = np.arange(256, dtype=np.uint8)
+for _char, _complement in zip("RYSWKMBDHVN", "YRSWMKVHDBN"):
+    _AMBIGUOUS_COMPLEMENT[ord(_char)] = ord(_complement)
+
+# Kod -> karakter dönüşümü
+_CODE_TO_BYTE = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+# Bayt içindeki 4 bazın bit kaydırmaları
+_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+
+# Her bayt değeri için 2 bitlik kodların sayımı (256 x 4)
+_BYTE_CODE_COUNTS = np.zeros((256, 4), dtype=np.int64)
+for _byte in range(256):
+    for _shift in _SHIFTS:
+        _BYTE_CODE_COUNTS[_byte, (_byte >> _shift) & 3] += 1
+
+
+def _pack_codes(codes):
+    """
+    0-3 aralığındaki baz kodlarını bayt başına dört baz olacak şekilde paketler.
+
+    Args:
+        codes (numpy.ndarray): uint8 baz kodları (0-3)
+
+    Returns:
+        numpy.ndarray: Paketlenmiş uint8 dizisi
+    """
+    padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+    padded[:len(codes)] = codes
+    quads = padded.reshape(-1, 4)
+    return quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+
+
+class PackedSequence:
+    """2 bit/baz ile paketlenmiş, değiştirilemez DNA dizisi."""
+
+    def __init__(self, sequence):
+        """
+        PackedSequence sınıfı için başlatıcı.
+
+        Args:
+            sequence (str): DNA dizisi (büyük/küçük harf duyarsız). A, C, G, T
+                dışındaki karakterler belirsiz baz olarak maskede saklanır.
+        """
+        raw = np.frombuffer(sequence.upper().encode("ascii", "replace"), dtype=np.uint8)
+        codes = encode_sequence(sequence)
+
+        mask_positions = np.flatnonzero(codes == BASE_OTHER)
+        codes = codes.copy()
+        codes[mask_positions] = 0
+
+        self._set_state(_pack_codes(codes), len(codes), mask_positions, raw[mask_positions])
+
+    @classmethod
+    def from_codes(cls, codes, mask_positions=None, mask_chars=None):
+        """
+        Baz kodlarından PackedSequence oluşturur.
+
+        Args:
+            codes (numpy.ndarray): Baz kodları (A=0, C=1, G=2, T=3, diğer=4)
+            mask_positions (numpy.ndarray, optional): Belirsiz baz konumları
+            mask_chars (numpy.ndarray, optional): Belirsiz bazların ASCII kodları;
+                verilmezse kodu 4 olan konumlar N kabul edilir
+
+        Returns:
+            PackedSequence: Yeni paketlenmiş dizi
+        """
+        codes = np.asarray(codes, dtype=np.uint8)
+        if mask_positions is None:
+            mask_positions = np.flatnonzero(codes == BASE_OTHER)
+            mask_chars = np.full(len(mask_positions), ord("N"), dtype=np.uint8)
+        if len(mask_positions):
+            codes = codes.copy()
+            codes[mask_positions] = 0
+
+        packed = cls.__new__(cls)
+        packed._set_state(
+            _pack_codes(codes),
+            len(codes),
+            np.asarray(mask_positions, dtype=np.int64),
+            np.asarray(mask_chars, dtype=np.uint8)
+        )
+        return packed
+
+    def _set_state(self, packed, length, mask_positions, mask_chars):
+        """İç durumu ayarlar (yalnızca oluşturma sırasında kullanılır)."""
+        self._packed = packed
+        self._length = length
+        self._mask_positions = mask_positions
+        self._mask_chars = mask_chars
+
+    def __len__(self):
+        """Baz sayısını döndürür."""
+        return self._length
+
+    def __str__(self):
+        """Diziyi büyük harfli str olarak çözer."""
+        return self.to_string()
+
+    def __repr__(self):
+        """Dizinin kısa gösterimini döndürür."""
+        preview = self[:20].to_string()
+        suffix = "..." if self._length > 20 else ""
+        return f"PackedSequence('{preview}{suffix}', length={self._length})"
+
+    def __eq__(self, other):
+        """İki paketlenmiş dizinin aynı olup olmadığını döndürür."""
+        if not isinstance(other, PackedSequence):
+            return NotImplemented
+        return (
+            self._length == other._length
+            and np.array_equal(self._packed, other._packed)
+            and np.array_equal(self._mask_positions, other._mask_positions)
+            and np.array_equal(self._mask_chars, other._mask_chars)
+        )
+
+    def __hash__(self):
+        """Dizinin özetine dayalı hash değeri."""
+        return hash(self.digest())
+
+    @property
+    def nbytes(self):
+        """Dizinin bellekte kapladığı yaklaşık bayt sayısı."""
+        return self._packed.nbytes + self._mask_positions.nbytes + self._mask_chars.nbytes
+
+    def digest(self):
+        """
+        Dizinin içeriğine göre SHA-1 özetini döndürür (önbellek anahtarı için).
+
+        Returns:
+            str: Onaltılık özet
+        """
+        hasher = hashlib.sha1()
+        hasher.update(self._length.to_bytes(8, "little"))
+        hasher.update(self._packed.tobytes())
+        hasher.update(self._mask_positions.tobytes())
+        hasher.update(self._mask_chars.tobytes())
+        return hasher.hexdigest()
+
+    def codes(self, start=0, stop=None):
+        """
+        Belirtilen aralıktaki baz kodlarını str'ye çözmeden döndürür.
+
+        Args:
+            start (int): Başlangıç konumu (dahil)
+            stop (int, optional): Bitiş konumu (hariç)
+
+        Returns:
+            numpy.ndarray: uint8 baz kodları (A=0, C=1, G=2, T=3, belirsiz=4)
+        """
+        stop = self._length if stop is None else min(stop, self._length)
+        start = max(0, min(start, stop))
+
+        first_byte = start // 4
+        last_byte = -(-stop // 4)
+        unpacked = (self._packed[first_byte:last_byte, None] >> _SHIFTS) & 3
+        codes = unpacked.ravel()[start - first_byte * 4:stop - first_byte * 4]
+
+        masked = self._mask_range(start, stop)
+        if masked.stop > masked.start:
+            codes[self._mask_positions[masked] - start] = BASE_OTHER
+        return codes
+
+    def _mask_range(self, start, stop):
+        """Maskede [start, stop) aralığına düşen kayıtların dilimini döndürür."""
+        low = np.searchsorted(self._mask_positions, start, side="left")
+        high = np.searchsorted(self._mask_positions, stop, side="left")
+        return slice(int(low), int(high))
+
+    def __getitem__(self, index):
+        """
+        Tek bir bazı (str) veya bir alt diziyi (PackedSequence) döndürür.
+
+        Args:
+            index (int or slice): Konum veya dilim
+
+        Returns:
+            str or PackedSequence: Baz karakteri veya alt dizi
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step == 1:
+                return self._slice(start, max(start, stop))
+            positions = np.arange(start, stop, step)
+            return self._take(positions)
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Dizi konumu aralık dışında.")
+
+        masked = self._mask_range(index, index + 1)
+        if masked.stop > masked.start:
+            return chr(self._mask_chars[masked.start])
+        return "ACGT"[(self._packed[index // 4] >> (2 * (index % 4))) & 3]
+
+    def _slice(self, start, stop):
+        """Ardışık bir alt diziyi paketli olarak döndürür."""
+        masked = self._mask_range(start, stop)
+        mask_positions = self._mask_positions[masked] - start
+        mask_chars = self._mask_chars[masked]
+
+        sliced = PackedSequence.__new__(PackedSequence)
+        if start % 4 == 0:
+            # Bayt sınırında başlayan dilimler yeniden paketlenmeden kopyalanır
+            packed = self._packed[start // 4:-(-stop // 4)].copy()
+            tail = (stop - start) % 4
+            if tail and len(packed):
+                packed[-1] &= (1 << (2 * tail)) - 1
+        else:
+            codes = self.codes(start, stop)
+            codes[mask_positions] = 0
+            packed = _pack_codes(codes)
+        sliced._set_state(packed, stop - start, mask_positions, mask_chars)
+        return sliced
+
+    def _take(self, positions):
+        """Verilen konumlardaki bazlardan yeni bir dizi oluşturur."""
+        codes = self.codes()[positions]
+        char_lookup = dict(zip(self._mask_positions.tolist(), self._mask_chars.tolist()))
+        mask_index = np.flatnonzero(codes == BASE_OTHER)
+        mask_chars = np.array(
+            [char_lookup[int(positions[i])] for i in mask_index], dtype=np.uint8
+        )
+        return PackedSequence.from_codes(codes, mask_index, mask_chars)
+
+    def reverse_complement(self):
+        """
+        Dizinin ters tümleyenini str'ye çözmeden hesaplar.
+
+        Returns:
+            PackedSequence: Ters tümleyen dizi
+        """
+        codes = self.codes()[::-1]
+        complement = np.where(codes == BASE_OTHER, BASE_OTHER, 3 - codes).astype(np.uint8)
+        mask_positions = (self._length - 1 - self._mask_positions)[::-1]
+        mask_chars = _AMBIGUOUS_COMPLEMENT[self._mask_chars][::-1]
+        return PackedSequence.from_codes(complement, mask_positions, mask_chars)
+
+    def base_counts(self):
+        """
+        Baz sayımlarını paketli veriden bayt tablosuyla hesaplar.
+
+        Returns:
+            dict: "A", "C", "G", "T" ve belirsiz bazlar için "N" sayıları
+        """
+        counts = _BYTE_CODE_COUNTS[self._packed].sum(axis=0)
+
+        # Son baytın dolgusu ve maskelenmiş konumlar A (0) olarak paketlenmiştir
+        padding = len(self._packed) * 4 - self._length
+        n_masked = len(self._mask_positions)
+        counts[0] -= padding + n_masked
+
+        return {
+            "A": int(counts[0]),
+            "C": int(counts[1]),
+            "G": int(counts[2]),
+            "T": int(counts[3]),
+            "N": n_masked
+        }
+
+    def ambiguous_bases(self):
+        """
+        Dizide bulunan belirsiz baz karakterlerini döndürür.
+
+        Returns:
+            set: Maskede bulunan farklı karakterler (ör. {"N"})
+        """
+        return {chr(char) for char in np.unique(self._mask_chars)}
+
+    def kmers(self, k):
+        """
+        Her konumdan başlayan k-mer'leri 2k bitlik tamsayılar olarak döndürür.
+
+        Args:
+            k (int): k-mer uzunluğu (1-32)
+
+        Returns:
+            tuple: (k-mer değerleri uint64 dizisi, belirsiz baz içermeyenler için
+                geçerlilik maskesi)
+        """
+        if not 1 <= k <= 32:
+            raise ValueError("k-mer uzunluğu 1 ile 32 arasında olmalıdır.")
+
+        n_kmers = self._length - k + 1
+        if n_kmers <= 0:
+            return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=bool)
+
+        codes = self.codes()
+        values = np.zeros(n_kmers, dtype=np.uint64)
+        for offset in range(k):
+            window = codes[offset:offset + n_kmers]
+            values = (values << np.uint64(2)) | (window & 3).astype(np.uint64)
+
+        # Belirsiz baz içeren k-mer'leri işaretle
+        ambiguous = np.zeros(self._length + 1, dtype=np.int64)
+        np.cumsum(codes == BASE_OTHER, out=ambiguous[1:])
+        valid = (ambiguous[k:] - ambiguous[:n_kmers]) == 0
+
+        return values, valid
+
+    def to_string(self):
+        """
+        Diziyi büyük harfli str olarak çözer.
+
+        Returns:
+            str: DNA dizisi
+        """
+        raw = _CODE_TO_BYTE[self.codes() & 3]
+        raw[self._mask_positions] = self._mask_chars
+        return raw.tobytes().decode("ascii")
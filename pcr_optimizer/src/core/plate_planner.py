@@ -0,0 +1,248 @@
+"""
+Bir plakadaki reaksiyonları ortak termal programlara gruplayan modül.
+
+Bir termal döngüleyici bloğu tek bir program çalıştırdığı için, protokolleri
+bağlanma sıcaklığı ve uzama süresi bakımından tolerans içinde kalan
+reaksiyonlar aynı programda birleştirilir. Gruplama sıralamaya dayalıdır:
+tam eşleşmesi gereken alanlara (döngü sayısı, uzama sıcaklığı, mod) göre
+ayrılan reaksiyonlar bağlanma sıcaklığına göre sıralanır ve açgözlü bir
+tarama ile en az sayıda pencereye bölünür (tek boyutta en iyi çözüm); her
+pencere aynı şekilde uzama süresine göre bölünür. Böylece büyük bir toplu
+iş O(N log N) sürede planlanır.
+"""
+
+import copy
+import math
+
+import numpy as np
+
+from .protocol_batch import ProtocolBatch
+from .protocol_model import as_dict
+
+
+# Bir programdaki en yüksek ve en düşük bağlanma sıcaklığı arasındaki izin verilen fark (°C)
+DEFAULT_ANNEALING_TOLERANCE = 2.0
+
+# Bir programdaki en uzun ve en kısa uzama süresi arasındaki izin verilen fark (saniye)
+DEFAULT_EXTENSION_TOLERANCE = 30
+
+# Bir çalıştırmadaki (blok) kuyucuk sayısı
+DEFAULT_PLATE_SIZE = 96
+
+# Ortak programda en yüksek değeri alınan süre ve sıcaklıklar
+_MAX_FIELDS = (
+    ("initial_denaturation", "temperature"), ("initial_denaturation", "time"),
+    ("final_extension", "time")
+)
+_MAX_CYCLE_FIELDS = (("denaturation", "temperature"), ("denaturation", "time"), ("annealing", "time"))
+
+
+def _merge_cycle_block(block, members):
+    """
+    Döngü bloğunun uzama süresini ve _MAX_CYCLE_FIELDS alanlarını üyelerin en yüksek değerine çeker.
+
+    Args:
+        block (dict): Ortak programın döngü bloğu (yerinde güncellenir)
+        members (list): Gruptaki protokollerin karşılık gelen döngü blokları
+    """
+    block["extension"]["time"] = max(member["extension"]["time"] for member in members)
+    for step, field in _MAX_CYCLE_FIELDS:
+        block[step][field] = max(member[step][field] for member in members)
+
+
+def _greedy_windows(values, tolerance):
+    """
+    Sıralı değerleri genişliği tolerance'ı aşmayan en az sayıda pencereye böler.
+
+    Args:
+        values (numpy.ndarray): Artan sırada değerler
+        tolerance (float): Bir penceredeki en büyük ve en küçük değer farkı
+
+    Returns:
+        list: Pencere başlangıç indeksleri
+    """
+    starts = []
+    limit = -math.inf
+    # Kayan nokta farkları (ör. 56.1 - 54.1) sınırı aşmasın diye küçük pay eklenir
+    for index, value in enumerate(values.tolist()):
+        if value > limit:
+            starts.append(index)
+            limit = value + tolerance + 1e-9
+    return starts
+
+
+class PlatePlanner:
+    """Reaksiyonları ortak termal programlara gruplayan sınıf."""
+
+    def __init__(self, annealing_tolerance=DEFAULT_ANNEALING_TOLERANCE,
+                 extension_tolerance=DEFAULT_EXTENSION_TOLERANCE, plate_size=DEFAULT_PLATE_SIZE):
+        """
+        PlatePlanner sınıfı için başlatıcı.
+
+        Args:
+            annealing_tolerance (float): Aynı programdaki bağlanma sıcaklıkları
+                arasındaki en büyük fark (°C)
+            extension_tolerance (float): Aynı programdaki uzama süreleri
+                arasındaki en büyük fark (saniye)
+            plate_size (int): Bir çalıştırmadaki kuyucuk sayısı (ör. 96 veya 384)
+        """
+        if annealing_tolerance < 0 or extension_tolerance < 0:
+            raise ValueError("Tolerans değerleri negatif olamaz.")
+        if plate_size < 1:
+            raise ValueError("Plaka boyutu en az 1 olmalıdır.")
+
+        self.annealing_tolerance = annealing_tolerance
+        self.extension_tolerance = extension_tolerance
+        self.plate_size = plate_size
+
+    def _columns(self, protocols):
+        """Gruplama için bağlanma, uzama ve tam eşleşme anahtarı sütunlarını çıkarır."""
+        if isinstance(protocols, ProtocolBatch):
+            annealing = protocols.column("annealing_temp").astype(np.float64)
+            extension = protocols.column("extension_time").astype(np.float64)
+            keys = list(zip(
+                protocols.column("cycle_count").tolist(),
+                protocols.column("extension_temp").tolist(),
+                ["standard"] * len(protocols),
+                [()] * len(protocols)
+            ))
+            for index, protocol in protocols.protocols.items():
+                keys[index] = self._hard_key(protocol)
+            return annealing, extension, keys
+
+        annealing = np.array(
+            [protocol["cycles"]["annealing"]["temperature"] for protocol in protocols], dtype=np.float64
+        )
+        extension = np.array(
+            [protocol["cycles"]["extension"]["time"] for protocol in protocols], dtype=np.float64
+        )
+        return annealing, extension, [self._hard_key(protocol) for protocol in protocols]
+
+    def _hard_key(self, protocol):
+        """
+        Aynı programı paylaşmak için tam eşleşmesi gereken değerleri döndürür.
+
+        Touchdown aşamaları ve gradyan sütunları da anahtara eklenir; bu
+        protokoller yalnızca aynı ön aşamaları veya gradyanı paylaşanlarla
+        birleştirilir.
+        """
+        cycles = protocol["cycles"]
+        extra = ()
+        if "cycle_stages" in protocol:
+            extra = tuple(
+                (stage["count"], stage["annealing"]["temperature"], stage["annealing"].get("step"))
+                for stage in protocol["cycle_stages"][:-1]
+            )
+        elif "gradient" in protocol:
+            extra = tuple(protocol["gradient"]["temperatures"])
+        return (
+            cycles["count"], cycles["extension"]["temperature"], protocol.get("mode", "standard"), extra
+        )
+
+    def group(self, protocols):
+        """
+        Reaksiyonları ortak programlara atar.
+
+        Args:
+            protocols (list or ProtocolBatch): create_complete_protocol sonuçları
+                veya create_protocols_batch sonucu
+
+        Returns:
+            list: Her program için reaksiyon indeksleri (numpy.ndarray), bağlanma
+                sıcaklığına göre sıralı
+        """
+        annealing, extension, keys = self._columns(protocols)
+        if not len(keys):
+            return []
+
+        # Tam eşleşme anahtarlarını tam sayı kodlarına çevir (sıralama için)
+        key_codes = {}
+        codes = np.array([key_codes.setdefault(key, len(key_codes)) for key in keys], dtype=np.int64)
+
+        order = np.lexsort((extension, annealing, codes))
+        sorted_codes = codes[order]
+        boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+        groups = []
+        for block in np.split(order, boundaries):
+            block_annealing = annealing[block]
+            starts = _greedy_windows(block_annealing, self.annealing_tolerance)
+            for window in np.split(block, starts[1:]):
+                window = window[np.argsort(extension[window], kind="stable")]
+                sub_starts = _greedy_windows(extension[window], self.extension_tolerance)
+                groups.extend(np.split(window, sub_starts[1:]))
+        return groups
+
+    def shared_program(self, protocols):
+        """
+        Bir gruptaki protokoller için ortak programı oluşturur.
+
+        Bağlanma sıcaklığı grubun orta noktasıdır (tüm reaksiyonlara en fazla
+        tolerans / 2 uzaklıkta); uzama süresi, denatürasyon sıcaklığı ve
+        süreler en yüksek değerdir (tüm ürünlerin tamamlanması için).
+        Touchdown ön aşamalarının süreleri de aynı şekilde en yüksek değere
+        çekilir; bağlanma sıcaklıkları gruplama anahtarı gereği zaten aynıdır.
+
+        Args:
+            protocols (list): Aynı gruba atanmış protokol sözlükleri
+
+        Returns:
+            dict: Ortak protokol
+        """
+        program = copy.deepcopy(as_dict(protocols[0]))
+        for key in ("gc_content", "local_gc_content", "amplicon", "amplification", "warnings"):
+            program.pop(key, None)
+
+        temperatures = [protocol["cycles"]["annealing"]["temperature"] for protocol in protocols]
+        program["cycles"]["annealing"]["temperature"] = round(
+            (min(temperatures) + max(temperatures)) / 2, 1
+        )
+        _merge_cycle_block(program["cycles"], [protocol["cycles"] for protocol in protocols])
+        for section, field in _MAX_FIELDS:
+            program[section][field] = max(protocol[section][field] for protocol in protocols)
+        if "cycle_stages" in program:
+            # Ön aşamalar (touchdown) her üyenin aynı sıradaki aşamasıyla birleştirilir
+            for number, stage in enumerate(program["cycle_stages"][:-1]):
+                _merge_cycle_block(stage, [protocol["cycle_stages"][number] for protocol in protocols])
+            program["cycle_stages"][-1] = dict(
+                copy.deepcopy(program["cycles"]), label=program["cycle_stages"][-1].get("label")
+            )
+        return program
+
+    def plan(self, protocols):
+        """
+        Plakanın programlarını ve çalıştırma sayısını planlar.
+
+        Args:
+            protocols (list or ProtocolBatch): create_complete_protocol sonuçları
+                veya create_protocols_batch sonucu
+
+        Returns:
+            dict: "programs" (her biri "program", "reactions", "annealing_range",
+                "extension_range" ve "runs" içeren sözlükler), "assignments"
+                (reaksiyon indeksi -> program indeksi), "program_count" ve
+                "run_count"
+        """
+        groups = self.group(protocols)
+        assignments = [0] * len(protocols)
+        programs = []
+        for number, members in enumerate(groups):
+            members = sorted(members.tolist())
+            group_protocols = [protocols[index] for index in members]
+            temperatures = [protocol["cycles"]["annealing"]["temperature"] for protocol in group_protocols]
+            times = [protocol["cycles"]["extension"]["time"] for protocol in group_protocols]
+            for index in members:
+                assignments[index] = number
+            programs.append({
+                "program": self.shared_program(group_protocols),
+                "reactions": members,
+                "annealing_range": (min(temperatures), max(temperatures)),
+                "extension_range": (min(times), max(times)),
+                "runs": math.ceil(len(members) / self.plate_size)
+            })
+
+        return {
+            "programs": programs,
+            "assignments": assignments,
+            "program_count": len(programs),
+            "run_count": sum(program["runs"] for program in programs)
+        }
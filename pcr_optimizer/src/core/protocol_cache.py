@@ -0,0 +1,344 @@
+"""
+Oluşturulan PCR protokollerini normalize edilmiş girdilere göre önbelleğe alan modül.
+
+Girdiler önce kanonik biçime getirilir (primer/dizi büyük harf ve boşluksuz,
+sayılar tek biçimde), ardından optimizasyon ayarlarıyla birlikte SHA-256
+özetine çevrilir. Sonuçlar bellekte LRU olarak, isteğe bağlı olarak da yeniden
+başlatmalardan sonra kullanılmak üzere diskte JSON dosyaları olarak tutulur.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from .cache import LRUCache
+from .kmer_index import template_digest
+from .packed_sequence import PackedSequence
+from .sequence_profile import SequenceProfile
+
+
+# Dizi olarak normalize edilen alanlar
+SEQUENCE_FIELDS = ("forward_primer", "reverse_primer", "sequence")
+
+# Sayı olarak normalize edilen alanlar
+NUMERIC_FIELDS = ("template_length", "template_concentration", "target_yield", "gc_content")
+
+# Varsayılan bellek içi kayıt sayısı
+DEFAULT_MAXSIZE = 1024
+
+# Anahtar ve disk biçimi sürümü (biçim değişirse eski kayıtlar kullanılmaz)
+KEY_VERSION = 1
+
+
+def _canonical_number(value):
+    """Sayıyı tek biçime getirir: tam sayı değerli sayılar int, diğerleri float olur."""
+    if isinstance(value, str):
+        value = value.strip().replace(",", ".")
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def canonical_parameters(parameters):
+    """
+    create_complete_protocol argümanlarını kanonik biçime getirir.
+
+    Dizilerdeki boşluklar kaldırılıp büyük harfe çevrilir, sayılar tek biçime
+    getirilir ("55,0", "55" ve 55.0 aynı değeri verir) ve None ya da boş
+    değerler çıkarılır. Protokol bu kanonik argümanlarla oluşturulduğu için
+    girdinin biçimi sonucu etkilemez.
+
+    Args:
+        parameters (dict): create_complete_protocol argümanları
+
+    Returns:
+        dict: Kanonik argümanlar
+    """
+    canonical = {}
+    for name, value in parameters.items():
+        if isinstance(value, SequenceProfile):
+            value = value.sequence
+        if name in SEQUENCE_FIELDS and isinstance(value, str):
+            value = "".join(value.split()).upper()
+        if value is None or (isinstance(value, str) and not value):
+            continue
+
+        if name in NUMERIC_FIELDS:
+            value = _canonical_number(value)
+        elif name == "is_diagnostic":
+            value = bool(value)
+        canonical[name] = value
+    return canonical
+
+
+def optimizer_fingerprint(optimizer):
+    """
+    Protokol sonucunu etkileyen optimizasyon ayarlarını döndürür.
+
+    Disk önbelleği yeniden başlatmalardan sonra da kullanıldığı için ayarlar
+    (Tm modeli, polimeraz hızı, kural tablosu vb.) anahtara eklenir.
+
+    Args:
+        optimizer (PCROptimizer): Protokolleri oluşturan optimizasyon nesnesi
+
+    Returns:
+        dict: JSON'a dönüştürülebilir ayarlar
+    """
+    calculator = optimizer.calculator
+    return {
+        "tm_model": list(calculator.tm_model_key()),
+        "polymerase_speed": calculator.polymerase_speed,
+        "gc_statistic": optimizer.gc_statistic,
+        "gc_window": optimizer.gc_window,
+        "dimer_annealing_adjustment": optimizer.dimer_annealing_adjustment,
+        "touchdown_step": optimizer.touchdown_step,
+        "gradient_columns": optimizer.gradient_columns,
+        "rules": optimizer.rules.table,
+        "cycle_model": (
+            list(optimizer.amplification_model.parameters())
+            if optimizer.amplification_model is not None else None
+        )
+    }
+
+
+def protocol_key(parameters, context=None):
+    """
+    Kanonik argümanlar ve ayarlar için önbellek anahtarını hesaplar.
+
+    Diziler anahtara özetleri (SHA-1) olarak eklenir.
+
+    Args:
+        parameters (dict): canonical_parameters sonucu
+        context (dict, optional): Sonucu etkileyen ayarlar (optimizer_fingerprint)
+
+    Returns:
+        str: Onaltılık SHA-256 anahtarı
+    """
+    tokens = {}
+    for name, value in parameters.items():
+        if isinstance(value, PackedSequence):
+            tokens[name] = "packed:" + template_digest(value)
+        elif name in SEQUENCE_FIELDS:
+            tokens[name] = "sha1:" + template_digest(str(value))
+        else:
+            tokens[name] = value
+
+    payload = json.dumps(
+        {"version": KEY_VERSION, "parameters": tokens, "context": context},
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ProtocolCache:
+    """Bellek (LRU) ve isteğe bağlı disk katmanlı protokol önbelleği."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, ttl=None, directory=None, clock=time.time):
+        """
+        ProtocolCache sınıfı için başlatıcı.
+
+        Args:
+            maxsize (int): Bellekte tutulacak en fazla protokol sayısı
+            ttl (float, optional): Kayıtların geçerlilik süresi (saniye);
+                verilmezse kayıtlar süresizdir
+            directory (str, optional): Disk katmanı için klasör; verilmezse
+                yalnızca bellek kullanılır
+            clock (callable): Geçerli zamanı (saniye) döndüren fonksiyon
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Önbellek süresi (TTL) pozitif olmalıdır.")
+
+        self.memory = LRUCache(maxsize)
+        self.renders = LRUCache(maxsize)
+        self.ttl = ttl
+        self.directory = directory
+        self.clock = clock
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # İstatistik sayaçları
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    def _count(self, counter):
+        """Bir istatistik sayacını artırır."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _expired(self, created):
+        """Kaydın TTL süresini aşıp aşmadığını döndürür."""
+        return self.ttl is not None and self.clock() - created >= self.ttl
+
+    def _path(self, key):
+        """Anahtarın disk katmanındaki dosya yolunu döndürür."""
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _read_disk(self, key):
+        """Disk katmanından (oluşturulma zamanı, protokol) kaydını okur."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry["created"], entry["protocol"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Bozuk kayıt: ıska sayılır ve silinir
+            self._remove_disk(key)
+            return None
+
+    def _write_disk(self, key, created, protocol):
+        """Kaydı disk katmanına atomik olarak yazar."""
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+                json.dump({"created": created, "protocol": protocol}, f, ensure_ascii=False)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _remove_disk(self, key):
+        """Kaydı disk katmanından siler."""
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def get(self, key):
+        """
+        Anahtara karşılık gelen protokolü döndürür.
+
+        Önce bellek, sonra disk katmanına bakılır; diskte bulunan kayıt belleğe
+        alınır. Süresi dolmuş kayıtlar silinir ve ıska sayılır.
+
+        Args:
+            key (str): protocol_key ile hesaplanmış anahtar
+
+        Returns:
+            dict or None: Protokolün bir kopyası veya bulunamazsa None
+        """
+        entry = self.memory.get(key)
+        if entry is not None:
+            if not self._expired(entry[0]):
+                self._count("memory_hits")
+                return copy.deepcopy(entry[1])
+            self.memory.pop(key)
+            self._count("expirations")
+
+        if self.directory:
+            entry = self._read_disk(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self.memory.put(key, entry)
+                    self._count("disk_hits")
+                    return copy.deepcopy(entry[1])
+                self._remove_disk(key)
+                self._count("expirations")
+
+        self._count("misses")
+        return None
+
+    def put(self, key, protocol):
+        """
+        Protokolü önbelleğe (ve varsa disk katmanına) ekler.
+
+        Args:
+            key (str): protocol_key ile hesaplanmış anahtar
+            protocol (dict): Protokol
+        """
+        created = self.clock()
+        protocol = copy.deepcopy(protocol)
+        self.memory.put(key, (created, protocol))
+        if self.directory:
+            self._write_disk(key, created, protocol)
+
+    def get_or_compute(self, key, compute):
+        """
+        Protokolü önbellekten döndürür; yoksa oluşturup ekler.
+
+        Args:
+            key (str): protocol_key ile hesaplanmış anahtar
+            compute (callable): Protokolü oluşturan parametresiz fonksiyon
+
+        Returns:
+            dict: Protokol
+        """
+        protocol = self.get(key)
+        if protocol is None:
+            protocol = compute()
+            self.put(key, protocol)
+        return protocol
+
+    def get_or_render(self, key, format, render):
+        """
+        Protokolün belirtilen biçimdeki çıktısını önbellekten döndürür; yoksa oluşturur.
+
+        Çıktılar protokolün kendi anahtarıyla tutulur; protokol içeriğinin
+        özetini her çağrıda yeniden hesaplamak biçimlendirmenin kendisinden
+        pahalı olduğu için anahtar çağıran tarafından verilir.
+
+        Args:
+            key (str): protocol_key ile hesaplanmış protokol anahtarı
+            format (str): Çıktı biçimi (ör. "text", "csv")
+            render (callable): Çıktıyı oluşturan parametresiz fonksiyon
+
+        Returns:
+            str: Biçimlendirilmiş protokol
+        """
+        return self.renders.get_or_compute((key, format), render)
+
+    def clear(self, disk=False):
+        """
+        Bellek katmanını ve istatistikleri sıfırlar.
+
+        Args:
+            disk (bool): True ise disk katmanındaki kayıtlar da silinir
+        """
+        self.memory.clear()
+        self.renders.clear()
+        with self._lock:
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.expirations = 0
+
+        if disk and self.directory:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    self._remove_disk(name[:-len(".json")])
+
+    def stats(self):
+        """
+        Önbellek istatistiklerini döndürür.
+
+        Returns:
+            dict: Boyut, bellek/disk isabetleri, ıska, süresi dolan ve çıkarılan
+                kayıt sayıları, isabet oranı ve çıktı (render) önbelleği istatistikleri
+        """
+        memory = self.memory.stats()
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "size": memory["size"],
+                "maxsize": memory["maxsize"],
+                "ttl": self.ttl,
+                "disk": bool(self.directory),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "hits": hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": memory["evictions"],
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "renders": self.renders.stats()
+            }
@@ -0,0 +1,332 @@
+"""
+PCR optimizasyon kurallarını tablo olarak tanımlayan ve değerlendiren modül.
+
+Varsayılan değerler ve eşik kuralları (GC içeriği, şablon uzunluğu, tanısal
+PCR vb.) polimeraz/kit ön ayarları (preset) hâlinde tutulur. Bir tablo bir kez
+RuleSet olarak derlenir; hem tek bir kayıt için hem de her kural bir NumPy
+işlemi olacak şekilde toplu (sütunlu) olarak değerlendirilebilir.
+
+Kurallar tablodaki sırayla uygulanır; aynı çıktıyı belirleyen sonraki kural
+öncekini geçersiz kılar. Bir kural yalnızca ilgili alan verilmişse (None, 0
+veya NaN değilse) tetiklenir.
+"""
+
+import copy
+import math
+import operator
+import numpy as np
+
+
+# Kuralların koşul olarak kullanabileceği giriş alanları
+RULE_FIELDS = ("gc_content", "template_length", "is_diagnostic")
+
+# Kuralların belirleyebileceği çıktılar
+RULE_OUTPUTS = (
+    "denaturation_temp", "annealing_temp", "extension_temp",
+    "initial_denaturation_time", "denaturation_time", "annealing_time",
+    "extension_time", "final_extension_time", "cycle_count"
+)
+
+# Koşul işleçleri (skaler değerler ve NumPy dizileri için aynı fonksiyonlar)
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne
+}
+
+# Polimeraz/kit ön ayarları
+PRESETS = {
+    # Taq polimeraz (uygulamanın varsayılan davranışı)
+    "taq": {
+        "defaults": {
+            "denaturation_temp": 95,
+            "annealing_temp": 55,
+            "extension_temp": 72,
+            "initial_denaturation_time": 180,
+            "denaturation_time": 30,
+            "annealing_time": 30,
+            "extension_time": 60,
+            "final_extension_time": 300,
+            "cycle_count": 25
+        },
+        "rules": [
+            {
+                "name": "gc_yuksek_denaturasyon",
+                "when": ("gc_content", ">", 55),
+                "set": {"denaturation_temp": 97}
+            },
+            {
+                "name": "gc_cok_yuksek_denaturasyon",
+                "when": ("gc_content", ">", 65),
+                "set": {
+                    "denaturation_temp": 98,
+                    "initial_denaturation_time": 300,
+                    "denaturation_time": 45
+                }
+            },
+            {
+                "name": "uzun_sablon_son_uzama",
+                "when": ("template_length", ">", 3000),
+                "set": {"final_extension_time": 600}
+            },
+            {
+                "name": "tanisal_dongu",
+                "when": ("is_diagnostic", "==", True),
+                "set": {"cycle_count": 40}
+            }
+        ]
+    },
+    # Yüksek doğruluklu (proofreading) polimerazlar: daha yüksek ve kısa denatürasyon
+    "high_fidelity": {
+        "defaults": {
+            "denaturation_temp": 98,
+            "annealing_temp": 55,
+            "extension_temp": 72,
+            "initial_denaturation_time": 30,
+            "denaturation_time": 10,
+            "annealing_time": 20,
+            "extension_time": 30,
+            "final_extension_time": 300,
+            "cycle_count": 30
+        },
+        "rules": [
+            {
+                "name": "gc_cok_yuksek_denaturasyon",
+                "when": ("gc_content", ">", 65),
+                "set": {"initial_denaturation_time": 180, "denaturation_time": 20}
+            },
+            {
+                "name": "uzun_sablon_son_uzama",
+                "when": ("template_length", ">", 6000),
+                "set": {"final_extension_time": 600}
+            },
+            {
+                "name": "tanisal_dongu",
+                "when": ("is_diagnostic", "==", True),
+                "set": {"cycle_count": 35}
+            }
+        ]
+    }
+}
+
+# Varsayılan ön ayar
+DEFAULT_PRESET = "taq"
+
+
+def _is_given(value):
+    """Kuralın değerlendirilmesi için alanın verilmiş olup olmadığını döndürür."""
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return bool(value)
+
+
+class RuleSet:
+    """Derlenmiş bir optimizasyon kuralı tablosu."""
+
+    def __init__(self, table, name=None):
+        """
+        RuleSet sınıfı için başlatıcı.
+
+        Tablo doğrulanır ve kurallar (ad, alan, işleç, eşik, atamalar)
+        demetlerine derlenir.
+
+        Args:
+            table (dict): "defaults" (her RULE_OUTPUTS çıktısı için varsayılan
+                değer) ve "rules" (sıralı kural listesi) içeren tablo. Her kural
+                "name", "when" ((alan, işleç, eşik)) ve "set" (çıktı -> değer)
+                anahtarlarını içerir.
+            name (str, optional): Tablonun adı (ör. ön ayar adı)
+
+        Raises:
+            ValueError: Tablo geçersizse
+        """
+        defaults = dict(table.get("defaults", {}))
+        missing = [output for output in RULE_OUTPUTS if output not in defaults]
+        if missing:
+            raise ValueError(f"Kural tablosunda varsayılan değer eksik: {', '.join(missing)}")
+
+        rules = []
+        for rule in table.get("rules", []):
+            field, symbol, threshold = rule["when"]
+            if field not in RULE_FIELDS:
+                raise ValueError(f"Bilinmeyen kural alanı: {field}")
+            if symbol not in OPERATORS:
+                raise ValueError(f"Bilinmeyen kural işleci: {symbol}")
+            unknown = [output for output in rule["set"] if output not in RULE_OUTPUTS]
+            if unknown:
+                raise ValueError(f"Bilinmeyen kural çıktısı: {', '.join(unknown)}")
+            rules.append((
+                rule["name"], field, symbol, OPERATORS[symbol], threshold,
+                tuple(rule["set"].items())
+            ))
+
+        self.name = name
+        self.table = copy.deepcopy(table)
+        self.defaults = defaults
+        self.rules = tuple(rules)
+
+        # Hem int hem float değer alabilen çıktılar (toplu sonuçta tür maskesi gerekir)
+        self.mixed_outputs = set()
+        for output in RULE_OUTPUTS:
+            values = [defaults[output]] + [
+                value for rule in self.rules for key, value in rule[5] if key == output
+            ]
+            if len({isinstance(value, int) for value in values}) > 1:
+                self.mixed_outputs.add(output)
+
+    @classmethod
+    def preset(cls, name=DEFAULT_PRESET):
+        """
+        Adı verilen ön ayarın derlenmiş kural tablosunu döndürür.
+
+        Args:
+            name (str): PRESETS içindeki ön ayar adı
+
+        Returns:
+            RuleSet: Derlenmiş kural tablosu
+        """
+        if name not in _COMPILED_PRESETS:
+            raise ValueError(
+                f"Bilinmeyen ön ayar: {name}. Geçerli ön ayarlar: {', '.join(PRESETS)}"
+            )
+        return _COMPILED_PRESETS[name]
+
+    @classmethod
+    def of(cls, rules):
+        """
+        Ön ayar adını, tabloyu veya hazır RuleSet'i RuleSet nesnesine dönüştürür.
+
+        Args:
+            rules (str, dict or RuleSet): Ön ayar adı, kural tablosu veya RuleSet
+
+        Returns:
+            RuleSet: Derlenmiş kural tablosu
+        """
+        if isinstance(rules, cls):
+            return rules
+        if isinstance(rules, str):
+            return cls.preset(rules)
+        return cls(rules)
+
+    def _fires(self, rule, record):
+        """Bir kuralın tek bir kayıt için tetiklenip tetiklenmediğini döndürür."""
+        value = record.get(rule[1])
+        if not _is_given(value):
+            return False
+        if isinstance(rule[4], bool):
+            # Bool eşikli koşullar (ör. is_diagnostic == True) doğruluk değeriyle
+            # karşılaştırılır; toplu yoldaki bool sütunla aynı sonucu verir
+            value = bool(value)
+        return bool(rule[3](value, rule[4]))
+
+    def evaluate(self, record):
+        """
+        Tek bir kayıt için tüm kuralları uygular.
+
+        Args:
+            record (dict): RULE_FIELDS alanlarını içeren kayıt (eksik alanlar
+                verilmemiş sayılır)
+
+        Returns:
+            dict: Her RULE_OUTPUTS çıktısı için değer
+        """
+        values = dict(self.defaults)
+        for rule in self.rules:
+            if self._fires(rule, record):
+                values.update(rule[5])
+        return values
+
+    def explain(self, record):
+        """
+        Bir kayıt için tetiklenen kuralları listeler.
+
+        Args:
+            record (dict): RULE_FIELDS alanlarını içeren kayıt
+
+        Returns:
+            list: Tetiklenen her kural için "name", "condition" (ör.
+                "gc_content > 65"), "value" (kayıttaki alan değeri) ve "set"
+                (atanan çıktılar) içeren sözlükler, uygulanma sırasıyla
+        """
+        fired = []
+        for rule in self.rules:
+            if self._fires(rule, record):
+                fired.append({
+                    "name": rule[0],
+                    "condition": f"{rule[1]} {rule[2]} {rule[4]}",
+                    "value": record.get(rule[1]),
+                    "set": dict(rule[5])
+                })
+        return fired
+
+    def fired_batch(self, columns):
+        """
+        Her kuralın her kayıt için tetiklenip tetiklenmediğini hesaplar.
+
+        Args:
+            columns (dict): RULE_FIELDS alanı -> N uzunluğunda sayısal dizi
+                (verilmemiş değerler 0 veya NaN; is_diagnostic için bool)
+
+        Returns:
+            numpy.ndarray: (kural sayısı, N) bool matris
+        """
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+        fired = np.zeros((len(self.rules), n_rows), dtype=bool)
+
+        prepared = {}
+        for field, values in columns.items():
+            values = np.asarray(values, dtype=np.float64)
+            given = ~np.isnan(values) & (values != 0)
+            prepared[field] = (values, given)
+
+        with np.errstate(invalid="ignore"):
+            for index, rule in enumerate(self.rules):
+                if rule[1] not in prepared:
+                    continue
+                values, given = prepared[rule[1]]
+                fired[index] = given & rule[3](values, rule[4])
+        return fired
+
+    def evaluate_batch(self, columns):
+        """
+        Tüm kuralları sütunlar üzerinde, her kural için tek bir NumPy işlemiyle uygular.
+
+        Args:
+            columns (dict): RULE_FIELDS alanı -> N uzunluğunda sayısal dizi
+
+        Returns:
+            tuple: (çıktı -> N uzunluğunda dizi, çıktı -> int değerli satır
+                maskesi). Maskeler yalnızca hem int hem float değer alabilen
+                çıktılar için verilir; diğer çıktıların dizi türü (int64 veya
+                float64) değerlerin türüyle aynıdır.
+        """
+        fired = self.fired_batch(columns)
+        n_rows = fired.shape[1]
+
+        values = {
+            output: np.full(
+                n_rows, self.defaults[output],
+                dtype=np.float64 if output in self.mixed_outputs
+                or isinstance(self.defaults[output], float) else np.int64
+            )
+            for output in RULE_OUTPUTS
+        }
+        integer_masks = {
+            output: np.full(n_rows, isinstance(self.defaults[output], int))
+            for output in self.mixed_outputs
+        }
+
+        for index, rule in enumerate(self.rules):
+            mask = fired[index]
+            for output, value in rule[5]:
+                values[output][mask] = value
+                if output in integer_masks:
+                    integer_masks[output][mask] = isinstance(value, int)
+        return values, integer_masks
+
+
+# Ön ayarlar modül yüklenirken bir kez derlenir
+_COMPILED_PRESETS = {name: RuleSet(table, name) for name, table in PRESETS.items()}
@@ -0,0 +1,100 @@
+"""
+DNA dizisinin türetilmiş özelliklerini tek geçişte hesaplayıp saklayan modül.
+"""
+
+import numpy as np
+
+from .packed_sequence import PackedSequence
+from .sequence_encoding import BASE_A, BASE_C, BASE_G, BASE_T, BASE_OTHER, encode_sequence
+
+
+class SequenceProfile:
+    """
+    Bir DNA dizisinin bileşimini, uzunluğunu ve türetilmiş değerlerini saklar.
+
+    Dizi yalnızca oluşturma sırasında bir kez kodlanır ve sayılır. Tm gibi
+    modele bağlı değerler cached() ile ilk istendiklerinde hesaplanıp saklanır;
+    böylece bir istek boyunca aynı dizi tekrar taranmaz.
+    """
+
+    def __init__(self, sequence):
+        """
+        SequenceProfile sınıfı için başlatıcı.
+
+        Args:
+            sequence (str or PackedSequence): DNA dizisi (büyük/küçük harf duyarsız)
+        """
+        self.sequence = sequence
+        if isinstance(sequence, PackedSequence):
+            self.codes = sequence.codes()
+        else:
+            self.codes = encode_sequence(sequence)
+        self.length = len(self.codes)
+
+        counts = np.bincount(self.codes, minlength=5)
+        self.a_count = int(counts[BASE_A])
+        self.c_count = int(counts[BASE_C])
+        self.g_count = int(counts[BASE_G])
+        self.t_count = int(counts[BASE_T])
+        self.other_count = int(counts[BASE_OTHER])
+
+        self._cache = {}
+
+    @classmethod
+    def of(cls, value):
+        """
+        Verilen değeri SequenceProfile nesnesine dönüştürür.
+
+        Args:
+            value (str, PackedSequence or SequenceProfile): DNA dizisi veya hazır profil
+
+        Returns:
+            SequenceProfile: Değer zaten bir profilse kendisi, değilse yeni profil
+        """
+        if isinstance(value, cls):
+            return value
+        return cls(value)
+
+    def __len__(self):
+        """Dizi uzunluğunu döndürür."""
+        return self.length
+
+    def __str__(self):
+        """Orijinal diziyi str olarak döndürür."""
+        return str(self.sequence)
+
+    def __repr__(self):
+        """Profilin kısa gösterimini döndürür."""
+        return f"SequenceProfile(length={self.length}, gc_content={self.gc_content})"
+
+    @property
+    def gc_count(self):
+        """G ve C bazlarının toplam sayısı."""
+        return self.g_count + self.c_count
+
+    @property
+    def at_count(self):
+        """A ve T bazlarının toplam sayısı."""
+        return self.a_count + self.t_count
+
+    @property
+    def gc_content(self):
+        """GC içeriği yüzdesi (calculate_gc_content ile aynı yuvarlama)."""
+        if not self.length:
+            return 0
+        return round((self.gc_count / self.length) * 100, 1)
+
+    def cached(self, key, compute):
+        """
+        Türetilmiş bir değeri ilk istendiğinde hesaplar ve saklar.
+
+        Args:
+            key: Değerin anahtarı (ör. Tm modeli ve parametreleri)
+            compute (callable): Değeri hesaplayan parametresiz fonksiyon
+
+        Returns:
+            Saklanan veya yeni hesaplanan değer
+        """
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
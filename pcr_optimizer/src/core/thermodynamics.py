@@ -0,0 +1,266 @@
+"""
+En yakın komşu (nearest-neighbor) termodinamik modeli ile Tm hesaplayan modül.
+
+SantaLucia (1998) birleşik parametreleri kullanılır. Tuz düzeltmesi için
+Mg²⁺ ve dNTP etkisi von Ahsen (2001) Na⁺ eşdeğeri ile hesaba katılır.
+"""
+
+import math
+import numpy as np
+
+from .sequence_encoding import BASE_OTHER, encode_batch, round_array
+
+
+# Gaz sabiti (cal/K·mol)
+GAS_CONSTANT = 1.9872
+
+# Dinükleotit indeksi: 4 * ilk baz + ikinci baz (A=0, C=1, G=2, T=3)
+# ΔH (kcal/mol)
+NN_ENTHALPY = np.array([
+    # A      C      G      T      (ikinci baz)
+    -7.9,  -8.4,  -7.8,  -7.2,   # A
+    -8.5,  -8.0, -10.6,  -7.8,   # C
+    -8.2,  -9.8,  -8.0,  -8.4,   # G
+    -7.2,  -8.2,  -8.5,  -7.9,   # T
+])
+
+# ΔS (cal/K·mol)
+NN_ENTROPY = np.array([
+    -22.2, -22.4, -21.0, -20.4,
+    -22.7, -19.9, -27.2, -21.0,
+    -22.2, -24.4, -19.9, -22.4,
+    -21.3, -22.2, -22.7, -22.2,
+])
+
+# Uçtaki baza göre başlatma terimleri (ΔH, ΔS); indeks baz kodudur
+TERMINAL_ENTHALPY = np.array([2.3, 0.1, 0.1, 2.3, 0.0])
+TERMINAL_ENTROPY = np.array([4.1, -2.8, -2.8, 4.1, 0.0])
+
+# Kendi kendine tamamlayıcı diziler için simetri düzeltmesi (cal/K·mol)
+SYMMETRY_ENTROPY = -1.4
+
+
+class NearestNeighborModel:
+    """SantaLucia en yakın komşu parametreleriyle Tm hesaplayan model."""
+
+    def __init__(self, na_conc=50.0, mg_conc=1.5, dntp_conc=0.8, primer_conc=250.0):
+        """
+        NearestNeighborModel sınıfı için başlatıcı.
+
+        Args:
+            na_conc (float): Monovalan katyon (Na⁺/K⁺) konsantrasyonu (mM)
+            mg_conc (float): Mg²⁺ konsantrasyonu (mM)
+            dntp_conc (float): Toplam dNTP konsantrasyonu (mM)
+            primer_conc (float): Primer konsantrasyonu (nM)
+        """
+        self.na_conc = na_conc
+        self.mg_conc = mg_conc
+        self.dntp_conc = dntp_conc
+        self.primer_conc = primer_conc
+
+    def sodium_equivalent(self):
+        """
+        Mg²⁺ ve dNTP etkisini de içeren Na⁺ eşdeğer konsantrasyonunu hesaplar.
+
+        dNTP'ler Mg²⁺ iyonlarını bağladığı için yalnızca serbest Mg²⁺ hesaba katılır.
+
+        Returns:
+            float: Na⁺ eşdeğeri (M)
+        """
+        free_mg = max(self.mg_conc - self.dntp_conc, 0.0)
+        na_eq = self.na_conc + 120 * math.sqrt(free_mg)
+        return na_eq / 1000.0
+
+    def parameters(self):
+        """
+        Modelin önbellek anahtarı ve raporlama için parametrelerini döndürür.
+
+        Returns:
+            tuple: (na_conc, mg_conc, dntp_conc, primer_conc)
+        """
+        return (self.na_conc, self.mg_conc, self.dntp_conc, self.primer_conc)
+
+    def calculate_tm(self, primer_sequence):
+        """
+        Tek bir primerin en yakın komşu modeline göre Tm değerini hesaplar.
+
+        Args:
+            primer_sequence (str): Primer dizisi
+
+        Returns:
+            float: Erime sıcaklığı (°C)
+        """
+        return float(self.calculate_tm_batch([primer_sequence])[0])
+
+    def calculate_tm_batch(self, sequences):
+        """
+        Çok sayıda primer için Tm değerlerini tek çağrıda hesaplar.
+
+        Diziler bir kez kodlanır; ΔH/ΔS toplamları dinükleotit indeksleri
+        üzerinden tablo araması ve segment toplamlarıyla hesaplanır.
+
+        Args:
+            sequences (list): Primer dizileri listesi
+
+        Returns:
+            numpy.ndarray: Her primer için erime sıcaklığı (°C), 1 ondalık
+        """
+        sequences = list(sequences)
+        if not sequences:
+            return np.zeros(0, dtype=np.float64)
+
+        codes, starts, lengths = encode_batch(sequences)
+        return self.tm_from_encoded(codes, starts, lengths)
+
+    def calculate_tm_encoded(self, codes):
+        """
+        Önceden kodlanmış tek bir dizi için Tm hesaplar.
+
+        Args:
+            codes (numpy.ndarray): encode_sequence ile üretilmiş baz kodları
+
+        Returns:
+            float: Erime sıcaklığı (°C)
+        """
+        starts = np.zeros(1, dtype=np.int64)
+        lengths = np.array([len(codes)], dtype=np.int64)
+        return float(self.tm_from_encoded(codes, starts, lengths)[0])
+
+    def tm_from_encoded(self, codes, starts, lengths):
+        """
+        Kodlanmış diziler için Tm değerlerini hesaplar.
+
+        Args:
+            codes (numpy.ndarray): Uç uca eklenmiş baz kodları
+            starts (numpy.ndarray): Her dizinin başlangıç konumu
+            lengths (numpy.ndarray): Her dizinin uzunluğu
+
+        Returns:
+            numpy.ndarray: Her dizi için erime sıcaklığı (°C), 1 ondalık
+        """
+        enthalpy, entropy, self_complementary = self.duplex_terms(codes, starts, lengths)
+
+        # Tuz düzeltmesi (SantaLucia 1998, entropi üzerinden)
+        entropy = entropy + 0.368 * (lengths - 1) * math.log(self.sodium_equivalent())
+
+        # Primer konsantrasyonu terimi
+        total_conc = self.primer_conc * 1e-9
+        conc_term = np.where(self_complementary, total_conc, total_conc / 4)
+
+        tm = np.zeros(len(lengths), dtype=np.float64)
+        valid = lengths >= 2
+        tm[valid] = (
+            1000 * enthalpy[valid]
+            / (entropy[valid] + GAS_CONSTANT * np.log(conc_term[valid]))
+            - 273.15
+        )
+        return round_array(tm, 1)
+
+    def tm_windows(self, codes, length):
+        """
+        Bir dizinin tüm ardışık pencereleri için Tm değerlerini hesaplar.
+
+        Dinükleotit ΔH/ΔS katkılarının kümülatif toplamı bir kez alınır; her
+        pencerenin toplamı iki değerin farkıdır. Maliyet pencere uzunluğundan
+        bağımsız olarak dizi uzunluğuyla doğrusaldır.
+
+        Args:
+            codes (numpy.ndarray): encode_sequence ile üretilmiş baz kodları
+            length (int): Pencere uzunluğu (baz)
+
+        Returns:
+            numpy.ndarray: Konum i'den başlayan pencerenin Tm değeri (°C), 1 ondalık
+        """
+        n_windows = len(codes) - length + 1
+        if n_windows <= 0 or length < 2:
+            return np.zeros(max(n_windows, 0), dtype=np.float64)
+
+        codes = codes.astype(np.int64)
+        left = codes[:-1]
+        right = codes[1:]
+        valid_pair = (left != BASE_OTHER) & (right != BASE_OTHER)
+        pair_index = np.where(valid_pair, left * 4 + right, 0)
+
+        enthalpy_cumsum = np.zeros(len(codes), dtype=np.float64)
+        np.cumsum(np.where(valid_pair, NN_ENTHALPY[pair_index], 0.0), out=enthalpy_cumsum[1:])
+        entropy_cumsum = np.zeros(len(codes), dtype=np.float64)
+        np.cumsum(np.where(valid_pair, NN_ENTROPY[pair_index], 0.0), out=entropy_cumsum[1:])
+
+        starts = np.arange(n_windows)
+        ends = starts + length - 1
+        enthalpy = enthalpy_cumsum[ends] - enthalpy_cumsum[starts]
+        entropy = entropy_cumsum[ends] - entropy_cumsum[starts]
+
+        # Uçlardaki başlatma terimleri
+        first = codes[starts]
+        last = codes[ends]
+        enthalpy += TERMINAL_ENTHALPY[first] + TERMINAL_ENTHALPY[last]
+        entropy += TERMINAL_ENTROPY[first] + TERMINAL_ENTROPY[last]
+
+        # Kendi kendine tamamlayıcılık: pencerenin her iki ucundan içe doğru karşılaştır
+        self_complementary = np.ones(n_windows, dtype=bool)
+        for offset in range((length + 1) // 2):
+            outer = codes[starts + offset]
+            inner = codes[ends - offset]
+            self_complementary &= (outer != BASE_OTHER) & (outer + inner == 3)
+        entropy[self_complementary] += SYMMETRY_ENTROPY
+
+        entropy = entropy + 0.368 * (length - 1) * math.log(self.sodium_equivalent())
+        total_conc = self.primer_conc * 1e-9
+        conc_term = np.where(self_complementary, total_conc, total_conc / 4)
+
+        tm = 1000 * enthalpy / (entropy + GAS_CONSTANT * np.log(conc_term)) - 273.15
+        return round_array(tm, 1)
+
+    def duplex_terms(self, codes, starts, lengths):
+        """
+        Kodlanmış diziler için toplam ΔH, ΔS ve simetri bilgisini hesaplar.
+
+        Belirsiz baz (N vb.) içeren dinükleotitler toplamlara katkı vermez.
+
+        Args:
+            codes (numpy.ndarray): encode_batch ile üretilmiş baz kodları
+            starts (numpy.ndarray): Her dizinin başlangıç konumu
+            lengths (numpy.ndarray): Her dizinin uzunluğu
+
+        Returns:
+            tuple: (ΔH kcal/mol, ΔS cal/K·mol, kendi kendine tamamlayıcı mı)
+        """
+        n_sequences = len(lengths)
+        segment_ids = np.repeat(np.arange(n_sequences, dtype=np.int64), lengths)
+
+        # Dinükleotit katkıları
+        left = codes[:-1].astype(np.int64)
+        right = codes[1:].astype(np.int64)
+        valid_pair = (
+            (segment_ids[:-1] == segment_ids[1:])
+            & (left != BASE_OTHER)
+            & (right != BASE_OTHER)
+        )
+        pair_index = (left * 4 + right)[valid_pair]
+        pair_segment = segment_ids[:-1][valid_pair]
+        enthalpy = np.bincount(
+            pair_segment, weights=NN_ENTHALPY[pair_index], minlength=n_sequences
+        ).astype(np.float64)
+        entropy = np.bincount(
+            pair_segment, weights=NN_ENTROPY[pair_index], minlength=n_sequences
+        ).astype(np.float64)
+
+        # Uçlardaki başlatma terimleri
+        non_empty = lengths > 0
+        first = codes[starts[non_empty]]
+        last = codes[starts[non_empty] + lengths[non_empty] - 1]
+        enthalpy[non_empty] += TERMINAL_ENTHALPY[first] + TERMINAL_ENTHALPY[last]
+        entropy[non_empty] += TERMINAL_ENTROPY[first] + TERMINAL_ENTROPY[last]
+
+        # Kendi kendine tamamlayıcılık: her baz, ters tümleyenindeki karşılığına eşit mi
+        positions = np.arange(len(codes), dtype=np.int64)
+        mirror = 2 * starts[segment_ids] + lengths[segment_ids] - 1 - positions
+        complement = np.where(codes[mirror] == BASE_OTHER, -1, 3 - codes[mirror].astype(np.int64))
+        mismatches = np.bincount(
+            segment_ids, weights=(codes != complement), minlength=n_sequences
+        )
+        self_complementary = non_empty & (mismatches == 0)
+        entropy[self_complementary] += SYMMETRY_ENTROPY
+
+        return enthalpy, entropy, self_complementary
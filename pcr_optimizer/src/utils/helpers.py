@@ -4,22 +4,35 @@ PCR optimizasyon uygulaması için yardımcı fonksiyonlar.
 
 import re
 
+try:
+    from core.iupac import IUPAC_CODES
+    from core.kmer_index import DEFAULT_K, KmerIndex
+    from core.packed_sequence import PackedSequence
+except ImportError:
+    from ..core.iupac import IUPAC_CODES
+    from ..core.kmer_index import DEFAULT_K, KmerIndex
+    from ..core.packed_sequence import PackedSequence
+
 
 def is_valid_dna_sequence(sequence):
     """
     Verilen dizinin geçerli bir DNA dizisi olup olmadığını kontrol eder.
     
     Args:
-        sequence (str): Kontrol edilecek DNA dizisi
+        sequence (str or PackedSequence): Kontrol edilecek DNA dizisi
         
     Returns:
         bool: Dizi geçerli ise True, değilse False
     """
     if not sequence:
         return False
+    
+    # Paketlenmiş dizilerde yalnızca belirsiz baz maskesi kontrol edilir
+    if isinstance(sequence, PackedSequence):
+        return set(sequence.ambiguous_bases()) <= set(IUPAC_CODES)
         
-    # Dizi yalnızca A, T, G, C, N içermeli (büyük/küçük harf duyarsız)
-    pattern = r'^[ATGCNatgcn]+$'
+    # Dizi yalnızca IUPAC nükleotit kodlarını içermeli (büyük/küçük harf duyarsız)
+    pattern = r'^[ATGCRYSWKMBDHVNatgcryswkmbdhvn]+$'
     return bool(re.match(pattern, sequence))
 
 
@@ -28,7 +41,7 @@ def format_dna_sequence(sequence, width=60):
     DNA dizisini okunabilir bir formatta biçimlendirir.
     
     Args:
-        sequence (str): Formatlanacak DNA dizisi
+        sequence (str or PackedSequence): Formatlanacak DNA dizisi
         width (int): Her satırdaki maksimum karakter sayısı
         
     Returns:
@@ -36,11 +49,17 @@ def format_dna_sequence(sequence, width=60):
     """
     if not sequence:
         return ""
-        
-    sequence = sequence.upper()
     
-    # Diziyi belirtilen genişlikte alt dizilere böl
-    formatted_seq = [sequence[i:i+width] for i in range(0, len(sequence), width)]
+    if isinstance(sequence, PackedSequence):
+        # Tüm diziyi tek seferde çözmek yerine satır satır çöz
+        formatted_seq = [
+            sequence[i:i+width].to_string() for i in range(0, len(sequence), width)
+        ]
+    else:
+        sequence = sequence.upper()
+        
+        # Diziyi belirtilen genişlikte alt dizilere böl
+        formatted_seq = [sequence[i:i+width] for i in range(0, len(sequence), width)]
     
     # Satır numaralarıyla birlikte formatla
     result = []
@@ -51,20 +70,38 @@ def format_dna_sequence(sequence, width=60):
     return "\n".join(result)
 
 
-def estimate_pcr_product_size(forward_primer, reverse_primer, template_length=None):
+def estimate_pcr_product_size(forward_primer, reverse_primer, template_length=None,
+                              template_sequence=None):
     """
     PCR ürün boyutunu tahmin eder.
     
+    Şablon dizisi verilirse primerlerin bağlanma yerleri k-mer indeksiyle
+    bulunur ve gerçek ürün koordinatları döndürülür.
+    
     Args:
-        forward_primer (str): İleri primer dizisi
-        reverse_primer (str): Geri primer dizisi
+        forward_primer (str or PackedSequence): İleri primer dizisi
+        reverse_primer (str or PackedSequence): Geri primer dizisi
         template_length (int, optional): Şablon DNA uzunluğu
+        template_sequence (str or PackedSequence, optional): Şablon DNA dizisi
         
     Returns:
         str: Tahmin edilen PCR ürün boyutu açıklaması
     """
     if not forward_primer or not reverse_primer:
         return "Primer dizileri belirtilmediği için ürün boyutu tahmin edilemiyor."
+    
+    if template_sequence:
+        k = min(DEFAULT_K, len(forward_primer), len(reverse_primer))
+        amplicon = KmerIndex.for_template(template_sequence, k).find_amplicon(
+            str(forward_primer), str(reverse_primer)
+        )
+        if amplicon is None:
+            return "Primerlerin şablon üzerinde bağlandığı bir ürün bulunamadı."
+        
+        return (
+            f"PCR ürün boyutu: {amplicon['size']} baz çifti "
+            f"(şablon konumu {amplicon['start'] + 1}-{amplicon['end']})"
+        )
         
     if template_length:
         # Ortalama bir değer olarak tahmin et
@@ -5,6 +5,13 @@ PCR optimizasyon uygulaması için girdi doğrulama fonksiyonları.
 import re
 from .helpers import is_valid_dna_sequence
 
+try:
+    from core.cycling import PROTOCOL_MODES
+    from core.packed_sequence import PackedSequence
+except ImportError:
+    from ..core.cycling import PROTOCOL_MODES
+    from ..core.packed_sequence import PackedSequence
+
 
 class PCRValidationError(Exception):
     """PCR validasyon hatası için özel istisna sınıfı."""
@@ -16,24 +23,32 @@ def validate_dna_sequence(sequence, field_name="DNA dizisi"):
     DNA dizisini doğrular.
     
     Args:
-        sequence (str): Doğrulanacak DNA dizisi
+        sequence (str or PackedSequence): Doğrulanacak DNA dizisi
         field_name (str): Hata mesajında kullanılacak alan adı
         
     Returns:
-        str: Doğrulanmış DNA dizisi (büyük harfle)
+        str or PackedSequence: Doğrulanmış DNA dizisi (büyük harfle). Paketlenmiş
+            diziler çözülmeden olduğu gibi döndürülür.
         
     Raises:
         PCRValidationError: Dizi geçerli değilse
     """
     if not sequence:
         raise PCRValidationError(f"{field_name} boş olamaz.")
+    
+    if isinstance(sequence, PackedSequence):
+        if not is_valid_dna_sequence(sequence):
+            raise PCRValidationError(
+                f"{field_name} yalnızca A, T, G, C ve IUPAC belirsiz baz kodlarını (R, Y, S, W, K, M, B, D, H, V, N) içerebilir."
+            )
+        return sequence
         
     # Boşlukları kaldır
     sequence = sequence.replace(" ", "").replace("\n", "").replace("\t", "")
     
     if not is_valid_dna_sequence(sequence):
         raise PCRValidationError(
-            f"{field_name} yalnızca A, T, G, C, N karakterlerini içerebilir."
+            f"{field_name} yalnızca A, T, G, C ve IUPAC belirsiz baz kodlarını (R, Y, S, W, K, M, B, D, H, V, N) içerebilir."
         )
         
     return sequence.upper()
@@ -84,24 +99,25 @@ def validate_primer(primer, primer_type="Primer"):
     Primer dizisini doğrular.
     
     Args:
-        primer (str): Doğrulanacak primer dizisi
+        primer (str or PackedSequence): Doğrulanacak primer dizisi
         primer_type (str): Primer tipi (ör. "İleri primer", "Geri primer")
         
     Returns:
-        str: Doğrulanmış primer dizisi (büyük harfle)
+        str or PackedSequence: Doğrulanmış primer dizisi (büyük harfle)
         
     Raises:
         PCRValidationError: Primer geçerli değilse
     """
     if not primer:
         raise PCRValidationError(f"{primer_type} boş olamaz.")
-        
-    # Boşlukları kaldır
-    primer = primer.replace(" ", "").replace("\n", "").replace("\t", "")
+    
+    if not isinstance(primer, PackedSequence):
+        # Boşlukları kaldır
+        primer = primer.replace(" ", "").replace("\n", "").replace("\t", "")
     
     if not is_valid_dna_sequence(primer):
         raise PCRValidationError(
-            f"{primer_type} yalnızca A, T, G, C, N karakterlerini içerebilir."
+            f"{primer_type} yalnızca A, T, G, C ve IUPAC belirsiz baz kodlarını (R, Y, S, W, K, M, B, D, H, V, N) içerebilir."
         )
         
     # Primer uzunluğu genellikle 15-30 baz arasındadır
@@ -114,6 +130,9 @@ def validate_primer(primer, primer_type="Primer"):
         raise PCRValidationError(
             f"{primer_type} çok uzun (en fazla 40 baz olmalıdır)."
         )
+    
+    if isinstance(primer, PackedSequence):
+        return primer
         
     return primer.upper()
 
@@ -160,6 +179,27 @@ def validate_cycle_number(cycles):
     )
 
 
+def validate_protocol_mode(mode):
+    """
+    Protokol modunu doğrular.
+    
+    Args:
+        mode: Doğrulanacak mod ("standard", "touchdown" veya "gradient")
+        
+    Returns:
+        str: Doğrulanmış mod
+        
+    Raises:
+        PCRValidationError: Mod geçerli değilse
+    """
+    mode = str(mode or "standard").strip().lower()
+    if mode not in PROTOCOL_MODES:
+        raise PCRValidationError(
+            f"Protokol modu geçersiz. Geçerli modlar: {', '.join(PROTOCOL_MODES)}."
+        )
+    return mode
+
+
 def validate_temperature(temp, field_name="Sıcaklık"):
     """
     Sıcaklık değerini doğrular.
@@ -223,4 +263,57 @@ def validate_concentration(conc, field_name="Konsantrasyon"):
         field_name, 
         min_value=0, 
         max_value=1000
-    ) 
\ No newline at end of file
+    ) 
+
+
+def validate_design_parameters(data):
+    """
+    Primer tasarımı parametrelerini doğrular.
+    
+    Primer uzunluk sınırları validate_primer ile aynıdır (15-40 baz); böylece
+    tasarlanan primerler doğrudan optimizasyon girdisi olarak kullanılabilir.
+    
+    Args:
+        data (dict): İstekten gelen parametreler (tümü opsiyonel)
+        
+    Returns:
+        dict: PrimerDesigner için doğrulanmış anahtar kelime argümanları
+        
+    Raises:
+        PCRValidationError: Parametreler geçerli değilse
+    """
+    params = {}
+    
+    if 'min_length' in data:
+        params['min_length'] = int(validate_numeric_value(
+            data['min_length'], "En kısa primer uzunluğu", min_value=15, max_value=40
+        ))
+    if 'max_length' in data:
+        params['max_length'] = int(validate_numeric_value(
+            data['max_length'], "En uzun primer uzunluğu", min_value=15, max_value=40
+        ))
+    if params.get('min_length', 18) > params.get('max_length', 30):
+        raise PCRValidationError("En kısa primer uzunluğu en uzun uzunluktan büyük olamaz.")
+    
+    if 'tm_min' in data or 'tm_max' in data:
+        params['tm_range'] = (
+            validate_temperature(data.get('tm_min', 55), "En düşük Tm"),
+            validate_temperature(data.get('tm_max', 65), "En yüksek Tm")
+        )
+    
+    if 'gc_min' in data or 'gc_max' in data:
+        params['gc_range'] = (
+            validate_numeric_value(data.get('gc_min', 40), "En düşük GC", min_value=0, max_value=100),
+            validate_numeric_value(data.get('gc_max', 60), "En yüksek GC", min_value=0, max_value=100)
+        )
+    
+    if 'product_min' in data or 'product_max' in data:
+        params['product_size_range'] = (
+            validate_template_length(data.get('product_min', 100)),
+            validate_template_length(data.get('product_max', 1000))
+        )
+    
+    if 'optimal_product_size' in data:
+        params['optimal_product_size'] = validate_template_length(data['optimal_product_size'])
+    
+    return params
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+LRU önbellek ve hesaplayıcı önbelleği için birim testleri.
+"""
+
+import pytest
+import sys
+import os
+import pickle
+import threading
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.cache import LRUCache
+from src.core.calculator import PCRCalculator
+
+
+class TestLRUCache:
+    """LRUCache sınıfı için test sınıfı."""
+
+    def test_eviction_and_stats(self):
+        """En az kullanılan kaydın çıkarıldığını ve sayaçları test eder."""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "a" en son kullanılan olur
+        cache.put("c", 3)           # "b" çıkarılır
+
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+        assert stats["size"] == 2
+
+    def test_invalid_size(self):
+        """Geçersiz önbellek boyutu için hata verildiğini test eder."""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+    def test_thread_safety(self):
+        """Eşzamanlı erişimde boyut sınırının korunduğunu test eder."""
+        cache = LRUCache(maxsize=50)
+
+        def worker(offset):
+            for i in range(500):
+                cache.get_or_compute((offset + i) % 80, lambda: i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats["size"] <= 50
+        assert stats["hits"] + stats["misses"] == 8 * 500
+
+    def test_pickle(self):
+        """Önbelleğin kilide rağmen pickle edilebildiğini ve boş olarak açıldığını test eder."""
+        cache = LRUCache(maxsize=4)
+        cache.put("a", 1)
+        restored = pickle.loads(pickle.dumps(cache))
+        assert restored.maxsize == 4
+        assert len(restored) == 0
+        restored.put("b", 2)
+        assert restored.get("b") == 2
+
+
+class TestCalculatorCache:
+    """PCRCalculator önbelleği için test sınıfı."""
+
+    def test_disabled_by_default(self):
+        """Önbelleğin varsayılan olarak kapalı olduğunu test eder."""
+        assert PCRCalculator().cache_stats() is None
+
+    def test_normalized_keys(self):
+        """Büyük/küçük harf farkının aynı anahtara gittiğini test eder."""
+        calculator = PCRCalculator(cache_size=16)
+        tm = calculator.calculate_tm("ATGCTAGCTAGCTAGC")
+        assert calculator.calculate_tm("atgctagctagctagc") == tm
+        assert calculator.calculate_gc_content("ATGCTAGCTAGCTAGC") == 50.0
+
+        stats = calculator.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+
+    def test_model_parameters_in_key(self):
+        """Tm modeli değiştiğinde önbellekten eski değerin dönmediğini test eder."""
+        calculator = PCRCalculator(cache_size=16)
+        primer = "AGAGCTACGAGCTGCCTGAC"
+        basic_tm = calculator.calculate_tm(primer)
+
+        calculator.tm_model = "nearest_neighbor"
+        nn_tm = calculator.calculate_tm(primer)
+        assert nn_tm != basic_tm
+
+        calculator.nearest_neighbor.na_conc = 100
+        assert calculator.calculate_tm(primer) != nn_tm
+
+    def test_cached_dicts_are_copies(self):
+        """Döndürülen dimer/firkete sözlüklerinin değiştirilmesinin önbelleği bozmadığını test eder."""
+        calculator = PCRCalculator(cache_size=16)
+        primer = "AGAGCTACGAGCTGCCTGAC"
+        dimer = calculator.calculate_dimer(primer, primer)
+        expected = dict(dimer)
+        dimer["max_run"] = 99
+        assert calculator.calculate_dimer(primer, primer) == expected
+
+        hairpin = calculator.calculate_hairpin(primer)
+        expected = dict(hairpin)
+        hairpin["delta_g"] = 0
+        assert calculator.calculate_hairpin(primer) == expected
+        assert calculator.cache_stats()["hits"] == 2
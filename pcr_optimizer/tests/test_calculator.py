@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.core.calculator import PCRCalculator
+from src.core.sequence_profile import SequenceProfile
 
 
 class TestPCRCalculator:
@@ -92,4 +93,78 @@ class TestPCRCalculator:
         # Düşük başlangıç konsantrasyonu ve yüksek hedef verim için daha fazla döngü
         low_conc_cycles = self.calculator.calculate_cycle_number(0.1, 100)
         high_conc_cycles = self.calculator.calculate_cycle_number(10, 100)
-        assert low_conc_cycles > high_conc_cycles 
\ No newline at end of file
+        assert low_conc_cycles > high_conc_cycles 
+
+    def test_calculate_tm_batch(self):
+        """calculate_tm_batch metodunun skaler sonuçlarla aynı olduğunu test eder."""
+        primers = [
+            "", "ATGC", "atgctagc", "GCGCGCGCGCGCG", "ATGCTAGCTAGCTA",
+            "ATGCTAGCTAGCTAGCTAGCTAGC", "GCGCGGCGCGGCGCTAGCTAG", "ACGTNNACGTACGTACGT"
+        ]
+        batch = self.calculator.calculate_tm_batch(primers)
+        
+        assert len(batch) == len(primers)
+        for primer, tm in zip(primers, batch):
+            assert tm == self.calculator.calculate_tm(primer)
+    
+    def test_calculate_gc_content_batch(self):
+        """calculate_gc_content_batch metodunun skaler sonuçlarla aynı olduğunu test eder."""
+        sequences = ["", "ATGC", "GCGCGC", "ATATAT", "ATGCATATATATA", "acgtnacgt"]
+        batch = self.calculator.calculate_gc_content_batch(sequences)
+        
+        for sequence, gc in zip(sequences, batch):
+            assert gc == self.calculator.calculate_gc_content(sequence)
+        
+        # Boş liste için boş dizi
+        assert len(self.calculator.calculate_gc_content_batch([])) == 0
+    
+    def test_gc_profile(self):
+        """gc_profile metodunun pencere bazında doğru sonuç verdiğini test eder."""
+        sequence = "ATATATATAT" + "GCGCGCGCGC" + "ATATATATAT"
+        profile = self.calculator.gc_profile(sequence, window=10, step=5)
+        
+        expected = [
+            self.calculator.calculate_gc_content(sequence[start:start + 10])
+            for start in range(0, len(sequence) - 10 + 1, 5)
+        ]
+        assert list(profile) == expected
+        
+        # Diziden uzun pencere tüm diziyi kapsar
+        assert list(self.calculator.gc_profile("ATGC", window=100)) == [50.0]
+        
+        # Uzun şablonda pencere sayısı doğrusal
+        long_profile = self.calculator.gc_profile("ATGC" * 12500, window=200, step=1)
+        assert len(long_profile) == 50000 - 200 + 1
+    
+    def test_calculate_local_gc(self):
+        """calculate_local_gc metodunun yerel GC zengin bölgeleri yakaladığını test eder."""
+        sequence = "AT" * 200 + "GC" * 50 + "AT" * 200
+        
+        assert self.calculator.calculate_local_gc(sequence, "mean") == \
+            self.calculator.calculate_gc_content(sequence)
+        assert self.calculator.calculate_local_gc(sequence, "max", window=100) == 100.0
+        assert self.calculator.calculate_local_gc(sequence, 50, window=100) == 0.0
+        
+        with pytest.raises(ValueError):
+            self.calculator.calculate_local_gc(sequence, "median")
+    
+    def test_sequence_profile_inputs(self):
+        """Hesaplayıcı metodlarının SequenceProfile kabul ettiğini test eder."""
+        nn_calculator = PCRCalculator(tm_model="nearest_neighbor")
+        for sequence in ["", "ATGCTAGC", "atgctagctagctagctagctagc", "ACGTNNACGTACGTACGT"]:
+            profile = SequenceProfile(sequence)
+            assert self.calculator.calculate_tm(profile) == self.calculator.calculate_tm(sequence)
+            assert nn_calculator.calculate_tm(profile) == nn_calculator.calculate_tm(sequence)
+            assert self.calculator.calculate_gc_content(profile) == \
+                self.calculator.calculate_gc_content(sequence)
+        
+        # Farklı Tm modelleri profil önbelleğinde birbirine karışmamalı
+        profile = SequenceProfile("AGAGCTACGAGCTGCCTGAC")
+        assert self.calculator.calculate_tm(profile) != nn_calculator.calculate_tm(profile)
+        
+        forward = SequenceProfile("ATGCTAGCTAGCTAGC")
+        reverse = SequenceProfile("TAGCTAGCTAGCTAGC")
+        assert self.calculator.calculate_annealing_temp(forward, reverse) == \
+            self.calculator.calculate_annealing_temp("ATGCTAGCTAGCTAGC", "TAGCTAGCTAGCTAGC")
+        assert self.calculator.calculate_extension_time(SequenceProfile("A" * 5000)) == \
+            self.calculator.calculate_extension_time(5000)
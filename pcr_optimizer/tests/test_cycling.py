@@ -0,0 +1,95 @@
+"""
+Touchdown ve gradyan protokol modları için birim testleri.
+"""
+
+import pytest
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.cycling import cycle_stages, gradient_layout, total_time, touchdown_stages
+from src.core.optimizer import PCROptimizer
+from src.core.protocol_generator import ProtocolGenerator
+
+
+class TestProtocolModes:
+    """Çok aşamalı döngü blokları ve gradyan düzeni için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.optimizer = PCROptimizer()
+        self.generator = ProtocolGenerator(self.optimizer)
+        self.parameters = {
+            "template_length": 1500,
+            "forward_primer": "ATGCTAGCTAGCTAGCTAGT",
+            "reverse_primer": "TGCATGCATGCATGCATGCA"
+        }
+
+    def test_touchdown_stages(self):
+        """Touchdown aşamasının Tm üst sınırından bağlanma sıcaklığına indiğini test eder."""
+        protocol = self.optimizer.create_complete_protocol(mode="touchdown", **self.parameters)
+        standard = self.optimizer.create_complete_protocol(**self.parameters)
+        assert protocol["cycles"] == standard["cycles"]
+
+        touchdown, final = protocol["cycle_stages"]
+        annealing_temp = standard["cycles"]["annealing"]["temperature"]
+        tm_high = max(self.optimizer.calculator.calculate_tm(primer) for primer in
+                      (self.parameters["forward_primer"], self.parameters["reverse_primer"]))
+        assert touchdown["annealing"]["temperature"] == round(tm_high, 1)
+        last = touchdown["annealing"]["temperature"] + touchdown["annealing"]["step"] * (touchdown["count"] - 1)
+        assert annealing_temp < last <= annealing_temp + 1
+        assert final["count"] == standard["cycles"]["count"]
+
+        # Başlangıç bağlanma sıcaklığının altındaysa touchdown aşaması oluşturulmaz
+        assert len(touchdown_stages(standard["cycles"], annealing_temp - 1)) == 1
+        with pytest.raises(ValueError):
+            touchdown_stages(standard["cycles"], 70, step=0)
+
+    def test_total_time(self):
+        """Toplam sürenin tüm aşamaları kapsadığını test eder."""
+        standard = self.optimizer.create_complete_protocol(**self.parameters)
+        protocol = self.optimizer.create_complete_protocol(mode="touchdown", **self.parameters)
+        touchdown = protocol["cycle_stages"][0]
+        per_cycle = sum(touchdown[step]["time"] for step in ("denaturation", "annealing", "extension"))
+        assert total_time(protocol) == total_time(standard) + touchdown["count"] * per_cycle
+        assert cycle_stages(standard) == [standard["cycles"]]
+
+    def test_gradient_layout(self):
+        """Gradyan sütunlarının sıralı ve bağlanma sıcaklığını kapsadığını test eder."""
+        protocol = self.optimizer.create_complete_protocol(mode="gradient", **self.parameters)
+        gradient = protocol["gradient"]
+        temperatures = gradient["temperatures"]
+        annealing_temp = protocol["cycles"]["annealing"]["temperature"]
+        assert gradient["columns"] == len(temperatures) == 12
+        assert temperatures == sorted(temperatures)
+        assert temperatures[0] <= annealing_temp <= temperatures[-1]
+        assert temperatures[-1] - temperatures[0] >= 10
+        recommended = temperatures[gradient["recommended_column"] - 1]
+        assert all(abs(recommended - annealing_temp) <= abs(t - annealing_temp) for t in temperatures)
+
+        layout = gradient_layout(55, columns=8)
+        assert layout["temperatures"][0] == 50 and layout["temperatures"][-1] == 60
+        with pytest.raises(ValueError):
+            gradient_layout(55, columns=1)
+        with pytest.raises(ValueError):
+            self.optimizer.create_complete_protocol(mode="ramp", **self.parameters)
+
+    def test_rendering(self):
+        """Metin ve CSV çıktılarının aşamaları ve gradyanı içerdiğini test eder."""
+        protocol = self.optimizer.create_complete_protocol(mode="touchdown", **self.parameters)
+        text = self.generator.protocol_to_text(protocol)
+        assert "Aşama 1: Touchdown" in text
+        assert "Aşama 2: Çoğaltma" in text
+        assert "(döngü başına -1.0°C)" in text
+
+        lines = self.generator.protocol_to_csv(protocol).splitlines()
+        assert lines[0].endswith("Döngü Başına Değişim (°C)")
+        assert all(line.count(",") == 4 for line in lines)
+        assert "Bağlanma (Aşama 1)" in lines[3]
+
+        gradient = self.optimizer.create_complete_protocol(mode="gradient", **self.parameters)
+        csv_text = self.generator.protocol_to_csv(gradient)
+        assert csv_text.count("Gradyan Sütun") == 12
+        assert "Önerilen: Sütun" in self.generator.protocol_to_text(gradient)
@@ -0,0 +1,101 @@
+"""
+Primer dimer puanlama modülü için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.dimer import score_dimer, score_dimers_batch
+from src.core.optimizer import PCROptimizer
+
+
+COMPLEMENT = {"A": "T", "T": "A", "G": "C", "C": "G"}
+
+
+def brute_force(first, second):
+    """Karşılaştırma için iç içe döngülü referans puanlama."""
+    reverse = second[::-1]
+    best = {"score": 0, "max_run": 0, "three_prime_score": 0, "three_prime_run": 0}
+    for offset in range(-(len(reverse) - 1), len(first)):
+        run = score = 0
+        for i in range(len(first)):
+            m = i - offset
+            paired = 0 <= m < len(reverse) and COMPLEMENT.get(first[i]) == reverse[m]
+            if paired:
+                if run == 0:
+                    start = m
+                run += 1
+                score += 4 if first[i] in "GC" else 2
+                best["score"] = max(best["score"], score)
+                best["max_run"] = max(best["max_run"], run)
+                if i == len(first) - 1 or start == 0:
+                    best["three_prime_score"] = max(best["three_prime_score"], score)
+                    best["three_prime_run"] = max(best["three_prime_run"], run)
+            else:
+                run = score = 0
+    return best
+
+
+class TestDimer:
+    """Dimer puanlama fonksiyonları için test sınıfı."""
+
+    def test_matches_brute_force(self):
+        """Vektörel puanlamanın referans uygulama ile aynı olduğunu test eder."""
+        rng = random.Random(3)
+        firsts = ["".join(rng.choice("ACGT") for _ in range(rng.randint(1, 30))) for _ in range(200)]
+        seconds = ["".join(rng.choice("ACGT") for _ in range(rng.randint(1, 30))) for _ in range(200)]
+
+        batch = score_dimers_batch(firsts, seconds, chunk_size=64)
+        for n, (first, second) in enumerate(zip(firsts, seconds)):
+            expected = brute_force(first, second)
+            assert {key: int(values[n]) for key, values in batch.items()} == expected
+
+    def test_self_complementary_primer(self):
+        """Kendi kendine tamamlayıcı primerin tam uzunlukta eşleştiğini test eder."""
+        scores = score_dimer("ACGTACGTACGT", "ACGTACGTACGT")
+        assert scores["max_run"] == 12
+        assert scores["three_prime_run"] == 12
+
+    def test_ambiguous_bases_do_not_pair(self):
+        """N bazlarının eşleşme sayılmadığını test eder."""
+        assert score_dimer("NNNN", "NNNN")["max_run"] == 0
+
+    def test_length_mismatch(self):
+        """Farklı uzunluktaki listeler için hata verildiğini test eder."""
+        with pytest.raises(ValueError):
+            score_dimers_batch(["ACGT"], [])
+
+    def test_calculator_and_optimizer(self):
+        """Hesaplayıcı ve optimize edicinin dimer uyarılarını test eder."""
+        calculator = PCRCalculator(cache_size=16)
+        assert calculator.calculate_dimer("ACGTACGTACGT", "ACGTACGTACGT")["max_run"] == 12
+
+        optimizer = PCROptimizer(calculator=calculator)
+        protocol = optimizer.create_complete_protocol(
+            template_length=500,
+            forward_primer="ATGCATGCATGCACGTACGT",
+            reverse_primer="TTGACCTAGGATCCAAGTCC"
+        )
+        assert any("3' uç" in warning for warning in protocol["warnings"])
+        base_annealing = protocol["cycles"]["annealing"]["temperature"]
+
+        optimizer.dimer_annealing_adjustment = 2
+        adjusted = optimizer.create_complete_protocol(
+            template_length=500,
+            forward_primer="ATGCATGCATGCACGTACGT",
+            reverse_primer="TTGACCTAGGATCCAAGTCC"
+        )
+        assert adjusted["cycles"]["annealing"]["temperature"] == round(base_annealing + 2, 1)
+
+        clean = optimizer.create_complete_protocol(
+            template_length=500,
+            forward_primer="AGAGCTACGAGCTGCCTGAC",
+            reverse_primer="TTGACCTAGGATCCAAGTCC"
+        )
+        assert "warnings" not in clean
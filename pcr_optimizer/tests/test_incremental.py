@@ -0,0 +1,92 @@
+"""
+Artımlı yeniden optimizasyon için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.incremental import IncrementalOptimizer, dirty_stages
+from src.core.optimizer import PCROptimizer
+
+
+def random_dna(rng, length):
+    """Rastgele bir DNA dizisi üretir."""
+    return "".join(rng.choice("ACGT") for _ in range(length))
+
+
+class TestIncrementalOptimizer:
+    """IncrementalOptimizer sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.rng = random.Random(21)
+        self.sequence = random_dna(self.rng, 1200)
+        self.parameters = {
+            "sequence": self.sequence,
+            "template_length": len(self.sequence),
+            "forward_primer": self.sequence[100:120],
+            "reverse_primer": "".join(
+                {"A": "T", "C": "G", "G": "C", "T": "A"}[base] for base in reversed(self.sequence[700:720])
+            ),
+            "template_concentration": 10,
+            "target_yield": 50
+        }
+
+    def test_random_deltas_match_full_recompute(self):
+        """Rastgele değişikliklerden sonra sonucun tam yeniden hesaplamayla aynı olduğunu test eder."""
+        for optimizer in (PCROptimizer(), PCROptimizer(gc_statistic="max", cycle_model="kinetic")):
+            incremental = IncrementalOptimizer(optimizer)
+            handle = incremental.create(**self.parameters)
+            parameters = dict(self.parameters)
+            assert handle.protocol == optimizer.create_complete_protocol(**parameters)
+
+            choices = {
+                "template_length": lambda: self.rng.randint(100, 8000),
+                "forward_primer": lambda: random_dna(self.rng, 20),
+                "reverse_primer": lambda: random_dna(self.rng, 22),
+                "template_concentration": lambda: self.rng.choice([None, 0.01, 1, 50]),
+                "target_yield": lambda: self.rng.choice([None, 20, 100]),
+                "sequence": lambda: self.rng.choice([None, self.sequence, random_dna(self.rng, 800)]),
+                "is_diagnostic": lambda: self.rng.random() < 0.5,
+                "gc_content": lambda: self.rng.choice([None, 35, 65]),
+                "mode": lambda: self.rng.choice(["standard", "touchdown", "gradient"])
+            }
+            for _ in range(40):
+                delta = {field: choices[field]() for field in self.rng.sample(sorted(choices), 2)}
+                handle = incremental.update(handle.id, **delta)
+                parameters.update(delta)
+                assert handle.protocol == optimizer.create_complete_protocol(**parameters)
+
+    def test_only_affected_stages_recomputed(self):
+        """Yalnızca değişen girdiye bağlı aşamaların yeniden hesaplandığını test eder."""
+        incremental = IncrementalOptimizer(PCROptimizer())
+        handle = incremental.create(**self.parameters)
+
+        assert incremental.update(handle, target_yield=80).recomputed == ["cycles", "protocol"]
+        assert incremental.update(handle, mode="touchdown").recomputed == ["protocol"]
+        assert incremental.update(handle, target_yield=50).recomputed == []
+        assert incremental.update(handle, gc_content=40).recomputed == [
+            "gc", "temperatures", "annealing", "times", "protocol"
+        ]
+        assert "primer_checks" in dirty_stages(["forward_primer"])
+        assert "cycles" not in dirty_stages(["sequence"])
+
+        # Önceki tanıtıcı değişmez
+        assert incremental.get(handle.id).protocol == PCROptimizer().create_complete_protocol(**self.parameters)
+
+    def test_invalid_requests(self):
+        """Bilinmeyen tanıtıcı, alan ve modların hata verdiğini test eder."""
+        incremental = IncrementalOptimizer(PCROptimizer(), max_handles=1)
+        first = incremental.create(template_length=500)
+        incremental.create(template_length=600)
+        with pytest.raises(KeyError):
+            incremental.update(first.id, target_yield=10)
+        with pytest.raises(ValueError):
+            incremental.create(template_length=500, primer="ACGT")
+        with pytest.raises(ValueError):
+            incremental.create(template_length=500, mode="nested")
@@ -0,0 +1,101 @@
+"""
+IUPAC belirsiz baz desteği için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.iupac import IUPAC_CODES, count_expansions, expand_iupac, is_degenerate
+from src.core.packed_sequence import PackedSequence
+from src.core.sequence_profile import SequenceProfile
+from src.utils.validators import PCRValidationError, validate_primer
+
+
+class TestIupac:
+    """IUPAC yardımcıları ve Tm/GC sınırları için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(12)
+        codes = list(IUPAC_CODES)
+        self.primers = []
+        while len(self.primers) < 40:
+            primer = "".join(
+                rng.choice("ACGT") if rng.random() < 0.8 else rng.choice(codes)
+                for _ in range(rng.randint(10, 22))
+            )
+            if count_expansions(primer) <= 2000:
+                self.primers.append(primer)
+
+    def test_expansion_is_lazy_and_capped(self):
+        """Varyant üretecinin sınırı uyguladığını test eder."""
+        assert count_expansions("ACNRT") == 8
+        assert sorted(expand_iupac("ACNRT")) == sorted(
+            f"AC{n}{r}T" for n in "ACGT" for r in "AG"
+        )
+
+        # 4^40 varyant; üreteç yalnızca istenen kadarını üretir
+        variants = list(expand_iupac("N" * 40, limit=5))
+        assert len(variants) == 5
+        assert variants[0] == "A" * 40
+
+        with pytest.raises(ValueError):
+            list(expand_iupac("ACGTX"))
+
+    @pytest.mark.parametrize("tm_model", ["basic", "nearest_neighbor"])
+    def test_bounds_match_enumeration(self, tm_model):
+        """Analitik Tm/GC sınırlarının tüm varyantlarla aynı olduğunu test eder."""
+        calculator = PCRCalculator(tm_model=tm_model)
+        for primer in self.primers:
+            variants = list(expand_iupac(primer, limit=None))
+            tms = [calculator.calculate_tm(variant) for variant in variants]
+            gcs = [calculator.calculate_gc_content(variant) for variant in variants]
+
+            assert calculator.calculate_tm_range(primer) == (min(tms), max(tms))
+            assert calculator.calculate_gc_range(primer) == (min(gcs), max(gcs))
+
+    @pytest.mark.parametrize("tm_model", ["basic", "nearest_neighbor"])
+    def test_degenerate_values_within_bounds(self, tm_model):
+        """Dejenere primerlerde Tm ve GC değerlerinin sınırlar içinde kaldığını test eder."""
+        calculator = PCRCalculator(tm_model=tm_model)
+        primers = [primer for primer in self.primers if is_degenerate(primer)]
+        primers.append("ACGTRCGTACGTACGTAC")
+        for primer in primers:
+            tm_low, tm_high = calculator.calculate_tm_range(primer)
+            gc_low, gc_high = calculator.calculate_gc_range(primer)
+            for value in (primer, SequenceProfile(primer), PackedSequence(primer)):
+                assert calculator.calculate_tm(value) == tm_low
+                assert gc_low <= calculator.calculate_gc_content(value) <= gc_high
+
+        assert list(calculator.calculate_tm_batch(primers)) == [calculator.calculate_tm(primer) for primer in primers]
+        assert list(calculator.calculate_gc_content_batch(primers)) == [
+            calculator.calculate_gc_content(primer) for primer in primers
+        ]
+
+    def test_non_degenerate_range_is_single_value(self):
+        """Dejenere olmayan primerde sınırların Tm değerine eşit olduğunu test eder."""
+        calculator = PCRCalculator(tm_model="nearest_neighbor")
+        primer = "ATGCTAGCTAGCTAGCTAGT"
+        tm = calculator.calculate_tm(primer)
+        assert not is_degenerate(primer)
+        assert calculator.calculate_tm_range(primer) == (tm, tm)
+
+    def test_degenerate_annealing_uses_lower_bound(self):
+        """Dejenere primerlerde bağlanma sıcaklığının Tm alt sınırını kullandığını test eder."""
+        calculator = PCRCalculator()
+        forward = "ATGCTAGCTAGCTAGCTAGTN"
+        reverse = "TGCATGCATGCATGCATGCAS"
+        lowest = min(calculator.calculate_tm_range(forward)[0], calculator.calculate_tm(reverse))
+        assert calculator.calculate_annealing_temp(forward, reverse) == round(lowest - 5, 1)
+
+    def test_validator_accepts_iupac(self):
+        """Doğrulayıcının IUPAC kodlarını kabul ettiğini test eder."""
+        assert validate_primer("atgcrysWKMbdhvnatgc") == "ATGCRYSWKMBDHVNATGC"
+        with pytest.raises(PCRValidationError):
+            validate_primer("ATGCTAGCTAGXTAGCTAGT")
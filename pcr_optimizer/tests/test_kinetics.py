@@ -0,0 +1,87 @@
+"""
+Çoğaltma kinetiği modeli için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+import numpy as np
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.kinetics import AmplificationModel, FALLBACK_CYCLES
+from src.core.optimizer import PCROptimizer
+
+
+class TestAmplificationModel:
+    """AmplificationModel sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.model = AmplificationModel()
+
+    def test_curves_monotonic_and_bounded(self):
+        """Eğrilerin azalmadığını ve platoyu aşmadığını test eder."""
+        curves = self.model.simulate([0.001, 0.5, 10, 60])
+        assert curves.shape == (self.model.max_cycles + 1, 4)
+        assert np.all(np.diff(curves[:, :3], axis=0) >= 0)
+        assert np.all(curves[:, :3] <= self.model.plateau_yield)
+        # Plato üzerindeki başlangıç değeri çoğalmaz
+        assert np.all(curves[:, 3] == 60)
+
+    def test_target_cycle(self):
+        """Hedefe ulaşılan ilk döngünün seçildiğini test eder."""
+        model = AmplificationModel(efficiency=1.0, efficiency_decay=0.0, plateau_yield=1e9, min_cycles=1)
+        cycles, reached, _ = model.cycle_numbers([1.0], [1000.0])
+        # Plato uzakta ve tam verimde log2 kuralıyla aynı: 2^10 >= 1000
+        assert cycles.tolist() == [10]
+        assert reached.tolist() == [True]
+
+    def test_unreachable_target_uses_plateau(self):
+        """Plato hedefin altındaysa platoya yaklaşılan döngünün seçildiğini test eder."""
+        cycles, reached, curves = self.model.cycle_numbers([0.01], [500.0])
+        assert not reached[0]
+        assert curves[cycles[0], 0] >= 0.95 * curves[-1, 0]
+        assert curves[cycles[0] - 1, 0] < 0.95 * curves[-1, 0]
+
+    def test_invalid_inputs(self):
+        """Geçersiz girdilerin ve parametrelerin ele alınışını test eder."""
+        cycles, reached, _ = self.model.cycle_numbers([0, -1, 0.5], [50, 50, -5])
+        assert cycles.tolist() == [FALLBACK_CYCLES] * 3
+        assert not reached.any()
+        with pytest.raises(ValueError):
+            AmplificationModel(efficiency=1.5)
+        with pytest.raises(ValueError):
+            PCROptimizer(cycle_model="sigmoid")
+
+    def test_optimizer_integration(self):
+        """Optimizasyonun eğriyi döndürdüğünü ve toplu yolla aynı olduğunu test eder."""
+        optimizer = PCROptimizer(cycle_model="kinetic")
+        protocol = optimizer.create_complete_protocol(
+            template_length=1500, template_concentration=0.0001, target_yield=20
+        )
+        amplification = protocol["amplification"]
+        assert amplification["target_reached"]
+        count = protocol["cycles"]["count"]
+        assert count > 15
+        assert amplification["yield"][count] >= 20 > amplification["yield"][count - 1]
+        assert "amplification" not in PCROptimizer().create_complete_protocol(
+            template_concentration=0.5, target_yield=20
+        )
+
+        rng = random.Random(16)
+        records = [
+            {
+                "template_length": rng.choice([None, 500, 4000]),
+                "template_concentration": rng.choice([None, 0, -1, 0.001, 0.5, 10]),
+                "target_yield": rng.choice([None, 0, 5, 50, 45.5, 200]),
+                "is_diagnostic": rng.choice([True, False])
+            }
+            for _ in range(100)
+        ]
+        batch = optimizer.create_protocols_batch(records)
+        for record, batched in zip(records, batch):
+            assert batched == optimizer.create_complete_protocol(**record)
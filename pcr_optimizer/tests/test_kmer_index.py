@@ -0,0 +1,90 @@
+"""
+k-mer indeksi ve ürün boyutu hesaplaması için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.kmer_index import KmerIndex
+from src.core.optimizer import PCROptimizer
+from src.core.packed_sequence import PackedSequence
+from src.utils.helpers import estimate_pcr_product_size
+
+
+def reverse_complement(sequence):
+    """Karşılaştırma için basit ters tümleyen."""
+    return sequence.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+
+
+class TestKmerIndex:
+    """KmerIndex sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(5)
+        self.template = "".join(rng.choice("ACGT") for _ in range(3000))
+        self.forward = self.template[400:420]
+        self.reverse = reverse_complement(self.template[1180:1200])
+
+    def test_lookup_matches_str_find(self):
+        """k-mer aramasının tüm konumları bulduğunu test eder."""
+        index = KmerIndex(self.template, k=6)
+        kmer = self.template[100:106]
+        expected = [i for i in range(len(self.template)) if self.template.startswith(kmer, i)]
+        assert list(index.lookup(kmer)) == expected
+        assert len(index.lookup("ACGTNA")) == 0
+
+    def test_binding_sites_and_mismatches(self):
+        """Bağlanma yerlerini ve 5' uyumsuzluk toleransını test eder."""
+        index = KmerIndex(self.template)
+        assert list(index.find_binding_sites(self.forward)) == [400]
+
+        mismatched = ("T" if self.forward[0] != "T" else "A") + self.forward[1:]
+        assert len(index.find_binding_sites(mismatched)) == 0
+        assert list(index.find_binding_sites(mismatched, max_mismatches=1)) == [400]
+
+        with pytest.raises(ValueError):
+            index.find_binding_sites("ACGT")
+
+    def test_find_amplicon(self):
+        """Gerçek ürün koordinatlarının bulunduğunu test eder."""
+        index = KmerIndex.for_template(self.template)
+        amplicon = index.find_amplicon(self.forward, self.reverse)
+        assert amplicon == {"start": 400, "end": 1200, "size": 800, "orientation": "forward"}
+
+        # Primerler yer değiştirildiğinde de ürün bulunur
+        assert index.find_amplicon(self.reverse, self.forward)["orientation"] == "reverse"
+
+        # Aynı şablon için indeks önbellekten döner
+        assert KmerIndex.for_template(self.template) is index
+        assert KmerIndex.for_template(PackedSequence(self.template)).length == len(self.template)
+
+    def test_extension_time_uses_amplicon(self):
+        """Uzama süresinin şablon yerine ürün boyutuna göre hesaplandığını test eder."""
+        calculator = PCRCalculator()
+        long_template = self.template * 20
+        assert calculator.find_amplicon(long_template, self.forward, self.reverse)["size"] == 800
+
+        protocol = PCROptimizer(calculator=calculator).create_complete_protocol(
+            template_length=len(long_template),
+            forward_primer=self.forward,
+            reverse_primer=self.reverse,
+            sequence=long_template
+        )
+        assert protocol["amplicon"]["size"] == 800
+        assert protocol["cycles"]["extension"]["time"] == calculator.calculate_extension_time(800)
+
+    def test_estimate_pcr_product_size(self):
+        """Ürün boyutu açıklamasının gerçek koordinatları kullandığını test eder."""
+        text = estimate_pcr_product_size(self.forward, self.reverse, template_sequence=self.template)
+        assert "800 baz çifti" in text
+        assert "401-1200" in text
+        assert "bulunamadı" in estimate_pcr_product_size(
+            self.forward, self.forward, template_sequence=self.template
+        )
@@ -0,0 +1,65 @@
+"""
+Multipleks panel analizi için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.dimer import score_dimer
+from src.core.multiplex import MultiplexAnalyzer
+
+
+class TestMultiplexAnalyzer:
+    """MultiplexAnalyzer sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(8)
+        self.primers = [
+            "".join(rng.choice("ACGT") for _ in range(rng.randint(18, 26))) for _ in range(23)
+        ]
+        # 3' ucu tamamlayıcı bir çift ekle
+        self.primers.append("ATGCATGCATGCACGTACGT")
+
+    def test_matrices_match_pairwise_scores(self):
+        """Blok matrislerinin tek tek çift puanlarıyla aynı olduğunu test eder."""
+        result = MultiplexAnalyzer(block_size=5).analyze(self.primers)
+        n_primers = len(self.primers)
+        assert result["dimer_score"].shape == (n_primers, n_primers)
+
+        for i in range(n_primers):
+            for j in range(n_primers):
+                scores = score_dimer(self.primers[i], self.primers[j])
+                assert result["dimer_score"][i, j] == scores["score"]
+                assert result["three_prime_run"][i, j] == scores["three_prime_run"]
+
+        assert (result["tm_difference"] == result["tm_difference"].T).all()
+
+        # Süreç havuzuyla dağıtılan bloklar aynı sonucu verir
+        pooled = MultiplexAnalyzer(block_size=8, processes=2).dimer_matrices(self.primers)
+        assert (pooled["score"] == result["dimer_score"]).all()
+
+    def test_flags_and_common_annealing(self):
+        """Sorunlu çiftlerin işaretlendiğini ve ortak bağlanma sıcaklığını test eder."""
+        calculator = PCRCalculator()
+        result = MultiplexAnalyzer(calculator=calculator).analyze(self.primers)
+
+        self_dimers = [
+            flag for flag in result["flagged"] if flag["first"] == flag["second"] == "P24"
+        ]
+        assert self_dimers and self_dimers[0]["three_prime_run"] >= 4
+
+        assert result["annealing_temp"] == round(min(result["tm"]) - 5, 1)
+        assert calculator.calculate_annealing_temp(self.primers[0], self.primers[1]) == \
+            calculator.calculate_common_annealing_temp(self.primers[:2])
+
+    def test_names_validation(self):
+        """Ad ve dizi sayısı uyuşmazsa hata verildiğini test eder."""
+        with pytest.raises(ValueError):
+            MultiplexAnalyzer().analyze(self.primers, names=["A"])
@@ -0,0 +1,58 @@
+"""
+PCROptimizer sınıfı için birim testleri.
+"""
+
+import pytest
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+
+
+class TestPCROptimizer:
+    """PCROptimizer sınıfı için test sınıfı."""
+    
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.optimizer = PCROptimizer()
+    
+    def test_local_gc_statistic(self):
+        """Yerel GC istatistiğinin denatürasyon kararlarını etkilediğini test eder."""
+        # Küresel GC düşük, ancak 200 bazlık GC zengin bir bölge var
+        sequence = "AT" * 500 + "GC" * 100 + "AT" * 500
+        
+        mean_protocol = self.optimizer.create_complete_protocol(
+            template_length=len(sequence), sequence=sequence
+        )
+        assert mean_protocol["initial_denaturation"]["temperature"] == 95
+        assert "local_gc_content" not in mean_protocol
+        
+        max_optimizer = PCROptimizer(gc_statistic="max", gc_window=100)
+        max_protocol = max_optimizer.create_complete_protocol(
+            template_length=len(sequence), sequence=sequence
+        )
+        assert max_protocol["initial_denaturation"]["temperature"] == 98
+        assert max_protocol["local_gc_content"] == 100.0
+        assert max_protocol["gc_content"] == mean_protocol["gc_content"]
+    
+    def test_precomputed_gc_content(self):
+        """Önceden hesaplanmış GC içeriğinin doğrudan kullanıldığını test eder."""
+        protocol = self.optimizer.create_complete_protocol(
+            template_length=800,
+            forward_primer="GCGCGGCGCGGCGCTAGCTAG",
+            reverse_primer="GCGCGCTAGCTAGCGCGCTAG",
+            gc_content=68.5
+        )
+        assert protocol["gc_content"] == 68.5
+        assert protocol["initial_denaturation"]["temperature"] == 98
+        assert protocol["cycles"]["denaturation"]["time"] == 45
+        
+        # Dizi de verilse, verilen GC içeriği yeniden hesaplanmaz
+        protocol = self.optimizer.create_complete_protocol(
+            template_length=8, sequence="ATATATAT", gc_content=60.0
+        )
+        assert protocol["gc_content"] == 60.0
+        assert protocol["initial_denaturation"]["temperature"] == 97
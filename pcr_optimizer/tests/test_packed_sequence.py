@@ -0,0 +1,94 @@
+"""
+PackedSequence sınıfı için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.packed_sequence import PackedSequence
+from src.utils.helpers import format_dna_sequence, is_valid_dna_sequence
+from src.utils.validators import PCRValidationError, validate_dna_sequence, validate_primer
+
+
+def reverse_complement(sequence):
+    """Karşılaştırma için basit ters tümleyen."""
+    return sequence.translate(str.maketrans("ACGTN", "TGCAN"))[::-1]
+
+
+class TestPackedSequence:
+    """PackedSequence sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(7)
+        self.sequence = "".join(rng.choice("ACGT") for _ in range(1001))
+        self.sequence = self.sequence[:100] + "NNN" + self.sequence[103:500] + "N" + self.sequence[501:]
+        self.packed = PackedSequence(self.sequence.lower())
+
+    def test_round_trip_and_memory(self):
+        """Dizinin kayıpsız çözüldüğünü ve belleğin azaldığını test eder."""
+        assert len(self.packed) == len(self.sequence)
+        assert self.packed.to_string() == self.sequence
+        assert self.packed.nbytes < len(self.sequence) / 3
+
+    def test_indexing_and_slicing(self):
+        """Tek baz erişimini ve dilimlemeyi str ile karşılaştırır."""
+        assert self.packed[0] == self.sequence[0]
+        assert self.packed[101] == "N"
+        assert self.packed[-1] == self.sequence[-1]
+
+        for start, stop in [(0, 8), (3, 17), (96, 110), (498, 503), (990, 2000), (10, 10)]:
+            assert self.packed[start:stop].to_string() == self.sequence[start:stop]
+        assert self.packed[5:200:7].to_string() == self.sequence[5:200:7]
+        assert self.packed[::-1].to_string() == self.sequence[::-1]
+
+        with pytest.raises(IndexError):
+            self.packed[len(self.sequence)]
+
+    def test_reverse_complement(self):
+        """Ters tümleyenin doğru hesaplandığını test eder."""
+        assert self.packed.reverse_complement().to_string() == reverse_complement(self.sequence)
+        assert PackedSequence("ARYN").reverse_complement().to_string() == "NRYT"
+
+    def test_base_counts(self):
+        """Baz sayımlarının str sayımlarıyla aynı olduğunu test eder."""
+        counts = self.packed.base_counts()
+        for base in "ACGTN":
+            assert counts[base] == self.sequence.count(base)
+        assert self.packed[3:17].base_counts()["A"] == self.sequence[3:17].count("A")
+
+    def test_kmers(self):
+        """k-mer değerlerini ve belirsiz baz maskesini test eder."""
+        packed = PackedSequence("ACGTNAC")
+        values, valid = packed.kmers(2)
+        # AC=0b0001, CG=0b0110, GT=0b1011
+        assert list(values[:3]) == [1, 6, 11]
+        assert list(valid) == [True, True, True, False, False, True]
+
+        with pytest.raises(ValueError):
+            packed.kmers(33)
+
+    def test_calculator_and_utils_accept_packed(self):
+        """Hesaplayıcı, doğrulayıcı ve yardımcıların paketli diziyi kabul ettiğini test eder."""
+        calculator = PCRCalculator()
+        assert calculator.calculate_gc_content(self.packed) == \
+            calculator.calculate_gc_content(self.sequence)
+        assert list(calculator.gc_profile(self.packed, 50, 10)) == \
+            list(calculator.gc_profile(self.sequence, 50, 10))
+
+        primer = PackedSequence("ATGCTAGCTAGCTAGCTAGT")
+        assert calculator.calculate_tm(primer) == calculator.calculate_tm("ATGCTAGCTAGCTAGCTAGT")
+
+        assert is_valid_dna_sequence(self.packed)
+        assert validate_dna_sequence(self.packed) is self.packed
+        assert validate_primer(primer) is primer
+        assert format_dna_sequence(self.packed) == format_dna_sequence(self.sequence)
+
+        with pytest.raises(PCRValidationError):
+            validate_dna_sequence(PackedSequence("ACGTXACGT"))
@@ -0,0 +1,102 @@
+"""
+Plaka planlayıcısı için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.plate_planner import PlatePlanner
+
+
+class TestPlatePlanner:
+    """PlatePlanner sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(19)
+        self.optimizer = PCROptimizer()
+        self.records = [
+            {
+                "template_length": rng.randint(200, 4000),
+                "forward_primer": "".join(rng.choice("ACGT") for _ in range(rng.randint(18, 24))),
+                "reverse_primer": "".join(rng.choice("ACGT") for _ in range(rng.randint(18, 24))),
+                "gc_content": rng.choice([None, 45, 60]),
+                "is_diagnostic": rng.random() < 0.2
+            }
+            for _ in range(300)
+        ]
+        self.protocols = [self.optimizer.create_complete_protocol(**record) for record in self.records]
+
+    def test_groups_respect_tolerances(self):
+        """Gruplardaki reaksiyonların toleranslar ve tam eşleşme alanları içinde kaldığını test eder."""
+        plan = PlatePlanner(annealing_tolerance=2.0, extension_tolerance=30).plan(self.protocols)
+        assert sorted(index for program in plan["programs"] for index in program["reactions"]) == list(range(300))
+        for number, program in enumerate(plan["programs"]):
+            members = [self.protocols[index] for index in program["reactions"]]
+            temperatures = [protocol["cycles"]["annealing"]["temperature"] for protocol in members]
+            times = [protocol["cycles"]["extension"]["time"] for protocol in members]
+            assert max(temperatures) - min(temperatures) <= 2.0 + 1e-9
+            assert max(times) - min(times) <= 30
+            assert len({protocol["cycles"]["count"] for protocol in members}) == 1
+            assert all(plan["assignments"][index] == number for index in program["reactions"])
+
+            shared = program["program"]
+            assert shared["cycles"]["extension"]["time"] == max(times)
+            assert all(abs(shared["cycles"]["annealing"]["temperature"] - t) <= 1.05 for t in temperatures)
+
+    def test_minimal_windows(self):
+        """Açgözlü taramanın en az sayıda bağlanma penceresi oluşturduğunu test eder."""
+        protocols = []
+        for temperature in (50.0, 50.5, 52.0, 52.1, 54.1, 60.0):
+            protocol = self.optimizer.create_complete_protocol(template_length=1000)
+            protocol["cycles"]["annealing"]["temperature"] = temperature
+            protocols.append(protocol)
+        groups = PlatePlanner(annealing_tolerance=2.0).group(protocols)
+        assert [group.tolist() for group in groups] == [[0, 1, 2], [3, 4], [5]]
+
+    def test_batch_matches_dicts(self):
+        """ProtocolBatch girdisinin sözlük listesiyle aynı gruplamayı verdiğini test eder."""
+        planner = PlatePlanner()
+        batch = self.optimizer.create_protocols_batch(self.records)
+        assert [group.tolist() for group in planner.group(batch)] == [
+            group.tolist() for group in planner.group(self.protocols)
+        ]
+
+    def test_runs_and_modes(self):
+        """Çalıştırma sayısını ve touchdown protokollerinin ayrı tutulmasını test eder."""
+        protocols = [self.optimizer.create_complete_protocol(template_length=1000) for _ in range(200)]
+        protocols.append(self.optimizer.create_complete_protocol(template_length=1000, mode="touchdown"))
+        plan = PlatePlanner(plate_size=96).plan(protocols)
+        assert plan["program_count"] == 2
+        assert plan["run_count"] == 4
+        touchdown = plan["programs"][plan["assignments"][200]]["program"]
+        assert touchdown["cycle_stages"][-1]["annealing"] == touchdown["cycles"]["annealing"]
+
+        assert PlatePlanner().plan([])["program_count"] == 0
+        with pytest.raises(ValueError):
+            PlatePlanner(plate_size=0)
+
+    def test_touchdown_stages_use_group_maximum(self):
+        """Touchdown ön aşamalarının uzama süresinin de grubun en yüksek değeri olduğunu test eder."""
+        self.optimizer.calculator.polymerase_speed = 16
+        protocols = [
+            self.optimizer.create_complete_protocol(template_length=length, mode="touchdown")
+            for length in (500, 900)
+        ]
+        assert protocols[0]["cycle_stages"][0]["extension"]["time"] < protocols[1]["cycle_stages"][0]["extension"]["time"]
+
+        plan = PlatePlanner(extension_tolerance=100).plan(protocols)
+        assert plan["program_count"] == 1
+        program = plan["programs"][0]["program"]
+        assert len(program["cycle_stages"]) == 2
+        longest = protocols[1]["cycles"]["extension"]["time"]
+        for stage in program["cycle_stages"]:
+            assert stage["extension"]["time"] == longest
+        # Touchdown bağlanma profili korunur
+        assert program["cycle_stages"][0]["annealing"] == protocols[0]["cycle_stages"][0]["annealing"]
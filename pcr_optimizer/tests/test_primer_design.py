@@ -0,0 +1,99 @@
+"""
+Primer tasarım modülü için birim testleri.
+"""
+
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.primer_design import PrimerDesigner
+from src.utils.validators import validate_primer
+
+
+def reverse_complement(sequence):
+    """Karşılaştırma için basit ters tümleyen."""
+    return sequence.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+
+
+def longest_run(sequence):
+    """Dizideki en uzun homopolimer uzunluğu."""
+    best = run = 1
+    for previous, current in zip(sequence, sequence[1:]):
+        run = run + 1 if previous == current else 1
+        best = max(best, run)
+    return best
+
+
+class TestPrimerDesigner:
+    """PrimerDesigner sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(21)
+        self.template = "".join(rng.choice("ACGT") for _ in range(4000))
+        self.calculator = PCRCalculator()
+
+    def test_candidates_match_scalar_filters(self):
+        """Vektörel filtrelerin tek tek hesaplanan değerlerle uyumlu olduğunu test eder."""
+        designer = PrimerDesigner(calculator=self.calculator)
+        candidates = designer.find_candidates(self.template[:600])
+        assert len(candidates["start"]) > 0
+
+        found = set()
+        for start, length, tm in zip(candidates["start"], candidates["length"], candidates["tm"]):
+            primer = self.template[start:start + length]
+            found.add((int(start), int(length)))
+            assert tm == self.calculator.calculate_tm(primer)
+            assert 55 <= tm <= 65
+            assert 40 <= self.calculator.calculate_gc_content(primer) <= 60
+            assert 1 <= sum(base in "GC" for base in primer[-5:]) <= 3
+            assert longest_run(primer) <= 4
+
+        # Filtreleri geçen hiçbir pencere atlanmamalı
+        for start in range(0, 600 - 18):
+            for length in (18, 24):
+                primer = self.template[start:start + length]
+                if len(primer) < length:
+                    continue
+                passes = (
+                    55 <= self.calculator.calculate_tm(primer) <= 65
+                    and 40 <= self.calculator.calculate_gc_content(primer) <= 60
+                    and 1 <= sum(base in "GC" for base in primer[-5:]) <= 3
+                    and longest_run(primer) <= 4
+                )
+                assert passes == ((start, length) in found)
+
+    def test_design_pairs(self):
+        """Önerilen çiftlerin koordinatlarını ve kısıtlarını test eder."""
+        designer = PrimerDesigner(
+            calculator=self.calculator, product_size_range=(200, 600), max_tm_difference=1.0
+        )
+        pairs = designer.design(self.template, top_k=3)
+        assert 0 < len(pairs) <= 3
+
+        penalties = [pair["penalty"] for pair in pairs]
+        assert penalties == sorted(penalties)
+
+        for pair in pairs:
+            forward = pair["forward"]
+            reverse = pair["reverse"]
+            assert self.template[forward["start"]:forward["end"]] == forward["sequence"]
+            assert reverse_complement(self.template[reverse["start"]:reverse["end"]]) == reverse["sequence"]
+            assert pair["product_size"] == reverse["end"] - forward["start"]
+            assert 200 <= pair["product_size"] <= 600
+            assert pair["tm_difference"] <= 1.0
+            assert validate_primer(forward["sequence"]) == forward["sequence"]
+
+            # Tasarlanan primerler şablonda gerçek ürünü verir
+            amplicon = self.calculator.find_amplicon(
+                self.template, forward["sequence"], reverse["sequence"]
+            )
+            assert amplicon["size"] == pair["product_size"]
+
+    def test_no_candidates(self):
+        """Uygun aday yoksa boş liste döndüğünü test eder."""
+        assert PrimerDesigner().design("A" * 500) == []
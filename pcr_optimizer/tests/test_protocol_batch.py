@@ -0,0 +1,112 @@
+"""
+Toplu protokol optimizasyonu için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.optimizer import PCROptimizer
+
+
+def assert_identical(actual, expected):
+    """İki protokolün değer, tür ve anahtar sırası bakımından aynı olduğunu doğrular."""
+    assert type(actual) is type(expected)
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected)
+        for key in expected:
+            assert_identical(actual[key], expected[key])
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for actual_item, expected_item in zip(actual, expected):
+            assert_identical(actual_item, expected_item)
+    else:
+        assert actual == expected
+
+
+class TestProtocolBatch:
+    """PCROptimizer.create_protocols_batch için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(13)
+
+        def primer():
+            if rng.random() < 0.1:
+                return None
+            return "".join(rng.choice("ACGT") for _ in range(rng.choice([12, 13, 18, 22])))
+
+        self.records = []
+        for _ in range(300):
+            self.records.append({
+                "template_length": rng.choice([None, 150, 3000, 3001, 36000, 12345.5]),
+                "forward_primer": primer(),
+                "reverse_primer": primer(),
+                "template_concentration": rng.choice([None, -1, 0.1, 2.5]),
+                "target_yield": rng.choice([None, 1, 64, 100.0]),
+                "is_diagnostic": rng.choice([True, False]),
+                "gc_content": rng.choice([None, 45.2, 55, 56.1, 70.3])
+            })
+        # Dimer ve firkete uyarısı veren, dejenere ve diziyle verilen satırlar
+        self.records.append({
+            "forward_primer": "ATGCATGCATGCACGTACGT", "reverse_primer": "GGGGCCCCAAAATTTTGGGG"
+        })
+        self.records.append({
+            "forward_primer": "ATGCTAGCTAGCTAGCTAGTN", "reverse_primer": "TGCATGCATGCATGCATGCA"
+        })
+        self.records.append({
+            "sequence": "ATGCTAGCTAGCTAGCTAGT" + "ACGT" * 50 + "TGCATGCATGCATGCATGCA",
+            "forward_primer": "ATGCTAGCTAGCTAGCTAGT", "reverse_primer": "TGCATGCATGCATGCATGCA"
+        })
+
+    @pytest.mark.parametrize("tm_model", ["basic", "nearest_neighbor"])
+    def test_matches_scalar_path(self, tm_model):
+        """Toplu sonuçların create_complete_protocol ile birebir aynı olduğunu test eder."""
+        optimizer = PCROptimizer(PCRCalculator(tm_model=tm_model))
+        optimizer.dimer_annealing_adjustment = 2
+
+        batch = optimizer.create_protocols_batch(self.records)
+        assert len(batch) == len(self.records)
+        for protocol, record in zip(batch, self.records):
+            assert_identical(protocol, optimizer.create_complete_protocol(**record))
+
+    def test_columnar_input(self):
+        """Sütunlu tablo girişinin kayıt listesiyle aynı sonucu verdiğini test eder."""
+        optimizer = PCROptimizer()
+        table = {
+            field: [record.get(field) for record in self.records]
+            for field in ("template_length", "forward_primer", "reverse_primer", "gc_content")
+        }
+        batch = optimizer.create_protocols_batch(table)
+        expected = optimizer.create_protocols_batch(
+            [{field: table[field][i] for field in table} for i in range(len(self.records))]
+        )
+
+        assert batch.column("extension_time").tolist() == expected.column("extension_time").tolist()
+        assert_identical(batch[-1], expected[-1])
+        assert_identical(batch.to_dicts(), expected.to_dicts())
+
+    def test_unknown_field(self):
+        """Bilinmeyen alanların hata verdiğini test eder."""
+        with pytest.raises(ValueError):
+            PCROptimizer().create_protocols_batch([{"template_lenght": 500}])
+
+    def test_protocol_modes(self):
+        """Touchdown ve gradyan modundaki satırların skaler yolla aynı sonucu verdiğini test eder."""
+        optimizer = PCROptimizer()
+        modes = ["standard", "touchdown", "gradient", None]
+        records = [dict(record, mode=modes[i % 4]) for i, record in enumerate(self.records)]
+
+        batch = optimizer.create_protocols_batch(records)
+        for protocol, record in zip(batch, records):
+            expected = optimizer.create_complete_protocol(**dict(record, mode=record["mode"] or "standard"))
+            assert_identical(protocol, expected)
+        assert batch[1]["mode"] == "touchdown"
+
+        with pytest.raises(ValueError, match="Bilinmeyen protokol modu"):
+            optimizer.create_protocols_batch([{"template_length": 500, "mode": "stepdown"}])
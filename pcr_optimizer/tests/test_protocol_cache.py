@@ -0,0 +1,157 @@
+"""
+Protokol önbelleği için birim testleri.
+"""
+
+import pytest
+import sys
+import os
+import timeit
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.protocol_cache import ProtocolCache, canonical_parameters, optimizer_fingerprint, protocol_key
+from src.core.protocol_generator import ProtocolGenerator
+
+
+class FakeClock:
+    """Testlerde zamanı elle ilerletmek için saat."""
+
+    def __init__(self):
+        """FakeClock sınıfı için başlatıcı."""
+        self.now = 1000.0
+
+    def __call__(self):
+        """Geçerli zamanı döndürür."""
+        return self.now
+
+
+class TestProtocolCache:
+    """ProtocolCache ve önbellekli ProtocolGenerator için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.parameters = {
+            "template_length": 1500,
+            "forward_primer": "ATGCTAGCTAGCTAGCTAGT",
+            "reverse_primer": "TGCATGCATGCATGCATGCA",
+            "template_concentration": 0.5,
+            "target_yield": 50
+        }
+
+    def test_canonical_key(self):
+        """Büyük/küçük harf, boşluk ve sayı biçiminin anahtarı değiştirmediğini test eder."""
+        variant = {
+            "template_length": "1500",
+            "forward_primer": " atgctagcta gctagctagt\n",
+            "reverse_primer": "TGCATGCATGCATGCATGCA",
+            "template_concentration": "0,5",
+            "target_yield": 50.0,
+            "gc_content": None
+        }
+        assert canonical_parameters(variant) == self.parameters
+        assert protocol_key(canonical_parameters(variant)) == protocol_key(self.parameters)
+        assert protocol_key(self.parameters, {"tm_model": ["basic"]}) != protocol_key(
+            self.parameters, {"tm_model": ["nearest_neighbor"]}
+        )
+
+    def test_generator_hits(self):
+        """Aynı girdilerin önbellekten döndürüldüğünü ve sonucun değişmediğini test eder."""
+        optimizer = PCROptimizer()
+        generator = ProtocolGenerator(optimizer, cache=ProtocolCache(maxsize=8))
+
+        first = generator.generate_protocol(**self.parameters)
+        second = generator.generate_protocol(
+            **dict(self.parameters, forward_primer=self.parameters["forward_primer"].lower())
+        )
+        assert first == second == optimizer.create_complete_protocol(**self.parameters)
+
+        # Döndürülen protokol önbellekteki kaydı değiştirmemeli
+        second["cycles"]["count"] = 0
+        assert generator.generate_protocol(**self.parameters) == first
+
+        stats = generator.cache_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == round(2 / 3, 4)
+
+        assert generator.render(first, "csv") == generator.protocol_to_csv(first)
+        assert generator.generate_rendered("csv", **self.parameters) == generator.protocol_to_csv(first)
+        generator.generate_rendered("csv", **self.parameters)
+        assert generator.cache_stats()["renders"]["hits"] == 1
+        with pytest.raises(ValueError):
+            generator.generate_rendered("xml", **self.parameters)
+
+    def test_render_hit_is_cheaper_than_render(self):
+        """Çıktı önbelleği isabetinin biçimlendirmenin kendisinden ucuz olduğunu test eder."""
+        optimizer = PCROptimizer()
+        cache = ProtocolCache(maxsize=8)
+        generator = ProtocolGenerator(optimizer, cache=cache)
+        protocol = generator.generate_protocol(**self.parameters)
+        key = protocol_key(canonical_parameters(self.parameters), optimizer_fingerprint(optimizer))
+
+        for format in ("text", "csv"):
+            formatter = generator._formatter(format)
+            assert cache.get_or_render(key, format, lambda: formatter(protocol)) == formatter(protocol)
+            hit = min(timeit.repeat(
+                lambda: cache.get_or_render(key, format, lambda: formatter(protocol)), number=200, repeat=5
+            ))
+            render = min(timeit.repeat(lambda: formatter(protocol), number=200, repeat=5))
+            assert hit < render
+
+        # Parametrelerden çıktıya: isabet, protokol önbelleği + biçimlendirmeden ucuzdur
+        generator.generate_rendered("text", **self.parameters)
+        hit = min(timeit.repeat(
+            lambda: generator.generate_rendered("text", **self.parameters), number=200, repeat=5
+        ))
+        render = min(timeit.repeat(
+            lambda: generator.render(generator.generate_protocol(**self.parameters), "text"), number=200, repeat=5
+        ))
+        assert hit < render
+
+    def test_lru_and_ttl(self):
+        """LRU çıkarmasını ve TTL süresinin dolmasını test eder."""
+        clock = FakeClock()
+        cache = ProtocolCache(maxsize=2, ttl=60, clock=clock)
+        for key in ("a", "b", "c"):
+            cache.put(key, {"key": key})
+        assert cache.get("a") is None
+        assert cache.get("c") == {"key": "c"}
+
+        clock.now += 61
+        assert cache.get("c") is None
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["expirations"] == 1
+
+    def test_disk_tier(self, tmp_path):
+        """Disk katmanının yeni bir önbellek nesnesi tarafından okunduğunu test eder."""
+        clock = FakeClock()
+        optimizer = PCROptimizer()
+        generator = ProtocolGenerator(
+            optimizer, cache=ProtocolCache(directory=str(tmp_path), ttl=60, clock=clock)
+        )
+        protocol = generator.generate_protocol(**self.parameters)
+
+        # Yeniden başlatma: boş bellek, aynı klasör
+        restarted = ProtocolGenerator(
+            optimizer, cache=ProtocolCache(directory=str(tmp_path), ttl=60, clock=clock)
+        )
+        assert restarted.generate_protocol(**self.parameters) == protocol
+        assert restarted.cache_stats()["disk_hits"] == 1
+
+        clock.now += 120
+        expired = ProtocolCache(directory=str(tmp_path), ttl=60, clock=clock)
+        key = protocol_key(canonical_parameters(self.parameters))
+        assert expired.get(key) is None
+
+        # Bozuk dosyalar ıska sayılır
+        with open(os.path.join(str(tmp_path), "bozuk.json"), "w") as f:
+            f.write("{")
+        assert ProtocolCache(directory=str(tmp_path)).get("bozuk") is None
+
+    def test_invalid_ttl(self):
+        """Geçersiz TTL değerinin hata verdiğini test eder."""
+        with pytest.raises(ValueError):
+            ProtocolCache(ttl=0)
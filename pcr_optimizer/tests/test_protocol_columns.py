@@ -0,0 +1,108 @@
+"""
+Sütunlu protokol gösterimi için birim testleri.
+"""
+
+import pytest
+import io
+import json
+import random
+import sys
+import os
+
+import numpy as np
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.protocol_columns import COLUMNS, INTEGER_MASK, PROTOCOL_DTYPE, ProtocolColumns
+
+
+def random_dna(rng, length):
+    """Rastgele bir DNA dizisi üretir."""
+    return "".join(rng.choice("ACGT") for _ in range(length))
+
+
+class TestProtocolColumns:
+    """ProtocolColumns sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(24)
+        self.optimizer = PCROptimizer(cycle_model="kinetic", gc_statistic="max")
+        self.records = [
+            {
+                "template_length": rng.randint(100, 9000),
+                "forward_primer": rng.choice([None, random_dna(rng, 20)]),
+                "reverse_primer": rng.choice([None, random_dna(rng, 21)]),
+                "gc_content": rng.choice([None, 44, 61.5]),
+                "sequence": random_dna(rng, 500) if rng.random() < 0.2 else None,
+                "template_concentration": rng.choice([None, 0.01, 3]),
+                "target_yield": rng.choice([None, 40]),
+                "is_diagnostic": rng.random() < 0.3
+            }
+            for _ in range(150)
+        ]
+        modes = [rng.choice(["standard", "touchdown", "gradient"]) for _ in self.records]
+        self.protocols = [
+            self.optimizer.create_complete_protocol(**record, mode=mode)
+            for record, mode in zip(self.records, modes)
+        ]
+
+    def test_round_trip_is_lossless(self):
+        """Sözlük -> sütun -> sözlük dönüşümünün değer, tür ve anahtar sırasını koruduğunu test eder."""
+        columns = ProtocolColumns.from_protocols(self.protocols)
+        assert len(columns) == 150
+        # JSON metni tür (95 / 95.0) ve anahtar sırası farklarını da yakalar
+        assert json.dumps(columns.to_dicts()) == json.dumps(self.protocols)
+        assert json.dumps(columns[-1]) == json.dumps(self.protocols[-1])
+        assert not columns.protocols
+
+        # Standart yapıya uymayan protokol olduğu gibi saklanır
+        odd = dict(self.protocols[0], cycles=dict(self.protocols[0]["cycles"], note="elle eklendi"))
+        odd_columns = ProtocolColumns.from_protocols([odd])
+        assert odd_columns[0] == odd
+        assert odd_columns.column("cycle_count")[0] == odd["cycles"]["count"]
+
+    def test_batch_matches_dicts(self):
+        """ProtocolBatch dönüşümünün sözlük dönüşümüyle aynı sütunları verdiğini test eder."""
+        batch = self.optimizer.create_protocols_batch(self.records)
+        from_batch = ProtocolColumns.from_batch(batch)
+        from_dicts = ProtocolColumns.from_protocols(batch.to_dicts())
+        for name in COLUMNS + (INTEGER_MASK,):
+            np.testing.assert_array_equal(from_batch.column(name), from_dicts.column(name))
+        assert json.dumps(from_batch.to_dicts()) == json.dumps(batch.to_dicts())
+
+    def test_structured_and_npz(self):
+        """Yapılandırılmış dizi ve .npz dışa aktarımlarının kayıpsız olduğunu test eder."""
+        columns = ProtocolColumns.from_protocols(self.protocols)
+        structured = columns.to_structured()
+        assert structured.dtype == PROTOCOL_DTYPE
+        np.testing.assert_array_equal(structured["annealing_temperature"], columns.column("annealing_temperature"))
+        restored = ProtocolColumns.from_structured(structured, columns.extras, columns.protocols)
+        assert json.dumps(restored.to_dicts()) == json.dumps(self.protocols)
+
+        stream = io.BytesIO()
+        columns.save(stream)
+        stream.seek(0)
+        assert json.dumps(ProtocolColumns.load(stream).to_dicts()) == json.dumps(self.protocols)
+
+    def test_columns_are_contiguous(self):
+        """Sütunların kopyalanmadan paylaşılabilen bitişik diziler olduğunu test eder."""
+        columns = ProtocolColumns.from_protocols(self.protocols)
+        for name in COLUMNS:
+            assert columns.column(name).flags["C_CONTIGUOUS"]
+            assert columns.column(name) is columns.column(name)
+        with pytest.raises(IndexError):
+            columns[150]
+
+    def test_arrow(self):
+        """Arrow tablosunda isteğe bağlı sütunların null olarak işaretlendiğini test eder."""
+        pa = pytest.importorskip("pyarrow")
+        columns = ProtocolColumns.from_protocols(self.protocols)
+        table = columns.to_arrow()
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 150
+        assert table.column("gc_content").null_count == sum(
+            "gc_content" not in protocol for protocol in self.protocols
+        )
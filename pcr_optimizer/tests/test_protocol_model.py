@@ -0,0 +1,132 @@
+"""
+Değiştirilemez protokol nesneleri için birim testleri.
+"""
+
+import pytest
+import json
+import pickle
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.protocol_columns import ProtocolColumns
+from src.core.protocol_generator import ProtocolGenerator
+from src.core.protocol_model import CycleBlock, Protocol, Step, as_dict
+
+
+def random_dna(rng, length):
+    """Rastgele bir DNA dizisi üretir."""
+    return "".join(rng.choice("ACGT") for _ in range(length))
+
+
+class TestProtocolModel:
+    """Protocol, CycleBlock ve Step sınıfları için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(25)
+        self.optimizer = PCROptimizer(cycle_model="kinetic")
+        self.protocols = [
+            self.optimizer.create_complete_protocol(
+                template_length=rng.randint(100, 9000),
+                forward_primer=rng.choice([None, random_dna(rng, 20)]),
+                reverse_primer=rng.choice([None, random_dna(rng, 21)]),
+                gc_content=rng.choice([None, 44, 61.5]),
+                sequence=random_dna(rng, 500) if rng.random() < 0.2 else None,
+                template_concentration=rng.choice([None, 0.01, 3]),
+                target_yield=rng.choice([None, 40]),
+                is_diagnostic=rng.random() < 0.3,
+                mode=mode
+            )
+            for mode in [rng.choice(["standard", "touchdown", "gradient"]) for _ in range(60)]
+        ]
+
+    def test_dict_round_trip(self):
+        """Sözlük -> nesne -> sözlük dönüşümünün değer, tür ve anahtar sırasını koruduğunu test eder."""
+        for protocol in self.protocols:
+            model = Protocol.from_dict(protocol)
+            assert json.dumps(model.to_dict()) == json.dumps(protocol)
+            assert model == protocol
+            assert model == Protocol.from_dict(protocol)
+            # Eşleme olarak da sözlükle aynı anahtar ve değerleri verir
+            assert list(model) == list(protocol)
+            assert model["cycles"]["annealing"]["temperature"] == protocol["cycles"]["annealing"]["temperature"]
+            assert model.get("missing") is None
+            assert Protocol.from_dict(model) is model
+
+    def test_bytes_round_trip(self):
+        """İkili gösterimin kayıpsız olduğunu ve sözlük JSON'undan küçük olduğunu test eder."""
+        for protocol in self.protocols:
+            model = Protocol.from_dict(protocol)
+            data = model.to_bytes()
+            assert json.dumps(Protocol.from_bytes(data).to_dict()) == json.dumps(protocol)
+            assert len(data) < len(json.dumps(protocol).encode("utf-8"))
+            assert pickle.loads(pickle.dumps(model)) == model
+            assert hash(Protocol.from_bytes(data)) == hash(model)
+
+        with pytest.raises(ValueError):
+            Protocol.from_bytes(b"\x01")
+        with pytest.raises(ValueError):
+            Protocol.from_bytes(b"\x09" + Protocol.from_dict(self.protocols[0]).to_bytes()[1:])
+
+    def test_immutable(self):
+        """Nesnelerin alanlarının değiştirilemediğini test eder."""
+        model = Protocol.from_dict(self.protocols[0])
+        with pytest.raises(AttributeError):
+            model.gc_content = 10
+        with pytest.raises(AttributeError):
+            model.cycles.count = 5
+        with pytest.raises(AttributeError):
+            del model.cycles.annealing.temperature
+        with pytest.raises(TypeError):
+            model["hold"] = Step(4, "indefinite")
+        with pytest.raises(AttributeError):
+            Step(95, 30).note = "not"
+
+        # İç içe ek bilgiler de salt okunurdur; kaynak sözlük değişse de nesne değişmez
+        touchdown = next(protocol for protocol in self.protocols if "cycle_stages" in protocol)
+        model = Protocol.from_dict(touchdown)
+        digest = hash(model)
+        with pytest.raises(TypeError):
+            model["cycle_stages"][0]["count"] = 99
+        with pytest.raises(AttributeError):
+            model["cycle_stages"].append({})
+        touchdown["cycle_stages"][0]["count"] = 99
+        assert model["cycle_stages"][0]["count"] != 99
+        assert hash(model) == digest
+        model.to_dict()["cycle_stages"][0]["count"] = 98
+        assert model["cycle_stages"][0]["count"] != 98
+
+        step = Step(95, 30)
+        assert step == {"temperature": 95, "time": 30}
+        assert CycleBlock(30, step, Step(58, 30), Step(72, 60)).to_dict()["denaturation"] == step.to_dict()
+
+    def test_generator_adapter(self):
+        """Sözlük tabanlı ProtocolGenerator metotlarının nesnelerle aynı çıktıyı verdiğini test eder."""
+        generator = ProtocolGenerator(self.optimizer)
+        for protocol in self.protocols[:10]:
+            model = Protocol.from_dict(protocol)
+            for format in ("text", "json", "csv"):
+                assert generator.render(model, format) == generator.render(protocol, format)
+            assert generator.protocol_to_text(model) == generator.protocol_to_text(protocol)
+            assert generator.protocol_to_csv(model) == generator.protocol_to_csv(protocol)
+            assert generator.protocol_to_json(model) == generator.protocol_to_json(protocol)
+
+        models = [Protocol.from_dict(protocol) for protocol in self.protocols]
+        for format in ("ndjson", "csv", "text"):
+            assert list(generator.iter_protocols(models, format)) == list(
+                generator.iter_protocols(self.protocols, format)
+            )
+        columns = ProtocolColumns.from_protocols(models)
+        assert json.dumps(columns.to_dicts()) == json.dumps(self.protocols)
+
+    def test_non_standard_dict(self):
+        """Standart yapıya uymayan sözlüklerin reddedildiğini ve as_dict'in sözlükleri değiştirmediğini test eder."""
+        odd = dict(self.protocols[0], cycles=dict(self.protocols[0]["cycles"], note="elle eklendi"))
+        with pytest.raises(ValueError):
+            Protocol.from_dict(odd)
+        assert as_dict(odd) is odd
@@ -0,0 +1,77 @@
+"""
+Protokol akış yazıcıları için birim testleri.
+"""
+
+import pytest
+import io
+import json
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.protocol_generator import STREAM_CSV_HEADER, STREAM_TEXT_SEPARATOR, ProtocolGenerator
+
+
+class TestProtocolStream:
+    """ProtocolGenerator akış yazıcıları için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(22)
+        self.optimizer = PCROptimizer()
+        self.generator = ProtocolGenerator(self.optimizer)
+        self.records = [
+            {
+                "template_length": rng.randint(200, 6000),
+                "forward_primer": "".join(rng.choice("ACGT") for _ in range(20)),
+                "gc_content": rng.choice([None, 40, 65]),
+                "is_diagnostic": rng.random() < 0.3
+            }
+            for _ in range(50)
+        ]
+        self.protocols = [self.optimizer.create_complete_protocol(**record) for record in self.records]
+
+    def test_generate_protocols_in_chunks(self):
+        """Parça parça üretilen protokollerin tek tek oluşturulanlarla aynı olduğunu test eder."""
+        protocols = self.generator.generate_protocols(iter(self.records), chunk_size=7)
+        assert list(protocols) == self.protocols
+        with pytest.raises(ValueError):
+            list(self.generator.generate_protocols(self.records, chunk_size=0))
+
+    def test_ndjson(self):
+        """NDJSON çıktısında her satırın bir protokol olduğunu test eder."""
+        stream = io.StringIO()
+        assert self.generator.write_protocols(iter(self.protocols), stream, "ndjson") == 50
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == json.loads(json.dumps(self.protocols))
+
+    def test_csv_and_text_match_single_protocol_output(self):
+        """CSV ve metin akışının tek protokol çıktılarıyla uyumlu olduğunu test eder."""
+        protocols = self.protocols[:3] + [
+            self.optimizer.create_complete_protocol(template_length=1000, forward_primer="ATGCTAGCTAGCTAGCTAGT",
+                                                    mode=mode)
+            for mode in ("touchdown", "gradient")
+        ]
+        csv_text = "".join(self.generator.iter_protocols(protocols, "csv"))
+        lines = csv_text.splitlines()
+        assert lines[0] == STREAM_CSV_HEADER
+        for number, protocol in enumerate(protocols, 1):
+            rows = [line.split(",", 1)[1] for line in lines[1:] if line.split(",", 1)[0] == str(number)]
+            single = self.generator.protocol_to_csv(protocol).splitlines()[1:]
+            assert [row.split(",")[:4] for row in rows] == [row.split(",")[:4] for row in single]
+
+        text = "".join(self.generator.iter_protocols(protocols, "text"))
+        assert text.split(STREAM_TEXT_SEPARATOR) == [
+            self.generator.protocol_to_text(protocol) for protocol in protocols
+        ]
+
+    def test_invalid_format(self):
+        """Desteklenmeyen biçimin hata verdiğini test eder."""
+        with pytest.raises(ValueError):
+            self.generator.write_protocols(self.protocols, io.StringIO(), "xml")
+        with pytest.raises(ValueError):
+            list(self.generator.iter_protocols(self.protocols, "json"))
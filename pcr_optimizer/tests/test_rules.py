@@ -0,0 +1,114 @@
+"""
+Kural tablosu için birim testleri.
+"""
+
+import pytest
+import random
+import sys
+import os
+
+import numpy as np
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.rules import PRESETS, RULE_OUTPUTS, RuleSet
+
+
+class TestRuleSet:
+    """RuleSet sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        rng = random.Random(14)
+        self.records = [
+            {
+                "gc_content": rng.choice([None, 0, 40.0, 55, 55.1, 65, 65.5, 80.2]),
+                "template_length": rng.choice([None, 0, 500, 3000, 3001, 6001]),
+                "is_diagnostic": rng.choice([True, False])
+            }
+            for _ in range(200)
+        ]
+
+    def test_taq_preset_thresholds(self):
+        """Varsayılan ön ayarın eşik kurallarını test eder."""
+        rules = RuleSet.preset("taq")
+        assert rules.evaluate({})["denaturation_temp"] == 95
+        assert rules.evaluate({"gc_content": 60})["denaturation_temp"] == 97
+        high_gc = rules.evaluate({"gc_content": 70})
+        assert high_gc["denaturation_temp"] == 98
+        assert high_gc["denaturation_time"] == 45
+        assert rules.evaluate({"template_length": 3001})["final_extension_time"] == 600
+        assert rules.evaluate({"is_diagnostic": True})["cycle_count"] == 40
+
+    @pytest.mark.parametrize("preset", sorted(PRESETS))
+    def test_batch_matches_per_call(self, preset):
+        """Toplu değerlendirmenin kayıt kayıt değerlendirmeyle aynı olduğunu test eder."""
+        rules = RuleSet.preset(preset)
+        columns = {
+            field: np.array(
+                [record[field] if record[field] else 0 for record in self.records], dtype=np.float64
+            )
+            for field in ("gc_content", "template_length", "is_diagnostic")
+        }
+        values, _ = rules.evaluate_batch(columns)
+        for i, record in enumerate(self.records):
+            expected = rules.evaluate(record)
+            for output in RULE_OUTPUTS:
+                assert values[output][i].item() == expected[output]
+                assert type(values[output][i].item()) is type(expected[output])
+
+    def test_truthy_diagnostic_flag(self):
+        """Bool olmayan doğru is_diagnostic değerlerinin skaler ve toplu yolda aynı kuralı tetiklediğini test eder."""
+        optimizer = PCROptimizer()
+        for flag in (1, 2, "evet", 1.0):
+            assert optimizer.rules.evaluate({"is_diagnostic": flag})["cycle_count"] == 40
+            batch = optimizer.create_protocols_batch([{"is_diagnostic": flag}])
+            assert batch[0] == optimizer.create_complete_protocol(is_diagnostic=flag)
+            assert batch[0]["cycles"]["count"] == 40
+        assert optimizer.rules.evaluate({"is_diagnostic": 0}) == optimizer.rules.evaluate({})
+
+    def test_explain(self):
+        """Tetiklenen kuralların sırayla listelendiğini test eder."""
+        fired = PCROptimizer().explain_rules(template_length=5000, gc_content=70)
+        assert [rule["name"] for rule in fired] == [
+            "gc_yuksek_denaturasyon", "gc_cok_yuksek_denaturasyon", "uzun_sablon_son_uzama"
+        ]
+        assert fired[1]["condition"] == "gc_content > 65"
+        assert fired[1]["set"]["denaturation_temp"] == 98
+        assert PCROptimizer().explain_rules(gc_content=40) == []
+
+    def test_custom_table_and_preset(self):
+        """Özel tablo ve ön ayarların optimizasyona uygulandığını test eder."""
+        table = {
+            "defaults": dict(PRESETS["taq"]["defaults"], annealing_time=45.5),
+            "rules": [{"name": "kisa", "when": ("template_length", "<", 200), "set": {"annealing_time": 15}}]
+        }
+        optimizer = PCROptimizer(rules=table)
+        assert optimizer.optimize_times(150)["annealing_time"] == 15
+        assert optimizer.optimize_times(500)["annealing_time"] == 45.5
+
+        batch = optimizer.create_protocols_batch([{"template_length": 150}, {"template_length": 500}])
+        assert [protocol["cycles"]["annealing"]["time"] for protocol in batch] == [15, 45.5]
+        assert type(batch[0]["cycles"]["annealing"]["time"]) is int
+
+        high_fidelity = PCROptimizer(rules="high_fidelity")
+        protocol = high_fidelity.create_complete_protocol(template_length=500, is_diagnostic=True)
+        assert protocol["cycles"]["denaturation"]["temperature"] == 98
+        assert protocol["cycles"]["count"] == 35
+        assert high_fidelity.create_protocols_batch(
+            [{"template_length": 500, "is_diagnostic": True}]
+        )[0] == protocol
+
+    def test_invalid_table(self):
+        """Geçersiz tabloların hata verdiğini test eder."""
+        with pytest.raises(ValueError):
+            RuleSet({"defaults": {}, "rules": []})
+        with pytest.raises(ValueError):
+            RuleSet({
+                "defaults": PRESETS["taq"]["defaults"],
+                "rules": [{"name": "x", "when": ("primer_length", ">", 20), "set": {}}]
+            })
+        with pytest.raises(ValueError):
+            RuleSet.preset("pfu")
@@ -0,0 +1,92 @@
+"""
+Çalıştırma planlayıcısı için birim testleri.
+"""
+
+import pytest
+import itertools
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.cycling import total_time
+from src.core.optimizer import PCROptimizer
+from src.core.plate_planner import PlatePlanner
+from src.core.scheduler import RunScheduler, jobs_from_plan
+
+
+class TestRunScheduler:
+    """RunScheduler sınıfı için test sınıfı."""
+
+    def test_exact_matches_brute_force(self):
+        """Kesin yöntemin tüm atamaların en iyisini bulduğunu ve LPT'nin bundan iyi olmadığını test eder."""
+        rng = random.Random(20)
+        for _ in range(50):
+            instruments = [{"capacity": rng.choice([48, 96, 384])} for _ in range(rng.randint(1, 3))]
+            jobs = [
+                {"duration": rng.randint(1, 90) * 60, "reactions": rng.randint(1, 96)}
+                for _ in range(rng.randint(1, 6))
+            ]
+            exact = RunScheduler(instruments, "exact", split=False).schedule(jobs)
+            lpt = RunScheduler(instruments, "lpt", split=False).schedule(jobs)
+
+            loads = [
+                [-(-job["reactions"] // instrument["capacity"]) * job["duration"] for instrument in instruments]
+                for job in jobs
+            ]
+            best = min(
+                max(sum(loads[j][m] for j in range(len(jobs)) if assignment[j] == m)
+                    for m in range(len(instruments)))
+                for assignment in itertools.product(range(len(instruments)), repeat=len(jobs))
+            )
+            assert exact["makespan"] == best
+            assert lpt["makespan"] >= best
+
+    def test_runs_are_sequential(self):
+        """Her cihazdaki çalıştırmaların çakışmadığını ve tüm işlerin atandığını test eder."""
+        jobs = [{"duration": 3600 + 60 * i, "reactions": 40 * (i + 1), "name": f"P{i}"} for i in range(10)]
+        result = RunScheduler([{"name": "A", "capacity": 96}, {"name": "B", "capacity": 48}]).schedule(jobs)
+        assert result["method"] == "lpt"
+        for instrument in result["instruments"]:
+            previous_end = 0
+            for run in instrument["runs"]:
+                assert run["start"] == previous_end
+                previous_end = run["end"]
+            assert instrument["busy_time"] == previous_end
+        assert result["makespan"] == max(instrument["busy_time"] for instrument in result["instruments"])
+
+        # Bölünen işlerin reaksiyon sayıları korunur
+        scheduled = {}
+        for assignment in result["assignments"]:
+            scheduled[assignment["job"]] = scheduled.get(assignment["job"], 0) + assignment["reactions"]
+        assert scheduled == {i: job["reactions"] for i, job in enumerate(jobs)}
+
+    def test_split_uses_idle_instruments(self):
+        """Büyük işlerin parçalanarak boş cihazlara dağıtıldığını test eder."""
+        instruments = [{"capacity": 96}, {"capacity": 96}]
+        jobs = [{"duration": 3600, "reactions": 192}]
+        assert RunScheduler(instruments, split=False).schedule(jobs)["makespan"] == 7200
+        assert RunScheduler(instruments).schedule(jobs)["makespan"] == 3600
+
+    def test_plate_plan_jobs(self):
+        """Plaka planından oluşturulan işlerin protokol toplam süresini kullandığını test eder."""
+        optimizer = PCROptimizer()
+        protocols = [optimizer.create_complete_protocol(template_length=length) for length in (500, 900, 6000)]
+        jobs = jobs_from_plan(PlatePlanner().plan(protocols))
+        result = RunScheduler([{"capacity": 96}]).schedule(jobs)
+        assert result["makespan"] == sum(total_time(job["protocol"]) for job in jobs)
+
+    def test_invalid_arguments(self):
+        """Geçersiz cihaz, yöntem ve girdi boyutlarının hata verdiğini test eder."""
+        with pytest.raises(ValueError):
+            RunScheduler([])
+        with pytest.raises(ValueError):
+            RunScheduler([{"capacity": 0}])
+        with pytest.raises(ValueError):
+            RunScheduler([{"capacity": 96}], method="genetic")
+        with pytest.raises(ValueError):
+            RunScheduler([{"capacity": 96}], method="exact").schedule(
+                [{"duration": 60, "reactions": 1}] * 13
+            )
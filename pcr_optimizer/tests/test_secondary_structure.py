@@ -0,0 +1,102 @@
+"""
+Firkete (hairpin) tahmin modülü için birim testleri.
+"""
+
+import functools
+import math
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.optimizer import PCROptimizer
+from src.core.secondary_structure import (
+    BULGE_ENERGY, MIN_LOOP_LENGTH, hairpin_loop_energy, predict_hairpin,
+    predict_hairpins_batch
+)
+from src.core.thermodynamics import (
+    NN_ENTHALPY, NN_ENTROPY, TERMINAL_ENTHALPY, TERMINAL_ENTROPY
+)
+
+
+CODES = {"A": 0, "C": 1, "G": 2, "T": 3}
+
+
+def stack_energy(first, second):
+    """37°C'de dinükleotit istifleme enerjisi."""
+    index = 4 * CODES[first] + CODES[second]
+    return NN_ENTHALPY[index] - 310.15 * NN_ENTROPY[index] / 1000
+
+
+def reference_delta_g(sequence):
+    """Karşılaştırma için özyinelemeli referans katlama."""
+    @functools.lru_cache(None)
+    def closed(i, j):
+        pairs = sequence[i] in CODES and sequence[j] in CODES and \
+            CODES[sequence[i]] + CODES[sequence[j]] == 3
+        if not pairs or j - i - 1 < MIN_LOOP_LENGTH:
+            return math.inf
+        best = hairpin_loop_energy(j - i - 1)
+        for left, right, partner, penalty in ((1, 1, 1, 0), (2, 1, 2, BULGE_ENERGY), (1, 2, 1, BULGE_ENERGY)):
+            if (j - right) - (i + left) - 1 >= MIN_LOOP_LENGTH:
+                best = min(best, closed(i + left, j - right)
+                           + stack_energy(sequence[i], sequence[i + partner]) + penalty)
+        return best
+
+    best = 0.0
+    for i in range(len(sequence)):
+        for j in range(i + MIN_LOOP_LENGTH + 1, len(sequence)):
+            energy = closed(i, j)
+            if energy < math.inf:
+                code = CODES[sequence[i]]
+                best = min(best, energy + TERMINAL_ENTHALPY[code] - 310.15 * TERMINAL_ENTROPY[code] / 1000)
+    return best
+
+
+class TestSecondaryStructure:
+    """Firkete tahmini için test sınıfı."""
+
+    def test_matches_reference(self):
+        """Anti-köşegen DP sonucunun özyinelemeli referansla aynı olduğunu test eder."""
+        rng = random.Random(11)
+        primers = ["".join(rng.choice("ACGT") for _ in range(rng.randint(3, 32))) for _ in range(120)]
+        primers += ["GCGCGAAAACGCGC", "ACGTNACGT", ""]
+
+        result = predict_hairpins_batch(primers, chunk_size=50)
+        for n, primer in enumerate(primers):
+            assert abs(result["delta_g"][n] - reference_delta_g(primer)) < 1e-9
+
+        # ΔG, geri izlemeyle bulunan ΔH ve ΔS ile tutarlı olmalı
+        stable = result["delta_g"] < 0
+        recomputed = result["delta_h"] - 310.15 * result["delta_s"] / 1000
+        assert abs(recomputed[stable] - result["delta_g"][stable]).max() < 1e-9
+
+    def test_stable_hairpin(self):
+        """Belirgin bir gövde-ilmek yapısının bulunduğunu test eder."""
+        hairpin = predict_hairpin("GCGCGAAAACGCGC")
+        assert hairpin["delta_g"] < -3
+        assert hairpin["stem_length"] == 5
+        assert hairpin["loop_length"] == 4
+        assert hairpin["tm"] > 37
+
+    def test_no_structure(self):
+        """Yapı oluşturamayan primer için sıfır ΔG ve None Tm döndüğünü test eder."""
+        hairpin = predict_hairpin("AAAAAAAAAAAAAAAAAAAA")
+        assert hairpin == {"delta_g": 0.0, "tm": None, "stem_length": 0, "loop_length": 0}
+
+    def test_calculator_and_optimizer(self):
+        """Hesaplayıcı ve optimize edicinin firkete sonuçlarını kullandığını test eder."""
+        calculator = PCRCalculator(cache_size=16)
+        assert calculator.calculate_hairpin("gcgcgaaaacgcgc") == predict_hairpin("GCGCGAAAACGCGC")
+        batch = calculator.calculate_hairpin_batch(["GCGCGAAAACGCGC", "AAAAAAAAAA"])
+        assert math.isnan(batch["tm"][1])
+
+        protocol = PCROptimizer(calculator=calculator).create_complete_protocol(
+            template_length=500,
+            forward_primer="GCGCGAAAACGCGCTTAGTC",
+            reverse_primer="TTGACCTAGGATCCAAGTCC"
+        )
+        assert any("firkete" in warning for warning in protocol["warnings"])
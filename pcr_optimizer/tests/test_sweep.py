@@ -0,0 +1,113 @@
+"""
+Parametre taraması için birim testleri.
+"""
+
+import pytest
+import csv
+import functools
+import io
+import json
+import multiprocessing
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import sweep as sweep_module
+from src.core.calculator import PCRCalculator
+from src.core.optimizer import PCROptimizer
+from src.core.sweep import ParameterGrid, ParameterSweep, parse_range
+
+
+class TestParameterSweep:
+    """ParameterGrid ve ParameterSweep sınıfları için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.optimizer = PCROptimizer()
+        self.grid = ParameterGrid(
+            {
+                "template_length": [200, 1500, 4000],
+                "gc_content": [40, 60, 70.5],
+                "template_concentration": [0.5, 5]
+            },
+            fixed={
+                "forward_primer": "ATGCTAGCTAGCTAGCTAGT",
+                "reverse_primer": "TGCATGCATGCATGCATGCA",
+                "target_yield": 50
+            }
+        )
+
+    def test_parse_range(self):
+        """Aralık ve liste tanımlarının ayrıştırılmasını test eder."""
+        assert parse_range("500:2000:500") == [500, 1000, 1500, 2000]
+        assert parse_range("0,1:0,3:0,1") == [0.1, 0.2, 0.3]
+        assert parse_range("40;55,5;70") == [40, 55.5, 70]
+        for text in ("a:b:c", "10:1:1", "1:5:0", "1:5", ""):
+            with pytest.raises(ValueError):
+                parse_range(text)
+
+    def test_grid_order(self):
+        """Izgaranın Kartezyen sırayla ve parçalar hâlinde üretildiğini test eder."""
+        assert len(self.grid) == 18
+        points = list(self.grid)
+        assert points[0]["template_length"] == 200
+        assert points[1]["template_concentration"] == 5
+        assert points[-1]["gc_content"] == 70.5
+        assert [len(chunk) for chunk in self.grid.chunks(7)] == [7, 7, 4]
+        with pytest.raises(ValueError):
+            ParameterGrid({"primer_length": [20]})
+
+    def test_rows_match_protocols(self):
+        """Tarama satırlarının create_complete_protocol ile aynı olduğunu test eder."""
+        rows = list(ParameterSweep(self.optimizer, chunk_size=5).iter_rows(self.grid))
+        for point, row in zip(self.grid, rows):
+            protocol = self.optimizer.create_complete_protocol(**point)
+            assert row["template_length"] == point["template_length"]
+            assert row["annealing_temp"] == protocol["cycles"]["annealing"]["temperature"]
+            assert row["denaturation_temp"] == protocol["cycles"]["denaturation"]["temperature"]
+            assert row["extension_time"] == protocol["cycles"]["extension"]["time"]
+            assert row["cycle_count"] == protocol["cycles"]["count"]
+            assert row["warnings"] == protocol.get("warnings", [])
+
+    def test_write_formats(self):
+        """CSV ve NDJSON çıktılarının aynı satırları içerdiğini test eder."""
+        sweep = ParameterSweep(self.optimizer, chunk_size=4)
+        csv_stream = io.StringIO()
+        assert sweep.write(self.grid, csv_stream, "csv") == 18
+        csv_rows = list(csv.DictReader(io.StringIO(csv_stream.getvalue())))
+
+        ndjson_stream = io.StringIO()
+        sweep.write(self.grid, ndjson_stream, "ndjson")
+        json_rows = [json.loads(line) for line in ndjson_stream.getvalue().splitlines()]
+
+        assert len(csv_rows) == len(json_rows) == 18
+        for csv_row, json_row in zip(csv_rows, json_rows):
+            assert float(csv_row["annealing_temp"]) == json_row["annealing_temp"]
+            assert csv_row["warnings"] == "; ".join(json_row["warnings"])
+        with pytest.raises(ValueError):
+            sweep.write(self.grid, io.StringIO(), "xlsx")
+
+    def test_process_pool(self):
+        """Süreç havuzuyla sonuçların aynı sırada ve aynı değerde olduğunu test eder."""
+        serial = list(ParameterSweep(self.optimizer, chunk_size=4).iter_rows(self.grid))
+        parallel = list(ParameterSweep(self.optimizer, chunk_size=4, processes=2).iter_rows(self.grid))
+        assert parallel == serial
+
+    @pytest.mark.parametrize("start_method", ["fork", "spawn"])
+    def test_process_pool_with_cached_calculator(self, start_method, monkeypatch):
+        """Önbellekli hesaplayıcının (kilit içeren LRUCache) süreç havuzunda çalıştığını test eder."""
+        if start_method not in multiprocessing.get_all_start_methods():
+            pytest.skip(f"{start_method} başlatma yöntemi desteklenmiyor")
+        monkeypatch.setattr(
+            sweep_module, "ProcessPoolExecutor",
+            functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context(start_method))
+        )
+        optimizer = PCROptimizer(calculator=PCRCalculator(cache_size=100))
+        serial = list(ParameterSweep(self.optimizer, chunk_size=4).iter_rows(self.grid))
+        stream = io.StringIO()
+        count = ParameterSweep(optimizer, chunk_size=4, processes=2).write(self.grid, stream, "ndjson")
+        assert count == 18
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == serial
@@ -0,0 +1,136 @@
+"""
+Derlenmiş protokol metni oluşturucusu için birim testleri.
+"""
+
+import pytest
+import copy
+import random
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.optimizer import PCROptimizer
+from src.core.protocol_batch import assemble_protocol
+from src.core.text_renderer import TextRenderer
+
+
+# Beklenen (altın) metinler: biçimdeki her değişiklik bu testleri bozar
+GOLDEN_STANDARD = (
+    "# PCR Protokolü\n\n"
+    "## Başlangıç Denatürasyonu\n- Sıcaklık: 95°C\n- Süre: 3 dk 0 sn\n\n"
+    "## Döngüler (x30)\n"
+    "### Denatürasyon\n- Sıcaklık: 95°C\n- Süre: 30 sn\n\n"
+    "### Bağlanma (Annealing)\n- Sıcaklık: 58.4°C\n- Süre: 30 sn\n\n"
+    "### Uzama (Extension)\n- Sıcaklık: 72°C\n- Süre: 1 dk 35 sn\n\n"
+    "## Son Uzama\n- Sıcaklık: 72°C\n- Süre: 5 dk 0 sn\n\n"
+    "## Saklama\n- Sıcaklık: 4°C\n- Süre: Süresiz\n\n"
+    "GC İçeriği: %52.5\n\n"
+    "PCR Ürünü: 840 bp (şablon konumu 100-939)\n\n"
+    "## Uyarılar\n- Birinci uyarı\n- İkinci uyarı\n\n"
+    "Tahmini Toplam Süre: 1 saat 25 dakika 30 saniye\n"
+)
+
+GOLDEN_TOUCHDOWN_CYCLES = (
+    "## Döngüler - Aşama 1: Touchdown (x5)\n"
+    "### Denatürasyon\n- Sıcaklık: 95°C\n- Süre: 30 sn\n\n"
+    "### Bağlanma (Annealing)\n- Sıcaklık: 63.4°C → 59.4°C (döngü başına -1.0°C)\n- Süre: 30 sn\n\n"
+    "### Uzama (Extension)\n- Sıcaklık: 72°C\n- Süre: 1 dk 35 sn\n\n"
+    "## Döngüler - Aşama 2: Çoğaltma (x30)\n"
+)
+
+GOLDEN_GRADIENT = (
+    "## Gradyan Bağlanma Sıcaklıkları (3 sütun)\n"
+    "- Sütun 1: 56.0°C\n- Sütun 2: 58.4°C\n- Sütun 3: 60.8°C\n"
+    "- Önerilen: Sütun 2 (58.4°C)\n\n"
+)
+
+
+def golden_protocol():
+    """Altın metinlerin oluşturulduğu sabit protokolü döndürür."""
+    protocol = assemble_protocol(
+        {"denaturation_temp": 95, "annealing_temp": 58.4, "extension_temp": 72},
+        {"initial_denaturation_time": 180, "denaturation_time": 30, "annealing_time": 30,
+         "extension_time": 95, "final_extension_time": 300},
+        30
+    )
+    protocol["gc_content"] = 52.5
+    protocol["amplicon"] = {"size": 840, "start": 99, "end": 939}
+    protocol["warnings"] = ["Birinci uyarı", "İkinci uyarı"]
+    return protocol
+
+
+class TestTextRenderer:
+    """TextRenderer sınıfı için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.renderer = TextRenderer()
+
+    def test_golden_standard(self):
+        """Standart protokol metninin altın metinle bayt düzeyinde aynı olduğunu test eder."""
+        assert self.renderer.render(golden_protocol()) == GOLDEN_STANDARD
+
+    def test_golden_modes(self):
+        """Touchdown aşamalarının ve gradyan bloğunun altın metinlerle aynı olduğunu test eder."""
+        touchdown = golden_protocol()
+        first = copy.deepcopy(touchdown["cycles"])
+        first.update(count=5, label="Touchdown")
+        first["annealing"] = {"temperature": 63.4, "time": 30, "step": -1.0}
+        touchdown["cycle_stages"] = [first, dict(copy.deepcopy(touchdown["cycles"]), label="Çoğaltma")]
+        text = self.renderer.render(touchdown)
+        assert GOLDEN_TOUCHDOWN_CYCLES in text
+        assert text.endswith("Tahmini Toplam Süre: 1 saat 38 dakika 25 saniye\n")
+
+        gradient = golden_protocol()
+        gradient["gradient"] = {"columns": 3, "temperatures": [56.0, 58.4, 60.8], "recommended_column": 2}
+        text = self.renderer.render(gradient)
+        assert GOLDEN_GRADIENT in text
+        assert text.replace(GOLDEN_GRADIENT, "") == GOLDEN_STANDARD
+
+    def test_value_types_are_kept(self):
+        """Tam sayı ve ondalık sürelerin önbelleğe rağmen farklı biçimlendirildiğini test eder."""
+        assert self.renderer.format_time(30) == "30 sn"
+        assert self.renderer.format_time(30.0) == "30.0 sn"
+        assert self.renderer.format_time(90) == "1 dk 30 sn"
+        assert self.renderer.format_total(3600) == "1 saat"
+        assert self.renderer.format_total(3600.0) == "1.0 saat"
+
+    def test_render_many_matches_render(self):
+        """render_many'nin sözlük listesi ve ProtocolBatch için render ile aynı metni verdiğini test eder."""
+        rng = random.Random(23)
+        optimizer = PCROptimizer()
+        records = [
+            {
+                "template_length": rng.randint(150, 8000),
+                "forward_primer": "".join(rng.choice("ACGT") for _ in range(20)),
+                "reverse_primer": rng.choice([None, "".join(rng.choice("ACGT") for _ in range(22))]),
+                "gc_content": rng.choice([None, 35, 62.5]),
+                "template_concentration": rng.choice([None, 0.01, 5]),
+                "target_yield": rng.choice([None, 50]),
+                "is_diagnostic": rng.random() < 0.3
+            }
+            for _ in range(100)
+        ]
+        batch = optimizer.create_protocols_batch(records)
+        expected = [self.renderer.render(protocol) for protocol in batch.to_dicts()]
+        assert list(self.renderer.render_many(batch)) == expected
+        assert list(self.renderer.render_many(iter(batch.to_dicts()))) == expected
+
+        protocols = [
+            optimizer.create_complete_protocol(**records[0], mode=mode)
+            for mode in ("standard", "touchdown", "gradient")
+        ]
+        assert list(self.renderer.render_many(protocols)) == [
+            self.renderer.render(protocol) for protocol in protocols
+        ]
+
+    def test_custom_strings(self):
+        """Yerel dil metinlerinin değiştirilebildiğini test eder."""
+        renderer = TextRenderer({"title": "PCR Protocol", "indefinite": "Forever"})
+        text = renderer.render(golden_protocol())
+        assert text.startswith("# PCR Protocol\n\n")
+        assert "- Süre: Forever\n" in text
+        with pytest.raises(KeyError):
+            renderer.render({})
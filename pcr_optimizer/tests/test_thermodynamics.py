@@ -0,0 +1,65 @@
+"""
+En yakın komşu Tm modeli için birim testleri.
+"""
+
+import pytest
+import sys
+import os
+
+# src dizinini Python yoluna ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.calculator import PCRCalculator
+from src.core.optimizer import PCROptimizer
+from src.core.thermodynamics import NearestNeighborModel
+
+
+class TestNearestNeighborModel:
+    """NearestNeighborModel ve Tm modeli seçimi için test sınıfı."""
+
+    def setup_method(self):
+        """Her test için çalışacak kurulum metodu."""
+        self.calculator = PCRCalculator(tm_model="nearest_neighbor")
+
+    def test_known_primer_range(self):
+        """Bilinen bir primerin Tm değerinin makul aralıkta olduğunu test eder."""
+        # Standart koşullarda (50 mM Na⁺, 1.5 mM Mg²⁺) beta-aktin primeri
+        tm = self.calculator.calculate_tm("AGAGCTACGAGCTGCCTGAC")
+        assert 60 <= tm <= 66
+
+    def test_batch_matches_scalar(self):
+        """Toplu hesaplamanın tekli hesaplamayla aynı olduğunu test eder."""
+        primers = [
+            "AGAGCTACGAGCTGCCTGAC", "ATGGTGAGCAAGGGCGAG", "ACGTACGTACGT",
+            "gcgcgc", "ACGTNNACGTACGTACGT", "A", ""
+        ]
+        batch = self.calculator.calculate_tm_batch(primers)
+
+        for primer, tm in zip(primers, batch):
+            assert tm == self.calculator.calculate_tm(primer)
+
+    def test_salt_and_concentration_corrections(self):
+        """Tuz ve primer konsantrasyonunun Tm'yi artırdığını test eder."""
+        primer = "AGAGCTACGAGCTGCCTGAC"
+        low_salt = NearestNeighborModel(na_conc=20, mg_conc=0, dntp_conc=0)
+        high_salt = NearestNeighborModel(na_conc=20, mg_conc=3, dntp_conc=0)
+        assert high_salt.calculate_tm(primer) > low_salt.calculate_tm(primer)
+
+        low_conc = NearestNeighborModel(primer_conc=50)
+        high_conc = NearestNeighborModel(primer_conc=1000)
+        assert high_conc.calculate_tm(primer) > low_conc.calculate_tm(primer)
+
+    def test_unknown_model(self):
+        """Bilinmeyen model adı için hata verildiğini test eder."""
+        with pytest.raises(ValueError):
+            PCRCalculator(tm_model="unknown")
+
+    def test_optimizer_uses_configured_model(self):
+        """Optimizer'ın hesaplayıcının Tm modelini kullandığını test eder."""
+        forward = "AGAGCTACGAGCTGCCTGAC"
+        reverse = "AGCACTGTGTTGGCGTACAG"
+        optimizer = PCROptimizer(calculator=self.calculator)
+        temps = optimizer.optimize_temperatures(forward, reverse)
+
+        assert temps["annealing_temp"] == self.calculator.calculate_annealing_temp(forward, reverse)
+        assert temps["annealing_temp"] != PCROptimizer().optimize_temperatures(forward, reverse)["annealing_temp"]
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+PCR parametre taraması scripti.
+Verilen parametre aralıklarının tüm kombinasyonları için protokol hesaplar ve
+sonuçları CSV veya NDJSON olarak akışa yazar.
+
+Örnek:
+    python run_sweep.py --template-length 500:5000:500 --gc-content 40:70:5 \\
+        --template-concentration "0,1;1;10" --target-yield 50 -o tarama.csv
+"""
+
+import argparse
+import sys
+import os
+
+try:
+    from src.core.calculator import PCRCalculator
+    from src.core.cycling import PROTOCOL_MODES
+    from src.core.optimizer import PCROptimizer
+    from src.core.rules import PRESETS
+    from src.core.sweep import (
+        DEFAULT_CHUNK_SIZE, SWEEP_FORMATS, ParameterGrid, ParameterSweep, parse_range
+    )
+except ImportError:
+    # Çalışma dizininden göreceli olarak içe aktar
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from src.core.calculator import PCRCalculator
+    from src.core.cycling import PROTOCOL_MODES
+    from src.core.optimizer import PCROptimizer
+    from src.core.rules import PRESETS
+    from src.core.sweep import (
+        DEFAULT_CHUNK_SIZE, SWEEP_FORMATS, ParameterGrid, ParameterSweep, parse_range
+    )
+
+# Komut satırından taranabilen parametreler (seçenek adı -> protokol argümanı)
+RANGE_OPTIONS = {
+    "template_length": "Şablon DNA uzunluğu (bp)",
+    "gc_content": "Şablon GC içeriği (%)",
+    "template_concentration": "Şablon DNA konsantrasyonu (ng/μL)",
+    "target_yield": "Hedeflenen ürün miktarı (ng/μL)"
+}
+
+
+def build_parser():
+    """Komut satırı argüman ayrıştırıcısını oluşturur."""
+    parser = argparse.ArgumentParser(
+        description="PCR protokol parametrelerini bir değer ızgarası üzerinde tarar.",
+        epilog="Aralıklar 'başlangıç:bitiş:adım' (bitiş dahil) veya ';' ile ayrılmış "
+               "değerler olarak verilir."
+    )
+    for name, help_text in RANGE_OPTIONS.items():
+        parser.add_argument("--" + name.replace("_", "-"), dest=name, help=help_text)
+    parser.add_argument("--forward-primer", help="İleri primer dizisi (tüm noktalarda sabit)")
+    parser.add_argument("--reverse-primer", help="Geri primer dizisi (tüm noktalarda sabit)")
+    parser.add_argument("--diagnostic", action="store_true", help="Tanısal PCR kuralları uygulansın")
+    parser.add_argument("--mode", default="standard", choices=PROTOCOL_MODES,
+                        help="Protokol modu (tüm noktalarda sabit)")
+    parser.add_argument("--tm-model", default="basic", choices=("basic", "nearest_neighbor"),
+                        help="Tm hesaplama modeli")
+    parser.add_argument("--rules", default="taq", choices=sorted(PRESETS),
+                        help="Polimeraz/kit ön ayarı")
+    parser.add_argument("--cycle-model", default="log2", choices=("log2", "kinetic"),
+                        help="Döngü sayısı modeli")
+    parser.add_argument("--format", default="csv", choices=SWEEP_FORMATS, help="Çıktı biçimi")
+    parser.add_argument("-o", "--output", help="Çıktı dosyası (verilmezse standart çıktı)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Bir parçada hesaplanan nokta sayısı")
+    parser.add_argument("--processes", type=int, help="Parçaları dağıtmak için süreç sayısı")
+    return parser
+
+
+def main(argv=None):
+    """Taramayı çalıştırır ve yazılan satır sayısını standart hataya bildirir."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    ranges = {}
+    try:
+        for name in RANGE_OPTIONS:
+            if getattr(args, name):
+                ranges[name] = parse_range(getattr(args, name))
+    except ValueError as error:
+        parser.error(str(error))
+    if not ranges:
+        parser.error("En az bir parametre aralığı verilmelidir.")
+
+    fixed = {"is_diagnostic": args.diagnostic}
+    if args.forward_primer:
+        fixed["forward_primer"] = args.forward_primer
+    if args.reverse_primer:
+        fixed["reverse_primer"] = args.reverse_primer
+    if args.mode != "standard":
+        fixed["mode"] = args.mode
+
+    optimizer = PCROptimizer(
+        calculator=PCRCalculator(tm_model=args.tm_model), rules=args.rules,
+        cycle_model=args.cycle_model
+    )
+    grid = ParameterGrid(ranges, fixed)
+    sweep = ParameterSweep(optimizer, chunk_size=args.chunk_size, processes=args.processes)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            count = sweep.write(grid, f, args.format)
+    else:
+        count = sweep.write(grid, sys.stdout, args.format)
+    print(f"{count} protokol yazıldı.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,40 @@ PCR Optimizer ana web uygulaması.
 """
 
 from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import Response, stream_with_context
 import os
 import io
 from datetime import datetime
 
 # Core sınıflarımızı içe aktar
 from core.calculator import PCRCalculator
+from core.cycling import PROTOCOL_MODES
 from core.optimizer import PCROptimizer
+from core.protocol_cache import ProtocolCache
 from core.protocol_generator import ProtocolGenerator
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'pcr-optimizer-secret-key'
 app.config['UPLOAD_FOLDER'] = 'uploads'
 
+# Protokol önbelleği: süre (saniye) ve isteğe bağlı disk klasörü
+app.config['PROTOCOL_CACHE_TTL'] = 24 * 3600
+app.config['PROTOCOL_CACHE_DIR'] = os.environ.get('PCR_PROTOCOL_CACHE_DIR')
+
 # Ana dizini oluştur (eğer yoksa)
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
 # Ana sınıfları başlat
-calculator = PCRCalculator()
-optimizer = PCROptimizer()
-protocol_generator = ProtocolGenerator(optimizer)
+# Aynı primerler tekrar tekrar gönderildiği için Tm/GC değerleri önbelleğe alınır
+calculator = PCRCalculator(cache_size=4096)
+optimizer = PCROptimizer(calculator=calculator)
+# Aynı istekler için protokol ve raporlar yeniden oluşturulmaz
+protocol_cache = ProtocolCache(
+    maxsize=1024,
+    ttl=app.config['PROTOCOL_CACHE_TTL'],
+    directory=app.config['PROTOCOL_CACHE_DIR']
+)
+protocol_generator = ProtocolGenerator(optimizer, cache=protocol_cache)
 
 
 @app.route('/')
@@ -58,10 +72,12 @@ def calculator_page():
         if forward_primer:
             results['forward_tm'] = calculator.calculate_tm(forward_primer)
             results['forward_gc'] = calculator.calculate_gc_content(forward_primer)
+            results['forward_hairpin'] = calculator.calculate_hairpin(forward_primer)
         
         if reverse_primer:
             results['reverse_tm'] = calculator.calculate_tm(reverse_primer)
             results['reverse_gc'] = calculator.calculate_gc_content(reverse_primer)
+            results['reverse_hairpin'] = calculator.calculate_hairpin(reverse_primer)
         
         if forward_primer and reverse_primer:
             results['annealing_temp'] = calculator.calculate_annealing_temp(
@@ -97,20 +113,28 @@ def optimizer_page():
             
             # Ek bilgiler
             is_diagnostic = 'is_diagnostic' in request.form
+            mode = (request.form.get('mode', 'standard') or 'standard').strip().lower()
             
             # Verileri doğrula
             if template_length <= 0:
                 return render_template('optimizer.html', error="Geçerli bir şablon uzunluğu giriniz.", now=datetime.now())
+            if mode not in PROTOCOL_MODES:
+                return render_template(
+                    'optimizer.html',
+                    error=f"Protokol modu geçersiz. Geçerli modlar: {', '.join(PROTOCOL_MODES)}.",
+                    now=datetime.now()
+                )
                 
             # Protokolü oluştur
-            protocol = optimizer.create_complete_protocol(
+            protocol = protocol_generator.generate_protocol(
                 template_length=template_length,
                 forward_primer=forward_primer,
                 reverse_primer=reverse_primer,
                 gc_content=template_gc if template_gc > 0 else None,
                 template_concentration=template_concentration if template_concentration > 0 else None,
                 target_yield=target_yield if target_yield > 0 else None,
-                is_diagnostic=is_diagnostic
+                is_diagnostic=is_diagnostic,
+                mode=mode
             )
             
             # Parametreleri kaydet
@@ -121,7 +145,8 @@ def optimizer_page():
                 "template_gc": template_gc,
                 "template_concentration": template_concentration,
                 "target_yield": target_yield,
-                "is_diagnostic": is_diagnostic
+                "is_diagnostic": is_diagnostic,
+                "mode": mode
             }
             
             # Raporu oluştur
@@ -142,20 +167,25 @@ def download_protocol():
         protocol_data = request.json.get('protocol')
         format_type = request.json.get('format', 'text')
         
+        # Birden çok protokol ("protocols") satır satır akışla gönderilir
+        protocol_list = request.json.get('protocols')
+        if protocol_list:
+            return download_protocols(protocol_list, format_type)
+        
         if not protocol_data:
             return jsonify({"error": "Protokol verisi bulunamadı."}), 400
             
         # Formatını belirle
         if format_type == 'json':
-            content = protocol_generator.protocol_to_json(protocol_data)
+            content = protocol_generator.render(protocol_data, 'json')
             mimetype = 'application/json'
             ext = 'json'
         elif format_type == 'csv':
-            content = protocol_generator.protocol_to_csv(protocol_data)
+            content = protocol_generator.render(protocol_data, 'csv')
             mimetype = 'text/csv'
             ext = 'csv'
         else:  # text
-            content = protocol_generator.protocol_to_text(protocol_data)
+            content = protocol_generator.render(protocol_data, 'text')
             mimetype = 'text/plain'
             ext = 'txt'
             
@@ -177,6 +207,35 @@ def download_protocol():
         return jsonify({"error": str(e)}), 500
 
 
+def download_protocols(protocols, format_type):
+    """Birden çok protokolü NDJSON, CSV veya metin olarak akışla indir."""
+    # JSON isteği satır başına bir nesne (NDJSON) olarak yazılır
+    stream_format = 'ndjson' if format_type == 'json' else format_type
+    if stream_format not in ('ndjson', 'csv'):
+        stream_format = 'text'
+    mimetype, ext = {
+        'ndjson': ('application/x-ndjson', 'ndjson'),
+        'csv': ('text/csv', 'csv'),
+        'text': ('text/plain', 'txt')
+    }[stream_format]
+    
+    filename = f"pcr_protocols_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
+    return Response(
+        stream_with_context(protocol_generator.iter_protocols(protocols, stream_format)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+
+@app.route('/api/cache_stats')
+def cache_stats():
+    """Protokol ve primer önbelleklerinin isabet istatistikleri."""
+    return jsonify({
+        "protocol_cache": protocol_generator.cache_stats(),
+        "calculator_cache": calculator.cache_stats()
+    })
+
+
 @app.route('/about')
 def about():
     """Hakkında sayfası."""
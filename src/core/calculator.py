@@ -5,30 +5,187 @@ PCR reaksiyonu için temel hesaplamaları yapan modül.
 import math
 import numpy as np
 
+from .sequence_encoding import (
+    BASE_C, BASE_G, BASE_OTHER, encode_batch, encode_sequence, base_counts_batch,
+    round_array
+)
+from .cache import LRUCache
+from .dimer import score_dimer, score_dimers_batch
+from .iupac import expected_gc_content, gc_extremes, is_degenerate, nearest_neighbor_tm_extremes
+from .kmer_index import DEFAULT_K, KmerIndex
+from .secondary_structure import predict_hairpin, predict_hairpins_batch
+from .packed_sequence import PackedSequence
+from .sequence_profile import SequenceProfile
+from .thermodynamics import NearestNeighborModel
+
+
+# Desteklenen Tm hesaplama modelleri
+TM_MODELS = ("basic", "nearest_neighbor")
+
+# Önbelleğe alınacak en uzun dizi (primer düzeyi değerler için; şablonlar hariç)
+CACHE_MAX_SEQUENCE_LENGTH = 100
+
+
+
+def _degenerate_text(sequence):
+    """
+    Dizi IUPAC belirsiz baz içeriyorsa metnini, içermiyorsa None döndürür.
+
+    Profil ve paketlenmiş dizilerde önce sayımlara bakılır; belirsiz baz
+    yoksa dizi metne çevrilmez.
+    """
+    if isinstance(sequence, SequenceProfile):
+        if not sequence.other_count:
+            return None
+    elif isinstance(sequence, PackedSequence):
+        if not sequence.base_counts()["N"]:
+            return None
+    text = str(sequence)
+    return text if is_degenerate(text) else None
+
+
+def _degenerate_rows(sequences):
+    """Belirsiz baz içeren dizilerin indekslerini döndürür."""
+    return [index for index, sequence in enumerate(sequences) if is_degenerate(sequence)]
 
 class PCRCalculator:
     """PCR parametrelerini hesaplamak için ana sınıf."""
     
-    def __init__(self):
-        """PCRCalculator sınıfı için başlatıcı."""
+    def __init__(self, tm_model="basic", na_conc=50.0, mg_conc=1.5, dntp_conc=0.8,
+                 primer_conc=250.0, cache_size=None):
+        """
+        PCRCalculator sınıfı için başlatıcı.
+        
+        Args:
+            tm_model (str): Tm hesaplama modeli ("basic" veya "nearest_neighbor")
+            na_conc (float): Monovalan katyon konsantrasyonu (mM), yalnızca
+                en yakın komşu modeli için
+            mg_conc (float): Mg²⁺ konsantrasyonu (mM)
+            dntp_conc (float): Toplam dNTP konsantrasyonu (mM)
+            primer_conc (float): Primer konsantrasyonu (nM)
+            cache_size (int, optional): Primer düzeyi değerler (Tm, GC vb.) için
+                istekler arası LRU önbellek boyutu. Verilmezse önbellek kapalıdır.
+        """
+        if tm_model not in TM_MODELS:
+            raise ValueError(
+                f"Bilinmeyen Tm modeli: {tm_model}. Geçerli modeller: {', '.join(TM_MODELS)}"
+            )
+        
         # Polimeraz enziminin aktivite hızı (nükleotid/saniye)
         self.polymerase_speed = 1000  # Taq polimeraz için yaklaşık değer
+        
+        # Tm hesaplama modeli
+        self.tm_model = tm_model
+        self.nearest_neighbor = NearestNeighborModel(
+            na_conc=na_conc,
+            mg_conc=mg_conc,
+            dntp_conc=dntp_conc,
+            primer_conc=primer_conc
+        )
+        
+        # İstekler arası primer önbelleği (isteğe bağlı)
+        self.cache = LRUCache(cache_size) if cache_size else None
+    
+    def _cached(self, kind, sequence, compute, parameters=()):
+        """
+        Primer düzeyi bir değeri önbellek üzerinden hesaplar.
+        
+        Anahtar, değerin türü, normalize edilmiş (büyük harf) dizi ve model
+        parametrelerinden oluşur. Önbellek kapalıysa veya dizi primer için
+        fazla uzunsa değer doğrudan hesaplanır. Sözlük değerler (dimer,
+        firkete) kopyalanarak döndürülür; çağıranın sonucu değiştirmesi
+        önbellekteki kaydı bozmaz.
+        
+        Args:
+            kind (str): Değerin türü (ör. "tm", "gc")
+            sequence (str or SequenceProfile): Dizi veya profili
+            compute (callable): Değeri hesaplayan parametresiz fonksiyon
+            parameters (tuple): Sonucu etkileyen model parametreleri
+            
+        Returns:
+            Hesaplanan veya önbellekteki değer
+        """
+        if self.cache is None or len(sequence) > CACHE_MAX_SEQUENCE_LENGTH:
+            return compute()
+        
+        key = (kind, str(sequence).upper()) + tuple(parameters)
+        value = self.cache.get_or_compute(key, compute)
+        return dict(value) if isinstance(value, dict) else value
+    
+    def cache_stats(self):
+        """
+        Primer önbelleğinin isabet/ıska/çıkarma istatistiklerini döndürür.
+        
+        Returns:
+            dict or None: Önbellek istatistikleri, önbellek kapalıysa None
+        """
+        if self.cache is None:
+            return None
+        return self.cache.stats()
+    
+    def tm_model_key(self):
+        """
+        Yapılandırılmış Tm modelini ve parametrelerini tanımlayan anahtar döndürür.
+        
+        Returns:
+            tuple: Model adı ve (en yakın komşu için) tuz/konsantrasyon parametreleri
+        """
+        if self.tm_model == "nearest_neighbor":
+            return (self.tm_model,) + self.nearest_neighbor.parameters()
+        return (self.tm_model,)
     
     def calculate_tm(self, primer_sequence):
         """
         Primer erime sıcaklığını (Tm) hesaplar.
         
         Basit hesaplama: 4 * (G+C) + 2 * (A+T)
-        Daha doğru hesaplama için Biopython kullanımı önerilir.
+        tm_model "nearest_neighbor" ise SantaLucia en yakın komşu modeli
+        tuz, Mg²⁺ ve primer konsantrasyonu düzeltmeleriyle kullanılır.
+        Dejenere (IUPAC) primerlerde belirsiz bazlar atlanmaz; bağlanma
+        sıcaklığında olduğu gibi calculate_tm_range'in alt sınırı döndürülür.
         
         Args:
-            primer_sequence (str): Primer dizisi
+            primer_sequence (str, PackedSequence or SequenceProfile): Primer dizisi
+                veya profili
             
         Returns:
             float: Tahmini erime sıcaklığı (°C)
         """
         if not primer_sequence:
             return 0
+        
+        return self._cached(
+            "tm", primer_sequence,
+            lambda: self._calculate_tm(primer_sequence),
+            self.tm_model_key()
+        )
+    
+    def _calculate_tm(self, primer_sequence):
+        """
+        calculate_tm için önbelleksiz hesaplama.
+        
+        Args:
+            primer_sequence (str, PackedSequence or SequenceProfile): Boş olmayan
+                primer dizisi
+            
+        Returns:
+            float: Tahmini erime sıcaklığı (°C)
+        """
+        degenerate = _degenerate_text(primer_sequence)
+        if degenerate is not None:
+            return self.calculate_tm_range(degenerate)[0]
+        
+        if isinstance(primer_sequence, PackedSequence):
+            primer_sequence = SequenceProfile(primer_sequence)
+        
+        if isinstance(primer_sequence, SequenceProfile):
+            return primer_sequence.cached(
+                ("tm",) + self.tm_model_key(),
+                lambda: self._profile_tm(primer_sequence)
+            )
+        
+        if self.tm_model == "nearest_neighbor":
+            return self.nearest_neighbor.calculate_tm(primer_sequence)
             
         sequence = primer_sequence.upper()
         g_count = sequence.count('G')
@@ -45,18 +202,65 @@ class PCRCalculator:
             
         return round(tm, 1)
     
+    def _profile_tm(self, profile):
+        """
+        Profilin sakladığı sayımlardan ve kodlardan Tm hesaplar.
+        
+        Args:
+            profile (SequenceProfile): Primer profili
+            
+        Returns:
+            float: Tahmini erime sıcaklığı (°C)
+        """
+        if self.tm_model == "nearest_neighbor":
+            return self.nearest_neighbor.calculate_tm_encoded(profile.codes)
+        
+        if profile.length < 14:
+            tm = 2 * profile.at_count + 4 * profile.gc_count
+        else:
+            tm = 64.9 + 41 * (profile.gc_count - 16.4) / profile.length
+            
+        return round(tm, 1)
+    
     def calculate_gc_content(self, sequence):
         """
         DNA dizisinin GC içeriğini yüzde olarak hesaplar.
         
+        Dejenere (IUPAC) dizilerde belirsiz bazlar atlanmaz; eşit olasılıklı
+        varyantların ortalama GC içeriği döndürülür (calculate_gc_range
+        sınırları arasında).
+        
         Args:
-            sequence (str): DNA dizisi
+            sequence (str, PackedSequence or SequenceProfile): DNA dizisi veya profili
             
         Returns:
             float: GC içeriği yüzdesi
         """
         if not sequence:
             return 0
+        
+        return self._cached("gc", sequence, lambda: self._calculate_gc_content(sequence))
+    
+    def _calculate_gc_content(self, sequence):
+        """
+        calculate_gc_content için önbelleksiz hesaplama.
+        
+        Args:
+            sequence (str, PackedSequence or SequenceProfile): Boş olmayan DNA dizisi
+            
+        Returns:
+            float: GC içeriği yüzdesi
+        """
+        degenerate = _degenerate_text(sequence)
+        if degenerate is not None:
+            return round(expected_gc_content(degenerate), 1)
+        
+        if isinstance(sequence, SequenceProfile):
+            return sequence.gc_content
+        
+        if isinstance(sequence, PackedSequence):
+            counts = sequence.base_counts()
+            return round(((counts["G"] + counts["C"]) / len(sequence)) * 100, 1)
             
         sequence = sequence.upper()
         gc_count = sequence.count('G') + sequence.count('C')
@@ -65,16 +269,94 @@ class PCRCalculator:
         gc_percentage = (gc_count / total_length) * 100
         return round(gc_percentage, 1)
     
+    def gc_profile(self, sequence, window=100, step=1):
+        """
+        DNA dizisi boyunca kayan pencere GC içeriği profilini hesaplar.
+        
+        Pencere toplamları kümülatif toplamdan elde edildiği için maliyet
+        pencere boyutundan bağımsız olarak dizi uzunluğuyla doğrusaldır.
+        
+        Args:
+            sequence (str, PackedSequence or SequenceProfile): DNA dizisi veya profili
+            window (int): Pencere uzunluğu (baz)
+            step (int): Ardışık pencereler arasındaki kayma (baz)
+            
+        Returns:
+            numpy.ndarray: Her pencere için GC içeriği yüzdesi. Dizi pencereden
+                kısaysa tüm dizi tek bir pencere olarak değerlendirilir.
+        """
+        if window < 1 or step < 1:
+            raise ValueError("Pencere boyutu ve adım en az 1 olmalıdır.")
+        
+        if not sequence:
+            return np.zeros(0, dtype=np.float64)
+        
+        if isinstance(sequence, SequenceProfile):
+            codes = sequence.codes
+        elif isinstance(sequence, PackedSequence):
+            codes = sequence.codes()
+        else:
+            codes = encode_sequence(sequence)
+        window = min(window, len(codes))
+        
+        # GC bazlarının kümülatif toplamı (başına 0 eklenmiş)
+        gc_cumsum = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum((codes == BASE_G) | (codes == BASE_C), out=gc_cumsum[1:])
+        
+        window_starts = np.arange(0, len(codes) - window + 1, step)
+        gc_counts = gc_cumsum[window_starts + window] - gc_cumsum[window_starts]
+        
+        return round_array((gc_counts / window) * 100, 1)
+    
+    def calculate_local_gc(self, sequence, statistic="max", window=100, step=1):
+        """
+        Yerel GC içeriğinin özet istatistiğini hesaplar.
+        
+        Küresel GC yüzdesi GC bakımından zengin kısa bölgeleri gizleyebilir;
+        bu metot kayan pencere profilinin maksimumunu veya bir yüzdeliğini verir.
+        
+        Args:
+            sequence (str, PackedSequence or SequenceProfile): DNA dizisi veya profili
+            statistic (str or float): "mean" (küresel GC), "max" veya 0-100
+                arasında bir yüzdelik değeri
+            window (int): Pencere uzunluğu (baz)
+            step (int): Ardışık pencereler arasındaki kayma (baz)
+            
+        Returns:
+            float: Seçilen istatistiğe göre GC içeriği yüzdesi
+        """
+        if statistic == "mean":
+            return self.calculate_gc_content(sequence)
+        
+        if statistic != "max" and not (
+            isinstance(statistic, (int, float)) and 0 <= statistic <= 100
+        ):
+            raise ValueError(
+                "GC istatistiği 'mean', 'max' veya 0-100 arasında bir yüzdelik olmalıdır."
+            )
+        
+        profile = self.gc_profile(sequence, window, step)
+        if profile.size == 0:
+            return 0
+        
+        if statistic == "max":
+            return float(profile.max())
+        return round(float(np.percentile(profile, statistic)), 1)
+    
     def calculate_extension_time(self, template_length):
         """
         DNA uzunluğuna göre uzama süresini hesaplar.
         
         Args:
-            template_length (int): Hedef DNA'nın baz çifti uzunluğu
+            template_length (int, PackedSequence or SequenceProfile): Hedef DNA'nın
+                baz çifti uzunluğu veya dizisi
             
         Returns:
             int: Önerilen uzama süresi (saniye)
         """
+        if isinstance(template_length, (SequenceProfile, PackedSequence)):
+            template_length = len(template_length)
+        
         # Polimeraz hızına göre hesaplama
         extension_time = template_length / self.polymerase_speed
         
@@ -86,25 +368,176 @@ class PCRCalculator:
         
         return math.ceil(extension_time)
     
+    def find_amplicon(self, template, forward_primer, reverse_primer, max_mismatches=0):
+        """
+        Primerlerin şablon üzerindeki bağlanma yerlerinden gerçek ürünü bulur.
+        
+        Şablonun k-mer indeksi şablon özetine göre önbelleğe alınır; aynı
+        şablonla yapılan sonraki sorgular indeksi yeniden oluşturmaz.
+        
+        Args:
+            template (str, PackedSequence or SequenceProfile): Şablon DNA dizisi
+            forward_primer (str or SequenceProfile): İleri primer dizisi
+            reverse_primer (str or SequenceProfile): Geri primer dizisi
+            max_mismatches (int): Primerlerin 5' bölgesinde izin verilen uyumsuzluk
+            
+        Returns:
+            dict or None: "start", "end" (0 tabanlı, yarı açık aralık), "size" ve
+                "orientation"; ürün bulunamazsa None
+        """
+        if isinstance(template, SequenceProfile):
+            template = template.sequence
+        forward_primer = str(forward_primer)
+        reverse_primer = str(reverse_primer)
+        
+        k = min(DEFAULT_K, len(forward_primer), len(reverse_primer))
+        if k < 1:
+            return None
+        
+        index = KmerIndex.for_template(template, k)
+        return index.find_amplicon(forward_primer, reverse_primer, max_mismatches)
+    
     def calculate_annealing_temp(self, forward_primer, reverse_primer):
         """
         Bağlanma sıcaklığını hesaplar.
         
+        Primer Tm değerleri yapılandırılmış Tm modeli (tm_model) ile hesaplanır.
+        
+        Args:
+            forward_primer (str or SequenceProfile): İleri primer dizisi veya profili
+            reverse_primer (str or SequenceProfile): Geri primer dizisi veya profili
+            
+        Returns:
+            float: Önerilen bağlanma sıcaklığı (°C)
+        """
+        return self.calculate_common_annealing_temp([forward_primer, reverse_primer])
+    
+    def calculate_common_annealing_temp(self, primers):
+        """
+        Bir primer grubunun tamamı için ortak bağlanma sıcaklığını hesaplar.
+        
+        İki primer için calculate_annealing_temp ile aynıdır; multipleks
+        panellerde tüm primerlere uygulanır.
+        
+        Dejenere (IUPAC) primerler için tüm varyantlara uyması amacıyla Tm
+        alt sınırı kullanılır.
+        
         Args:
-            forward_primer (str): İleri primer dizisi
-            reverse_primer (str): Geri primer dizisi
+            primers (list): Primer dizileri veya profilleri
             
         Returns:
             float: Önerilen bağlanma sıcaklığı (°C)
         """
-        forward_tm = self.calculate_tm(forward_primer)
-        reverse_tm = self.calculate_tm(reverse_primer)
+        primer_tms = [
+            self.calculate_tm_range(primer)[0] if is_degenerate(str(primer))
+            else self.calculate_tm(primer)
+            for primer in primers
+        ]
         
         # Önerilen bağlanma sıcaklığı genellikle en düşük Tm'den 5°C daha düşüktür
-        annealing_temp = min(forward_tm, reverse_tm) - 5
+        annealing_temp = min(primer_tms) - 5
         
         return round(annealing_temp, 1)
     
+    def calculate_tm_range(self, primer_sequence):
+        """
+        Dejenere (IUPAC) bir primerin tüm varyantları için Tm alt ve üst sınırını hesaplar.
+        
+        Sınırlar varyantlar tek tek üretilmeden, en düşük ve en yüksek Tm'li
+        varyantlar analitik olarak bulunarak hesaplanır. Dejenere olmayan
+        primerler için iki değer de calculate_tm sonucuna eşittir.
+        
+        Args:
+            primer_sequence (str or SequenceProfile): IUPAC primer dizisi
+            
+        Returns:
+            tuple: (en düşük Tm, en yüksek Tm) (°C)
+        """
+        if not primer_sequence:
+            return (0, 0)
+        
+        def compute():
+            sequence = str(primer_sequence).upper()
+            if self.tm_model == "nearest_neighbor":
+                low, high = nearest_neighbor_tm_extremes(sequence, self.nearest_neighbor)
+            else:
+                low, high = gc_extremes(sequence)
+            return (self._calculate_tm(low), self._calculate_tm(high))
+        
+        return self._cached("tm_range", primer_sequence, compute, self.tm_model_key())
+    
+    def calculate_gc_range(self, sequence):
+        """
+        Dejenere (IUPAC) bir dizinin tüm varyantları için GC içeriği sınırlarını hesaplar.
+        
+        Args:
+            sequence (str or SequenceProfile): IUPAC DNA dizisi
+            
+        Returns:
+            tuple: (en düşük GC yüzdesi, en yüksek GC yüzdesi)
+        """
+        if not sequence:
+            return (0, 0)
+        
+        low, high = gc_extremes(str(sequence).upper())
+        return (self._calculate_gc_content(low), self._calculate_gc_content(high))
+    
+    def calculate_dimer(self, first_primer, second_primer):
+        """
+        İki primer arasındaki dimer ve 3' uç tamamlayıcılığını puanlar.
+        
+        Self-dimer için aynı primer iki kez verilir.
+        
+        Args:
+            first_primer (str or SequenceProfile): İlk primer dizisi (5'→3')
+            second_primer (str or SequenceProfile): İkinci primer dizisi (5'→3')
+            
+        Returns:
+            dict: "score", "max_run", "three_prime_score", "three_prime_run"
+        """
+        return self._cached(
+            "dimer", f"{first_primer}/{second_primer}",
+            lambda: score_dimer(first_primer, second_primer)
+        )
+    
+    def calculate_dimer_batch(self, first_primers, second_primers):
+        """
+        N primer çiftinin dimer puanlarını tek çağrıda hesaplar.
+        
+        Args:
+            first_primers (list): İlk primer dizileri
+            second_primers (list): İkinci primer dizileri
+            
+        Returns:
+            dict: Her puan için N uzunluğunda NumPy dizisi
+        """
+        return score_dimers_batch(first_primers, second_primers)
+    
+    def calculate_hairpin(self, primer):
+        """
+        Primerin en kararlı firkete (hairpin) yapısını hesaplar.
+        
+        Args:
+            primer (str or SequenceProfile): Primer dizisi (5'→3')
+            
+        Returns:
+            dict: "delta_g" (kcal/mol, 37°C), "tm" (°C, yapı yoksa None),
+                "stem_length" ve "loop_length"
+        """
+        return self._cached("hairpin", primer, lambda: predict_hairpin(str(primer)))
+    
+    def calculate_hairpin_batch(self, primers):
+        """
+        Bir primer kütüphanesinin firkete yapılarını tek çağrıda hesaplar.
+        
+        Args:
+            primers (list): Primer dizileri
+            
+        Returns:
+            dict: Her değer için N uzunluğunda NumPy dizisi ("tm" yapı yoksa NaN)
+        """
+        return predict_hairpins_batch([str(primer) for primer in primers])
+    
     def calculate_cycle_number(self, template_concentration, target_yield):
         """
         PCR döngü sayısını hesaplar.
@@ -125,4 +558,126 @@ class PCRCalculator:
         # Pratik sınırlar içinde tutma
         cycles = max(15, min(40, math.ceil(cycles)))
         
-        return cycles 
\ No newline at end of file
+        return cycles
+
+    def calculate_tm_batch(self, sequences):
+        """
+        Çok sayıda primerin erime sıcaklığını (Tm) tek çağrıda hesaplar.
+
+        Diziler bir kez NumPy dizisine kodlanır ve baz sayımları vektörel
+        olarak yapılır. Sonuçlar calculate_tm ile birebir aynıdır (14 bazdan
+        kısa primerler için Wallace kuralı, uzunlar için uzun primer formülü;
+        en yakın komşu modelinde dinükleotit tablo araması).
+
+        Args:
+            sequences (list): Primer dizileri (str, PackedSequence veya SequenceProfile)
+
+        Returns:
+            numpy.ndarray: Her primer için erime sıcaklığı (°C)
+        """
+        sequences = [str(sequence) for sequence in sequences]
+        if not sequences:
+            return np.zeros(0, dtype=np.float64)
+        
+        if self.tm_model == "nearest_neighbor":
+            tm = self.nearest_neighbor.calculate_tm_batch(sequences)
+        else:
+            tm = self._basic_tm_batch(sequences)
+        
+        # Dejenere primerler calculate_tm gibi Tm alt sınırını alır
+        for index in _degenerate_rows(sequences):
+            tm[index] = self.calculate_tm(sequences[index])
+        return tm
+    
+    def _basic_tm_batch(self, sequences):
+        """calculate_tm_batch için basit (Wallace / uzun primer) formül."""
+        codes, _, lengths = encode_batch(sequences)
+        counts = base_counts_batch(codes, lengths)
+        at_count = counts[:, 0] + counts[:, 3]
+        gc_count = counts[:, 1] + counts[:, 2]
+
+        tm = np.zeros(len(sequences), dtype=np.float64)
+
+        # Kısa primerler için Wallace kuralı
+        short = (lengths > 0) & (lengths < 14)
+        tm[short] = 2 * at_count[short] + 4 * gc_count[short]
+
+        # Uzun primerler için
+        long = lengths >= 14
+        tm[long] = 64.9 + 41 * (gc_count[long] - 16.4) / lengths[long]
+
+        return round_array(tm, 1)
+
+    def calculate_tm_windows(self, sequence, length):
+        """
+        Bir dizinin belirtilen uzunluktaki tüm pencereleri için Tm hesaplar.
+        
+        Primer tasarımında şablondaki her aday konum için alt dizi üretmeden
+        kullanılır. Değerler calculate_tm ile aynı modeli kullanır.
+        
+        Args:
+            sequence (str, PackedSequence or SequenceProfile): DNA dizisi
+            length (int): Pencere (primer) uzunluğu
+            
+        Returns:
+            numpy.ndarray: Konum i'den başlayan pencerenin Tm değeri (°C)
+        """
+        if isinstance(sequence, SequenceProfile):
+            codes = sequence.codes
+        elif isinstance(sequence, PackedSequence):
+            codes = sequence.codes()
+        else:
+            codes = encode_sequence(sequence)
+        
+        if self.tm_model == "nearest_neighbor":
+            return self.nearest_neighbor.tm_windows(codes, length)
+        
+        n_windows = len(codes) - length + 1
+        if n_windows <= 0 or length < 1:
+            return np.zeros(max(n_windows, 0), dtype=np.float64)
+        
+        is_gc = (codes == BASE_G) | (codes == BASE_C)
+        is_at = (codes != BASE_OTHER) & ~is_gc
+        gc_cumsum = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(is_gc, out=gc_cumsum[1:])
+        at_cumsum = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(is_at, out=at_cumsum[1:])
+        
+        gc_count = gc_cumsum[length:] - gc_cumsum[:n_windows]
+        at_count = at_cumsum[length:] - at_cumsum[:n_windows]
+        
+        if length < 14:
+            tm = 2.0 * at_count + 4.0 * gc_count
+        else:
+            tm = 64.9 + 41 * (gc_count - 16.4) / length
+        return round_array(tm, 1)
+    
+    def calculate_gc_content_batch(self, sequences):
+        """
+        Çok sayıda DNA dizisinin GC içeriğini tek çağrıda hesaplar.
+
+        Sonuçlar calculate_gc_content ile birebir aynıdır.
+
+        Args:
+            sequences (list): DNA dizileri (str, PackedSequence veya SequenceProfile)
+
+        Returns:
+            numpy.ndarray: Her dizi için GC içeriği yüzdesi
+        """
+        sequences = [str(sequence) for sequence in sequences]
+        if not sequences:
+            return np.zeros(0, dtype=np.float64)
+
+        codes, _, lengths = encode_batch(sequences)
+        counts = base_counts_batch(codes, lengths)
+        gc_count = counts[:, 1] + counts[:, 2]
+
+        gc_percentage = np.zeros(len(sequences), dtype=np.float64)
+        non_empty = lengths > 0
+        gc_percentage[non_empty] = (gc_count[non_empty] / lengths[non_empty]) * 100
+        gc_percentage = round_array(gc_percentage, 1)
+
+        # Dejenere diziler calculate_gc_content gibi ortalama GC içeriğini alır
+        for index in _degenerate_rows(sequences):
+            gc_percentage[index] = round(expected_gc_content(sequences[index]), 1)
+        return gc_percentage
@@ -0,0 +1,136 @@
+"""
+Touchdown ve gradyan PCR için çok aşamalı döngü bloklarını oluşturan modül.
+
+Standart protokolde tek bir döngü bloğu ("cycles") vardır. Touchdown
+protokolünde bağlanma sıcaklığı her döngüde bir adım düşürülerek primer Tm
+üst sınırından hesaplanan bağlanma sıcaklığına inilir; ardından asıl çoğaltma
+bloğu gelir. Aşamalar "cycle_stages" listesinde, döngü başına değişim
+("step") ile sıkıştırılmış olarak tutulur; böylece aşama sayısı döngü
+sayısından bağımsızdır. Gradyan protokolünde ise 12 sütunlu bir blok için
+sütun başına bağlanma sıcaklıkları hesaplanır.
+"""
+
+import copy
+import math
+
+
+# Desteklenen protokol modları
+PROTOCOL_MODES = ("standard", "touchdown", "gradient")
+
+# Touchdown aşamasında döngü başına sıcaklık düşüşü (°C)
+DEFAULT_TOUCHDOWN_STEP = 1.0
+
+# Primer verilmediğinde touchdown başlangıcının bağlanma sıcaklığından farkı (°C)
+DEFAULT_TOUCHDOWN_RANGE = 10.0
+
+# Gradyan bloğunun sütun sayısı
+DEFAULT_GRADIENT_COLUMNS = 12
+
+# Gradyanın bağlanma sıcaklığının altına uzandığı aralık (°C)
+GRADIENT_MARGIN = 3.0
+
+# Gradyanın en az genişliği (°C); primer verilmediğinde bağlanma sıcaklığı ortada olur
+MIN_GRADIENT_SPAN = 10.0
+
+
+def cycle_stages(protocol):
+    """
+    Protokolün döngü aşamalarını döndürür.
+
+    Args:
+        protocol (dict): Protokol bilgisi
+
+    Returns:
+        list: Aşamalar; tek bloklu protokollerde [protocol["cycles"]]
+    """
+    return protocol.get("cycle_stages") or [protocol["cycles"]]
+
+
+def total_time(protocol):
+    """
+    Protokolün tahmini toplam süresini (ısıtma/soğutma hariç) hesaplar.
+
+    Args:
+        protocol (dict): Protokol bilgisi
+
+    Returns:
+        int or float: Toplam süre (saniye)
+    """
+    total = protocol["initial_denaturation"]["time"]
+    for stage in cycle_stages(protocol):
+        total += stage["count"] * (
+            stage["denaturation"]["time"] + stage["annealing"]["time"] + stage["extension"]["time"]
+        )
+    total += protocol["final_extension"]["time"]
+    return total
+
+
+def touchdown_stages(cycles, start_temp, step=DEFAULT_TOUCHDOWN_STEP):
+    """
+    Touchdown aşamasını ve asıl çoğaltma aşamasını oluşturur.
+
+    Touchdown aşamasında bağlanma sıcaklığı start_temp'ten başlayıp her
+    döngüde step kadar düşer; son touchdown döngüsü asıl bağlanma
+    sıcaklığının üzerinde kalır.
+
+    Args:
+        cycles (dict): Standart döngü bloğu (asıl çoğaltma aşaması)
+        start_temp (float): İlk touchdown döngüsünün bağlanma sıcaklığı (°C)
+        step (float): Döngü başına sıcaklık düşüşü (°C)
+
+    Returns:
+        list: [touchdown aşaması, çoğaltma aşaması]; başlangıç sıcaklığı
+            bağlanma sıcaklığından yüksek değilse yalnızca [çoğaltma aşaması]
+    """
+    if step <= 0:
+        raise ValueError("Touchdown adımı pozitif olmalıdır.")
+
+    final_stage = dict(copy.deepcopy(cycles), label="Çoğaltma")
+    annealing_temp = cycles["annealing"]["temperature"]
+    count = math.ceil(round((start_temp - annealing_temp) / step, 9))
+    if count < 1:
+        return [final_stage]
+
+    touchdown = copy.deepcopy(cycles)
+    touchdown["count"] = count
+    touchdown["annealing"]["temperature"] = round(start_temp, 1)
+    touchdown["annealing"]["step"] = -step
+    touchdown["label"] = "Touchdown"
+    return [touchdown, final_stage]
+
+
+def gradient_layout(annealing_temp, tm_high=None, columns=DEFAULT_GRADIENT_COLUMNS):
+    """
+    Gradyan bloğunun sütun başına bağlanma sıcaklıklarını hesaplar.
+
+    Gradyan, hesaplanan bağlanma sıcaklığının GRADIENT_MARGIN altından
+    primerlerin Tm üst sınırına kadar uzanır ve en az MIN_GRADIENT_SPAN
+    genişliğindedir. Sıcaklıklar sütunlar boyunca doğrusal artar.
+
+    Args:
+        annealing_temp (float): Hesaplanan bağlanma sıcaklığı (°C)
+        tm_high (float, optional): Primerlerin en yüksek Tm üst sınırı (°C)
+        columns (int): Sütun sayısı
+
+    Returns:
+        dict: "columns", "temperatures" (sütun sırasıyla, °C) ve
+            "recommended_column" (bağlanma sıcaklığına en yakın sütun, 1'den başlar)
+    """
+    if columns < 2:
+        raise ValueError("Gradyan en az 2 sütun içermelidir.")
+
+    if tm_high is None:
+        low = annealing_temp - MIN_GRADIENT_SPAN / 2
+        high = annealing_temp + MIN_GRADIENT_SPAN / 2
+    else:
+        low = annealing_temp - GRADIENT_MARGIN
+        high = max(tm_high, low + MIN_GRADIENT_SPAN)
+
+    width = (high - low) / (columns - 1)
+    temperatures = [round(low + k * width, 1) for k in range(columns)]
+    recommended = min(range(columns), key=lambda k: abs(temperatures[k] - annealing_temp))
+    return {
+        "columns": columns,
+        "temperatures": temperatures,
+        "recommended_column": recommended + 1
+    }
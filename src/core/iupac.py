@@ -0,0 +1,247 @@
+"""
+IUPAC belirsiz (dejenere) baz kodlarını destekleyen modül.
+
+Dejenere bir primerin Tm ve GC alt/üst sınırları tüm varyantlar üretilmeden
+hesaplanır: GC sınırları konum başına seçeneklerden doğrudan, en yakın komşu
+Tm sınırları ise ΔH/ΔS oranı için Dinkelbach yinelemesi ve dört durumlu bir
+zincir dinamik programlamasıyla bulunur. Varyantların açıkça üretilmesi
+yalnızca üst sınırlı, tembel (lazy) bir üreteçle yapılır.
+"""
+
+import itertools
+import math
+import numpy as np
+
+from .thermodynamics import (
+    GAS_CONSTANT, NN_ENTHALPY, NN_ENTROPY, TERMINAL_ENTHALPY, TERMINAL_ENTROPY
+)
+
+
+# IUPAC kodu -> temsil ettiği bazlar
+IUPAC_CODES = {
+    "A": "A", "C": "C", "G": "G", "T": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG",
+    "N": "ACGT"
+}
+
+# Belirsiz baz kodları (A, C, G, T dışındakiler)
+DEGENERATE_CODES = "".join(code for code in IUPAC_CODES if len(IUPAC_CODES[code]) > 1)
+
+# IUPAC kodu -> eşit olasılıklı varyantlarda konumun G veya C olma oranı
+GC_FRACTIONS = {
+    code: sum(base in "GC" for base in bases) / len(bases)
+    for code, bases in IUPAC_CODES.items()
+}
+
+# expand_iupac için varsayılan en fazla varyant sayısı
+DEFAULT_EXPANSION_LIMIT = 1000
+
+# Dinkelbach yinelemesi için en fazla adım
+_MAX_ITERATIONS = 50
+
+# Konum başına izin verilen bazlar için (4,) maske tablosu (A, C, G, T sırasıyla)
+_ALLOWED = {
+    code: np.array([base in bases for base in "ACGT"])
+    for code, bases in IUPAC_CODES.items()
+}
+
+
+def is_iupac_sequence(sequence):
+    """
+    Dizinin yalnızca IUPAC nükleotit kodlarından oluşup oluşmadığını kontrol eder.
+
+    Args:
+        sequence (str): DNA dizisi (büyük/küçük harf duyarsız)
+
+    Returns:
+        bool: Tüm karakterler IUPAC kodu ise True
+    """
+    return bool(sequence) and all(base in IUPAC_CODES for base in str(sequence).upper())
+
+
+def is_degenerate(sequence):
+    """
+    Dizinin en az bir belirsiz baz içerip içermediğini döndürür.
+
+    Args:
+        sequence (str): DNA dizisi
+
+    Returns:
+        bool: Belirsiz baz varsa True
+    """
+    return any(base in DEGENERATE_CODES for base in str(sequence).upper())
+
+
+def count_expansions(sequence):
+    """
+    Dejenere dizinin temsil ettiği varyant sayısını hesaplar.
+
+    Args:
+        sequence (str): IUPAC DNA dizisi
+
+    Returns:
+        int: Varyant sayısı
+    """
+    return math.prod(len(IUPAC_CODES[base]) for base in str(sequence).upper())
+
+
+def expand_iupac(sequence, limit=DEFAULT_EXPANSION_LIMIT):
+    """
+    Dejenere dizinin varyantlarını tembel olarak üretir.
+
+    Varyantlar sözlük sırasıyla, istendikçe üretilir; en fazla limit kadar
+    varyant döndürülür.
+
+    Args:
+        sequence (str): IUPAC DNA dizisi
+        limit (int, optional): En fazla varyant sayısı; None ise sınırsız
+
+    Yields:
+        str: A, C, G, T'den oluşan varyant dizisi
+    """
+    sequence = str(sequence).upper()
+    for base in sequence:
+        if base not in IUPAC_CODES:
+            raise ValueError(f"Geçersiz IUPAC kodu: {base}")
+
+    variants = itertools.product(*(IUPAC_CODES[base] for base in sequence))
+    for variant in itertools.islice(variants, limit):
+        yield "".join(variant)
+
+
+def gc_extremes(sequence):
+    """
+    En düşük ve en yüksek GC içeriğine sahip varyantları döndürür.
+
+    Her konumda mümkünse A/T (en düşük) veya G/C (en yüksek) seçilir. Basit
+    Tm formülleri GC sayısıyla monoton arttığı için bu varyantlar aynı zamanda
+    Tm sınırlarını verir.
+
+    Args:
+        sequence (str): IUPAC DNA dizisi
+
+    Returns:
+        tuple: (en düşük GC'li varyant, en yüksek GC'li varyant)
+    """
+    low = []
+    high = []
+    for base in str(sequence).upper():
+        options = IUPAC_CODES[base]
+        at_options = [option for option in options if option in "AT"]
+        gc_options = [option for option in options if option in "GC"]
+        low.append((at_options or gc_options)[0])
+        high.append((gc_options or at_options)[0])
+    return "".join(low), "".join(high)
+
+
+def expected_gc_content(sequence):
+    """
+    Eşit olasılıklı tüm varyantların ortalama GC içeriğini hesaplar.
+
+    Her konum G/C olma oranıyla (ör. S için 1, R için 0.5, B için 2/3) katkı
+    verir; sonuç gc_extremes sınırlarının arasındadır. IUPAC dışı karakterler
+    GC sayılmaz.
+
+    Args:
+        sequence (str): IUPAC DNA dizisi (boş olmamalı)
+
+    Returns:
+        float: GC içeriği yüzdesi
+    """
+    sequence = str(sequence).upper()
+    return sum(GC_FRACTIONS.get(base, 0.0) for base in sequence) / len(sequence) * 100
+
+
+def _best_chain(allowed, node_start, node_end, edge, maximize):
+    """
+    Konum başına izin verilen bazlar arasından toplam ağırlığı en iyi zinciri bulur.
+
+    Args:
+        allowed (numpy.ndarray): (L, 4) izin maskesi
+        node_start (numpy.ndarray): İlk baz için (4,) ağırlık
+        node_end (numpy.ndarray): Son baz için (4,) ağırlık
+        edge (numpy.ndarray): Ardışık baz çiftleri için (4, 4) ağırlık
+        maximize (bool): En büyük (True) veya en küçük (False) toplam
+
+    Returns:
+        list: En iyi zincirin baz kodları
+    """
+    sign = 1.0 if maximize else -1.0
+    blocked = -np.inf
+
+    score = np.where(allowed[0], sign * node_start, blocked)
+    back = np.zeros((len(allowed), 4), dtype=np.int64)
+    for position in range(1, len(allowed)):
+        # candidates[önceki, şimdiki]
+        candidates = score[:, None] + sign * edge
+        back[position] = candidates.argmax(axis=0)
+        score = np.where(allowed[position], candidates.max(axis=0), blocked)
+    score = score + sign * node_end
+
+    chain = [int(score.argmax())]
+    for position in range(len(allowed) - 1, 0, -1):
+        chain.append(int(back[position, chain[-1]]))
+    return chain[::-1]
+
+
+def nearest_neighbor_tm_extremes(sequence, model):
+    """
+    En yakın komşu modelinde en düşük ve en yüksek Tm'li varyantları bulur.
+
+    Tm + 273.15 = 1000 · ΔH / (ΔS + sabit) bir oran olduğundan, her
+    Dinkelbach adımında ΔH - λ·(ΔS + sabit) toplamını en iyileyen varyant
+    zincir DP'siyle bulunur ve λ oranla güncellenir. Varyant sayısından
+    bağımsız olarak O(uzunluk) sürede yakınsar. Kendi kendine tamamlayıcılık
+    düzeltmesi sınır aramasında göz ardı edilir.
+
+    Args:
+        sequence (str): IUPAC primer dizisi
+        model (NearestNeighborModel): Tm modeli
+
+    Returns:
+        tuple: (en düşük Tm'li varyant, en yüksek Tm'li varyant)
+    """
+    sequence = str(sequence).upper()
+    if len(sequence) < 2:
+        low, high = gc_extremes(sequence)
+        return low, high
+
+    allowed = np.array([_ALLOWED[base] for base in sequence])
+    edge_enthalpy = NN_ENTHALPY.reshape(4, 4)
+    edge_entropy = NN_ENTROPY.reshape(4, 4)
+    constant_entropy = (
+        0.368 * (len(sequence) - 1) * math.log(model.sodium_equivalent())
+        + GAS_CONSTANT * math.log(model.primer_conc * 1e-9 / 4)
+    )
+
+    def totals(chain):
+        enthalpy = TERMINAL_ENTHALPY[chain[0]] + TERMINAL_ENTHALPY[chain[-1]]
+        entropy = TERMINAL_ENTROPY[chain[0]] + TERMINAL_ENTROPY[chain[-1]] + constant_entropy
+        for left, right in zip(chain, chain[1:]):
+            enthalpy += edge_enthalpy[left, right]
+            entropy += edge_entropy[left, right]
+        return enthalpy, entropy
+
+    extremes = []
+    for maximize in (False, True):
+        chain = [int(np.flatnonzero(options)[0]) for options in allowed]
+        enthalpy, entropy = totals(chain)
+        ratio = enthalpy / entropy
+        for _ in range(_MAX_ITERATIONS):
+            # ΔH ve ΔS negatiftir; oran = (-ΔH) / (-ΔS) ile pozitif payda kullanılır
+            chain = _best_chain(
+                allowed,
+                -TERMINAL_ENTHALPY[:4] + ratio * TERMINAL_ENTROPY[:4],
+                -TERMINAL_ENTHALPY[:4] + ratio * TERMINAL_ENTROPY[:4],
+                -edge_enthalpy + ratio * edge_entropy,
+                maximize
+            )
+            enthalpy, entropy = totals(chain)
+            new_ratio = enthalpy / entropy
+            improved = new_ratio > ratio if maximize else new_ratio < ratio
+            if not improved or abs(new_ratio - ratio) < 1e-12:
+                break
+            ratio = new_ratio
+        extremes.append("".join("ACGT"[code] for code in chain))
+    return extremes[0], extremes[1]
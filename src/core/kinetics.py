@@ -0,0 +1,199 @@
+"""
+PCR çoğaltma kinetiği için vektörel simülasyon modülü.
+
+Basit log2(hedef / şablon) hesabı her döngüde tam ikiye katlanma varsayar.
+Bu modelde döngü verimi polimeraz aktivitesinin azalmasıyla döngüden döngüye
+düşer ve ürün reaktiflerin sınırladığı plato değerine yaklaştıkça lojistik
+olarak yavaşlar:
+
+    E_c = E_0 · (1 - d)^(c-1) · max(0, 1 - N_(c-1) / K)
+    N_c = N_(c-1) · (1 + E_c)
+
+Tüm reaksiyonlar (döngü × reaksiyon) bir NumPy dizisinde birlikte
+simüle edilir; döngüler boyunca tek bir kısa döngü yeterlidir.
+"""
+
+import numpy as np
+
+from .sequence_encoding import round_array
+
+
+# İlk döngülerdeki çoğaltma verimi (1.0 = tam ikiye katlanma)
+DEFAULT_EFFICIENCY = 0.95
+
+# Polimeraz aktivitesinin döngü başına kaybı (oran)
+DEFAULT_EFFICIENCY_DECAY = 0.01
+
+# Reaktiflerin sınırladığı en yüksek ürün miktarı (ng/μL)
+DEFAULT_PLATEAU_YIELD = 50.0
+
+# Hedefe ulaşılamazsa, son verimin bu oranına ulaşılan döngü seçilir (üstel evrenin sonu)
+PLATEAU_FRACTION = 0.95
+
+# Önerilen döngü sayısı sınırları (calculate_cycle_number ile aynı)
+MIN_CYCLES = 15
+MAX_CYCLES = 40
+
+# Geçersiz (sıfır veya negatif) girdiler için döngü sayısı
+FALLBACK_CYCLES = 30
+
+
+class AmplificationModel:
+    """Verim düşüşü ve plato içeren PCR çoğaltma modeli."""
+
+    def __init__(self, efficiency=DEFAULT_EFFICIENCY, efficiency_decay=DEFAULT_EFFICIENCY_DECAY,
+                 plateau_yield=DEFAULT_PLATEAU_YIELD, min_cycles=MIN_CYCLES, max_cycles=MAX_CYCLES):
+        """
+        AmplificationModel sınıfı için başlatıcı.
+
+        Args:
+            efficiency (float): İlk döngü verimi (0-1)
+            efficiency_decay (float): Döngü başına verim kaybı oranı (0-1)
+            plateau_yield (float): Reaktiflerin izin verdiği en yüksek ürün (ng/μL)
+            min_cycles (int): Önerilebilecek en az döngü sayısı
+            max_cycles (int): Simüle edilen ve önerilebilecek en fazla döngü sayısı
+        """
+        if not 0 < efficiency <= 1:
+            raise ValueError("Çoğaltma verimi 0 ile 1 arasında olmalıdır.")
+        if not 0 <= efficiency_decay < 1:
+            raise ValueError("Verim kaybı 0 ile 1 arasında olmalıdır.")
+        if plateau_yield <= 0:
+            raise ValueError("Plato verimi pozitif olmalıdır.")
+        if not 1 <= min_cycles <= max_cycles:
+            raise ValueError("Döngü sınırları geçersiz.")
+
+        self.efficiency = efficiency
+        self.efficiency_decay = efficiency_decay
+        self.plateau_yield = plateau_yield
+        self.min_cycles = min_cycles
+        self.max_cycles = max_cycles
+
+    def parameters(self):
+        """
+        Modelin önbellek anahtarı ve raporlama için parametrelerini döndürür.
+
+        Returns:
+            tuple: (efficiency, efficiency_decay, plateau_yield, min_cycles, max_cycles)
+        """
+        return (
+            self.efficiency, self.efficiency_decay, self.plateau_yield,
+            self.min_cycles, self.max_cycles
+        )
+
+    def simulate(self, template_concentration, cycles=None):
+        """
+        Reaksiyonların döngü başına ürün miktarını simüle eder.
+
+        Args:
+            template_concentration (float or array-like): Başlangıç şablon
+                konsantrasyonları (ng/μL)
+            cycles (int, optional): Simüle edilecek döngü sayısı; verilmezse max_cycles
+
+        Returns:
+            numpy.ndarray: (döngü + 1, reaksiyon) boyutunda ürün miktarları
+                (ng/μL); satır c, c döngü sonrasını gösterir
+        """
+        cycles = self.max_cycles if cycles is None else cycles
+        template = np.atleast_1d(np.asarray(template_concentration, dtype=np.float64))
+
+        # Döngü başına polimeraz kaynaklı verim: E_0 · (1 - d)^(c-1)
+        base_efficiency = self.efficiency * (1 - self.efficiency_decay) ** np.arange(cycles)
+
+        curves = np.empty((cycles + 1, len(template)), dtype=np.float64)
+        curves[0] = template
+        for cycle in range(cycles):
+            previous = curves[cycle]
+            efficiency = base_efficiency[cycle] * np.maximum(0.0, 1 - previous / self.plateau_yield)
+            curves[cycle + 1] = previous * (1 + efficiency)
+        return curves
+
+    def choose_cycles(self, curves, target_yield):
+        """
+        Simüle edilmiş eğrilerden döngü sayısını seçer.
+
+        Hedefe ulaşılan ilk döngü seçilir. Hedefe ulaşılamıyorsa (plato
+        hedefin altında veya döngü sınırı yetersiz) ürünün son değerinin
+        PLATEAU_FRACTION oranına ulaştığı döngü seçilir; sonraki döngüler
+        verimi anlamlı artırmaz. Sonuç [min_cycles, max_cycles] aralığına
+        sınırlanır.
+
+        Args:
+            curves (numpy.ndarray): simulate sonucu
+            target_yield (float or array-like): Hedeflenen ürün miktarları (ng/μL)
+
+        Returns:
+            tuple: (döngü sayıları int64 dizisi, hedefe ulaşıldı mı bool dizisi)
+        """
+        target = np.broadcast_to(np.asarray(target_yield, dtype=np.float64), curves.shape[1:])
+        reached_mask = curves[1:] >= target
+        reached = reached_mask.any(axis=0)
+        first_reached = reached_mask.argmax(axis=0) + 1
+
+        near_plateau = curves[1:] >= PLATEAU_FRACTION * curves[-1]
+        first_plateau = near_plateau.argmax(axis=0) + 1
+
+        cycles = np.where(reached, first_reached, first_plateau)
+        return np.clip(cycles, self.min_cycles, self.max_cycles).astype(np.int64), reached
+
+    def cycle_numbers(self, template_concentration, target_yield):
+        """
+        Çok sayıda reaksiyon için döngü sayılarını tek simülasyonla hesaplar.
+
+        Sıfır veya negatif girdiler için calculate_cycle_number gibi
+        FALLBACK_CYCLES döndürülür.
+
+        Args:
+            template_concentration (array-like): Şablon konsantrasyonları (ng/μL)
+            target_yield (array-like): Hedeflenen ürün miktarları (ng/μL)
+
+        Returns:
+            tuple: (döngü sayıları, hedefe ulaşıldı mı, simulate eğrileri)
+        """
+        template = np.atleast_1d(np.asarray(template_concentration, dtype=np.float64))
+        target = np.atleast_1d(np.asarray(target_yield, dtype=np.float64))
+        valid = (template > 0) & (target > 0)
+
+        curves = self.simulate(np.where(valid, template, 0.0))
+        cycles, reached = self.choose_cycles(curves, np.where(valid, target, 0.0))
+        cycles = np.where(valid, cycles, FALLBACK_CYCLES)
+        return cycles, reached & valid, curves
+
+    def curve_record(self, curve, target_yield, reached):
+        """
+        Bir reaksiyonun eğrisini protokole eklenecek (grafik için) sözlüğe çevirir.
+
+        Args:
+            curve (numpy.ndarray): Tek reaksiyonun (döngü + 1) ürün değerleri
+            target_yield (float): Hedeflenen ürün miktarı (ng/μL)
+            reached (bool): Hedefe ulaşıldı mı
+
+        Returns:
+            dict: "cycles" (0..max_cycles), "yield" (ng/μL, 4 ondalık),
+                "target_yield", "target_reached" ve "plateau_yield"
+        """
+        return self.curve_records(np.asarray(curve)[:, None], [target_yield], [reached])[0]
+
+    def curve_records(self, curves, target_yield, reached):
+        """
+        Birden çok reaksiyonun eğrisini tek yuvarlama işlemiyle sözlüklere çevirir.
+
+        Args:
+            curves (numpy.ndarray): (döngü + 1, reaksiyon) boyutunda eğriler
+            target_yield (list): Her reaksiyonun hedef ürün miktarı (ng/μL)
+            reached (array-like): Her reaksiyon için hedefe ulaşıldı mı
+
+        Returns:
+            list: Her reaksiyon için curve_record sözlüğü
+        """
+        cycles = list(range(curves.shape[0]))
+        yields = round_array(curves, 4).T.tolist()
+        return [
+            {
+                "cycles": list(cycles),
+                "yield": yields[k],
+                "target_yield": target_yield[k],
+                "target_reached": bool(reached[k]),
+                "plateau_yield": self.plateau_yield
+            }
+            for k in range(curves.shape[1])
+        ]
@@ -0,0 +1,219 @@
+"""
+Şablon DNA üzerinde primer bağlanma yerlerini bulan k-mer indeksi modülü.
+
+Şablonun her iki zincirindeki k-mer'ler 2k bitlik tamsayılar olarak sıralanır.
+Bir primerin 3' ucundaki k-mer ikili aramayla (searchsorted) bulunur ve aday
+konumlarda primerin tamamı doğrulanır; böylece sorgu süresi şablon
+uzunluğundan bağımsız kalır. İndeksler şablonun özetine göre önbelleğe alınır.
+"""
+
+import hashlib
+import numpy as np
+
+from .cache import LRUCache
+from .packed_sequence import PackedSequence
+from .sequence_encoding import BASE_OTHER, encode_sequence
+
+
+# Varsayılan k-mer uzunluğu (primerlerin 3' ucundaki tohum bölgesi)
+DEFAULT_K = 12
+
+# Şablon özeti -> KmerIndex önbelleği
+_INDEX_CACHE = LRUCache(maxsize=32)
+
+
+def template_digest(template):
+    """
+    Şablonun içeriğine göre önbellek anahtarı olarak kullanılacak özeti döndürür.
+
+    Args:
+        template (str or PackedSequence): Şablon DNA dizisi
+
+    Returns:
+        str: Onaltılık özet
+    """
+    if isinstance(template, PackedSequence):
+        return template.digest()
+    return hashlib.sha1(str(template).upper().encode("ascii", "replace")).hexdigest()
+
+
+class KmerIndex:
+    """Bir şablonun iki zinciri için sıralı k-mer indeksi."""
+
+    def __init__(self, template, k=DEFAULT_K):
+        """
+        KmerIndex sınıfı için başlatıcı.
+
+        Args:
+            template (str or PackedSequence): Şablon DNA dizisi (5'→3', + zincir)
+            k (int): k-mer uzunluğu (1-32)
+        """
+        if not isinstance(template, PackedSequence):
+            template = PackedSequence(str(template))
+
+        self.template = template
+        self.length = len(template)
+        self.k = k
+
+        # + zincir ve - zincir (ters tümleyen) indeksleri
+        self._strands = {
+            "+": self._build(template),
+            "-": self._build(template.reverse_complement())
+        }
+
+    @classmethod
+    def for_template(cls, template, k=DEFAULT_K):
+        """
+        Şablon için önbellekteki indeksi döndürür; yoksa oluşturur.
+
+        Args:
+            template (str or PackedSequence): Şablon DNA dizisi
+            k (int): k-mer uzunluğu
+
+        Returns:
+            KmerIndex: Şablonun indeksi
+        """
+        key = (template_digest(template), k)
+        return _INDEX_CACHE.get_or_compute(key, lambda: cls(template, k))
+
+    @staticmethod
+    def cache_stats():
+        """
+        İndeks önbelleğinin istatistiklerini döndürür.
+
+        Returns:
+            dict: LRUCache.stats() sonucu
+        """
+        return _INDEX_CACHE.stats()
+
+    def _build(self, strand):
+        """Bir zincirin sıralı k-mer değerlerini, konumlarını ve kodlarını hazırlar."""
+        values, valid = strand.kmers(self.k)
+        positions = np.flatnonzero(valid)
+        values = values[positions]
+        order = np.argsort(values, kind="stable")
+        return {
+            "values": values[order],
+            "positions": positions[order],
+            "codes": strand.codes()
+        }
+
+    def _kmer_value(self, codes):
+        """k uzunluğundaki kod dizisini 2k bitlik tamsayıya çevirir."""
+        value = 0
+        for code in codes.tolist():
+            value = (value << 2) | code
+        return np.uint64(value)
+
+    def lookup(self, kmer, strand="+"):
+        """
+        Bir k-mer'in zincirdeki tüm başlangıç konumlarını bulur.
+
+        Args:
+            kmer (str): k uzunluğunda DNA dizisi
+            strand (str): "+" (verilen şablon) veya "-" (ters tümleyen)
+
+        Returns:
+            numpy.ndarray: Zincir üzerindeki sıralı başlangıç konumları (0 tabanlı)
+        """
+        codes = encode_sequence(str(kmer))
+        if len(codes) != self.k or (codes == BASE_OTHER).any():
+            return np.zeros(0, dtype=np.int64)
+
+        index = self._strands[strand]
+        value = self._kmer_value(codes)
+        low = np.searchsorted(index["values"], value, side="left")
+        high = np.searchsorted(index["values"], value, side="right")
+        return np.sort(index["positions"][low:high])
+
+    def find_binding_sites(self, primer, strand="+", max_mismatches=0):
+        """
+        Primerin zincir üzerindeki bağlanma yerlerini bulur.
+
+        3' uçtaki k baz tam eşleşmelidir; primerin geri kalanında en fazla
+        max_mismatches uyumsuzluğa izin verilir.
+
+        Args:
+            primer (str): Primer dizisi (5'→3')
+            strand (str): "+" veya "-" zinciri
+            max_mismatches (int): 5' bölgede izin verilen uyumsuzluk sayısı
+
+        Returns:
+            numpy.ndarray: Primerin zincir üzerindeki başlangıç konumları (0 tabanlı)
+        """
+        primer = str(primer).upper()
+        if len(primer) < self.k:
+            raise ValueError(f"Primer uzunluğu k-mer uzunluğundan ({self.k}) kısa olamaz.")
+
+        seeds = self.lookup(primer[-self.k:], strand)
+        starts = seeds - (len(primer) - self.k)
+        starts = starts[starts >= 0]
+        if not len(starts):
+            return starts
+
+        # Aday konumlarda primerin tamamını doğrula
+        strand_codes = self._strands[strand]["codes"]
+        primer_codes = encode_sequence(primer)
+        windows = strand_codes[starts[:, None] + np.arange(len(primer))[None, :]]
+        mismatches = (windows != primer_codes[None, :]).sum(axis=1)
+        return starts[mismatches <= max_mismatches]
+
+    def to_forward_coordinates(self, starts, length):
+        """
+        - zincirdeki konumları + zincir koordinatlarına çevirir.
+
+        Args:
+            starts (numpy.ndarray): - zincirdeki başlangıç konumları
+            length (int): Bağlanan dizinin uzunluğu
+
+        Returns:
+            numpy.ndarray: + zincirde bağlanma bölgesinin başlangıç konumları
+        """
+        return self.length - np.asarray(starts) - length
+
+    def find_amplicon(self, forward_primer, reverse_primer, max_mismatches=0):
+        """
+        İki primerin oluşturduğu en kısa PCR ürününü bulur.
+
+        İleri primer + zincirde, geri primer - zincirde aranır; bulunamazsa
+        primerler yer değiştirilerek ters yönde de denenir.
+
+        Args:
+            forward_primer (str): İleri primer dizisi (5'→3')
+            reverse_primer (str): Geri primer dizisi (5'→3')
+            max_mismatches (int): 5' bölgede izin verilen uyumsuzluk sayısı
+
+        Returns:
+            dict or None: "start" (0 tabanlı, dahil), "end" (hariç), "size"
+                (baz çifti) ve "orientation" ("forward" veya "reverse");
+                ürün bulunamazsa None
+        """
+        for orientation, left, right in (
+            ("forward", forward_primer, reverse_primer),
+            ("reverse", reverse_primer, forward_primer)
+        ):
+            left_starts = self.find_binding_sites(left, "+", max_mismatches)
+            right_sites = self.find_binding_sites(right, "-", max_mismatches)
+            if not len(left_starts) or not len(right_sites):
+                continue
+
+            # Sağ primerin + zincirdeki bitiş konumları (hariç), sıralı
+            right_ends = np.sort(self.to_forward_coordinates(right_sites, len(right)) + len(right))
+
+            # Her sol primer için, kendisinden sonra biten ilk sağ primer
+            minimum_ends = left_starts + len(left)
+            candidates = np.searchsorted(right_ends, minimum_ends, side="left")
+            found = candidates < len(right_ends)
+            if not found.any():
+                continue
+
+            starts = left_starts[found]
+            ends = right_ends[candidates[found]]
+            best = int(np.argmin(ends - starts))
+            return {
+                "start": int(starts[best]),
+                "end": int(ends[best]),
+                "size": int(ends[best] - starts[best]),
+                "orientation": orientation
+            }
+        return None
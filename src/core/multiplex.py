@@ -0,0 +1,188 @@
+"""
+Multipleks PCR panelleri için primer uyumluluk analizi modülü.
+
+N primerlik bir panelde tüm primer çiftlerinin çapraz dimer puanları ve Tm
+farkları N×N matrisler olarak hesaplanır. Dimer puanları simetrik olduğu için
+yalnızca üst üçgen, bloklar hâlinde ve her blok tek bir vektörel çağrıyla
+puanlanır; büyük paneller için bloklar isteğe bağlı olarak bir süreç havuzuna
+dağıtılır.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .calculator import PCRCalculator
+from .dimer import DIMER_RUN_WARNING, THREE_PRIME_RUN_WARNING, dimer_warnings, score_dimers_batch
+
+
+# Bir blokta yer alan primer sayısı (blok başına en fazla blok² çift puanlanır)
+DEFAULT_BLOCK_SIZE = 64
+
+# Paneldeki iki primer arasında izin verilen en fazla Tm farkı (°C)
+DEFAULT_MAX_TM_DIFFERENCE = 5.0
+
+
+def _score_block(job):
+    """
+    Bir blok çiftindeki primer çiftlerini puanlar (süreç havuzunda da çalışır).
+
+    Args:
+        job (tuple): (satır indeksleri, sütun indeksleri, satır primerleri,
+            sütun primerleri)
+
+    Returns:
+        tuple: (satır indeksleri, sütun indeksleri, puan sözlüğü)
+    """
+    rows, columns, row_primers, column_primers = job
+    scores = score_dimers_batch(
+        [row_primers[i] for i in rows], [column_primers[j] for j in columns]
+    )
+    return rows, columns, scores
+
+
+class MultiplexAnalyzer:
+    """Bir primer panelinin çapraz dimer ve Tm uyumluluğunu analiz eden sınıf."""
+
+    def __init__(self, calculator=None, block_size=DEFAULT_BLOCK_SIZE,
+                 max_tm_difference=DEFAULT_MAX_TM_DIFFERENCE, processes=None):
+        """
+        MultiplexAnalyzer sınıfı için başlatıcı.
+
+        Args:
+            calculator (PCRCalculator, optional): Tm hesaplayıcısı
+            block_size (int): Bir blokta yer alan primer sayısı
+            max_tm_difference (float): İşaretlenmeden önce izin verilen Tm farkı (°C)
+            processes (int, optional): Blokları dağıtmak için süreç sayısı;
+                verilmezse tüm bloklar bu süreçte puanlanır
+        """
+        if block_size < 1:
+            raise ValueError("Blok boyutu en az 1 olmalıdır.")
+
+        self.calculator = calculator or PCRCalculator()
+        self.block_size = block_size
+        self.max_tm_difference = max_tm_difference
+        self.processes = processes
+
+    def _jobs(self, primers):
+        """Üst üçgeni kapsayan blok işlerini üretir."""
+        n_primers = len(primers)
+        for row_start in range(0, n_primers, self.block_size):
+            for column_start in range(row_start, n_primers, self.block_size):
+                row_block = np.arange(row_start, min(row_start + self.block_size, n_primers))
+                column_block = np.arange(column_start, min(column_start + self.block_size, n_primers))
+                rows, columns = np.meshgrid(row_block, column_block, indexing="ij")
+                upper = rows <= columns
+                rows = rows[upper]
+                columns = columns[upper]
+                # Alt süreçlere yalnızca bloğun ihtiyaç duyduğu primerler gönderilir
+                yield (
+                    rows - row_start, columns - column_start,
+                    primers[row_start:row_start + self.block_size],
+                    primers[column_start:column_start + self.block_size],
+                    row_start, column_start
+                )
+
+    def dimer_matrices(self, primers):
+        """
+        Tüm primer çiftleri için simetrik dimer puanı matrislerini hesaplar.
+
+        Köşegen, her primerin kendi kendine (self-dimer) puanıdır.
+
+        Args:
+            primers (list): Primer dizileri (5'→3')
+
+        Returns:
+            dict: "score", "max_run" ve "three_prime_run" için N×N int16 matrisler
+        """
+        primers = [str(primer).upper() for primer in primers]
+        n_primers = len(primers)
+        matrices = {
+            key: np.zeros((n_primers, n_primers), dtype=np.int16)
+            for key in ("score", "max_run", "three_prime_run")
+        }
+
+        jobs = list(self._jobs(primers))
+        offsets = [(job[4], job[5]) for job in jobs]
+        payloads = [job[:4] for job in jobs]
+
+        if self.processes and len(payloads) > 1:
+            with ProcessPoolExecutor(max_workers=self.processes) as executor:
+                results = list(executor.map(_score_block, payloads))
+        else:
+            results = [_score_block(payload) for payload in payloads]
+
+        for (row_start, column_start), (rows, columns, scores) in zip(offsets, results):
+            rows = rows + row_start
+            columns = columns + column_start
+            for key, matrix in matrices.items():
+                matrix[rows, columns] = scores[key]
+                matrix[columns, rows] = scores[key]
+        return matrices
+
+    def analyze(self, primers, names=None):
+        """
+        Primer panelinin uyumluluk analizini yapar.
+
+        Args:
+            primers (list): Primer dizileri (5'→3')
+            names (list, optional): Primer adları; verilmezse "P1", "P2", ...
+
+        Returns:
+            dict: "names", "tm" (liste), "tm_difference" (N×N float32),
+                "dimer_score", "max_run", "three_prime_run" (N×N int16),
+                "flagged" (sorunlu çiftlerin listesi) ve "annealing_temp"
+                (tüm panel için ortak bağlanma sıcaklığı)
+        """
+        primers = [str(primer).upper() for primer in primers]
+        if not primers:
+            raise ValueError("Panel en az bir primer içermelidir.")
+        if names is None:
+            names = [f"P{i + 1}" for i in range(len(primers))]
+        elif len(names) != len(primers):
+            raise ValueError("Primer adları ve dizileri aynı sayıda olmalıdır.")
+
+        tm = np.array([self.calculator.calculate_tm(primer) for primer in primers])
+        tm_difference = np.abs(tm[:, None] - tm[None, :]).astype(np.float32)
+        matrices = self.dimer_matrices(primers)
+
+        return {
+            "names": list(names),
+            "tm": tm.tolist(),
+            "tm_difference": tm_difference,
+            "dimer_score": matrices["score"],
+            "max_run": matrices["max_run"],
+            "three_prime_run": matrices["three_prime_run"],
+            "flagged": self._flag(names, tm, matrices),
+            "annealing_temp": self.calculator.calculate_common_annealing_temp(primers)
+        }
+
+    def _flag(self, names, tm, matrices):
+        """Dimer veya Tm farkı eşiklerini aşan çiftleri listeler."""
+        tm_difference = np.abs(tm[:, None] - tm[None, :])
+        problem = (
+            (matrices["three_prime_run"] >= THREE_PRIME_RUN_WARNING)
+            | (matrices["max_run"] >= DIMER_RUN_WARNING)
+            | (tm_difference > self.max_tm_difference)
+        )
+        rows, columns = np.nonzero(np.triu(problem))
+
+        flagged = []
+        for i, j in zip(rows.tolist(), columns.tolist()):
+            label = f"{names[i]} self-dimer" if i == j else f"{names[i]} / {names[j]} cross-dimer"
+            reasons = dimer_warnings(
+                {key: int(matrices[key][i, j]) for key in ("max_run", "three_prime_run")}, label
+            )
+            if tm_difference[i, j] > self.max_tm_difference:
+                reasons.append(
+                    f"{names[i]} / {names[j]}: Tm farkı {round(float(tm_difference[i, j]), 1)}°C."
+                )
+            flagged.append({
+                "first": names[i],
+                "second": names[j],
+                "three_prime_run": int(matrices["three_prime_run"][i, j]),
+                "max_run": int(matrices["max_run"][i, j]),
+                "tm_difference": round(float(tm_difference[i, j]), 1),
+                "reasons": reasons
+            })
+        return flagged
@@ -0,0 +1,299 @@
+"""
+Şablon DNA üzerinde aday primer çiftleri tasarlayan modül.
+
+Şablonun her iki zincirindeki tüm pencereler (ör. 18-30 nt) alt dizi
+üretilmeden, kümülatif toplamlar üzerinden NumPy dizileriyle değerlendirilir.
+Tm, GC, GC kıskacı (GC clamp) ve homopolimer filtrelerinden geçen adaylar
+eşleştirilir ve Tm uyumu ile ürün boyutuna göre sıralanır.
+"""
+
+import numpy as np
+
+from .calculator import PCRCalculator
+from .dimer import THREE_PRIME_RUN_WARNING
+from .packed_sequence import PackedSequence
+from .sequence_encoding import BASE_C, BASE_G, BASE_OTHER
+from .sequence_profile import SequenceProfile
+
+
+# 3' uçta GC kıskacı için bakılan baz sayısı ve izin verilen G/C sayısı aralığı
+GC_CLAMP_WINDOW = 5
+GC_CLAMP_RANGE = (1, 3)
+
+# Eşleştirme için her zincirde karşı zincirle eşleştirilen en iyi aday sayısı
+DEFAULT_MAX_CANDIDATES = 500
+
+
+def _cumulative(mask):
+    """Başına 0 eklenmiş kümülatif toplam (pencere sayımları için)."""
+    cumsum = np.zeros(len(mask) + 1, dtype=np.int64)
+    np.cumsum(mask, out=cumsum[1:])
+    return cumsum
+
+
+def _window_pairs(lower, upper, sorted_positions):
+    """
+    Her sorgu için [lower, upper] aralığındaki tüm sıralı konumları eşleştirir.
+
+    Args:
+        lower (numpy.ndarray): Sorgu aralıklarının alt sınırları
+        upper (numpy.ndarray): Sorgu aralıklarının üst sınırları (dahil)
+        sorted_positions (numpy.ndarray): Sıralı konumlar
+
+    Returns:
+        tuple: (sorgu indeksleri, konum indeksleri)
+    """
+    low = np.searchsorted(sorted_positions, lower, side="left")
+    high = np.searchsorted(sorted_positions, upper, side="right")
+    counts = np.maximum(high - low, 0)
+
+    query_index = np.repeat(np.arange(len(lower)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return query_index, np.repeat(low, counts) + offsets
+
+
+class PrimerDesigner:
+    """Bir şablon için ileri/geri primer çiftleri öneren sınıf."""
+
+    def __init__(self, calculator=None, min_length=18, max_length=30,
+                 tm_range=(55.0, 65.0), gc_range=(40.0, 60.0), max_homopolymer=4,
+                 gc_clamp=True, product_size_range=(100, 1000), optimal_product_size=None,
+                 max_tm_difference=2.0, max_candidates=DEFAULT_MAX_CANDIDATES):
+        """
+        PrimerDesigner sınıfı için başlatıcı.
+
+        Args:
+            calculator (PCRCalculator, optional): Tm ve dimer hesaplayıcısı
+            min_length (int): En kısa primer uzunluğu (baz)
+            max_length (int): En uzun primer uzunluğu (baz)
+            tm_range (tuple): Kabul edilen Tm aralığı (°C)
+            gc_range (tuple): Kabul edilen GC içeriği aralığı (%)
+            max_homopolymer (int): Aynı bazın en fazla ardışık tekrar sayısı
+            gc_clamp (bool): 3' uçtaki son 5 bazda 1-3 G/C şartı aranır mı
+            product_size_range (tuple): Kabul edilen ürün boyutu aralığı (bp)
+            optimal_product_size (int, optional): Verilirse bu boyuta yakın
+                ürünler tercih edilir
+            max_tm_difference (float): Çiftteki primerlerin en fazla Tm farkı (°C)
+            max_candidates (int): Her zincirde karşı zincirle eşleştirilen en iyi
+                aday sayısı
+        """
+        if min_length < 1 or max_length < min_length:
+            raise ValueError("Primer uzunluk aralığı geçersiz.")
+
+        self.calculator = calculator or PCRCalculator()
+        self.min_length = min_length
+        self.max_length = max_length
+        self.tm_range = tm_range
+        self.gc_range = gc_range
+        self.max_homopolymer = max_homopolymer
+        self.gc_clamp = gc_clamp
+        self.product_size_range = product_size_range
+        self.optimal_product_size = optimal_product_size
+        self.max_tm_difference = max_tm_difference
+        self.max_candidates = max_candidates
+
+    def find_candidates(self, strand):
+        """
+        Bir zincirdeki filtrelerden geçen tüm aday primerleri bulur.
+
+        Args:
+            strand (str, PackedSequence or SequenceProfile): Zincir dizisi (5'→3')
+
+        Returns:
+            dict: "start", "length", "tm" ve "gc_content" dizileri (zincir
+                koordinatlarında, Tm hedefine uzaklığa göre sıralı)
+        """
+        profile = SequenceProfile.of(strand)
+        codes = profile.codes
+
+        is_gc = (codes == BASE_G) | (codes == BASE_C)
+        gc_cumsum = _cumulative(is_gc)
+        other_cumsum = _cumulative(codes == BASE_OTHER)
+
+        # Konum i'de biten homopolimerin uzunluğu max_homopolymer'ı aşıyor mu
+        same_as_previous = np.zeros(len(codes), dtype=bool)
+        same_as_previous[1:] = codes[1:] == codes[:-1]
+        run_cumsum = np.cumsum(same_as_previous)
+        run_breaks = np.maximum.accumulate(np.where(same_as_previous, 0, run_cumsum))
+        run_length = run_cumsum - run_breaks + 1
+        long_run_cumsum = _cumulative(run_length > self.max_homopolymer)
+
+        columns = {"start": [], "length": [], "tm": [], "gc_content": []}
+        for length in range(self.min_length, self.max_length + 1):
+            n_windows = len(codes) - length + 1
+            if n_windows <= 0:
+                break
+            starts = np.arange(n_windows)
+            ends = starts + length
+
+            keep = (other_cumsum[ends] - other_cumsum[starts]) == 0
+
+            gc_content = (gc_cumsum[ends] - gc_cumsum[starts]) / length * 100
+            keep &= (gc_content >= self.gc_range[0]) & (gc_content <= self.gc_range[1])
+
+            if self.gc_clamp:
+                clamp_start = np.maximum(ends - GC_CLAMP_WINDOW, starts)
+                clamp = gc_cumsum[ends] - gc_cumsum[clamp_start]
+                keep &= (clamp >= GC_CLAMP_RANGE[0]) & (clamp <= GC_CLAMP_RANGE[1])
+
+            # Pencere içinde biten ve tamamen pencerede kalan uzun tekrarlar
+            run_check_start = np.minimum(starts + self.max_homopolymer, ends)
+            keep &= (long_run_cumsum[ends] - long_run_cumsum[run_check_start]) == 0
+
+            if not keep.any():
+                continue
+
+            tm = self.calculator.calculate_tm_windows(profile, length)
+            keep &= (tm >= self.tm_range[0]) & (tm <= self.tm_range[1])
+
+            columns["start"].append(starts[keep])
+            columns["length"].append(np.full(int(keep.sum()), length, dtype=np.int64))
+            columns["tm"].append(tm[keep])
+            columns["gc_content"].append(gc_content[keep])
+
+        if not columns["start"]:
+            return {
+                "start": np.zeros(0, dtype=np.int64), "length": np.zeros(0, dtype=np.int64),
+                "tm": np.zeros(0), "gc_content": np.zeros(0)
+            }
+
+        candidates = {key: np.concatenate(values) for key, values in columns.items()}
+        target_tm = sum(self.tm_range) / 2
+        order = np.argsort(np.abs(candidates["tm"] - target_tm), kind="stable")
+        return {key: values[order] for key, values in candidates.items()}
+
+    def design(self, template, top_k=5):
+        """
+        Şablon için en iyi ileri/geri primer çiftlerini önerir.
+
+        İleri primerler + zincirde, geri primerler ters tümleyen zincirde
+        aranır ve her başlangıç konumu için Tm hedefine en yakın uzunluk
+        tutulur. Her zincirin en iyi max_candidates adayı, karşı zincirde ürün
+        boyutu aralığına düşen tüm adaylarla vektörel olarak eşleştirilir;
+        Tm farkı sınırını aşan çiftler elenir, 3' uç çapraz dimer riski
+        taşıyan çiftler atlanır.
+
+        Args:
+            template (str or PackedSequence): Şablon DNA dizisi (5'→3')
+            top_k (int): Döndürülecek en fazla çift sayısı
+
+        Returns:
+            list: Ceza puanına göre sıralı çiftler. Her çift "forward" ve
+                "reverse" (dizi, + zincirde 0 tabanlı "start"/"end", uzunluk,
+                Tm, GC), "product_size", "tm_difference" ve "penalty" içerir.
+        """
+        if not isinstance(template, PackedSequence):
+            template = PackedSequence(str(template))
+        template_length = len(template)
+        minus = template.reverse_complement()
+
+        forward = self._best_per_start(self.find_candidates(template))
+        reverse = self._best_per_start(self.find_candidates(minus))
+        if not len(forward["start"]) or not len(reverse["start"]):
+            return []
+
+        # Geri primerlerin + zincirdeki bölgesi [begin, end); bitişe göre sıralı
+        reverse_end = template_length - reverse["start"]
+        order = np.argsort(reverse_end, kind="stable")
+        reverse = {key: values[order] for key, values in reverse.items()}
+        reverse_end = reverse_end[order]
+        reverse_begin = reverse_end - reverse["length"]
+        forward_end = forward["start"] + forward["length"]
+
+        min_size, max_size = self.product_size_range
+        target_tm = sum(self.tm_range) / 2
+
+        # En iyi ileri adaylar x aralıktaki tüm geri adaylar
+        best_forward = np.argsort(np.abs(forward["tm"] - target_tm), kind="stable")[:self.max_candidates]
+        forward_index, reverse_index = _window_pairs(
+            forward["start"][best_forward] + min_size,
+            forward["start"][best_forward] + max_size,
+            reverse_end
+        )
+        forward_index = best_forward[forward_index]
+
+        # En iyi geri adaylar x aralıktaki diğer ileri adaylar (ilk adımda
+        # eşleştirilmiş ileri adaylar tekrar sayılmaz)
+        best_reverse = np.argsort(np.abs(reverse["tm"] - target_tm), kind="stable")[:self.max_candidates]
+        remaining = np.ones(len(forward["start"]), dtype=bool)
+        remaining[best_forward] = False
+        forward_order = np.flatnonzero(remaining)
+        forward_order = forward_order[np.argsort(forward["start"][forward_order], kind="stable")]
+        reverse_side, forward_side = _window_pairs(
+            reverse_end[best_reverse] - max_size,
+            reverse_end[best_reverse] - min_size,
+            forward["start"][forward_order]
+        )
+        forward_index = np.concatenate([forward_index, forward_order[forward_side]])
+        reverse_index = np.concatenate([reverse_index, best_reverse[reverse_side]])
+
+        product_size = reverse_end[reverse_index] - forward["start"][forward_index]
+        tm_difference = np.abs(forward["tm"][forward_index] - reverse["tm"][reverse_index])
+        valid = (
+            (reverse_begin[reverse_index] >= forward_end[forward_index])
+            & (tm_difference <= self.max_tm_difference)
+        )
+        if not valid.any():
+            return []
+        forward_index = forward_index[valid]
+        reverse_index = reverse_index[valid]
+        product_size = product_size[valid]
+        tm_difference = tm_difference[valid]
+
+        # Ceza: primerler arası Tm farkı + Tm hedefinden ortalama sapma (+ ürün boyutu)
+        target_deviation = (
+            np.abs(forward["tm"][forward_index] - target_tm)
+            + np.abs(reverse["tm"][reverse_index] - target_tm)
+        ) / 2
+        penalty = tm_difference + target_deviation
+        if self.optimal_product_size:
+            penalty += np.abs(product_size - self.optimal_product_size) / self.optimal_product_size
+
+        # Dimer kontrolünde elenenler için gerekenden fazla çift seç, ardından sırala
+        n_pick = min(len(penalty), top_k * 10)
+        picked = np.argpartition(penalty, n_pick - 1)[:n_pick]
+        picked = picked[np.argsort(penalty[picked], kind="stable")]
+
+        forward_sequences = [
+            template[int(forward["start"][i]):int(forward_end[i])].to_string()
+            for i in forward_index[picked]
+        ]
+        reverse_sequences = [
+            minus[int(reverse["start"][i]):int(reverse["start"][i] + reverse["length"][i])].to_string()
+            for i in reverse_index[picked]
+        ]
+        dimers = self.calculator.calculate_dimer_batch(forward_sequences, reverse_sequences)
+
+        pairs = []
+        for n, pick in enumerate(picked):
+            if dimers["three_prime_run"][n] >= THREE_PRIME_RUN_WARNING:
+                continue
+            f = forward_index[pick]
+            r = reverse_index[pick]
+            pairs.append({
+                "forward": self._describe(forward_sequences[n], int(forward["start"][f]), int(forward_end[f])),
+                "reverse": self._describe(reverse_sequences[n], int(reverse_begin[r]), int(reverse_end[r])),
+                "product_size": int(product_size[pick]),
+                "tm_difference": round(float(tm_difference[pick]), 1),
+                "penalty": round(float(penalty[pick]), 3)
+            })
+            if len(pairs) == top_k:
+                break
+        return pairs
+
+    def _best_per_start(self, candidates):
+        """Her başlangıç konumu için Tm hedefine en yakın uzunluğu tutar."""
+        # Adaylar Tm hedefine uzaklığa göre sıralı; ilk görülen en iyisidir
+        _, first = np.unique(candidates["start"], return_index=True)
+        return {key: values[first] for key, values in candidates.items()}
+
+    def _describe(self, sequence, start, end):
+        """Bir primerin raporlanan özelliklerini hesaplayıcıyla hesaplar."""
+        return {
+            "sequence": sequence,
+            "start": start,
+            "end": end,
+            "length": len(sequence),
+            "tm": self.calculator.calculate_tm(sequence),
+            "gc_content": self.calculator.calculate_gc_content(sequence)
+        }
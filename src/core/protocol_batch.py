@@ -0,0 +1,279 @@
+"""
+Toplu protokol optimizasyonu için sütunlu (columnar) veri yapıları.
+
+PCROptimizer.create_protocols_batch sonuçları her alan için bir NumPy dizisi
+olarak tutar; iç içe protokol sözlükleri yalnızca bir satır istendiğinde
+oluşturulur.
+"""
+
+import copy
+import math
+import numpy as np
+
+
+# create_protocols_batch'in kabul ettiği giriş alanları (create_complete_protocol argümanları)
+BATCH_FIELDS = (
+    "template_length", "forward_primer", "reverse_primer", "template_concentration",
+    "target_yield", "sequence", "is_diagnostic", "gc_content", "mode"
+)
+
+# Akışlı üretimde (tarama, dışa aktarma) create_protocols_batch'e bir seferde verilen kayıt sayısı
+DEFAULT_CHUNK_SIZE = 2000
+
+# ProtocolBatch sütunları (optimize_temperatures / optimize_times anahtarları ve döngü sayısı)
+TEMPERATURE_COLUMNS = ("denaturation_temp", "annealing_temp", "extension_temp")
+TIME_COLUMNS = (
+    "initial_denaturation_time", "denaturation_time", "annealing_time",
+    "extension_time", "final_extension_time"
+)
+PROTOCOL_COLUMNS = TEMPERATURE_COLUMNS + TIME_COLUMNS + ("cycle_count", "gc_content")
+
+
+def assemble_protocol(optimized_temps, optimized_times, cycle_number):
+    """
+    Sıcaklık, süre ve döngü değerlerinden iç içe protokol sözlüğünü oluşturur.
+
+    Args:
+        optimized_temps (dict): optimize_temperatures sonucu
+        optimized_times (dict): optimize_times sonucu
+        cycle_number (int): Döngü sayısı
+
+    Returns:
+        dict: Ek bilgiler (GC içeriği, uyarılar vb.) içermeyen PCR protokolü
+    """
+    return {
+        "initial_denaturation": {
+            "temperature": optimized_temps["denaturation_temp"],
+            "time": optimized_times["initial_denaturation_time"]
+        },
+        "cycles": {
+            "count": cycle_number,
+            "denaturation": {
+                "temperature": optimized_temps["denaturation_temp"],
+                "time": optimized_times["denaturation_time"]
+            },
+            "annealing": {
+                "temperature": optimized_temps["annealing_temp"],
+                "time": optimized_times["annealing_time"]
+            },
+            "extension": {
+                "temperature": optimized_temps["extension_temp"],
+                "time": optimized_times["extension_time"]
+            }
+        },
+        "final_extension": {
+            "temperature": optimized_temps["extension_temp"],
+            "time": optimized_times["final_extension_time"]
+        },
+        "hold": {
+            "temperature": 4,
+            "time": "indefinite"
+        }
+    }
+
+
+def is_set(value):
+    """
+    Değerin create_complete_protocol'deki gibi "verilmiş" sayılıp sayılmadığını döndürür.
+
+    None, 0, boş dizi ve NaN verilmemiş kabul edilir.
+
+    Args:
+        value: Giriş değeri
+
+    Returns:
+        bool: Değer verilmişse True
+    """
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return bool(value)
+
+
+def normalize_records(records):
+    """
+    Kayıt listesini veya sütunlu tabloyu alan adı -> değer listesi biçimine getirir.
+
+    Args:
+        records (list or dict): create_complete_protocol argümanlarını içeren
+            sözlüklerin listesi veya alan adı -> değer dizisi eşlemesi
+
+    Returns:
+        tuple: (alan adı -> liste sözlüğü, satır sayısı)
+
+    Raises:
+        ValueError: Bilinmeyen alan veya farklı uzunlukta sütunlar varsa
+    """
+    if isinstance(records, dict):
+        columns = {name: list(values) for name, values in records.items()}
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Tüm sütunlar aynı uzunlukta olmalıdır.")
+        n_rows = lengths.pop() if lengths else 0
+    else:
+        records = list(records)
+        n_rows = len(records)
+        names = set()
+        for record in records:
+            names.update(record)
+        columns = {
+            name: [record.get(name) for record in records] for name in names
+        }
+
+    unknown = set(columns) - set(BATCH_FIELDS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen protokol alanları: {', '.join(sorted(unknown))}")
+
+    for name in BATCH_FIELDS:
+        columns.setdefault(name, [None] * n_rows)
+    return columns, n_rows
+
+
+def numeric_column(values):
+    """
+    Değer listesini float64 diziye çevirir; verilmemiş değerler 0 olur.
+
+    Args:
+        values (list): Sayısal değerler veya None
+
+    Returns:
+        numpy.ndarray: float64 değerler
+    """
+    return np.array([value if is_set(value) else 0 for value in values], dtype=np.float64)
+
+
+class ProtocolBatch:
+    """Toplu optimizasyonla üretilen protokolleri sütunlar hâlinde tutan sınıf."""
+
+    def __init__(self, columns, integer_masks=None, warnings=None, protocols=None,
+                 amplification=None):
+        """
+        ProtocolBatch sınıfı için başlatıcı.
+
+        Args:
+            columns (dict): PROTOCOL_COLUMNS adı -> N uzunluğunda NumPy dizisi.
+                "gc_content" verilmemiş satırlarda NaN'dır.
+            integer_masks (dict, optional): Hem int hem float değer alabilen
+                sütunlar için, değeri int olan satırları gösteren maske
+            warnings (list, optional): Her satır için uyarı mesajları listesi
+            protocols (dict, optional): Satır indeksi -> create_complete_protocol
+                ile hesaplanmış hazır protokol (ör. dizi verilen satırlar)
+            amplification (dict, optional): Satır indeksi -> çoğaltma kinetiği
+                eğrisi (AmplificationModel.curve_record)
+        """
+        self.columns = columns
+        self.integer_masks = integer_masks or {}
+        self.length = len(columns["cycle_count"])
+        self.warnings = warnings if warnings is not None else [[] for _ in range(self.length)]
+        self.protocols = protocols or {}
+        self.amplification = amplification or {}
+
+    def __len__(self):
+        """Protokol sayısını döndürür."""
+        return self.length
+
+    def __iter__(self):
+        """Protokolleri sırayla sözlük olarak üretir."""
+        for index in range(self.length):
+            yield self[index]
+
+    def column(self, name):
+        """
+        Bir sütunun değerlerini döndürür.
+
+        Args:
+            name (str): PROTOCOL_COLUMNS içindeki sütun adı
+
+        Returns:
+            numpy.ndarray: Sütun değerleri
+        """
+        return self.columns[name]
+
+    def set_row(self, index, protocol):
+        """
+        Bir satırı hazır bir protokol sözlüğüyle doldurur.
+
+        Args:
+            index (int): Satır indeksi
+            protocol (dict): create_complete_protocol sonucu
+        """
+        cycles = protocol["cycles"]
+        values = {
+            "denaturation_temp": cycles["denaturation"]["temperature"],
+            "annealing_temp": cycles["annealing"]["temperature"],
+            "extension_temp": cycles["extension"]["temperature"],
+            "initial_denaturation_time": protocol["initial_denaturation"]["time"],
+            "denaturation_time": cycles["denaturation"]["time"],
+            "annealing_time": cycles["annealing"]["time"],
+            "extension_time": cycles["extension"]["time"],
+            "final_extension_time": protocol["final_extension"]["time"],
+            "cycle_count": cycles["count"],
+            "gc_content": protocol.get("gc_content", np.nan)
+        }
+        for name, value in values.items():
+            self.columns[name][index] = value
+            if name in self.integer_masks:
+                self.integer_masks[name][index] = isinstance(value, int) and is_set(value)
+
+        self.warnings[index] = list(protocol.get("warnings", []))
+        self.protocols[index] = protocol
+
+    def value(self, name, index):
+        """
+        Bir hücrenin değerini skaler yoldaki Python türüyle döndürür.
+
+        Args:
+            name (str): Sütun adı
+            index (int): Satır indeksi
+
+        Returns:
+            int or float: Hücre değeri
+        """
+        value = self.columns[name][index]
+        mask = self.integer_masks.get(name)
+        if mask is not None:
+            return int(value) if mask[index] else float(value)
+        return value.item()
+
+    def __getitem__(self, index):
+        """
+        Bir satırı create_complete_protocol ile aynı biçimde protokol sözlüğüne çevirir.
+
+        Args:
+            index (int): Satır indeksi (negatif indeks desteklenir)
+
+        Returns:
+            dict: Tam PCR protokolü
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Protokol indeksi aralık dışında.")
+
+        if index in self.protocols:
+            return copy.deepcopy(self.protocols[index])
+
+        protocol = assemble_protocol(
+            {name: self.value(name, index) for name in TEMPERATURE_COLUMNS},
+            {name: self.value(name, index) for name in TIME_COLUMNS},
+            self.value("cycle_count", index)
+        )
+
+        gc_content = self.value("gc_content", index)
+        if is_set(gc_content):
+            protocol["gc_content"] = gc_content
+
+        if index in self.amplification:
+            protocol["amplification"] = copy.deepcopy(self.amplification[index])
+
+        if self.warnings[index]:
+            protocol["warnings"] = list(self.warnings[index])
+        return protocol
+
+    def to_dicts(self):
+        """
+        Tüm satırları protokol sözlüklerine çevirir.
+
+        Returns:
+            list: Protokol sözlükleri
+        """
+        return list(self)
@@ -0,0 +1,458 @@
+"""
+Protokollerin düz, sütunlu (columnar) gösterimi.
+
+İç içe protokol sözlüklerindeki her adım parametresi (ör.
+cycles.annealing.temperature) ayrı, bitişik bir float64 sütununda tutulur.
+Değerin skaler yoldaki türü (int veya float) satır başına bir bit maskesinde
+saklanır; böylece sözlüğe geri dönüşüm kayıpsızdır (ör. 95 ve 95.0 metinde
+farklı yazılır). Sayısal olmayan ek bilgiler (uyarılar, touchdown aşamaları,
+gradyan, ürün vb.) yalnızca bulundukları satırlar için ayrıca saklanır.
+
+Sütunlar NumPy yapılandırılmış dizisine (structured array), .npz dosyasına
+veya (pyarrow kuruluysa) Arrow tablosuna dönüştürülebilir. Sütunlar bitişik
+olduğu için Arrow'a kopyalanmadan aktarılır.
+"""
+
+import copy
+import json
+import math
+
+import numpy as np
+
+
+# Sütun adı -> protokol sözlüğündeki yol
+COLUMN_PATHS = (
+    ("initial_denaturation_temperature", ("initial_denaturation", "temperature")),
+    ("initial_denaturation_time", ("initial_denaturation", "time")),
+    ("cycle_count", ("cycles", "count")),
+    ("denaturation_temperature", ("cycles", "denaturation", "temperature")),
+    ("denaturation_time", ("cycles", "denaturation", "time")),
+    ("annealing_temperature", ("cycles", "annealing", "temperature")),
+    ("annealing_time", ("cycles", "annealing", "time")),
+    ("extension_temperature", ("cycles", "extension", "temperature")),
+    ("extension_time", ("cycles", "extension", "time")),
+    ("final_extension_temperature", ("final_extension", "temperature")),
+    ("final_extension_time", ("final_extension", "time")),
+    ("hold_temperature", ("hold", "temperature")),
+    ("hold_time", ("hold", "time")),
+    ("gc_content", ("gc_content",)),
+    ("local_gc_content", ("local_gc_content",))
+)
+COLUMNS = tuple(name for name, _ in COLUMN_PATHS)
+
+# Verilmediğinde NaN olan isteğe bağlı sütunlar
+OPTIONAL_COLUMNS = ("gc_content", "local_gc_content")
+
+# Her sütunun değerinin int olup olmadığını gösteren bit maskesi sütunu
+INTEGER_MASK = "integer_mask"
+
+# Yapılandırılmış dizi (ve .npy) kayıt türü
+PROTOCOL_DTYPE = np.dtype([(name, np.float64) for name in COLUMNS] + [(INTEGER_MASK, np.uint16)])
+
+# Protokol sözlüğü anahtarlarının sırası (create_complete_protocol ile aynı)
+KEY_ORDER = (
+    "initial_denaturation", "cycles", "final_extension", "hold", "mode", "cycle_stages",
+    "gradient", "gc_content", "local_gc_content", "amplicon", "amplification", "warnings"
+)
+
+# Sütunlara açılan sabit yapı
+_SECTION_KEYS = ["temperature", "time"]
+_CYCLE_KEYS = ["count", "denaturation", "annealing", "extension"]
+_BASE_KEYS = ("initial_denaturation", "cycles", "final_extension", "hold")
+
+# Sözlüklere dönüştürülürken sütunlardan bir seferde okunan satır sayısı
+_ITER_CHUNK_SIZE = 4096
+
+# Süresiz saklama adımı hold_time sütununda NaN olarak tutulur
+INDEFINITE = "indefinite"
+
+
+def _is_number(value):
+    """Değerin sütunda saklanabilen bir sayı (bool olmayan int veya float) olup olmadığını döndürür."""
+    return value.__class__ is int or value.__class__ is float
+
+
+def matches_layout(protocol):
+    """
+    Protokolün sütunlara kayıpsız açılabilen standart yapıda olup olmadığını kontrol eder.
+
+    Bölümlerin anahtarları ve sırası, sayısal değerlerin türü ve üst düzey
+    anahtar sırası create_complete_protocol çıktısıyla aynı olmalıdır.
+    """
+    keys = list(protocol)
+    expected = [key for key in KEY_ORDER if key in protocol]
+    if keys[:len(expected)] != expected or not all(key in protocol for key in _BASE_KEYS):
+        return False
+
+    cycles = protocol["cycles"]
+    if not isinstance(cycles, dict) or list(cycles) != _CYCLE_KEYS or not _is_number(cycles["count"]):
+        return False
+    sections = [protocol[key] for key in ("initial_denaturation", "final_extension", "hold")]
+    sections += [cycles[key] for key in _CYCLE_KEYS[1:]]
+    for section in sections:
+        if not isinstance(section, dict) or list(section) != _SECTION_KEYS:
+            return False
+        if not _is_number(section["temperature"]):
+            return False
+        if not _is_number(section["time"]) and section is not protocol["hold"]:
+            return False
+    hold_time = protocol["hold"]["time"]
+    if not (_is_number(hold_time) and not math.isnan(hold_time)) and hold_time != INDEFINITE:
+        return False
+
+    for name in OPTIONAL_COLUMNS:
+        if name in protocol and not (_is_number(protocol[name]) and not math.isnan(protocol[name])):
+            return False
+    return True
+
+
+class ProtocolColumns:
+    """Protokolleri adım parametresi başına bir sütun olarak tutan sınıf."""
+
+    def __init__(self, columns, extras=None, protocols=None):
+        """
+        ProtocolColumns sınıfı için başlatıcı.
+
+        Args:
+            columns (dict): COLUMNS adı -> N uzunluğunda float64 dizisi ve
+                INTEGER_MASK -> uint16 dizisi (bit k: k. sütunun değeri int)
+            extras (dict, optional): Satır indeksi -> sayısal olmayan ek
+                anahtarlar (ör. "warnings", "cycle_stages", "amplicon")
+            protocols (dict, optional): Satır indeksi -> standart yapıya
+                uymayan ve olduğu gibi saklanan protokol sözlüğü
+        """
+        self.columns = {
+            name: np.ascontiguousarray(columns[name], dtype=np.float64) for name in COLUMNS
+        }
+        self.columns[INTEGER_MASK] = np.ascontiguousarray(columns[INTEGER_MASK], dtype=np.uint16)
+        self.length = len(self.columns[INTEGER_MASK])
+        self.extras = extras or {}
+        self.protocols = protocols or {}
+
+    @classmethod
+    def empty(cls, length):
+        """
+        Belirtilen satır sayısında boş (NaN) sütunlar oluşturur.
+
+        Args:
+            length (int): Satır sayısı
+
+        Returns:
+            ProtocolColumns: Doldurulacak sütunlar
+        """
+        columns = {name: np.full(length, np.nan) for name in COLUMNS}
+        columns[INTEGER_MASK] = np.zeros(length, dtype=np.uint16)
+        return cls(columns)
+
+    @classmethod
+    def from_protocols(cls, protocols):
+        """
+        Protokol sözlüklerini sütunlara dönüştürür.
+
+        Args:
+            protocols (list): create_complete_protocol sonuçları
+
+        Returns:
+            ProtocolColumns: Sütunlu protokoller
+        """
+        protocols = list(protocols)
+        result = cls.empty(len(protocols))
+        for index, protocol in enumerate(protocols):
+            result.set_row(index, protocol)
+        return result
+
+    @classmethod
+    def from_batch(cls, batch):
+        """
+        ProtocolBatch'i protokol sözlükleri oluşturmadan sütunlara dönüştürür.
+
+        Args:
+            batch (ProtocolBatch): create_protocols_batch sonucu
+
+        Returns:
+            ProtocolColumns: Sütunlu protokoller
+        """
+        n_rows = len(batch)
+        sources = {
+            "initial_denaturation_temperature": "denaturation_temp",
+            "initial_denaturation_time": "initial_denaturation_time",
+            "cycle_count": "cycle_count",
+            "denaturation_temperature": "denaturation_temp",
+            "denaturation_time": "denaturation_time",
+            "annealing_temperature": "annealing_temp",
+            "annealing_time": "annealing_time",
+            "extension_temperature": "extension_temp",
+            "extension_time": "extension_time",
+            "final_extension_temperature": "extension_temp",
+            "final_extension_time": "final_extension_time",
+            "gc_content": "gc_content"
+        }
+        columns = {name: np.full(n_rows, np.nan) for name in COLUMNS}
+        integer_mask = np.zeros(n_rows, dtype=np.uint16)
+        for name, source in sources.items():
+            values = batch.column(source)
+            columns[name] = values.astype(np.float64)
+            mask = batch.integer_masks.get(source)
+            if mask is None:
+                mask = np.full(n_rows, np.issubdtype(values.dtype, np.integer))
+            integer_mask |= mask.astype(np.uint16) << np.uint16(COLUMNS.index(name))
+
+        # Saklama adımı: 4°C (int), süresiz
+        columns["hold_temperature"] = np.full(n_rows, 4.0)
+        integer_mask |= np.uint16(1 << COLUMNS.index("hold_temperature"))
+        columns[INTEGER_MASK] = integer_mask
+
+        result = cls(columns)
+        for index in range(n_rows):
+            if index in batch.protocols:
+                result.set_row(index, batch.protocols[index])
+                continue
+            extras = {}
+            if index in batch.amplification:
+                extras["amplification"] = batch.amplification[index]
+            if batch.warnings[index]:
+                extras["warnings"] = list(batch.warnings[index])
+            if extras:
+                result.extras[index] = extras
+        return result
+
+    @classmethod
+    def from_structured(cls, array, extras=None, protocols=None):
+        """
+        PROTOCOL_DTYPE türündeki yapılandırılmış diziden sütunları oluşturur.
+
+        Args:
+            array (numpy.ndarray): Yapılandırılmış dizi (ör. np.load ile okunan .npy)
+            extras (dict, optional): Satır indeksi -> ek anahtarlar
+            protocols (dict, optional): Satır indeksi -> olduğu gibi saklanan protokol
+
+        Returns:
+            ProtocolColumns: Sütunlu protokoller
+        """
+        return cls({name: array[name] for name in PROTOCOL_DTYPE.names}, extras, protocols)
+
+    @classmethod
+    def load(cls, file):
+        """
+        save ile yazılan .npz dosyasını okur.
+
+        Args:
+            file (str or file): Dosya yolu veya ikili dosya nesnesi
+
+        Returns:
+            ProtocolColumns: Sütunlu protokoller
+        """
+        with np.load(file, allow_pickle=False) as data:
+            columns = {name: data[name] for name in PROTOCOL_DTYPE.names}
+            extras, protocols = {}, {}
+            for index, text in zip(data["extra_rows"].tolist(), data["extra_values"].tolist()):
+                record = json.loads(text)
+                if "protocol" in record:
+                    protocols[index] = record["protocol"]
+                else:
+                    extras[index] = record["extras"]
+        return cls(columns, extras, protocols)
+
+    def __len__(self):
+        """Protokol sayısını döndürür."""
+        return self.length
+
+    def __iter__(self):
+        """Protokolleri sırayla sözlük olarak üretir (sütunlar parça parça okunur)."""
+        for start in range(0, self.length, _ITER_CHUNK_SIZE):
+            stop = min(start + _ITER_CHUNK_SIZE, self.length)
+            columns = [self.columns[name][start:stop].tolist() for name in COLUMNS]
+            masks = self.columns[INTEGER_MASK][start:stop].tolist()
+            for offset, (values, mask) in enumerate(zip(zip(*columns), masks)):
+                yield self._row_to_dict(start + offset, values, mask)
+
+    def column(self, name):
+        """
+        Bir sütunu kopyalamadan döndürür.
+
+        Args:
+            name (str): COLUMNS içindeki sütun adı veya INTEGER_MASK
+
+        Returns:
+            numpy.ndarray: Bitişik sütun dizisi
+        """
+        return self.columns[name]
+
+    def set_row(self, index, protocol):
+        """
+        Bir satırı protokol sözlüğünden doldurur.
+
+        Standart yapıya uymayan protokoller (ör. elle değiştirilmiş bölümler)
+        sayısal sütunları doldurulduktan sonra olduğu gibi saklanır.
+
+        Args:
+            index (int): Satır indeksi
+            protocol (dict or Protocol): Protokol sözlüğü veya nesnesi
+        """
+        from .protocol_model import as_dict
+
+        protocol = as_dict(protocol)
+        self.extras.pop(index, None)
+        self.protocols.pop(index, None)
+        if not matches_layout(protocol):
+            self.protocols[index] = protocol
+            mask = 0
+            for bit, (name, path) in enumerate(COLUMN_PATHS):
+                value = protocol
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                self.columns[name][index] = value if _is_number(value) else np.nan
+                mask |= (value.__class__ is int) << bit
+            self.columns[INTEGER_MASK][index] = mask
+            return
+
+        mask = 0
+        for bit, (name, path) in enumerate(COLUMN_PATHS):
+            value = protocol.get(path[0], np.nan)
+            for key in path[1:]:
+                value = value[key]
+            if value == INDEFINITE:
+                value = np.nan
+            self.columns[name][index] = value
+            mask |= (value.__class__ is int) << bit
+        self.columns[INTEGER_MASK][index] = mask
+
+        extras = {
+            key: value for key, value in protocol.items()
+            if key not in _BASE_KEYS and key not in OPTIONAL_COLUMNS
+        }
+        if extras:
+            self.extras[index] = extras
+
+    def __getitem__(self, index):
+        """
+        Bir satırı protokol sözlüğüne çevirir.
+
+        Args:
+            index (int): Satır indeksi (negatif indeks desteklenir)
+
+        Returns:
+            dict: Protokol sözlüğü (sütunlara dönüştürülen sözlükle aynı)
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("Protokol indeksi aralık dışında.")
+        values = [self.columns[name][index].item() for name in COLUMNS]
+        return self._row_to_dict(index, values, int(self.columns[INTEGER_MASK][index]))
+
+    def to_dicts(self):
+        """
+        Tüm satırları protokol sözlüklerine çevirir.
+
+        Returns:
+            list: Protokol sözlükleri
+        """
+        return list(self)
+
+    def _row_to_dict(self, index, values, mask):
+        """Bir satırın değerlerinden protokol sözlüğünü oluşturur."""
+        if index in self.protocols:
+            return copy.deepcopy(self.protocols[index])
+
+        values = [
+            int(value) if mask >> bit & 1 else value for bit, value in enumerate(values)
+        ]
+        (initial_temp, initial_time, count, denaturation_temp, denaturation_time, annealing_temp,
+         annealing_time, extension_temp, extension_time, final_temp, final_time, hold_temp,
+         hold_time, gc_content, local_gc_content) = values
+
+        protocol = {
+            "initial_denaturation": {"temperature": initial_temp, "time": initial_time},
+            "cycles": {
+                "count": count,
+                "denaturation": {"temperature": denaturation_temp, "time": denaturation_time},
+                "annealing": {"temperature": annealing_temp, "time": annealing_time},
+                "extension": {"temperature": extension_temp, "time": extension_time}
+            },
+            "final_extension": {"temperature": final_temp, "time": final_time},
+            "hold": {"temperature": hold_temp, "time": INDEFINITE if math.isnan(hold_time) else hold_time}
+        }
+
+        extras = self.extras.get(index, {})
+        optional = {"gc_content": gc_content, "local_gc_content": local_gc_content}
+        for key in KEY_ORDER[len(_BASE_KEYS):]:
+            if key in optional:
+                if not math.isnan(optional[key]):
+                    protocol[key] = optional[key]
+            elif key in extras:
+                protocol[key] = copy.deepcopy(extras[key])
+        for key, value in extras.items():
+            if key not in protocol:
+                protocol[key] = copy.deepcopy(value)
+        return protocol
+
+    def to_structured(self):
+        """
+        Sütunları PROTOCOL_DTYPE türünde yapılandırılmış diziye kopyalar.
+
+        Ek bilgiler (uyarılar vb.) yapılandırılmış diziye dahil değildir;
+        kayıpsız saklama için save kullanılır.
+
+        Returns:
+            numpy.ndarray: Yapılandırılmış dizi (np.save ile .npy olarak yazılabilir)
+        """
+        array = np.empty(self.length, dtype=PROTOCOL_DTYPE)
+        for name in PROTOCOL_DTYPE.names:
+            array[name] = self.columns[name]
+        return array
+
+    def save(self, file):
+        """
+        Sütunları ve ek bilgileri .npz dosyasına kayıpsız yazar.
+
+        Ek bilgiler satır başına JSON metni olarak saklanır; dosya pickle
+        gerektirmeden okunur.
+
+        Args:
+            file (str or file): Dosya yolu veya ikili dosya nesnesi
+        """
+        rows = sorted(set(self.extras) | set(self.protocols))
+        values = [
+            json.dumps({"protocol": self.protocols[index]} if index in self.protocols
+                       else {"extras": self.extras[index]}, ensure_ascii=False)
+            for index in rows
+        ]
+        np.savez(
+            file,
+            extra_rows=np.array(rows, dtype=np.int64),
+            extra_values=np.array(values, dtype=np.str_),
+            **self.columns
+        )
+
+    def to_arrow(self):
+        """
+        Sütunları Arrow tablosuna dönüştürür (pyarrow gerektirir).
+
+        Sayısal sütunlar kopyalanmadan aktarılır; isteğe bağlı sütunlarda NaN
+        değerler null olarak işaretlenir. Ek bilgiler "extras" sütununda JSON
+        metni olarak yer alır.
+
+        Returns:
+            pyarrow.Table: Protokol tablosu
+
+        Raises:
+            ImportError: pyarrow kurulu değilse
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as error:
+            raise ImportError("Arrow dışa aktarımı için pyarrow paketi gereklidir.") from error
+
+        arrays = {}
+        for name in COLUMNS:
+            values = self.columns[name]
+            arrays[name] = pa.array(values, mask=np.isnan(values) if name in OPTIONAL_COLUMNS else None)
+        arrays[INTEGER_MASK] = pa.array(self.columns[INTEGER_MASK])
+        extras = [None] * self.length
+        for index, value in self.extras.items():
+            extras[index] = json.dumps({"extras": value}, ensure_ascii=False)
+        for index, value in self.protocols.items():
+            extras[index] = json.dumps({"protocol": value}, ensure_ascii=False)
+        arrays["extras"] = pa.array(extras, type=pa.string())
+        return pa.table(arrays)
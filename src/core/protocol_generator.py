@@ -2,33 +2,135 @@
 PCR protokollerini oluşturan ve formatlayan modül.
 """
 
+import itertools
 import json
 from datetime import datetime
 
+from .cycling import cycle_stages
+from .protocol_batch import DEFAULT_CHUNK_SIZE
+from .protocol_cache import canonical_parameters, optimizer_fingerprint, protocol_key
+from .protocol_model import as_dict
+from .text_renderer import TextRenderer
+
+
+# Çok sayıda protokolün akışla yazılabildiği biçimler
+STREAM_FORMATS = ("ndjson", "csv", "text")
+
+# Akış CSV çıktısının başlığı (her satır protokol numarasıyla başlar)
+STREAM_CSV_HEADER = "Protokol,Adım,Sıcaklık (°C),Süre,Döngü,Döngü Başına Değişim (°C)"
+
+# Metin akışında protokoller arasındaki ayırıcı
+STREAM_TEXT_SEPARATOR = "\n" + "=" * 40 + "\n\n"
+
 
 class ProtocolGenerator:
     """PCR protokollerini oluşturmak için ana sınıf."""
     
-    def __init__(self, optimizer):
+    def __init__(self, optimizer, cache=None):
         """
         ProtocolGenerator sınıfı için başlatıcı.
         
         Args:
             optimizer: PCROptimizer nesnesi
+            cache (ProtocolCache, optional): Protokol ve çıktı önbelleği. Verilirse
+                aynı (normalize edilmiş) girdiler için protokol yeniden oluşturulmaz.
         """
         self.optimizer = optimizer
+        self.cache = cache
+        self.text_renderer = TextRenderer()
     
     def generate_protocol(self, **kwargs):
         """
         Verilen parametrelere göre PCR protokolü oluşturur.
         
+        Önbellek varsa parametreler kanonik biçime getirilir ve protokol bu
+        biçimle oluşturulur; böylece primerlerin büyük/küçük harfi, boşluklar
+        ve sayı biçimi aynı sonucu verir.
+        
         Args:
             **kwargs: PCR parametreleri (optimizer.create_complete_protocol ile aynı)
             
         Returns:
             dict: Protokol bilgisi
         """
-        return self.optimizer.create_complete_protocol(**kwargs)
+        if self.cache is None:
+            return self.optimizer.create_complete_protocol(**kwargs)
+        
+        key, parameters = self._cache_key(kwargs)
+        return self.cache.get_or_compute(
+            key, lambda: self.optimizer.create_complete_protocol(**parameters)
+        )
+    
+    def generate_rendered(self, format="text", **kwargs):
+        """
+        Verilen parametreler için protokolü oluşturup istenen biçimde döndürür.
+        
+        Önbellek varsa çıktı, generate_protocol'un kullandığı protokol
+        anahtarıyla saklanır; isabette protokol ne yeniden oluşturulur ne de
+        yeniden biçimlendirilir.
+        
+        Args:
+            format (str): Çıktı biçimi ("text", "json", "csv")
+            **kwargs: PCR parametreleri (generate_protocol ile aynı)
+            
+        Returns:
+            str: Biçimlendirilmiş protokol
+        """
+        formatter = self._formatter(format)
+        if self.cache is None:
+            return formatter(self.generate_protocol(**kwargs))
+        
+        key, parameters = self._cache_key(kwargs)
+        return self.cache.get_or_render(
+            key, format,
+            lambda: formatter(self.cache.get_or_compute(
+                key, lambda: self.optimizer.create_complete_protocol(**parameters)
+            ))
+        )
+    
+    def render(self, protocol, format="text"):
+        """
+        Protokolü istenen biçime dönüştürür.
+        
+        Dışarıdan gelen protokollerin içerik özetini çıkarmak biçimlendirmekten
+        pahalı olduğu için çıktı önbelleğe alınmaz; önbellekli çıktı için
+        generate_rendered kullanılır.
+        
+        Args:
+            protocol (dict or Protocol): Protokol bilgisi
+            format (str): Çıktı biçimi ("text", "json", "csv")
+            
+        Returns:
+            str: Biçimlendirilmiş protokol
+        """
+        return self._formatter(format)(as_dict(protocol))
+    
+    def _cache_key(self, kwargs):
+        """Parametrelerin kanonik biçimini ve önbellek anahtarını döndürür."""
+        parameters = canonical_parameters(kwargs)
+        return protocol_key(parameters, optimizer_fingerprint(self.optimizer)), parameters
+    
+    def _formatter(self, format):
+        """Çıktı biçimine karşılık gelen dönüştürme metodunu döndürür."""
+        formatters = {
+            "text": self.protocol_to_text,
+            "json": self.protocol_to_json,
+            "csv": self.protocol_to_csv
+        }
+        if format not in formatters:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {format}")
+        return formatters[format]
+    
+    def cache_stats(self):
+        """
+        Protokol önbelleğinin istatistiklerini döndürür.
+        
+        Returns:
+            dict or None: ProtocolCache.stats() sonucu, önbellek yoksa None
+        """
+        if self.cache is None:
+            return None
+        return self.cache.stats()
     
     def format_time(self, seconds):
         """
@@ -40,102 +142,33 @@ class ProtocolGenerator:
         Returns:
             str: Formatlanmış süre (dakika:saniye)
         """
-        if seconds == "indefinite":
-            return "Süresiz"
-            
-        minutes = seconds // 60
-        remaining_seconds = seconds % 60
-        
-        if minutes > 0:
-            return f"{minutes} dk {remaining_seconds} sn"
-        else:
-            return f"{remaining_seconds} sn"
+        return self.text_renderer.format_time(seconds)
     
     def protocol_to_text(self, protocol):
         """
         Protokolü metin formatına dönüştürür.
         
+        Metin, rapor düzenini bir kez derleyen TextRenderer ile oluşturulur.
+        
         Args:
             protocol (dict): Protokol bilgisi
             
         Returns:
             str: Formatlanmış protokol metni
         """
-        text = "# PCR Protokolü\n\n"
-        
-        # Başlangıç denatürasyonu
-        text += "## Başlangıç Denatürasyonu\n"
-        text += f"- Sıcaklık: {protocol['initial_denaturation']['temperature']}°C\n"
-        text += f"- Süre: {self.format_time(protocol['initial_denaturation']['time'])}\n\n"
-        
-        # Döngüler
-        text += f"## Döngüler (x{protocol['cycles']['count']})\n"
-        
-        # Denatürasyon
-        text += "### Denatürasyon\n"
-        text += f"- Sıcaklık: {protocol['cycles']['denaturation']['temperature']}°C\n"
-        text += f"- Süre: {self.format_time(protocol['cycles']['denaturation']['time'])}\n\n"
-        
-        # Bağlanma
-        text += "### Bağlanma (Annealing)\n"
-        text += f"- Sıcaklık: {protocol['cycles']['annealing']['temperature']}°C\n"
-        text += f"- Süre: {self.format_time(protocol['cycles']['annealing']['time'])}\n\n"
-        
-        # Uzama
-        text += "### Uzama (Extension)\n"
-        text += f"- Sıcaklık: {protocol['cycles']['extension']['temperature']}°C\n"
-        text += f"- Süre: {self.format_time(protocol['cycles']['extension']['time'])}\n\n"
-        
-        # Son uzama
-        text += "## Son Uzama\n"
-        text += f"- Sıcaklık: {protocol['final_extension']['temperature']}°C\n"
-        text += f"- Süre: {self.format_time(protocol['final_extension']['time'])}\n\n"
-        
-        # Saklama
-        text += "## Saklama\n"
-        text += f"- Sıcaklık: {protocol['hold']['temperature']}°C\n"
-        text += f"- Süre: {self.format_time(protocol['hold']['time'])}\n\n"
-        
-        # Ek bilgiler
-        if "gc_content" in protocol:
-            text += f"GC İçeriği: %{protocol['gc_content']}\n\n"
-            
-        # Toplam süre
-        total_time = protocol['initial_denaturation']['time']
-        total_time += protocol['cycles']['count'] * (
-            protocol['cycles']['denaturation']['time'] +
-            protocol['cycles']['annealing']['time'] +
-            protocol['cycles']['extension']['time']
-        )
-        total_time += protocol['final_extension']['time']
-        
-        hours = total_time // 3600
-        minutes = (total_time % 3600) // 60
-        seconds = total_time % 60
-        
-        time_str = ""
-        if hours > 0:
-            time_str += f"{hours} saat "
-        if minutes > 0:
-            time_str += f"{minutes} dakika "
-        if seconds > 0:
-            time_str += f"{seconds} saniye"
-            
-        text += f"Tahmini Toplam Süre: {time_str.strip()}\n"
-        
-        return text
+        return self.text_renderer.render(protocol)
     
     def protocol_to_json(self, protocol):
         """
         Protokolü JSON formatına dönüştürür.
         
         Args:
-            protocol (dict): Protokol bilgisi
+            protocol (dict or Protocol): Protokol bilgisi
             
         Returns:
             str: JSON formatında protokol
         """
-        return json.dumps(protocol, indent=2, ensure_ascii=False)
+        return json.dumps(as_dict(protocol), indent=2, ensure_ascii=False)
     
     def protocol_to_csv(self, protocol):
         """
@@ -147,42 +180,147 @@ class ProtocolGenerator:
         Returns:
             str: CSV formatında protokol
         """
-        csv_lines = ["Adım,Sıcaklık (°C),Süre,Döngü"]
+        stepped = any(stage['annealing'].get('step') for stage in cycle_stages(protocol))
+        
+        # Touchdown aşamaları için döngü başına sıcaklık değişimi sütunu eklenir
+        header = "Adım,Sıcaklık (°C),Süre,Döngü"
+        csv_lines = [header + ",Döngü Başına Değişim (°C)" if stepped else header]
+        for row in self._csv_rows(protocol):
+            csv_lines.append(",".join(str(value) for value in (row if stepped else row[:-1])))
+        
+        return "\n".join(csv_lines)
+    
+    def _csv_rows(self, protocol):
+        """
+        Protokolün CSV satırlarını üretir.
+        
+        Args:
+            protocol (dict): Protokol bilgisi
+            
+        Yields:
+            tuple: (adım, sıcaklık, süre, döngü sayısı, döngü başına sıcaklık değişimi)
+        """
+        stages = cycle_stages(protocol)
         
         # Başlangıç denatürasyonu
-        csv_lines.append(
-            f"Başlangıç Denatürasyonu,{protocol['initial_denaturation']['temperature']},"
-            f"{protocol['initial_denaturation']['time']},1"
+        yield (
+            "Başlangıç Denatürasyonu", protocol['initial_denaturation']['temperature'],
+            protocol['initial_denaturation']['time'], 1, 0
         )
         
         # Döngüler
-        csv_lines.append(
-            f"Denatürasyon,{protocol['cycles']['denaturation']['temperature']},"
-            f"{protocol['cycles']['denaturation']['time']},{protocol['cycles']['count']}"
-        )
+        for number, stage in enumerate(stages, 1):
+            suffix = f" (Aşama {number})" if len(stages) > 1 else ""
+            for label, key in (("Denatürasyon", "denaturation"), ("Bağlanma", "annealing"),
+                               ("Uzama", "extension")):
+                step = stage[key]
+                yield (f"{label}{suffix}", step['temperature'], step['time'], stage['count'],
+                       step.get('step', 0))
         
-        csv_lines.append(
-            f"Bağlanma,{protocol['cycles']['annealing']['temperature']},"
-            f"{protocol['cycles']['annealing']['time']},{protocol['cycles']['count']}"
-        )
-        
-        csv_lines.append(
-            f"Uzama,{protocol['cycles']['extension']['temperature']},"
-            f"{protocol['cycles']['extension']['time']},{protocol['cycles']['count']}"
-        )
+        # Gradyan sütunları
+        if "gradient" in protocol:
+            annealing = protocol['cycles']['annealing']
+            for column, temperature in enumerate(protocol["gradient"]["temperatures"], 1):
+                yield (f"Gradyan Sütun {column}", temperature, annealing['time'],
+                       protocol['cycles']['count'], 0)
         
         # Son uzama
-        csv_lines.append(
-            f"Son Uzama,{protocol['final_extension']['temperature']},"
-            f"{protocol['final_extension']['time']},1"
+        yield (
+            "Son Uzama", protocol['final_extension']['temperature'],
+            protocol['final_extension']['time'], 1, 0
         )
         
         # Saklama
-        csv_lines.append(
-            f"Saklama,{protocol['hold']['temperature']},{protocol['hold']['time']},1"
-        )
+        yield ("Saklama", protocol['hold']['temperature'], protocol['hold']['time'], 1, 0)
+    
+    def generate_protocols(self, records, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Reaksiyon kayıtlarından protokolleri parça parça üretir.
         
-        return "\n".join(csv_lines)
+        Kayıtlar (ör. bir dosyadan okunan üreteç) chunk_size büyüklüğündeki
+        parçalar hâlinde create_protocols_batch ile hesaplanır; bellekte aynı
+        anda yalnızca bir parça tutulur.
+        
+        Args:
+            records (iterable): create_protocols_batch alanlarını içeren kayıt sözlükleri
+            chunk_size (int): Bir parçada hesaplanan kayıt sayısı
+            
+        Yields:
+            dict: Protokol sözlükleri (kayıt sırasıyla)
+        """
+        if chunk_size < 1:
+            raise ValueError("Parça boyutu en az 1 olmalıdır.")
+        records = iter(records)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            yield from self.optimizer.create_protocols_batch(chunk)
+    
+    def iter_protocols(self, protocols, format="ndjson"):
+        """
+        Çok sayıda protokolü akış için metin parçalarına dönüştürür.
+        
+        Her protokol ayrı bir parça olarak üretilir; çıktı hiçbir zaman
+        bütünüyle bellekte tutulmaz. Flask yanıtında (Response) doğrudan
+        kullanılabilir.
+        
+        Args:
+            protocols (iterable): Protokol sözlükleri (liste, üreteç veya ProtocolBatch)
+            format (str): "ndjson" (satır başına bir JSON nesnesi), "csv" (tek
+                başlık, her satırda protokol numarası) veya "text" (ayırıcılarla
+                art arda metin protokolleri)
+            
+        Yields:
+            str: Başlık ve protokol parçaları
+        """
+        self._check_stream_format(format)
+        if format == "csv":
+            yield STREAM_CSV_HEADER + "\n"
+        yield from self._stream_records(protocols, format)
+    
+    def write_protocols(self, protocols, stream, format="ndjson"):
+        """
+        Çok sayıda protokolü satır satır bir metin akışına yazar.
+        
+        Args:
+            protocols (iterable): Protokol sözlükleri (liste, üreteç veya ProtocolBatch)
+            stream (file): Metin akışı (ör. açık dosya veya sys.stdout)
+            format (str): "ndjson", "csv" veya "text"
+            
+        Returns:
+            int: Yazılan protokol sayısı
+        """
+        self._check_stream_format(format)
+        if format == "csv":
+            stream.write(STREAM_CSV_HEADER + "\n")
+        count = 0
+        for count, chunk in enumerate(self._stream_records(protocols, format), 1):
+            stream.write(chunk)
+        return count
+    
+    def _check_stream_format(self, format):
+        """Akış biçimini doğrular."""
+        if format not in STREAM_FORMATS:
+            raise ValueError(
+                f"Desteklenmeyen akış biçimi: {format}. Geçerli biçimler: {', '.join(STREAM_FORMATS)}"
+            )
+    
+    def _stream_records(self, protocols, format):
+        """Her protokol için bir akış parçası üretir (metin biçiminde TextRenderer.render_many ile)."""
+        if format == "text":
+            for number, text in enumerate(self.text_renderer.render_many(protocols), 1):
+                yield text if number == 1 else STREAM_TEXT_SEPARATOR + text
+            return
+        
+        for number, protocol in enumerate(protocols, 1):
+            if format == "ndjson":
+                yield json.dumps(as_dict(protocol), ensure_ascii=False) + "\n"
+            else:
+                yield "".join(
+                    f"{number}," + ",".join(str(value) for value in row) + "\n"
+                    for row in self._csv_rows(protocol)
+                )
     
     def generate_report(self, protocol, parameters=None, format="text"):
         """
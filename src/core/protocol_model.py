@@ -0,0 +1,416 @@
+"""
+İç içe protokol sözlükleri yerine kullanılabilen küçük, değiştirilemez protokol nesneleri.
+
+Protocol, CycleBlock ve Step sınıfları __slots__ kullanır; her protokol
+create_complete_protocol'ün ürettiği yaklaşık 12 sözlük yerine 7 küçük
+nesneyle tutulur. Nesneler salt okunur eşlemedir (Mapping): protocol["cycles"]
+["annealing"]["temperature"] gibi sözlük erişimi çalıştığı için mevcut
+sözlük tabanlı kod (metin ve CSV çıktıları, toplam süre vb.) değişmeden
+kullanılabilir. JSON gibi gerçek sözlük gerektiren yerler için to_dict ve
+as_dict dönüştürücüleri vardır.
+
+to_bytes/from_bytes ikili biçimi ProtocolColumns ile aynı sayısal düzeni
+kullanır: sürüm baytı, int türü bit maskesi ve 15 float64 değer; sayısal
+olmayan ek bilgiler (uyarılar, touchdown aşamaları vb.) sonda JSON metnidir.
+"""
+
+import json
+import math
+import struct
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .protocol_columns import COLUMNS, INDEFINITE, KEY_ORDER, matches_layout
+
+
+# İkili biçim sürümü
+BINARY_VERSION = 1
+
+# Sürüm, int bit maskesi ve COLUMNS sırasıyla sayısal değerler
+_HEADER = struct.Struct("<BH" + "d" * len(COLUMNS))
+
+# Protocol nesnesinde ayrı alan olarak tutulan üst düzey anahtarlar
+_FIELD_KEYS = (
+    "initial_denaturation", "cycles", "final_extension", "hold", "gc_content",
+    "local_gc_content", "warnings"
+)
+
+# Bağlanma adımlarının tutulduğu bölümler
+_STEP_KEYS = ("temperature", "time")
+_CYCLE_KEYS = ("count", "denaturation", "annealing", "extension")
+
+
+def _freeze(value):
+    """İç içe sözlük ve listeleri salt okunur eşleme ve demetlere çevirir."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """_freeze ile dondurulmuş değeri yeni sözlük ve listelere çevirir."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class _Frozen(Mapping):
+    """Alanları başlatıldıktan sonra değiştirilemeyen salt okunur eşleme tabanı."""
+
+    __slots__ = ()
+    _keys = ()
+
+    def __setattr__(self, name, value):
+        """Alan atamasını engeller."""
+        raise AttributeError(f"{type(self).__name__} nesneleri değiştirilemez.")
+
+    def __delattr__(self, name):
+        """Alan silmeyi engeller."""
+        raise AttributeError(f"{type(self).__name__} nesneleri değiştirilemez.")
+
+    def __getitem__(self, key):
+        """Sözlük erişimi için alan değerini döndürür."""
+        if key in self._keys:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        """Anahtarları sözlük sırasıyla üretir."""
+        return iter(self._keys)
+
+    def __len__(self):
+        """Anahtar sayısını döndürür."""
+        return len(self._keys)
+
+    def __hash__(self):
+        """Alan değerlerinden özet değeri hesaplar."""
+        return hash(tuple(getattr(self, key) for key in self._keys))
+
+    def __repr__(self):
+        """Nesnenin okunabilir gösterimini döndürür."""
+        fields = ", ".join(f"{key}={getattr(self, key)!r}" for key in self._keys)
+        return f"{type(self).__name__}({fields})"
+
+
+class Step(_Frozen):
+    """Bir sıcaklık adımı (ör. denatürasyon): sıcaklık ve süre."""
+
+    __slots__ = _STEP_KEYS
+    _keys = _STEP_KEYS
+
+    def __init__(self, temperature, time):
+        """
+        Step sınıfı için başlatıcı.
+
+        Args:
+            temperature (int or float): Sıcaklık (°C)
+            time (int or float or str): Süre (saniye) veya "indefinite"
+        """
+        object.__setattr__(self, "temperature", temperature)
+        object.__setattr__(self, "time", time)
+
+    @classmethod
+    def from_dict(cls, step):
+        """
+        {"temperature": ..., "time": ...} sözlüğünden adım oluşturur.
+
+        Args:
+            step (dict): Adım sözlüğü
+
+        Returns:
+            Step: Adım
+        """
+        return cls(step["temperature"], step["time"])
+
+    def to_dict(self):
+        """
+        Adımı sözlüğe dönüştürür.
+
+        Returns:
+            dict: {"temperature": ..., "time": ...}
+        """
+        return {"temperature": self.temperature, "time": self.time}
+
+
+class CycleBlock(_Frozen):
+    """Döngü bloğu: döngü sayısı ile denatürasyon, bağlanma ve uzama adımları."""
+
+    __slots__ = _CYCLE_KEYS
+    _keys = _CYCLE_KEYS
+
+    def __init__(self, count, denaturation, annealing, extension):
+        """
+        CycleBlock sınıfı için başlatıcı.
+
+        Args:
+            count (int): Döngü sayısı
+            denaturation (Step): Denatürasyon adımı
+            annealing (Step): Bağlanma adımı
+            extension (Step): Uzama adımı
+        """
+        object.__setattr__(self, "count", count)
+        object.__setattr__(self, "denaturation", denaturation)
+        object.__setattr__(self, "annealing", annealing)
+        object.__setattr__(self, "extension", extension)
+
+    @classmethod
+    def from_dict(cls, cycles):
+        """
+        protocol["cycles"] sözlüğünden döngü bloğu oluşturur.
+
+        Args:
+            cycles (dict): Döngü sözlüğü
+
+        Returns:
+            CycleBlock: Döngü bloğu
+        """
+        return cls(
+            cycles["count"], Step.from_dict(cycles["denaturation"]),
+            Step.from_dict(cycles["annealing"]), Step.from_dict(cycles["extension"])
+        )
+
+    def to_dict(self):
+        """
+        Döngü bloğunu sözlüğe dönüştürür.
+
+        Returns:
+            dict: protocol["cycles"] biçiminde sözlük
+        """
+        return {
+            "count": self.count,
+            "denaturation": self.denaturation.to_dict(),
+            "annealing": self.annealing.to_dict(),
+            "extension": self.extension.to_dict()
+        }
+
+
+class Protocol(_Frozen):
+    """create_complete_protocol sonucunun değiştirilemez nesne karşılığı."""
+
+    __slots__ = (
+        "initial_denaturation", "cycles", "final_extension", "hold", "gc_content",
+        "local_gc_content", "warnings", "extras", "_keys"
+    )
+
+    def __init__(self, initial_denaturation, cycles, final_extension, hold=None,
+                 gc_content=None, local_gc_content=None, warnings=None, extras=None):
+        """
+        Protocol sınıfı için başlatıcı.
+
+        Args:
+            initial_denaturation (Step): Başlangıç denatürasyonu
+            cycles (CycleBlock): Döngü bloğu
+            final_extension (Step): Son uzama
+            hold (Step, optional): Saklama adımı; verilmezse 4°C, süresiz
+            gc_content (float, optional): GC içeriği yüzdesi
+            local_gc_content (float, optional): Eşik kararlarında kullanılan yerel GC
+            warnings (tuple, optional): Uyarı mesajları
+            extras (dict, optional): Diğer üst düzey anahtarlar (ör. "mode",
+                "cycle_stages", "gradient", "amplicon", "amplification"); iç içe
+                sözlük ve listeler salt okunur kopyalar olarak saklanır
+        """
+        set_field = object.__setattr__
+        set_field(self, "initial_denaturation", initial_denaturation)
+        set_field(self, "cycles", cycles)
+        set_field(self, "final_extension", final_extension)
+        set_field(self, "hold", hold if hold is not None else Step(4, INDEFINITE))
+        set_field(self, "gc_content", gc_content)
+        set_field(self, "local_gc_content", local_gc_content)
+        set_field(self, "warnings", tuple(warnings) if warnings is not None else None)
+        set_field(self, "extras", _freeze(extras or {}))
+
+        # Sözlük anahtarları create_complete_protocol sırasıyla
+        present = {"gc_content": gc_content, "local_gc_content": local_gc_content, "warnings": warnings}
+        keys = list(KEY_ORDER[:4])
+        keys.extend(
+            key for key in KEY_ORDER[4:]
+            if key in self.extras or present.get(key) is not None
+        )
+        keys.extend(key for key in self.extras if key not in keys)
+        set_field(self, "_keys", tuple(keys))
+
+    def __getitem__(self, key):
+        """Sözlük erişimi için alan veya ek bilgi değerini döndürür."""
+        if key in self.extras:
+            return self.extras[key]
+        if key in self._keys:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __eq__(self, other):
+        """
+        Protokolü başka bir protokol nesnesi veya sözlüğüyle karşılaştırır.
+
+        Karşılaştırma to_dict biçiminde yapılır; böylece uyarıların demet,
+        sözlükte ise liste olarak tutulması eşitliği bozmaz.
+        """
+        if isinstance(other, Protocol):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __hash__(self):
+        """Protokolün ikili gösteriminden özet değeri hesaplar."""
+        return hash(self.to_bytes())
+
+    def __reduce__(self):
+        """Süreçler arası aktarım (pickle) için ikili gösterimi kullanır."""
+        return (Protocol.from_bytes, (self.to_bytes(),))
+
+    @classmethod
+    def from_dict(cls, protocol):
+        """
+        Protokol sözlüğünden nesne oluşturur.
+
+        Args:
+            protocol (dict): create_complete_protocol sonucu
+
+        Returns:
+            Protocol: Protokol nesnesi
+
+        Raises:
+            ValueError: Sözlük standart protokol yapısında değilse
+        """
+        if isinstance(protocol, Protocol):
+            return protocol
+        if not matches_layout(protocol):
+            raise ValueError("Protokol sözlüğü standart protokol yapısında değil.")
+        return cls(
+            Step.from_dict(protocol["initial_denaturation"]),
+            CycleBlock.from_dict(protocol["cycles"]),
+            Step.from_dict(protocol["final_extension"]),
+            Step.from_dict(protocol["hold"]),
+            protocol.get("gc_content"),
+            protocol.get("local_gc_content"),
+            protocol.get("warnings"),
+            {key: value for key, value in protocol.items() if key not in _FIELD_KEYS}
+        )
+
+    def to_dict(self):
+        """
+        Nesneyi create_complete_protocol ile aynı biçimde (anahtar sırası dahil) sözlüğe dönüştürür.
+
+        Returns:
+            dict: Protokol sözlüğü
+        """
+        protocol = {
+            "initial_denaturation": self.initial_denaturation.to_dict(),
+            "cycles": self.cycles.to_dict(),
+            "final_extension": self.final_extension.to_dict(),
+            "hold": self.hold.to_dict()
+        }
+        for key in self._keys[4:]:
+            if key in self.extras:
+                protocol[key] = _thaw(self.extras[key])
+            elif key == "warnings":
+                protocol[key] = list(self.warnings)
+            else:
+                protocol[key] = getattr(self, key)
+        return protocol
+
+    def _values(self):
+        """Sayısal alanları COLUMNS sırasıyla döndürür."""
+        cycles = self.cycles
+        hold_time = self.hold.time
+        return (
+            self.initial_denaturation.temperature, self.initial_denaturation.time, cycles.count,
+            cycles.denaturation.temperature, cycles.denaturation.time,
+            cycles.annealing.temperature, cycles.annealing.time,
+            cycles.extension.temperature, cycles.extension.time,
+            self.final_extension.temperature, self.final_extension.time,
+            self.hold.temperature, math.nan if hold_time == INDEFINITE else hold_time,
+            math.nan if self.gc_content is None else self.gc_content,
+            math.nan if self.local_gc_content is None else self.local_gc_content
+        )
+
+    def to_bytes(self):
+        """
+        Nesneyi küçük bir ikili gösterime dönüştürür.
+
+        Returns:
+            bytes: Sürüm, int bit maskesi, 15 float64 değer ve (varsa) ek
+                bilgilerin JSON metni
+        """
+        values = self._values()
+        mask = 0
+        for bit, value in enumerate(values):
+            if value.__class__ is int:
+                mask |= 1 << bit
+        data = _HEADER.pack(BINARY_VERSION, mask, *values)
+
+        extras = _thaw(self.extras)
+        if self.warnings is not None:
+            extras["warnings"] = list(self.warnings)
+        if extras:
+            # Anahtar sırası from_bytes'ta _keys ile yeniden kurulur
+            extras["_keys"] = list(self._keys)
+            data += json.dumps(extras, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return data
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        to_bytes ile oluşturulan ikili gösterimden nesne oluşturur.
+
+        Args:
+            data (bytes): İkili gösterim
+
+        Returns:
+            Protocol: Protokol nesnesi
+
+        Raises:
+            ValueError: Sürüm desteklenmiyorsa veya veri eksikse
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("İkili protokol verisi eksik.")
+        version, mask, *values = _HEADER.unpack_from(data)
+        if version != BINARY_VERSION:
+            raise ValueError(f"Desteklenmeyen ikili protokol sürümü: {version}")
+        values = [int(value) if mask >> bit & 1 else value for bit, value in enumerate(values)]
+        (initial_temp, initial_time, count, denaturation_temp, denaturation_time, annealing_temp,
+         annealing_time, extension_temp, extension_time, final_temp, final_time, hold_temp,
+         hold_time, gc_content, local_gc_content) = values
+
+        extras = {}
+        if len(data) > _HEADER.size:
+            extras = json.loads(data[_HEADER.size:].decode("utf-8"))
+            keys = extras.pop("_keys")
+            extras = {key: extras[key] for key in keys if key in extras}
+        warnings = extras.pop("warnings", None)
+
+        return cls(
+            Step(initial_temp, initial_time),
+            CycleBlock(
+                count, Step(denaturation_temp, denaturation_time),
+                Step(annealing_temp, annealing_time), Step(extension_temp, extension_time)
+            ),
+            Step(final_temp, final_time),
+            Step(hold_temp, INDEFINITE if math.isnan(hold_time) else hold_time),
+            None if math.isnan(gc_content) else gc_content,
+            None if math.isnan(local_gc_content) else local_gc_content,
+            warnings,
+            extras
+        )
+
+
+def as_dict(protocol):
+    """
+    Protocol nesnesini sözlüğe çevirir; sözlükleri olduğu gibi döndürür.
+
+    Sözlük tabanlı metotların (ör. ProtocolGenerator) Protocol nesnelerini de
+    kabul etmesi için kullanılır.
+
+    Args:
+        protocol (dict or Protocol): Protokol
+
+    Returns:
+        dict: Protokol sözlüğü
+    """
+    if isinstance(protocol, Protocol):
+        return protocol.to_dict()
+    return protocol
@@ -0,0 +1,224 @@
+"""
+Protokol gruplarını birden çok termal döngüleyiciye dağıtan çalıştırma planlayıcısı.
+
+Her iş, tek bir programı paylaşan bir reaksiyon grubudur (ör. PlatePlanner
+programı); süresi protocol_to_text'teki tahmini toplam süredir. Kapasitesi
+c olan bir cihazda n reaksiyonluk bir görev ceil(n / c) ardışık çalıştırma
+sürer; büyük işler en büyük cihaz kapasitesinde görevlere bölünerek farklı
+cihazlarda paralel çalışabilir. Amaç tüm işlerin bittiği zamanı (makespan)
+en aza indirmektir.
+
+İki yöntem vardır: hızlı LPT (en uzun işler önce, her iş en erken
+bitireceği cihaza) ve küçük girdiler için dal-sınır (branch and bound) ile
+kesin en iyi çözüm.
+"""
+
+import math
+
+from .cycling import total_time
+
+
+# Desteklenen yöntemler ("auto": küçük girdilerde kesin, diğerlerinde LPT)
+SCHEDULE_METHODS = ("auto", "lpt", "exact")
+
+# Kesin yöntemin kabul ettiği en fazla görev sayısı
+EXACT_MAX_JOBS = 12
+
+# "auto" yönteminde kesin çözümün kullanıldığı en fazla görev sayısı
+AUTO_EXACT_JOBS = 8
+
+
+def jobs_from_plan(plan):
+    """
+    PlatePlanner.plan sonucunu çalıştırma işlerine dönüştürür.
+
+    Args:
+        plan (dict): PlatePlanner.plan sonucu
+
+    Returns:
+        list: "protocol" ve "reactions" (reaksiyon sayısı) içeren iş sözlükleri
+    """
+    return [
+        {"protocol": program["program"], "reactions": len(program["reactions"])}
+        for program in plan["programs"]
+    ]
+
+
+class RunScheduler:
+    """İşleri cihazlara atayıp sıralayan ve makespan'i en aza indiren sınıf."""
+
+    def __init__(self, instruments, method="auto", split=True):
+        """
+        RunScheduler sınıfı için başlatıcı.
+
+        Args:
+            instruments (list): "name" ve "capacity" (çalıştırma başına kuyucuk
+                sayısı) içeren cihaz sözlükleri
+            method (str): "auto", "lpt" veya "exact"
+            split (bool): True ise en büyük cihaz kapasitesini aşan işler bu
+                kapasitede parçalara bölünür; parçalar farklı cihazlarda
+                paralel çalışabilir
+        """
+        if not instruments:
+            raise ValueError("En az bir cihaz gereklidir.")
+        if method not in SCHEDULE_METHODS:
+            raise ValueError(
+                f"Bilinmeyen planlama yöntemi: {method}. Geçerli yöntemler: {', '.join(SCHEDULE_METHODS)}"
+            )
+        for instrument in instruments:
+            if int(instrument.get("capacity", 0)) < 1:
+                raise ValueError(f"Cihaz kapasitesi en az 1 olmalıdır: {instrument.get('name')}")
+
+        self.instruments = [
+            {"name": instrument.get("name") or f"Cihaz {i + 1}", "capacity": int(instrument["capacity"])}
+            for i, instrument in enumerate(instruments)
+        ]
+        self.method = method
+        self.split = split
+
+    def _tasks(self, jobs):
+        """
+        İşleri (gerekirse parçalara bölerek) görevlere dönüştürür.
+
+        Returns:
+            list: (iş indeksi, reaksiyon sayısı, çalıştırma süresi) demetleri
+        """
+        largest = max(instrument["capacity"] for instrument in self.instruments)
+        tasks = []
+        for index, job in enumerate(jobs):
+            reactions = int(job.get("reactions", 1))
+            if reactions < 1:
+                raise ValueError("İşin reaksiyon sayısı en az 1 olmalıdır.")
+            run_time = job["duration"] if "duration" in job else total_time(job["protocol"])
+            part = largest if self.split else reactions
+            for start in range(0, reactions, part):
+                tasks.append((index, min(part, reactions - start), run_time))
+        return tasks
+
+    def _durations(self, tasks):
+        """Her görev ve cihaz için toplam süreyi (çalıştırma sayısı × program süresi) hesaplar."""
+        return [
+            [math.ceil(reactions / instrument["capacity"]) * run_time for instrument in self.instruments]
+            for _, reactions, run_time in tasks
+        ]
+
+    def _lpt(self, durations):
+        """LPT: işler en kısa süreleriyle azalan sırada en erken bitirecekleri cihaza atanır."""
+        loads = [0] * len(self.instruments)
+        assignment = [0] * len(durations)
+        order = sorted(range(len(durations)), key=lambda j: -min(durations[j]))
+        for job in order:
+            best = min(
+                range(len(loads)), key=lambda m: (loads[m] + durations[job][m], durations[job][m], m)
+            )
+            assignment[job] = best
+            loads[best] += durations[job][best]
+        return assignment
+
+    def _exact(self, durations, initial):
+        """
+        Dal-sınır araması ile makespan'i en küçük atamayı bulur.
+
+        İşler en uzundan kısaya atanır; makespan'i en iyi çözümden kötü olan
+        dallar ve aynı yükteki özdeş cihazlara yapılan simetrik atamalar
+        budanır. Başlangıç üst sınırı LPT çözümüdür.
+        """
+        n_machines = len(self.instruments)
+        order = sorted(range(len(durations)), key=lambda j: -min(durations[j]))
+        best = {"assignment": list(initial), "makespan": self._makespan(durations, initial)}
+        loads = [0] * n_machines
+        assignment = [0] * len(durations)
+
+        # Kalan işlerin en kısa sürelerinin toplamı (alt sınır için)
+        remaining = [0] * (len(order) + 1)
+        for k in range(len(order) - 1, -1, -1):
+            remaining[k] = remaining[k + 1] + min(durations[order[k]])
+
+        def search(k):
+            current = max(loads)
+            if current >= best["makespan"]:
+                return
+            # Alt sınır: kalan iş ortalama olarak cihazlara dağıtılsa bile aşılamayan süre
+            if (sum(loads) + remaining[k]) / n_machines >= best["makespan"]:
+                return
+            if k == len(order):
+                best["makespan"] = current
+                best["assignment"] = list(assignment)
+                return
+            job = order[k]
+            seen = set()
+            for machine in sorted(range(n_machines), key=lambda m: loads[m] + durations[job][m]):
+                state = (loads[machine], self.instruments[machine]["capacity"])
+                if state in seen:
+                    continue
+                seen.add(state)
+                loads[machine] += durations[job][machine]
+                assignment[job] = machine
+                search(k + 1)
+                loads[machine] -= durations[job][machine]
+
+        search(0)
+        return best["assignment"]
+
+    def _makespan(self, durations, assignment):
+        """Bir atamanın makespan değerini hesaplar."""
+        loads = [0] * len(self.instruments)
+        for job, machine in enumerate(assignment):
+            loads[machine] += durations[job][machine]
+        return max(loads)
+
+    def schedule(self, jobs):
+        """
+        İşleri cihazlara atar ve her cihazdaki çalıştırma sırasını belirler.
+
+        Args:
+            jobs (list): "protocol" (veya saniye cinsinden "duration") ve
+                "reactions" içeren iş sözlükleri; isteğe bağlı "name"
+
+        Returns:
+            dict: "method", "makespan" (saniye), "assignments" (her görev için
+                "job", "reactions" ve "instrument" indeksi) ve "instruments"
+                (her cihaz için "name", "capacity", "busy_time" ve
+                başlangıç/bitiş zamanlı "runs" listesi)
+        """
+        tasks = self._tasks(jobs)
+        durations = self._durations(tasks)
+        method = self.method
+        if method == "auto":
+            method = "exact" if len(tasks) <= AUTO_EXACT_JOBS else "lpt"
+        if method == "exact" and len(tasks) > EXACT_MAX_JOBS:
+            raise ValueError(f"Kesin yöntem en fazla {EXACT_MAX_JOBS} görev için kullanılabilir.")
+
+        assignment = self._lpt(durations) if tasks else []
+        if method == "exact" and tasks:
+            assignment = self._exact(durations, assignment)
+
+        # Her cihazdaki görevler en uzundan kısaya sıralanır
+        schedule = [
+            {"name": instrument["name"], "capacity": instrument["capacity"], "busy_time": 0, "runs": []}
+            for instrument in self.instruments
+        ]
+        for task in sorted(range(len(tasks)), key=lambda t: (-durations[t][assignment[t]], t)):
+            job, reactions, _ = tasks[task]
+            instrument = schedule[assignment[task]]
+            start = instrument["busy_time"]
+            end = start + durations[task][assignment[task]]
+            instrument["runs"].append({
+                "job": job,
+                "name": jobs[job].get("name", f"Program {job + 1}"),
+                "reactions": reactions,
+                "runs": math.ceil(reactions / instrument["capacity"]),
+                "start": start,
+                "end": end
+            })
+            instrument["busy_time"] = end
+
+        return {
+            "method": method,
+            "makespan": max((instrument["busy_time"] for instrument in schedule), default=0),
+            "assignments": [
+                {"job": job, "reactions": reactions, "instrument": machine}
+                for (job, reactions, _), machine in zip(tasks, assignment)
+            ],
+            "instruments": schedule
+        }
@@ -0,0 +1,274 @@
+"""
+Primerlerde firkete (hairpin) ikincil yapısını tahmin eden modül.
+
+Her (i, j) baz çifti için o çiftle kapanan en kararlı gövde-ilmek yapısının
+serbest enerjisi dinamik programlama ile hesaplanır. Aynı anti-köşegen
+üzerindeki (j - i sabit) hücreler yalnızca daha kısa aralıklara bağlı
+olduğundan her anti-köşegen tek bir NumPy işlemiyle, N primer için birlikte
+doldurulur.
+
+Gövde istiflenmesi için SantaLucia (1998), ilmek ve tek bazlık çıkıntı
+(bulge) cezaları için SantaLucia ve Hicks (2004) parametreleri kullanılır
+(1 M Na⁺, 37°C).
+"""
+
+import math
+import numpy as np
+
+from .sequence_encoding import BASE_OTHER, encode_padded
+from .thermodynamics import (
+    GAS_CONSTANT, NN_ENTHALPY, NN_ENTROPY, TERMINAL_ENTHALPY, TERMINAL_ENTROPY
+)
+
+
+# Serbest enerjinin hesaplandığı sıcaklık (K)
+REFERENCE_TEMPERATURE = 310.15
+
+# Firkete ilmeğindeki en az baz sayısı
+MIN_LOOP_LENGTH = 3
+
+# Firkete ilmeği başlatma ΔG değerleri (kcal/mol, ilmek uzunluğuna göre)
+HAIRPIN_LOOP_ENERGY = {3: 3.5, 4: 3.5, 5: 3.3, 6: 4.0, 7: 4.2, 8: 4.3, 9: 4.5}
+
+# Tek bazlık çıkıntı (bulge) cezası (kcal/mol)
+BULGE_ENERGY = 4.0
+
+# Bu değerin altındaki firketeler için uyarı verilir (kcal/mol)
+HAIRPIN_DELTA_G_WARNING = -3.0
+
+# Bellek kullanımını sınırlamak için tek seferde katlanan en fazla primer sayısı
+DEFAULT_CHUNK_SIZE = 256
+
+# İstifleme ve uç terimlerinin 37°C'deki serbest enerjileri
+_STACK_ENERGY = NN_ENTHALPY - REFERENCE_TEMPERATURE * NN_ENTROPY / 1000.0
+_TERMINAL_ENERGY = TERMINAL_ENTHALPY - REFERENCE_TEMPERATURE * TERMINAL_ENTROPY / 1000.0
+
+
+def hairpin_loop_energy(loop_length):
+    """
+    Firkete ilmeği başlatma serbest enerjisini döndürür.
+
+    9 bazdan uzun ilmekler için Jacobson-Stockmayer yaklaşımıyla uzatılır.
+
+    Args:
+        loop_length (int): İlmekteki eşleşmemiş baz sayısı
+
+    Returns:
+        float: ΔG (kcal/mol, 37°C)
+    """
+    if loop_length in HAIRPIN_LOOP_ENERGY:
+        return HAIRPIN_LOOP_ENERGY[loop_length]
+    return HAIRPIN_LOOP_ENERGY[9] + (
+        1.75 * GAS_CONSTANT * REFERENCE_TEMPERATURE * math.log(loop_length / 9) / 1000.0
+    )
+
+
+def _entropic(delta_g):
+    """Yalnızca entropiden kaynaklanan bir ΔG cezasını ΔS'ye (cal/K·mol) çevirir."""
+    return -delta_g * 1000.0 / REFERENCE_TEMPERATURE
+
+
+def _empty_result(n_primers):
+    """Yapı bulunmayan N primer için sıfır sonuçlar."""
+    return {
+        "delta_g": np.zeros(n_primers),
+        "delta_h": np.zeros(n_primers),
+        "delta_s": np.zeros(n_primers),
+        "stem_length": np.zeros(n_primers, dtype=np.int64),
+        "loop_length": np.zeros(n_primers, dtype=np.int64)
+    }
+
+
+def _fold_chunk(primers):
+    """Bir grup primeri katlar (predict_hairpins_batch için)."""
+    codes, lengths = encode_padded(primers)
+    n_primers, width = codes.shape
+    if width < MIN_LOOP_LENGTH + 2:
+        return _empty_result(n_primers)
+
+    valid = codes != BASE_OTHER
+    safe = np.minimum(codes, 3)
+
+    # Konum i'den başlayan dinükleotitler (i, i+1) ve çıkıntı atlamalı (i, i+2)
+    stack_next = np.zeros((n_primers, width), dtype=np.int64)
+    stack_next[:, :-1] = 4 * safe[:, :-1] + safe[:, 1:]
+    stack_skip = np.zeros((n_primers, width), dtype=np.int64)
+    stack_skip[:, :-2] = 4 * safe[:, :-2] + safe[:, 2:]
+    energy_next = _STACK_ENERGY[stack_next]
+    energy_skip = _STACK_ENERGY[stack_skip] + BULGE_ENERGY
+
+    # Anti-köşegen düzeni: energy[n, span, i] = (i, i + span) ile kapanan en iyi ΔG
+    # choice: 0 = ilmek, 1 = istifleme, 2 = soldaki çıkıntı, 3 = sağdaki çıkıntı
+    energy = np.full((n_primers, width, width), np.inf)
+    choice = np.zeros((n_primers, width, width), dtype=np.int8)
+
+    for span in range(MIN_LOOP_LENGTH + 1, width):
+        count = width - span
+        can_pair = valid[:, :count] & valid[:, span:] & (codes[:, :count] + codes[:, span:] == 3)
+
+        best = np.full((n_primers, count), hairpin_loop_energy(span - 1))
+        best_choice = np.zeros((n_primers, count), dtype=np.int8)
+
+        options = []
+        if span - 2 > MIN_LOOP_LENGTH:
+            # (i+1, j-1) üzerine istifleme
+            options.append((1, energy[:, span - 2, 1:1 + count] + energy_next[:, :count]))
+        if span - 3 > MIN_LOOP_LENGTH:
+            # (i+2, j-1): i+1 çıkıntıda; (i+1, j-2): j-1 çıkıntıda
+            options.append((2, energy[:, span - 3, 2:2 + count] + energy_skip[:, :count]))
+            options.append(
+                (3, energy[:, span - 3, 1:1 + count] + energy_next[:, :count] + BULGE_ENERGY)
+            )
+
+        for option, candidate in options:
+            better = candidate < best
+            best = np.where(better, candidate, best)
+            best_choice[better] = option
+
+        energy[:, span, :count] = np.where(can_pair, best, np.inf)
+        choice[:, span, :count] = best_choice
+
+    # Gövdenin dış ucundaki çift için uç terimi
+    total = energy + _TERMINAL_ENERGY[codes][:, None, :]
+    flat = total.reshape(n_primers, -1).argmin(axis=1)
+    rows = np.arange(n_primers)
+    span, position = np.unravel_index(flat, (width, width))
+
+    delta_g = total[rows, span, position]
+    stable = delta_g < 0
+
+    # Geri izleme: tüm primerler gövde boyunca birlikte izlenir
+    loop_table = np.array([0.0] + [hairpin_loop_energy(n) for n in range(1, width)])
+    terminal = codes[rows, position]
+    delta_h = TERMINAL_ENTHALPY[terminal].copy()
+    delta_s = TERMINAL_ENTROPY[terminal].copy()
+    stem_length = np.zeros(n_primers, dtype=np.int64)
+    loop_length = np.zeros(n_primers, dtype=np.int64)
+    active = stable.copy()
+    while active.any():
+        current = choice[rows, span, position]
+        stem_length += active
+
+        closes = active & (current == 0)
+        loop_length = np.where(closes, span - 1, loop_length)
+        delta_s += np.where(closes, _entropic(loop_table[span - 1]), 0.0)
+
+        active = active & (current != 0)
+        bulge = current >= 2
+        step = np.where(current == 2, stack_skip[rows, position], stack_next[rows, position])
+        delta_h += np.where(active, NN_ENTHALPY[step], 0.0)
+        delta_s += np.where(
+            active, NN_ENTROPY[step] + np.where(bulge, _entropic(BULGE_ENERGY), 0.0), 0.0
+        )
+
+        position = np.where(active, position + np.where(current == 2, 2, 1), position)
+        span = np.where(active, span - np.where(bulge, 3, 2), span)
+
+    return {
+        "delta_g": np.where(stable, delta_g, 0.0),
+        "delta_h": np.where(stable, delta_h, 0.0),
+        "delta_s": np.where(stable, delta_s, 0.0),
+        "stem_length": stem_length,
+        "loop_length": loop_length
+    }
+
+
+def hairpin_tm(delta_h, delta_s):
+    """
+    Tek moleküllü firkete yapısının erime sıcaklığını hesaplar.
+
+    Firkete katlanması konsantrasyondan bağımsız olduğu için Tm = ΔH / ΔS'dir.
+
+    Args:
+        delta_h (numpy.ndarray): ΔH değerleri (kcal/mol)
+        delta_s (numpy.ndarray): ΔS değerleri (cal/K·mol)
+
+    Returns:
+        numpy.ndarray: Tm (°C); yapı bulunmayanlarda NaN
+    """
+    delta_h = np.asarray(delta_h, dtype=np.float64)
+    delta_s = np.asarray(delta_s, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tm = delta_h * 1000.0 / delta_s - 273.15
+    return np.where(delta_s < 0, tm, np.nan)
+
+
+def predict_hairpins_batch(primers, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Bir primer kütüphanesindeki her primer için en kararlı firketeyi bulur.
+
+    Args:
+        primers (list): Primer dizileri (5'→3')
+        chunk_size (int): Bellek kullanımını sınırlamak için grup boyutu
+
+    Returns:
+        dict: Her biri N uzunluğunda dizi olan "delta_g" (kcal/mol, 37°C),
+            "delta_h", "delta_s", "tm" (°C, yapı yoksa NaN), "stem_length"
+            (baz çifti) ve "loop_length" (baz)
+    """
+    primers = list(primers)
+    if not primers:
+        result = _empty_result(0)
+    else:
+        chunks = [
+            _fold_chunk(primers[start:start + chunk_size])
+            for start in range(0, len(primers), chunk_size)
+        ]
+        result = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+    result["tm"] = hairpin_tm(result["delta_h"], result["delta_s"])
+    return result
+
+
+def predict_hairpin(primer):
+    """
+    Tek bir primer için en kararlı firketeyi bulur.
+
+    Args:
+        primer (str): Primer dizisi (5'→3')
+
+    Returns:
+        dict: "delta_g" (kcal/mol), "tm" (°C veya yapı yoksa None),
+            "stem_length" ve "loop_length"
+    """
+    return hairpin_record(predict_hairpins_batch([primer]), 0)
+
+
+def hairpin_record(result, index):
+    """
+    predict_hairpins_batch sonucundaki bir primeri predict_hairpin biçimine çevirir.
+
+    Args:
+        result (dict): predict_hairpins_batch sonucu
+        index (int): Primerin sonuçtaki sırası
+
+    Returns:
+        dict: "delta_g" (kcal/mol), "tm" (°C veya yapı yoksa None),
+            "stem_length" ve "loop_length"
+    """
+    tm = float(result["tm"][index])
+    return {
+        "delta_g": round(float(result["delta_g"][index]), 2),
+        "tm": None if math.isnan(tm) else round(tm, 1),
+        "stem_length": int(result["stem_length"][index]),
+        "loop_length": int(result["loop_length"][index])
+    }
+
+
+def hairpin_warnings(hairpin, label):
+    """
+    Firkete kararlılığı eşiği aşıyorsa uyarı mesajları üretir.
+
+    Args:
+        hairpin (dict): predict_hairpin sonucu
+        label (str): Mesajda kullanılacak primer adı (ör. "İleri primer")
+
+    Returns:
+        list: Uyarı mesajları
+    """
+    if hairpin["delta_g"] > HAIRPIN_DELTA_G_WARNING:
+        return []
+    return [
+        f"{label}: kararlı firkete yapısı (ΔG {hairpin['delta_g']} kcal/mol, "
+        f"Tm {hairpin['tm']}°C, {hairpin['stem_length']} bp gövde)."
+    ]
@@ -0,0 +1,130 @@
+"""
+DNA dizilerini NumPy dizilerine kodlayan yardımcı modül.
+
+Toplu hesaplamalar her diziyi ayrı ayrı taramak yerine tüm dizileri tek bir
+bayt dizisine kodlar ve sayımları bu dizi üzerinden vektörel olarak yapar.
+"""
+
+import numpy as np
+
+
+# Baz kodları: A=0, C=1, G=2, T=3, diğer tüm karakterler (N vb.) = 4
+BASE_A = 0
+BASE_C = 1
+BASE_G = 2
+BASE_T = 3
+BASE_OTHER = 4
+
+# ASCII karakterinden baz koduna dönüşüm tablosu
+BASE_LOOKUP = np.full(256, BASE_OTHER, dtype=np.uint8)
+for _char, _code in (("A", BASE_A), ("C", BASE_C), ("G", BASE_G), ("T", BASE_T)):
+    BASE_LOOKUP[ord(_char)] = _code
+    BASE_LOOKUP[ord(_char.lower())] = _code
+
+
+def encode_sequence(sequence):
+    """
+    Tek bir DNA dizisini baz kodu dizisine dönüştürür.
+
+    Args:
+        sequence (str): DNA dizisi
+
+    Returns:
+        numpy.ndarray: uint8 baz kodları (A=0, C=1, G=2, T=3, diğer=4)
+    """
+    raw = np.frombuffer(sequence.encode("ascii", "replace"), dtype=np.uint8)
+    return BASE_LOOKUP[raw]
+
+
+def encode_batch(sequences):
+    """
+    Birden fazla DNA dizisini tek seferde kodlar.
+
+    Tüm diziler uç uca eklenir ve tek bir uint8 dizisine dönüştürülür;
+    her dizinin başlangıç konumu ve uzunluğu ayrıca döndürülür.
+
+    Args:
+        sequences (list): DNA dizileri listesi
+
+    Returns:
+        tuple: (kodlar, başlangıç konumları, uzunluklar)
+    """
+    lengths = np.fromiter(
+        (len(sequence) for sequence in sequences), dtype=np.int64, count=len(sequences)
+    )
+    starts = np.zeros(len(sequences), dtype=np.int64)
+    if len(sequences) > 1:
+        np.cumsum(lengths[:-1], out=starts[1:])
+
+    codes = encode_sequence("".join(sequences))
+    return codes, starts, lengths
+
+
+def encode_padded(sequences, width=None):
+    """
+    Dizileri BASE_OTHER ile doldurulmuş (N, width) boyutlu kod matrisine dönüştürür.
+
+    Args:
+        sequences (list): DNA dizileri
+        width (int, optional): Matris genişliği; verilmezse en uzun dizinin uzunluğu
+
+    Returns:
+        tuple: (kod matrisi, uzunluklar)
+    """
+    codes, starts, lengths = encode_batch([str(sequence) for sequence in sequences])
+    if width is None:
+        width = int(lengths.max()) if len(lengths) else 0
+    padded = np.full((len(sequences), width), BASE_OTHER, dtype=np.int64)
+    rows = np.repeat(np.arange(len(sequences)), lengths)
+    columns = np.arange(len(codes)) - np.repeat(starts, lengths)
+    padded[rows, columns] = codes
+    return padded, lengths
+
+
+def base_counts_batch(codes, lengths):
+    """
+    Kodlanmış diziler için baz sayımlarını tek geçişte hesaplar.
+
+    Args:
+        codes (numpy.ndarray): encode_batch ile üretilmiş baz kodları
+        lengths (numpy.ndarray): Her dizinin uzunluğu
+
+    Returns:
+        numpy.ndarray: (dizi sayısı, 5) boyutlu sayım matrisi (A, C, G, T, diğer)
+    """
+    n_sequences = len(lengths)
+    segment_ids = np.repeat(np.arange(n_sequences, dtype=np.int64), lengths)
+    counts = np.bincount(
+        segment_ids * 5 + codes, minlength=n_sequences * 5
+    )
+    return counts.reshape(n_sequences, 5)
+
+
+def round_array(values, ndigits=1):
+    """
+    NumPy dizisini Python'un round() fonksiyonuyla birebir aynı şekilde yuvarlar.
+
+    numpy.round ikili kayan nokta gösterimi nedeniyle yalnızca yarıya çok
+    yakın sınır değerlerde round()'dan farklı sonuç verebilir. Bu yüzden
+    değerler numpy.round ile yuvarlanır; yalnızca sınıra yakın olanlar
+    round() ile yeniden yuvarlanır.
+
+    Args:
+        values (numpy.ndarray): Yuvarlanacak değerler
+        ndigits (int): Ondalık basamak sayısı
+
+    Returns:
+        numpy.ndarray: Yuvarlanmış değerler
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return values
+    rounded = np.round(values, ndigits)
+
+    scaled = values * 10.0 ** ndigits
+    with np.errstate(invalid="ignore"):
+        near_half = ~(np.abs(scaled - np.floor(scaled) - 0.5) > 1e-6)
+    if near_half.any():
+        rounded[near_half] = [round(float(value), ndigits) for value in values[near_half]]
+    return rounded
+
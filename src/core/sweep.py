@@ -0,0 +1,273 @@
+"""
+PCR parametre taraması (grid search) modülü.
+
+Şablon uzunluğu, GC içeriği, konsantrasyon vb. için verilen değer aralıklarının
+Kartezyen çarpımı oluşturulur ve her nokta için protokol hesaplanır. Izgara
+bellekte tutulmaz: noktalar parçalar (chunk) hâlinde üretilir, her parça
+create_protocols_batch ile (create_complete_protocol ile birebir aynı sonuç)
+hesaplanır ve satırlar sırayla CSV veya NDJSON olarak akışa yazılır. Parçalar
+isteğe bağlı olarak bir süreç havuzuna dağıtılır.
+"""
+
+import csv
+import itertools
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .protocol_batch import BATCH_FIELDS, DEFAULT_CHUNK_SIZE, TEMPERATURE_COLUMNS, TIME_COLUMNS
+
+
+# Taramada yazılan sonuç sütunları
+RESULT_COLUMNS = TEMPERATURE_COLUMNS + TIME_COLUMNS + ("cycle_count", "warnings")
+
+# Desteklenen çıktı biçimleri
+SWEEP_FORMATS = ("csv", "ndjson")
+
+
+def _parse_number(text):
+    """Metni sayıya çevirir ("0,5" kabul edilir); tam sayı yazımı int döndürür."""
+    text = text.strip().replace(",", ".")
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_range(text):
+    """
+    Komut satırı değer aralığını değer listesine çevirir.
+
+    "başlangıç:bitiş:adım" biçimi (bitiş dahil) veya ";" ile ayrılmış değer
+    listesi (ör. "500;1000;3000") kabul edilir. Ondalık ayırıcı olarak virgül
+    kullanılabilir.
+
+    Args:
+        text (str): Aralık tanımı
+
+    Returns:
+        list: Değerler
+
+    Raises:
+        ValueError: Aralık geçersizse
+    """
+    try:
+        parts = [_parse_number(part) for part in text.split(":" if ":" in text else ";")
+                 if part.strip()]
+    except ValueError as error:
+        raise ValueError(f"Geçersiz aralık: {text}") from error
+
+    if ":" not in text:
+        if not parts:
+            raise ValueError(f"Geçersiz aralık: {text}")
+        return parts
+
+    if len(parts) != 3:
+        raise ValueError(f"Geçersiz aralık: {text}. Biçim: başlangıç:bitiş:adım")
+    start, stop, step = parts
+    if step <= 0:
+        raise ValueError("Aralık adımı pozitif olmalıdır.")
+    if stop < start:
+        raise ValueError("Aralık bitişi başlangıçtan küçük olamaz.")
+
+    # Bitiş değeri kayan nokta hatasına rağmen dahil edilir
+    count = int((stop - start) / step + 1e-9) + 1
+    if isinstance(start, int) and isinstance(step, int):
+        return [start + k * step for k in range(count)]
+    return [round(start + k * step, 9) for k in range(count)]
+
+
+class ParameterGrid:
+    """Parametre aralıklarının Kartezyen çarpımını tembel olarak üreten sınıf."""
+
+    def __init__(self, ranges, fixed=None):
+        """
+        ParameterGrid sınıfı için başlatıcı.
+
+        Args:
+            ranges (dict): Parametre adı -> değer listesi (taranan parametreler)
+            fixed (dict, optional): Tüm noktalarda aynı olan parametreler (ör. primerler)
+        """
+        unknown = (set(ranges) | set(fixed or {})) - set(BATCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen tarama parametreleri: {', '.join(sorted(unknown))}")
+        empty = [name for name, values in ranges.items() if not len(values)]
+        if empty:
+            raise ValueError(f"Boş tarama aralığı: {', '.join(empty)}")
+
+        self.names = tuple(ranges)
+        self.values = tuple(list(values) for values in ranges.values())
+        self.fixed = dict(fixed or {})
+
+    def __len__(self):
+        """Izgaradaki nokta sayısını döndürür."""
+        size = 1
+        for values in self.values:
+            size *= len(values)
+        return size
+
+    def __iter__(self):
+        """Izgara noktalarını create_complete_protocol argümanları olarak üretir."""
+        for point in itertools.product(*self.values):
+            record = dict(self.fixed)
+            record.update(zip(self.names, point))
+            yield record
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Izgara noktalarını parçalar hâlinde üretir.
+
+        Args:
+            chunk_size (int): Bir parçadaki en fazla nokta sayısı
+
+        Yields:
+            list: Nokta sözlükleri
+        """
+        if chunk_size < 1:
+            raise ValueError("Parça boyutu en az 1 olmalıdır.")
+        points = iter(self)
+        while True:
+            chunk = list(itertools.islice(points, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+# Süreç havuzundaki her işçinin optimizasyon nesnesi (_init_worker ile bir kez atanır)
+_worker_optimizer = None
+
+
+def _init_worker(optimizer):
+    """Süreç havuzu işçisinin optimizasyon nesnesini ayarlar."""
+    global _worker_optimizer
+    _worker_optimizer = optimizer
+
+
+def _evaluate_in_worker(records, parameters):
+    """Bir parçayı süreç havuzu işçisinin optimizasyon nesnesiyle hesaplar."""
+    return _evaluate_chunk(_worker_optimizer, records, parameters)
+
+
+def _evaluate_chunk(optimizer, records, parameters):
+    """
+    Bir parçanın protokol sütunlarını hesaplar.
+
+    Args:
+        optimizer (PCROptimizer): Protokolleri hesaplayan optimizasyon nesnesi
+        records (list): Nokta sözlükleri
+        parameters (tuple): Çıktıya yazılacak parametreler
+
+    Returns:
+        list: Parametre ve RESULT_COLUMNS değerlerini içeren satır sözlükleri
+    """
+    batch = optimizer.create_protocols_batch(records)
+    rows = []
+    for index, record in enumerate(records):
+        row = {name: record.get(name) for name in parameters}
+        for name in RESULT_COLUMNS[:-1]:
+            row[name] = batch.value(name, index)
+        row["warnings"] = list(batch.warnings[index])
+        rows.append(row)
+    return rows
+
+
+class ParameterSweep:
+    """Bir parametre ızgarasını tarayıp sonuçları akışa yazan sınıf."""
+
+    def __init__(self, optimizer, chunk_size=DEFAULT_CHUNK_SIZE, processes=None):
+        """
+        ParameterSweep sınıfı için başlatıcı.
+
+        Args:
+            optimizer (PCROptimizer): Protokolleri hesaplayan optimizasyon nesnesi
+            chunk_size (int): Bir parçadaki ızgara noktası sayısı
+            processes (int, optional): Parçaları dağıtmak için süreç sayısı;
+                verilmezse tüm parçalar bu süreçte hesaplanır
+        """
+        if chunk_size < 1:
+            raise ValueError("Parça boyutu en az 1 olmalıdır.")
+        self.optimizer = optimizer
+        self.chunk_size = chunk_size
+        self.processes = processes
+
+    def iter_rows(self, grid):
+        """
+        Izgaranın sonuç satırlarını ızgara sırasıyla üretir.
+
+        Süreç havuzu kullanılırken aynı anda en fazla 2 × süreç sayısı parça
+        bekletilir; böylece bellek kullanımı ızgara boyutundan bağımsızdır.
+        Optimizasyon nesnesi işlere eklenmez, her işçiye başlatılırken bir
+        kez gönderilir.
+
+        Args:
+            grid (ParameterGrid): Taranacak ızgara
+
+        Yields:
+            dict: Parametre ve RESULT_COLUMNS değerlerini içeren satır
+        """
+        parameters = tuple(self.parameter_columns(grid))
+        chunks = grid.chunks(self.chunk_size)
+
+        if not self.processes or len(grid) <= self.chunk_size:
+            for chunk in chunks:
+                yield from _evaluate_chunk(self.optimizer, chunk, parameters)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.processes, initializer=_init_worker, initargs=(self.optimizer,)
+        ) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_evaluate_in_worker, chunk, parameters))
+                if len(pending) >= 2 * self.processes:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+    def parameter_columns(self, grid):
+        """
+        Çıktıya yazılacak parametre sütunlarını döndürür.
+
+        Args:
+            grid (ParameterGrid): Taranan ızgara
+
+        Returns:
+            list: Sabit ve taranan parametre adları (BATCH_FIELDS sırasıyla)
+        """
+        names = set(grid.names) | set(grid.fixed)
+        return [name for name in BATCH_FIELDS if name in names]
+
+    def write(self, grid, stream, format="csv"):
+        """
+        Tarama sonuçlarını satır satır akışa yazar.
+
+        Args:
+            grid (ParameterGrid): Taranacak ızgara
+            stream (file): Metin akışı (ör. açık dosya veya sys.stdout)
+            format (str): "csv" (uyarılar "; " ile birleştirilir) veya
+                "ndjson" (her satır bir JSON nesnesi)
+
+        Returns:
+            int: Yazılan satır sayısı
+        """
+        if format not in SWEEP_FORMATS:
+            raise ValueError(
+                f"Desteklenmeyen tarama biçimi: {format}. Geçerli biçimler: {', '.join(SWEEP_FORMATS)}"
+            )
+
+        count = 0
+        if format == "csv":
+            writer = csv.DictWriter(
+                stream, fieldnames=self.parameter_columns(grid) + list(RESULT_COLUMNS),
+                lineterminator="\n"
+            )
+            writer.writeheader()
+            for row in self.iter_rows(grid):
+                row["warnings"] = "; ".join(row["warnings"])
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in self.iter_rows(grid):
+                stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+        return count
@@ -0,0 +1,332 @@
+"""
+Önceden derlenmiş parçalarla hızlı protokol metni oluşturan modül.
+
+Rapor düzeni (başlıklar, etiketler, birimler) yerel dil metinlerinden bir kez
+sabit parçalara derlenir. Her protokol önce düz bir kayda (demet)
+dönüştürülür; metin, sabit parçalar ve kayıt değerleri tek bir listeye
+eklenip tek bir join ile oluşturulur. Süre metinleri değer başına bir kez
+hesaplanıp saklanır. ProtocolBatch girdilerinde kayıtlar protokol
+sözlükleri oluşturulmadan doğrudan sütunlardan okunur.
+
+Çıktı, ProtocolGenerator'ın önceki protocol_to_text çıktısıyla bayt
+düzeyinde aynıdır.
+"""
+
+from .protocol_batch import TEMPERATURE_COLUMNS, TIME_COLUMNS, ProtocolBatch, is_set
+
+
+# Rapor metinleri (yerel dil)
+TEXT_STRINGS = {
+    "title": "PCR Protokolü",
+    "initial_denaturation": "Başlangıç Denatürasyonu",
+    "cycles": "Döngüler",
+    "stage": "Aşama",
+    "denaturation": "Denatürasyon",
+    "annealing": "Bağlanma (Annealing)",
+    "extension": "Uzama (Extension)",
+    "final_extension": "Son Uzama",
+    "hold": "Saklama",
+    "temperature": "Sıcaklık",
+    "time": "Süre",
+    "per_cycle": "döngü başına",
+    "gradient": "Gradyan Bağlanma Sıcaklıkları",
+    "column": "Sütun",
+    "columns": "sütun",
+    "recommended": "Önerilen",
+    "gc_content": "GC İçeriği",
+    "amplicon": "PCR Ürünü",
+    "template_position": "şablon konumu",
+    "warnings": "Uyarılar",
+    "total_time": "Tahmini Toplam Süre",
+    "indefinite": "Süresiz",
+    "minutes_short": "dk",
+    "seconds_short": "sn",
+    "hours": "saat",
+    "minutes": "dakika",
+    "seconds": "saniye"
+}
+
+# Düz kayıttaki alanların sırası (bkz. TextRenderer.flatten)
+RECORD_FIELDS = (
+    "initial_temperature", "initial_time", "stages", "gradient", "final_temperature",
+    "final_time", "hold_temperature", "hold_time", "gc_content", "amplicon", "warnings", "total_time"
+)
+
+
+def _stage_record(stage):
+    """Bir döngü aşamasını düz demete çevirir."""
+    denaturation, annealing, extension = stage["denaturation"], stage["annealing"], stage["extension"]
+    return (
+        stage["count"], stage.get("label", ""),
+        denaturation["temperature"], denaturation["time"],
+        annealing["temperature"], annealing["time"], annealing.get("step"),
+        extension["temperature"], extension["time"]
+    )
+
+
+class TextRenderer:
+    """Protokolleri önceden derlenmiş düzenle metne dönüştüren sınıf."""
+
+    def __init__(self, strings=None):
+        """
+        TextRenderer sınıfı için başlatıcı.
+
+        Args:
+            strings (dict, optional): TEXT_STRINGS anahtarlarından bazılarının
+                yerine kullanılacak metinler
+        """
+        self.strings = dict(TEXT_STRINGS, **(strings or {}))
+        self._time_texts = {}
+        self._total_texts = {}
+        self._compile()
+
+    def _compile(self):
+        """Rapor düzenini değerler arasındaki sabit metin parçalarına derler."""
+        s = self.strings
+        temperature = f"- {s['temperature']}: "
+        self._fragments = (
+            # Başlangıç denatürasyonu ve sıcaklık ile süre arası
+            f"# {s['title']}\n\n## {s['initial_denaturation']}\n{temperature}",
+            f"°C\n- {s['time']}: ",
+            # Döngü aşaması başlıkları
+            f"## {s['cycles']} (x",
+            f"## {s['cycles']} - {s['stage']} ",
+            # Denatürasyon, bağlanma ve uzama adımları
+            f")\n### {s['denaturation']}\n{temperature}",
+            f"\n\n### {s['annealing']}\n{temperature}",
+            f"\n- {s['time']}: ",
+            f"\n\n### {s['extension']}\n{temperature}",
+            # Touchdown bağlanma sıcaklığı aralığı
+            "°C → ",
+            f"°C ({s['per_cycle']} ",
+            # Son uzama ve saklama
+            f"## {s['final_extension']}\n{temperature}",
+            f"\n\n## {s['hold']}\n{temperature}",
+            # Ek bilgiler ve toplam süre
+            f"{s['gc_content']}: %",
+            f"{s['amplicon']}: ",
+            f" bp ({s['template_position']} ",
+            f"## {s['warnings']}\n",
+            f"{s['total_time']}: "
+        )
+        self._gradient_fragments = (
+            f"## {s['gradient']} (",
+            f" {s['columns']})\n",
+            f"- {s['column']} ",
+            f"- {s['recommended']}: {s['column']} "
+        )
+
+    def format_time(self, seconds):
+        """
+        Saniye cinsinden süreyi okunabilir biçime dönüştürür (sonuçlar saklanır).
+
+        Args:
+            seconds: Saniye cinsinden süre veya "indefinite"
+
+        Returns:
+            str: Biçimlendirilmiş süre (ör. "1 dk 30 sn")
+        """
+        # 30 ve 30.0 farklı metin verdiği için tam sayı dışındaki değerlerin anahtarına tür de eklenir
+        key = seconds if seconds.__class__ is int else (seconds.__class__, seconds)
+        text = self._time_texts.get(key)
+        if text is None:
+            s = self.strings
+            if seconds == "indefinite":
+                text = s["indefinite"]
+            else:
+                minutes = seconds // 60
+                remaining_seconds = seconds % 60
+                if minutes > 0:
+                    text = f"{minutes} {s['minutes_short']} {remaining_seconds} {s['seconds_short']}"
+                else:
+                    text = f"{remaining_seconds} {s['seconds_short']}"
+            self._time_texts[key] = text
+        return text
+
+    def format_total(self, seconds_total):
+        """
+        Toplam süreyi saat, dakika ve saniye olarak biçimlendirir (sonuçlar saklanır).
+
+        Args:
+            seconds_total (int or float): Toplam süre (saniye)
+
+        Returns:
+            str: Biçimlendirilmiş süre (ör. "1 saat 5 dakika")
+        """
+        key = seconds_total if seconds_total.__class__ is int else (seconds_total.__class__, seconds_total)
+        text = self._total_texts.get(key)
+        if text is None:
+            s = self.strings
+            hours = seconds_total // 3600
+            minutes = (seconds_total % 3600) // 60
+            seconds = seconds_total % 60
+
+            text = ""
+            if hours > 0:
+                text += f"{hours} {s['hours']} "
+            if minutes > 0:
+                text += f"{minutes} {s['minutes']} "
+            if seconds > 0:
+                text += f"{seconds} {s['seconds']}"
+            text = text.strip()
+            self._total_texts[key] = text
+        return text
+
+    def flatten(self, protocol):
+        """
+        Protokol sözlüğünü düz kayda dönüştürür.
+
+        Args:
+            protocol (dict): Protokol bilgisi
+
+        Returns:
+            tuple: RECORD_FIELDS sırasıyla değerler; "stages" her aşama için bir demet içerir
+        """
+        initial, final, hold = protocol["initial_denaturation"], protocol["final_extension"], protocol["hold"]
+        stages = tuple(map(_stage_record, protocol.get("cycle_stages") or [protocol["cycles"]]))
+
+        # Toplam süre (cycling.total_time ile aynı işlem sırası)
+        seconds_total = initial["time"]
+        for stage in stages:
+            seconds_total += stage[0] * (stage[3] + stage[5] + stage[8])
+        seconds_total += final["time"]
+
+        return (
+            initial["temperature"], initial["time"], stages, protocol.get("gradient"),
+            final["temperature"], final["time"], hold["temperature"], hold["time"],
+            protocol.get("gc_content"), protocol.get("amplicon"), protocol.get("warnings"),
+            seconds_total
+        )
+
+    def render(self, protocol):
+        """
+        Protokolü metin biçimine dönüştürür.
+
+        Args:
+            protocol (dict): Protokol bilgisi
+
+        Returns:
+            str: Biçimlendirilmiş protokol metni
+        """
+        parts = []
+        self._render_record(parts, self.flatten(protocol))
+        return "".join(parts)
+
+    def render_many(self, protocols):
+        """
+        Çok sayıda protokolü sırayla metne dönüştürür.
+
+        Tüm protokoller için aynı parça listesi (tampon) yeniden kullanılır.
+        ProtocolBatch verilirse kayıtlar protokol sözlükleri oluşturulmadan
+        doğrudan sütunlardan okunur.
+
+        Args:
+            protocols (iterable or ProtocolBatch): Protokol sözlükleri veya
+                create_protocols_batch sonucu
+
+        Yields:
+            str: Her protokolün metni
+        """
+        if isinstance(protocols, ProtocolBatch):
+            records = self._batch_records(protocols)
+        else:
+            records = (self.flatten(protocol) for protocol in protocols)
+
+        parts = []
+        for record in records:
+            self._render_record(parts, record)
+            yield "".join(parts)
+            parts.clear()
+
+    def _batch_records(self, batch):
+        """ProtocolBatch satırlarını skaler yoldaki Python türleriyle düz kayıtlara dönüştürür."""
+        columns = {}
+        for name in TEMPERATURE_COLUMNS + TIME_COLUMNS + ("cycle_count", "gc_content"):
+            values = batch.column(name).tolist()
+            mask = batch.integer_masks.get(name)
+            if mask is not None:
+                values = [int(value) if integer else float(value)
+                          for value, integer in zip(values, mask.tolist())]
+            columns[name] = values
+
+        rows = zip(*(columns[name] for name in (
+            "denaturation_temp", "annealing_temp", "extension_temp", "initial_denaturation_time",
+            "denaturation_time", "annealing_time", "extension_time", "final_extension_time",
+            "cycle_count", "gc_content"
+        )))
+        for index, row in enumerate(rows):
+            if index in batch.protocols:
+                yield self.flatten(batch.protocols[index])
+                continue
+            (denaturation_temp, annealing_temp, extension_temp, initial_time, denaturation_time,
+             annealing_time, extension_time, final_time, count, gc_content) = row
+            yield (
+                denaturation_temp, initial_time,
+                ((count, "", denaturation_temp, denaturation_time, annealing_temp, annealing_time,
+                  None, extension_temp, extension_time),),
+                None, extension_temp, final_time, 4, "indefinite",
+                gc_content if is_set(gc_content) else None, None, batch.warnings[index],
+                initial_time + count * (denaturation_time + annealing_time + extension_time) + final_time
+            )
+
+    def _render_record(self, parts, record):
+        """Düz kaydın metin bloklarını listeye ekler."""
+        (initial_temperature, initial_time, stages, gradient, final_temperature, final_time,
+         hold_temperature, hold_time, gc_content, amplicon, warnings, seconds_total) = record
+        (head, degree_time, single_stage, multi_stage, denaturation, annealing_title, time,
+         extension, step_arrow, step_per_cycle, final, hold, gc_title, amplicon_title,
+         amplicon_position, warnings_title, total_title) = self._fragments
+        format_time = self.format_time
+
+        parts.append(f"{head}{initial_temperature}{degree_time}{format_time(initial_time)}\n\n")
+
+        # Döngüler (touchdown protokollerinde birden çok aşama)
+        single = len(stages) == 1
+        for number, (count, label, denaturation_temp, denaturation_time, annealing_temp,
+                     annealing_time, step, extension_temp, extension_time) in enumerate(stages, 1):
+            if single:
+                header = f"{single_stage}{count}"
+            else:
+                header = f"{multi_stage}{number}: {label} (x{count}"
+            if step:
+                last_temp = round(annealing_temp + step * (count - 1), 1)
+                annealing = f"{annealing_temp}{step_arrow}{last_temp}{step_per_cycle}{step:+}°C)"
+            else:
+                annealing = f"{annealing_temp}°C"
+            parts.append(
+                f"{header}{denaturation}{denaturation_temp}{degree_time}{format_time(denaturation_time)}"
+                f"{annealing_title}{annealing}{time}{format_time(annealing_time)}"
+                f"{extension}{extension_temp}{degree_time}{format_time(extension_time)}\n\n"
+            )
+
+        # Gradyan bloğu
+        if gradient is not None:
+            gradient_title, columns_title, column_title, recommended_title = self._gradient_fragments
+            temperatures = gradient["temperatures"]
+            parts.append(f"{gradient_title}{gradient['columns']}{columns_title}")
+            for column, temperature in enumerate(temperatures, 1):
+                parts.append(f"{column_title}{column}: {temperature}°C\n")
+            recommended = gradient["recommended_column"]
+            parts.append(f"{recommended_title}{recommended} ({temperatures[recommended - 1]}°C)\n\n")
+
+        # Son uzama ve saklama
+        parts.append(
+            f"{final}{final_temperature}{degree_time}{format_time(final_time)}"
+            f"{hold}{hold_temperature}{degree_time}{format_time(hold_time)}\n\n"
+        )
+
+        # Ek bilgiler
+        if gc_content is not None:
+            parts.append(f"{gc_title}{gc_content}\n\n")
+        if amplicon is not None:
+            parts.append(
+                f"{amplicon_title}{amplicon['size']}{amplicon_position}"
+                f"{amplicon['start'] + 1}-{amplicon['end']})\n\n"
+            )
+        if warnings:
+            parts.append(warnings_title)
+            for warning in warnings:
+                parts.append(f"- {warning}\n")
+            parts.append("\n")
+
+        parts.append(f"{total_title}{self.format_total(seconds_total)}\n")